@@ -1,10 +1,15 @@
 """NetApp NVMe driver with dynamic multi-SVM support."""
 
+import copy
+import threading
+import time
 import uuid as _uuid
 from collections.abc import Generator
+from concurrent import futures
 from contextlib import contextmanager
 from functools import cached_property
 
+import requests
 from cinder import context
 from cinder import exception
 from cinder import interface
@@ -13,6 +18,7 @@ from cinder.volume import driver as volume_driver
 from cinder.volume import volume_utils
 from cinder.volume.drivers.netapp import options as na_opts
 from cinder.volume.drivers.netapp import utils as na_utils
+from cinder.volume.drivers.netapp.dataontap.client import api as netapp_api
 from cinder.volume.drivers.netapp.dataontap.client.client_cmode_rest import (
     RestClient as RestNaServer,
 )
@@ -21,6 +27,7 @@ from cinder.volume.drivers.netapp.dataontap.performance import perf_cmode
 from cinder.volume.drivers.netapp.dataontap.utils import capabilities
 from oslo_config import cfg
 from oslo_log import log as logging
+from oslo_serialization import jsonutils
 from oslo_service import loopingcall
 
 LOG = logging.getLogger(__name__)
@@ -43,6 +50,23 @@ netapp_dynamic_opts = [
         "periodically scan the NetApp cluster for new SVMs matching the "
         "configured prefix.",
     ),
+    cfg.IntOpt(
+        "netapp_svm_stats_workers",
+        default=8,
+        min=1,
+        help="Maximum number of SVMs whose volume stats are collected "
+        "concurrently during a stats refresh.",
+    ),
+    cfg.IntOpt(
+        "netapp_svm_stats_timeout",
+        default=60,
+        min=1,
+        help="In seconds to wait for the volume stats of each SVM during a "
+        "stats refresh, counted from when its collection starts rather than "
+        "while it is queued behind other SVMs. SVMs that have not reported by "
+        "then keep their last collected pool stats and are collected again on "
+        "the next refresh once their in-flight collection has finished.",
+    ),
 ]
 
 # Configuration options for dynamic NetApp driver
@@ -59,11 +83,100 @@ NETAPP_DYNAMIC_OPTS = [
 ]
 
 
+# In seconds to wait before looking up again an SVM that was not found
+# by an on-demand discovery.
+_SVM_MISS_TTL = 30
+
 # We use a + because of the special meaning of # in
 # cinder/volume/volume_utils.py extract_host()
 _SVM_NAME_DELIM = "+"
 
 
+class _SharedSession:
+    """Holds one HTTP session shared by copies of a connection."""
+
+    def __init__(self):
+        self.session = None
+        self.lock = threading.Lock()
+
+
+class PooledRestNaServer(netapp_api.RestNaServer):
+    """REST connection reusing one pooled HTTP session.
+
+    Upstream builds a brand new requests.Session, and with it a new TCP and
+    TLS connection, for every single REST call. This connection builds the
+    session once and copies of it (one per SVM) keep sharing it, so all the
+    SVM libraries on a cluster go through the same keep-alive pool.
+    """
+
+    @classmethod
+    def from_connection(cls, connection: netapp_api.RestNaServer):
+        pooled = cls.__new__(cls)
+        pooled.__dict__.update(connection.__dict__)
+        pooled._shared = _SharedSession()
+        return pooled
+
+    def _get_shared_session(self):
+        with self._shared.lock:
+            if self._shared.session is None:
+                # headers are sent per request since they differ per SVM
+                self._build_session({})
+                self._shared.session = self._session
+        return self._shared.session
+
+    @volume_utils.trace_api(filter_function=na_utils.trace_filter_func_rest_api)
+    def send_http_request(self, method, url, body, headers):
+        """Invoke the API on the server.
+
+        This is a copy of the upstream call except that the shared session
+        is used and the headers are passed with the request instead of being
+        set on the session, which is not safe with concurrent SVMs.
+        """
+        data = jsonutils.dumps(body) if body else {}
+
+        session = self._get_shared_session()
+        request_method = self._get_request_method(method, session)
+
+        try:
+            if self._timeout is not None:
+                response = request_method(
+                    url, data=data, headers=headers, timeout=self._timeout
+                )
+            else:
+                response = request_method(url, data=data, headers=headers)
+        except requests.HTTPError as e:
+            raise netapp_api.NaApiError(e.errno, e.strerror) from e
+        except Exception as e:
+            raise netapp_api.NaApiError(message=e) from e
+
+        code = response.status_code
+        body = jsonutils.loads(response.content) if response.content else {}
+        return code, body
+
+
+class SvmRestClient(RestNaServer):
+    """REST client for one SVM derived from the cluster client.
+
+    The upstream client constructor opens its own connection and, together
+    with its ZAPI fallback client, queries the ONTAP and ONTAPI versions and
+    the cluster nodes. Those answers are the same for every SVM on the
+    cluster so they are copied from the cluster client and only the
+    connections are scoped to the SVM.
+    """
+
+    def __init__(self, cluster: RestNaServer, vserver: str):
+        self.connection = copy.copy(cluster.connection)
+        self.connection.set_vserver(vserver)
+        self.vserver = vserver
+        self.async_rest_timeout = cluster.async_rest_timeout
+        self.ssh_client = cluster.ssh_client
+        self.zapi_client = copy.copy(cluster.zapi_client)
+        self.zapi_client.connection = copy.copy(cluster.zapi_client.connection)
+        self.zapi_client.connection.set_vserver(vserver)
+        self.zapi_client.vserver = vserver
+        self.features = cluster.features
+
+
 class NetAppMinimalLibrary(NetAppNVMeStorageLibrary):
     """Minimal overriding library.
 
@@ -73,8 +186,11 @@ class NetAppMinimalLibrary(NetAppNVMeStorageLibrary):
     for that approach.
     """
 
-    def __init__(self, driver_name, driver_protocol, **kwargs):
+    def __init__(self, driver_name, driver_protocol, cluster_client=None, **kwargs):
         super().__init__(driver_name, driver_protocol, **kwargs)
+        # when provided the REST client is derived from this cluster client
+        # instead of connecting to the cluster from scratch
+        self.cluster_client = cluster_client
         # the upstream library sets this field by parsing the host
         # which is "pod@config_group" in syntax. The issue is that
         # will point to our parent group. This backend_name is then
@@ -104,22 +220,27 @@ class NetAppMinimalLibrary(NetAppNVMeStorageLibrary):
         na_utils.check_flags(self.REQUIRED_CMODE_FLAGS, self.configuration)
 
         # this is the change from upstream right here
-        self.client = RestNaServer(
-            transport_type=self.configuration.netapp_transport_type,
-            ssl_cert_path=self.configuration.netapp_ssl_cert_path,
-            username=self.configuration.netapp_login,
-            password=self.configuration.netapp_password,
-            hostname=self.configuration.netapp_server_hostname,
-            port=self.configuration.netapp_server_port,
-            vserver=self.configuration.netapp_vserver,
-            trace=volume_utils.TRACE_API,
-            api_trace_pattern=self.configuration.netapp_api_trace_pattern,
-            async_rest_timeout=self.configuration.netapp_async_rest_timeout,
-            private_key_file=None,
-            certificate_file=None,
-            ca_certificate_file=None,
-            certificate_host_validation=None,
-        )
+        if self.cluster_client is not None:
+            self.client = SvmRestClient(
+                self.cluster_client, self.configuration.netapp_vserver
+            )
+        else:
+            self.client = RestNaServer(
+                transport_type=self.configuration.netapp_transport_type,
+                ssl_cert_path=self.configuration.netapp_ssl_cert_path,
+                username=self.configuration.netapp_login,
+                password=self.configuration.netapp_password,
+                hostname=self.configuration.netapp_server_hostname,
+                port=self.configuration.netapp_server_port,
+                vserver=self.configuration.netapp_vserver,
+                trace=volume_utils.TRACE_API,
+                api_trace_pattern=self.configuration.netapp_api_trace_pattern,
+                async_rest_timeout=self.configuration.netapp_async_rest_timeout,
+                private_key_file=None,
+                certificate_file=None,
+                ca_certificate_file=None,
+                certificate_host_validation=None,
+            )
         self.vserver = self.client.vserver
 
         # Storage service catalog.
@@ -154,10 +275,33 @@ class NetappCinderDynamicDriver(volume_driver.BaseVD):
         self._init_kwargs = kwargs
         # but we don't need the configuration
         del self._init_kwargs["configuration"]
+        # SVM name to UUID of the SVMs found on the cluster, their
+        # libraries are created lazily
+        self._svms = {}
+        # SVM name to time of the last failed on-demand discovery
+        self._svm_misses = {}
+        # duration in seconds of the last SVM refresh
+        self._svm_refresh_latency = None
         # child libraries
         self._libraries = {}
+        self._svm_locks = {}
         # aggregated stats
         self._stats = self._empty_volume_stats()
+        # last good pool stats, their serialized size in bytes, in-flight
+        # collections, when they started and collection latency in seconds,
+        # all keyed by SVM name
+        self._svm_pools = {}
+        self._svm_pools_size = {}
+        self._svm_stats_futures = {}
+        self._svm_stats_started = {}
+        self._svm_stats_latency = {}
+        # guards the per-SVM stats above against collections finishing
+        # after their SVM was forgotten
+        self._svm_stats_lock = threading.Lock()
+        # SVM specific pool fields keyed by SVM and FlexVol name
+        self._pool_identities = {}
+        # approximate serialized size of the pools reported to the scheduler
+        self._stats_payload_size = 0
         # looping call placeholder
         self._looping_call = None
 
@@ -193,6 +337,7 @@ class NetappCinderDynamicDriver(volume_driver.BaseVD):
             "NVMe",
             configuration=child_cfg,
             netapp_mode="proxy",
+            cluster_client=self.cluster,
             **self._init_kwargs,
         )
 
@@ -203,7 +348,7 @@ class NetappCinderDynamicDriver(volume_driver.BaseVD):
 
     @cached_property
     def cluster(self) -> RestNaServer:
-        return RestNaServer(
+        client = RestNaServer(
             transport_type=self.configuration.netapp_transport_type,
             ssl_cert_path=self.configuration.netapp_ssl_cert_path,
             username=self.configuration.netapp_login,
@@ -219,34 +364,61 @@ class NetappCinderDynamicDriver(volume_driver.BaseVD):
             ca_certificate_file=None,
             certificate_host_validation=None,
         )
+        # share one pooled HTTP session with every SVM library
+        client.connection = PooledRestNaServer.from_connection(client.connection)
+        return client
 
-    def _get_svms(self):
+    def _get_svms(self, svm_name: str | None = None) -> dict[str, str]:
+        """Return the name to UUID mapping of the usable SVMs.
+
+        When svm_name is given only that SVM is looked up.
+        """
         prefix = self.configuration.safe_get("netapp_vserver_prefix")
+        if svm_name is not None and not svm_name.startswith(prefix):
+            return {}
         svm_filter = {
             "state": "running",
             "nvme.enabled": "true",
-            "name": f"{prefix}*",
+            "name": svm_name or f"{prefix}*",
             "fields": "name,uuid",
         }
         ret = self.cluster.get_records(
             "svm/svms", query=svm_filter, enable_tunneling=False
         )
-        return [rec["name"] for rec in ret["records"]]
+        return {rec["name"]: rec["uuid"] for rec in ret["records"]}
 
     def do_setup(self, ctxt):
         """Setup the driver.
 
         Connected to the NetApp with cluster credentials to find the SVMs.
+        The NVMe library of each SVM is only created when it is first used
+        by a volume operation or a stats refresh.
         """
-        for svm_name in self._get_svms():
-            if svm_name in self._libraries:
-                LOG.info("NVMe library already exists for SVM %s, skipping", svm_name)
-                continue
+        self._svms = self._get_svms()
+        LOG.info("Found SVMs: %s", sorted(self._svms))
+
+    def _get_svm_lib(self, svm_name: str, ctxt=None) -> NetAppMinimalLibrary:
+        """Return the NVMe library for an SVM, creating it on first use."""
+        lib = self._libraries.get(svm_name)
+        if lib is not None:
+            return lib
 
-            LOG.info("Creating NVMe library instance for SVM %s", svm_name)
-            svm_lib = self._create_svm_lib(svm_name)
-            svm_lib.do_setup(ctxt)
-            self._libraries[svm_name] = svm_lib
+        with self._svm_locks.setdefault(svm_name, threading.Lock()):
+            lib = self._libraries.get(svm_name)
+            if lib is not None:
+                return lib
+
+            LOG.info("Creating NVMe library for SVM: %s", svm_name)
+            lib = self._create_svm_lib(svm_name)
+            try:
+                lib.do_setup(ctxt or context.get_admin_context())
+                lib.check_for_setup_error()
+            except Exception:
+                self._remove_svm_lib(lib)
+                raise
+            LOG.info("Library creation success for SVM: %s", svm_name)
+            self._libraries[svm_name] = lib
+            return lib
 
     def _remove_svm_lib(self, svm_lib: NetAppMinimalLibrary):
         """Remove resources for a given SVM library."""
@@ -258,45 +430,92 @@ class NetappCinderDynamicDriver(volume_driver.BaseVD):
     def _refresh_svm_libraries(self):
         return self._actual_refresh_svm_libraries(context.get_admin_context())
 
+    def _forget_svm(self, svm_name: str):
+        """Drop an SVM and everything the driver holds for it."""
+        self._svms.pop(svm_name, None)
+        svm_lib = self._libraries.pop(svm_name, None)
+        if svm_lib is not None:
+            self._remove_svm_lib(svm_lib)
+        self._svm_locks.pop(svm_name, None)
+        with self._svm_stats_lock:
+            self._svm_pools.pop(svm_name, None)
+            self._svm_pools_size.pop(svm_name, None)
+            self._svm_stats_futures.pop(svm_name, None)
+            self._svm_stats_started.pop(svm_name, None)
+            self._svm_stats_latency.pop(svm_name, None)
+        self._pool_identities = {
+            key: identity
+            for key, identity in self._pool_identities.items()
+            if key[0] != svm_name
+        }
+
     def _actual_refresh_svm_libraries(self, ctxt):
         """Refresh the SVM libraries."""
         LOG.debug("Start refreshing SVM libraries")
-        existing_libs = set(self._libraries.keys())
-        current_svms = set(self._get_svms())
+        start = time.monotonic()
+        current_svms = self._get_svms()
+        # the name/UUID listing is tiny, when it is unchanged there is
+        # nothing else to do
+        if current_svms == self._svms:
+            self._svm_refresh_latency = time.monotonic() - start
+            LOG.debug("_refresh_svm_libraries: SVMs unchanged")
+            return
+
         LOG.debug(
             "_refresh_svm_libraries: existing=%s current=%s",
-            existing_libs,
+            self._svms,
             current_svms,
         )
-        # Remove libraries for SVMs that no longer exist
-        stale_svms = existing_libs - current_svms
+        # Remove libraries for SVMs that no longer exist or were re-created
+        # with the same name
+        stale_svms = [
+            svm_name
+            for svm_name, svm_uuid in self._svms.items()
+            if current_svms.get(svm_name) != svm_uuid
+        ]
         for svm_name in stale_svms:
             LOG.info("Removing stale NVMe library for SVM: %s", svm_name)
-            svm_lib = self._libraries[svm_name]
-            self._remove_svm_lib(svm_lib)
-            del self._libraries[svm_name]
+            self._forget_svm(svm_name)
 
-        # Add new SVM libraries
-        new_svms = current_svms - existing_libs
+        # New SVMs get their library on first use
+        new_svms = [svm_name for svm_name in current_svms if svm_name not in self._svms]
         for svm_name in new_svms:
-            LOG.info("Creating NVMe library for new SVM: %s", svm_name)
-            lib = self._create_svm_lib(svm_name)
-            try:
-                # Call do_setup to initialize the library
-                lib.do_setup(ctxt)
-                lib.check_for_setup_error()
-                LOG.info("Library creation success for SVM: %s", svm_name)
-                self._libraries[svm_name] = lib
-            except Exception:
-                LOG.exception(
-                    "Failed to create library for SVM %s",
-                    svm_name,
-                )
-                self._remove_svm_lib(lib)
-        LOG.info("Final libraries loaded: %s", list(self._libraries.keys()))
+            LOG.info("Found new SVM: %s", svm_name)
+            self._svms[svm_name] = current_svms[svm_name]
+            self._svm_misses.pop(svm_name, None)
+
+        self._svm_refresh_latency = time.monotonic() - start
+        LOG.info(
+            "Refreshed SVMs in %.2fs: added=%s removed=%s known=%s",
+            self._svm_refresh_latency,
+            sorted(new_svms),
+            sorted(stale_svms),
+            len(self._svms),
+        )
+
+    def _discover_svm(self, svm_name: str) -> bool:
+        """Look up a single SVM not known yet, returns if it was found."""
+        missed = self._svm_misses.get(svm_name)
+        if missed is not None and time.monotonic() - missed < _SVM_MISS_TTL:
+            return False
+
+        start = time.monotonic()
+        found = self._get_svms(svm_name)
+        if svm_name not in found:
+            self._svm_misses[svm_name] = time.monotonic()
+            return False
+
+        self._svm_misses.pop(svm_name, None)
+        self._svms[svm_name] = found[svm_name]
+        LOG.info(
+            "Discovered SVM %s on demand in %.2fs",
+            svm_name,
+            time.monotonic() - start,
+        )
+        return True
 
     def check_for_setup_error(self):
-        """Check for setup errors."""
+        """Check for setup errors of the libraries created so far."""
         svm_to_init = set(self._libraries.keys())
         LOG.debug(
             "check_for_setup_error: verifying %d SVM(s): %s",
@@ -313,6 +532,7 @@ class NetappCinderDynamicDriver(volume_driver.BaseVD):
                 LOG.exception("Failed to initialize SVM %s, skipping", svm_name)
                 self._remove_svm_lib(svm_lib)
                 del self._libraries[svm_name]
+                self._svms.pop(svm_name, None)
         LOG.debug(
             "check_for_setup_error complete: active SVMs=%s",
             list(self._libraries.keys()),
@@ -329,8 +549,17 @@ class NetappCinderDynamicDriver(volume_driver.BaseVD):
             else:
                 LOG.info("SVM discovery timer disabled (interval=%s)", interval)
 
-    def _svmify_pool(self, pool: dict, svm_name: str, **kwargs) -> dict:
-        """Applies SVM info to a pool so we can target it and track it."""
+    @cached_property
+    def _pool_name_regex(self):
+        return na_utils.get_pool_name_filter_regex(self.configuration)
+
+    def _pool_identity(self, svm_name: str, pool_name: str) -> dict:
+        """The SVM specific fields of a pool, computed once per pool."""
+        key = (svm_name, pool_name)
+        identity = self._pool_identities.get(key)
+        if identity is not None:
+            return identity
+
         # We need to prefix our pool_name, which is 1:1 with the FlexVol
         # name on the SVM, with the SVM name. This is because the name of
         # a FlexVol is unique within 1 SVM. Two different SVMs can have
@@ -338,15 +567,14 @@ class NetappCinderDynamicDriver(volume_driver.BaseVD):
         # using # as our separator because it has special meaning to
         # cinder. See the cinder/volume/volume_utils.py extract_host()
         # function for details.
-        pool_name = pool["pool_name"]
-        pool["pool_name"] = f"{svm_name}{_SVM_NAME_DELIM}{pool_name}"
-        pool["netapp_vserver"] = svm_name
         prefix = self.configuration.safe_get("netapp_vserver_prefix")
-        project_uuid = svm_name.removeprefix(prefix)
-        pool["netapp_project_id"] = project_uuid
+        identity = {
+            "pool_name": f"{svm_name}{_SVM_NAME_DELIM}{pool_name}",
+            "netapp_vserver": svm_name,
+            "netapp_project_id": svm_name.removeprefix(prefix),
+        }
 
-        pool_regex = na_utils.get_pool_name_filter_regex(self.configuration)
-        match = pool_regex.match(pool_name)
+        match = self._pool_name_regex.match(pool_name)
         netapp_volume_type_id = ""
         if match:
             raw_id = match.group(1)
@@ -365,7 +593,13 @@ class NetappCinderDynamicDriver(volume_driver.BaseVD):
                 " netapp_volume_type_id left empty",
                 pool_name,
             )
-        pool["netapp_volume_type_id"] = netapp_volume_type_id
+        identity["netapp_volume_type_id"] = netapp_volume_type_id
+        self._pool_identities[key] = identity
+        return identity
+
+    def _svmify_pool(self, pool: dict, svm_name: str, **kwargs) -> dict:
+        """Applies SVM info to a pool so we can target it and track it."""
+        pool.update(self._pool_identity(svm_name, pool["pool_name"]))
         pool.update(kwargs)
         return pool
 
@@ -395,14 +629,18 @@ class NetappCinderDynamicDriver(volume_driver.BaseVD):
             flexvol_name,
         )
 
-        try:
-            lib = self._libraries[svm_name]
-        except KeyError:
+        if svm_name not in self._svms and not self._discover_svm(svm_name):
             LOG.error(
-                "_volume_to_library: SVM=%s not found in active libraries=%s",
+                "_volume_to_library: SVM=%s not found in known SVMs=%s",
                 svm_name,
-                list(self._libraries.keys()),
+                sorted(self._svms),
             )
+            raise exception.DriverNotInitialized()
+
+        try:
+            lib = self._get_svm_lib(svm_name)
+        except Exception:
+            LOG.exception("_volume_to_library: failed to set up SVM=%s", svm_name)
             raise exception.DriverNotInitialized() from None
 
         if lib.vserver != svm_name:
@@ -497,26 +735,142 @@ class NetappCinderDynamicDriver(volume_driver.BaseVD):
         data["total_capacity_gb"] = "unknown"
         data["free_capacity_gb"] = "unknown"
         # ensure we filter our pools by SVM
-        data["filter_function"] = self.get_filter_function()
-        data["goodness_function"] = self.get_goodness_function()
+        data["filter_function"] = self._stats_filter_function
+        data["goodness_function"] = self._stats_goodness_function
         data["pools"] = []
         return data
 
+    @cached_property
+    def _stats_filter_function(self):
+        # only depends on configuration so build it once
+        return self.get_filter_function()
+
+    @cached_property
+    def _stats_goodness_function(self):
+        return self.get_goodness_function()
+
+    @cached_property
+    def _stats_executor(self) -> futures.ThreadPoolExecutor:
+        return futures.ThreadPoolExecutor(
+            max_workers=self.configuration.safe_get("netapp_svm_stats_workers"),
+            thread_name_prefix="svm-stats",
+        )
+
+    def _collect_svm_stats(self, svm_name: str, filter_function: str) -> None:
+        """Collect and cache the pool stats of one SVM."""
+        start = time.monotonic()
+        self._svm_stats_started[svm_name] = start
+        svm_lib = self._get_svm_lib(svm_name)
+        ret = svm_lib.get_volume_stats(True)
+        pools = [
+            self._svmify_pool(pool, svm_name, filter_function=filter_function)
+            for pool in ret["pools"]
+        ]
+        with self._svm_stats_lock:
+            if svm_name not in self._svms:
+                LOG.debug("Dropping volume stats of removed SVM %s", svm_name)
+                return
+            # only re-measure the pools of SVMs whose stats changed and keep
+            # the previous objects otherwise
+            if pools != self._svm_pools.get(svm_name):
+                self._svm_pools[svm_name] = pools
+                self._svm_pools_size[svm_name] = len(jsonutils.dumps(pools))
+            self._svm_stats_latency[svm_name] = time.monotonic() - start
+        LOG.debug(
+            "Collected volume stats for SVM %s in %.2fs",
+            svm_name,
+            time.monotonic() - start,
+        )
+
+    def _refresh_svm_stats(self, filter_function: str) -> None:
+        """Collect pool stats of all SVMs using a bounded worker pool.
+
+        This also sets up the libraries of SVMs not used yet, in parallel.
+        SVMs whose collection does not finish within the configured timeout
+        of starting, or whose previous collection is still running, keep
+        their last good pool stats.
+        """
+        pending = {}
+        for svm_name in sorted(self._svms):
+            in_flight = self._svm_stats_futures.get(svm_name)
+            if in_flight is not None and not in_flight.done():
+                LOG.warning(
+                    "Volume stats for SVM %s still being collected, "
+                    "reusing last known pool stats",
+                    svm_name,
+                )
+                continue
+            LOG.info("Get Volume Stats for SVM %s", svm_name)
+            self._svm_stats_started.pop(svm_name, None)
+            future = self._stats_executor.submit(
+                self._collect_svm_stats, svm_name, filter_function
+            )
+            self._svm_stats_futures[svm_name] = future
+            pending[future] = svm_name
+
+        timeout = self.configuration.safe_get("netapp_svm_stats_timeout")
+        workers = self.configuration.safe_get("netapp_svm_stats_workers")
+        while pending:
+            now = time.monotonic()
+            deadlines = {}
+            for future, svm_name in list(pending.items()):
+                started = self._svm_stats_started.get(svm_name)
+                if future.done():
+                    del pending[future]
+                    if future.exception() is not None:
+                        LOG.error(
+                            "Failed to get volume stats for SVM %s, "
+                            "reusing last known pool stats",
+                            svm_name,
+                            exc_info=future.exception(),
+                        )
+                elif started is not None and now - started >= timeout:
+                    del pending[future]
+                    LOG.warning(
+                        "Volume stats for SVM %s not collected within %ss, "
+                        "reusing last known pool stats",
+                        svm_name,
+                        timeout,
+                    )
+                elif started is not None:
+                    deadlines[future] = started + timeout
+            # collections we gave up on still hold their workers; once they
+            # hold them all nothing still queued can start
+            stuck = sum(
+                1
+                for future in self._svm_stats_futures.values()
+                if future not in pending and future.running()
+            )
+            if pending and stuck >= workers:
+                for svm_name in pending.values():
+                    LOG.warning(
+                        "Volume stats for SVM %s not started, all workers are "
+                        "busy, reusing last known pool stats",
+                        svm_name,
+                    )
+                break
+            if pending:
+                wait = min(deadlines.values(), default=now + timeout) - now
+                futures.wait(pending, timeout=wait, return_when=futures.FIRST_COMPLETED)
+
     def get_volume_stats(self, refresh=False):
         """Get volume stats."""
         if refresh:
             data = self._empty_volume_stats()
-            for svm_name, svm_lib in self._libraries.items():
-                LOG.info("Get Volume Stats for SVM %s", svm_name)
-                ret = svm_lib.get_volume_stats(refresh)
-                data["pools"].extend(
-                    [
-                        self._svmify_pool(
-                            pool, svm_name, filter_function=data["filter_function"]
-                        )
-                        for pool in ret["pools"]
-                    ]
-                )
+            self._refresh_svm_stats(data["filter_function"])
+            payload_size = 0
+            # the scheduler drops every pool missing from a report, so the
+            # full pool list has to be sent each time even though only the
+            # pools of changed SVMs are rebuilt and re-measured
+            for svm_name in sorted(self._svms):
+                data["pools"].extend(self._svm_pools.get(svm_name, []))
+                payload_size += self._svm_pools_size.get(svm_name, 0)
+            self._stats_payload_size = payload_size
+            LOG.debug(
+                "Volume stats have %d pools, about %d bytes",
+                len(data["pools"]),
+                payload_size,
+            )
             self._stats = data
         return self._stats
 
@@ -1,14 +1,18 @@
 """Test NetApp dynamic driver implementation."""
 
+import threading
+import time
 import uuid
 from unittest import mock
 
 from cinder import context
 from cinder import db
+from cinder import exception
 from cinder.tests.unit import fake_volume
 from cinder.tests.unit import test
 from cinder.tests.unit import utils as test_utils
 from cinder.tests.unit.volume.drivers.netapp import fakes as na_fakes
+from cinder.volume.drivers.netapp.dataontap.client import api as netapp_api
 from cinder.volume.drivers.netapp.dataontap.nvme_library import NetAppNVMeStorageLibrary
 from cinder.volume.drivers.netapp.dataontap.utils import loopingcalls
 
@@ -45,16 +49,23 @@ class NetappDynamicDriverTestCase(test.TestCase):
         }
         self.driver = dynamic_netapp_driver.NetappCinderDynamicDriver(**kwargs)
         self.override_config("netapp_pool_name_search_pattern", r"vol_(.+)")
-        self.driver._cluster = mock.Mock()
-        self.driver._get_svms = mock.Mock(return_value=self.svms)
+        self.driver.cluster = mock.MagicMock()
+        self.driver._get_svms = mock.Mock(
+            return_value={svm_name: str(uuid.uuid4()) for svm_name in self.svms}
+        )
 
-        with mock.patch(
-            "cinder_understack.dynamic_netapp_driver.RestNaServer"
-        ) as mock_rest:
+        with (
+            mock.patch(
+                "cinder_understack.dynamic_netapp_driver.RestNaServer"
+            ) as mock_rest,
+            mock.patch("cinder_understack.dynamic_netapp_driver.SvmRestClient"),
+            mock.patch.object(NetAppNVMeStorageLibrary, "check_for_setup_error"),
+        ):
             self._setup_rest_mock(mock_rest)
             self.driver.do_setup(context.get_admin_context())
+            # libraries are created lazily, create them up front for the tests
             for svm_name in self.svms:
-                self.driver._libraries[svm_name].vserver = svm_name
+                self.driver._get_svm_lib(svm_name).vserver = svm_name
 
     def get_config_base(self):
         """Get base configuration for testing."""
@@ -93,6 +104,7 @@ class NetappDynamicDriverTestCase(test.TestCase):
         """Test that do_setup delegates to library."""
         self.driver.do_setup(self.ctxt)
         old_do_setup.assert_not_called()
+        self.assertEqual(self.svms, list(self.driver._svms))
         self.assertEqual(self.svms, list(self.driver._libraries.keys()))
 
     @mock.patch.object(NetAppNVMeStorageLibrary, "create_volume")
@@ -162,14 +174,19 @@ class NetappDynamicDriverTestCase(test.TestCase):
         # Existing SVMs (before refresh called)
         expected_svm = f"os-{self.project_id}"
 
+        old_lib = _create_mock_svm_lib("os-old-svm")
         self.driver._libraries = {
-            "os-old-svm": _create_mock_svm_lib("os-old-svm"),
+            "os-old-svm": old_lib,
             expected_svm: _create_mock_svm_lib(expected_svm),
         }
+        self.driver._svms = {"os-old-svm": "uuid-old", expected_svm: "uuid-keep"}
 
         self.driver._get_svms = mock_get_svms
         # Returned by _get_svms (after refresh)
-        mock_get_svms.return_value = [expected_svm, "os-new-svm"]
+        mock_get_svms.return_value = {
+            expected_svm: "uuid-keep",
+            "os-new-svm": "uuid-new",
+        }
 
         # make the created lib look like the real thing
         mock_lib_instance = _create_mock_svm_lib("os-new-svm")
@@ -182,39 +199,119 @@ class NetappDynamicDriverTestCase(test.TestCase):
 
         # Check stale SVM was removed
         self.assertNotIn("os-old-svm", self.driver._libraries)
+        self.assertNotIn("os-old-svm", self.driver._svms)
 
         # Check SVM was retained
         self.assertIn(expected_svm, self.driver._libraries)
 
-        # Check new SVM was added
-        self.assertIn("os-new-svm", self.driver._libraries)
+        # Check new SVM was added but its library is not created yet
+        self.assertIn("os-new-svm", self.driver._svms)
+        self.assertNotIn("os-new-svm", self.driver._libraries)
+        mock_create_svm_lib.assert_not_called()
 
-        # New SVM lib should've been created and setup
+        # New SVM lib is created and setup on first use
+        self.assertIs(
+            mock_lib_instance, self.driver._get_svm_lib("os-new-svm", self.ctxt)
+        )
         mock_create_svm_lib.assert_called_once_with("os-new-svm")
         mock_lib_instance.do_setup.assert_called_once_with(self.ctxt)
         mock_lib_instance.check_for_setup_error.assert_called_once()
+        self.assertIn("os-new-svm", self.driver._libraries)
 
     @mock.patch.object(
         dynamic_netapp_driver.NetappCinderDynamicDriver, "_create_svm_lib"
     )
-    @mock.patch.object(dynamic_netapp_driver.NetappCinderDynamicDriver, "_get_svms")
-    def test_refresh_svm_libraries_handles_lib_creation_failure(
-        self, mock_get_svms, mock_create_svm_lib
-    ):
-        """Ensure that failure in lib creation is caught and logged, not raised."""
+    def test_get_svm_lib_handles_lib_creation_failure(self, mock_create_svm_lib):
+        """Ensure that failure in lib creation is raised and not cached."""
         test_svm_name = "os-new-failing_svm"
-        mock_get_svms.return_value = [test_svm_name]
         mock_svm_lib = _create_mock_svm_lib(test_svm_name)
-        mock_svm_lib.check_for_setup_error.side_effect = Exception("Simulated failure")
+        mock_svm_lib.check_for_setup_error.side_effect = (
+            exception.VolumeBackendAPIException("Simulated failure")
+        )
         mock_create_svm_lib.return_value = mock_svm_lib
 
         self.driver._libraries = {}
+        self.driver._svms = {test_svm_name: "uuid-fail"}
 
-        # Should not raise exception
-        self.driver._actual_refresh_svm_libraries(mock.Mock())
+        self.assertRaises(  # noqa: PT027
+            exception.VolumeBackendAPIException,
+            self.driver._get_svm_lib,
+            test_svm_name,
+        )
 
         # The failing SVM should not be added to self._libraries
-        self.assertNotIn("os-new-failing-svm", self.driver._libraries)
+        self.assertNotIn(test_svm_name, self.driver._libraries)
+
+    def test_volume_to_library_unknown_svm(self):
+        """A volume on an SVM that was never discovered is rejected."""
+        self.driver._svms = {}
+        self.driver._get_svms = mock.Mock(return_value={})
+        test_vol = self._get_fake_volume(None)
+
+        self.assertRaises(  # noqa: PT027
+            exception.DriverNotInitialized, self.driver.create_volume, test_vol
+        )
+
+    def test_refresh_svm_libraries_unchanged(self):
+        """An unchanged SVM listing leaves the libraries alone."""
+        libraries = dict(self.driver._libraries)
+        self.driver._actual_refresh_svm_libraries(self.ctxt)
+
+        self.assertEqual(libraries, self.driver._libraries)
+        self.assertIsNotNone(self.driver._svm_refresh_latency)
+
+    def test_refresh_svm_libraries_recreated_svm(self):
+        """An SVM re-created with the same name gets a new library."""
+        svm_name = self.svms[0]
+        self.driver._get_svms = mock.Mock(return_value={svm_name: "uuid-recreated"})
+
+        self.driver._actual_refresh_svm_libraries(self.ctxt)
+
+        self.assertNotIn(svm_name, self.driver._libraries)
+        self.assertEqual({svm_name: "uuid-recreated"}, self.driver._svms)
+
+    def test_volume_to_library_discovers_new_svm(self):
+        """A volume on an SVM created since the last refresh is served."""
+        svm_name = self.svms[0]
+        lib = self.driver._libraries[svm_name]
+        self.driver._svms = {}
+        self.driver._get_svms = mock.Mock(return_value={svm_name: "uuid"})
+        test_vol = self._get_fake_volume(None)
+
+        with self.driver._volume_to_library(test_vol) as found:
+            self.assertIs(lib, found)
+        self.driver._get_svms.assert_called_once_with(svm_name)
+        self.assertIn(svm_name, self.driver._svms)
+
+    def test_volume_to_library_unknown_svm_lookup_is_throttled(self):
+        """A missing SVM is not looked up again on every request."""
+        self.driver._svms = {}
+        self.driver._get_svms = mock.Mock(return_value={})
+        test_vol = self._get_fake_volume(None)
+
+        for _ in range(2):
+            self.assertRaises(  # noqa: PT027
+                exception.DriverNotInitialized, self.driver.create_volume, test_vol
+            )
+        self.driver._get_svms.assert_called_once()
+
+    def test_svm_rest_client_shares_cluster_connection(self):
+        """SVM clients are scoped to the SVM but share the HTTP session."""
+        connection = netapp_api.RestNaServer(host="127.0.0.1", username="u")
+        cluster = mock.MagicMock()
+        cluster.connection = dynamic_netapp_driver.PooledRestNaServer.from_connection(
+            connection
+        )
+
+        client_a = dynamic_netapp_driver.SvmRestClient(cluster, "os-a")
+        client_b = dynamic_netapp_driver.SvmRestClient(cluster, "os-b")
+
+        self.assertEqual("os-a", client_a.connection.get_vserver())
+        self.assertEqual("os-b", client_b.connection.get_vserver())
+        self.assertIs(
+            client_a.connection._get_shared_session(),
+            client_b.connection._get_shared_session(),
+        )
 
     # --- _svmify_pool tests ---
 
@@ -341,3 +438,140 @@ class NetappDynamicDriverTestCase(test.TestCase):
         test_vol = self._get_fake_volume(vol_type.id)
         self.driver.delete_volume(test_vol)
         mock_delete_volume.assert_called_once_with(test_vol)
+
+    # --- get_volume_stats tests ---
+
+    def _stats_libs(self, **pools_by_svm):
+        libs = {}
+        for svm_name, pool_names in pools_by_svm.items():
+            lib = _create_mock_svm_lib(svm_name)
+            # like the real library every refresh returns new pool dicts
+            lib.get_volume_stats.side_effect = lambda refresh, names=pool_names: {
+                "pools": [self._make_pool(name) for name in names]
+            }
+            libs[svm_name] = lib
+        self.driver._svms = {svm_name: svm_name for svm_name in libs}
+        return libs
+
+    def test_get_volume_stats_collects_all_svms(self):
+        """Pools of every SVM are svmified and aggregated."""
+        self.driver._libraries = self._stats_libs(
+            **{"os-a": ["vol_a"], "os-b": ["vol_b1", "vol_b2"]}
+        )
+
+        stats = self.driver.get_volume_stats(refresh=True)
+
+        self.assertEqual(
+            ["os-a+vol_a", "os-b+vol_b1", "os-b+vol_b2"],
+            sorted(pool["pool_name"] for pool in stats["pools"]),
+        )
+        self.assertEqual({"os-a", "os-b"}, set(self.driver._svm_stats_latency))
+
+    def test_get_volume_stats_reuses_last_stats_on_failure(self):
+        """An SVM failing to report keeps its previous pool stats."""
+        self.driver._libraries = self._stats_libs(**{"os-a": ["vol_a"]})
+        self.driver.get_volume_stats(refresh=True)
+
+        self.driver._libraries["os-a"].get_volume_stats.side_effect = Exception(
+            "Simulated failure"
+        )
+        stats = self.driver.get_volume_stats(refresh=True)
+
+        self.assertEqual(["os-a+vol_a"], [pool["pool_name"] for pool in stats["pools"]])
+
+    def test_get_volume_stats_reuses_last_stats_on_timeout(self):
+        """A slow SVM keeps its previous pool stats and is not resubmitted."""
+        self.driver._libraries = self._stats_libs(**{"os-a": ["vol_a"]})
+        self.driver.get_volume_stats(refresh=True)
+
+        slow = mock.Mock()
+        slow.done.return_value = False
+        self.driver._svm_stats_futures["os-a"] = slow
+        self.driver._libraries["os-a"].get_volume_stats.reset_mock()
+
+        stats = self.driver.get_volume_stats(refresh=True)
+
+        self.driver._libraries["os-a"].get_volume_stats.assert_not_called()
+        self.assertEqual(["os-a+vol_a"], [pool["pool_name"] for pool in stats["pools"]])
+
+    def test_get_volume_stats_timeout_is_per_svm(self):
+        """An SVM queued behind a slow one gets its own full timeout."""
+        self.override_config("netapp_svm_stats_workers", 1)
+        self.override_config("netapp_svm_stats_timeout", 1)
+        self.driver._libraries = self._stats_libs(
+            **{"os-a": ["vol_a"], "os-b": ["vol_b"]}
+        )
+        for lib in self.driver._libraries.values():
+            lib.get_volume_stats.side_effect = lambda refresh: (
+                time.sleep(0.6) or {"pools": [self._make_pool("vol_x")]}
+            )
+
+        stats = self.driver.get_volume_stats(refresh=True)
+
+        self.assertEqual(
+            ["os-a+vol_x", "os-b+vol_x"],
+            sorted(pool["pool_name"] for pool in stats["pools"]),
+        )
+
+    def test_get_volume_stats_gives_up_when_workers_are_stuck(self):
+        """Queued SVMs are skipped once timed out SVMs hold every worker."""
+        self.override_config("netapp_svm_stats_workers", 1)
+        self.override_config("netapp_svm_stats_timeout", 1)
+        self.driver._libraries = self._stats_libs(
+            **{"os-a": ["vol_a"], "os-b": ["vol_b"]}
+        )
+        release = threading.Event()
+        self.addCleanup(release.set)
+        self.driver._libraries["os-a"].get_volume_stats.side_effect = lambda refresh: (
+            release.wait() and {"pools": []}
+        )
+
+        stats = self.driver.get_volume_stats(refresh=True)
+
+        self.assertEqual([], stats["pools"])
+        self.driver._libraries["os-b"].get_volume_stats.assert_not_called()
+
+    def test_collect_svm_stats_drops_removed_svm(self):
+        """A collection finishing after its SVM was removed is not stored."""
+        self.driver._libraries = self._stats_libs(**{"os-a": ["vol_a"]})
+
+        def remove_svm(refresh):
+            self.driver._forget_svm("os-a")
+            return {"pools": [self._make_pool("vol_a")]}
+
+        self.driver._libraries["os-a"].get_volume_stats.side_effect = remove_svm
+        self.driver._collect_svm_stats("os-a", "")
+
+        self.assertNotIn("os-a", self.driver._svm_pools)
+        self.assertNotIn("os-a", self.driver._svm_stats_latency)
+
+    def test_svmify_pool_identity_is_cached(self):
+        """The SVM specific pool fields are only computed once per pool."""
+        svm_name = f"os-{self.project_id}"
+
+        with mock.patch.object(dynamic_netapp_driver.LOG, "warning") as mock_warn:
+            first = self.driver._svmify_pool(self._make_pool("svm_root"), svm_name)
+            second = self.driver._svmify_pool(self._make_pool("svm_root"), svm_name)
+
+        self.assertEqual(first, second)
+        mock_warn.assert_called_once()
+
+    def test_get_volume_stats_payload_size(self):
+        """The payload size only changes when an SVM's pools change."""
+        self.driver._libraries = self._stats_libs(**{"os-a": ["vol_a"]})
+        self.driver.get_volume_stats(refresh=True)
+        size = self.driver._stats_payload_size
+        pools = self.driver._svm_pools["os-a"]
+        self.assertGreater(size, 0)
+
+        # same stats again keep the previous pool objects
+        self.driver.get_volume_stats(refresh=True)
+        self.assertIs(pools, self.driver._svm_pools["os-a"])
+        self.assertEqual(size, self.driver._stats_payload_size)
+
+        self.driver._libraries["os-a"].get_volume_stats.side_effect = None
+        self.driver._libraries["os-a"].get_volume_stats.return_value = {
+            "pools": [self._make_pool("vol_a"), self._make_pool("vol_b")]
+        }
+        self.driver.get_volume_stats(refresh=True)
+        self.assertGreater(self.driver._stats_payload_size, size)
@@ -1,15 +1,20 @@
+import json
 import os
 import sys
+from pathlib import Path
 
+import structlog
 import typer
-from diffsync.diff import Diff
 from rich import print
 from rich.console import Console
 from rich.table import Table
 
+from diff_nautobot_understack.diff_run import DiffRun
+from diff_nautobot_understack.network.adapters.snapshot import NetworkSnapshot
 from diff_nautobot_understack.network.main import (
     openstack_network_diff_from_ucvni_network,
 )
+from diff_nautobot_understack.project.adapters.snapshot import ProjectSnapshot
 from diff_nautobot_understack.project.main import (
     openstack_all_projects_diff_from_nautobot_tenant,
 )
@@ -17,9 +22,14 @@ from diff_nautobot_understack.project.main import (
     openstack_project_diff_from_nautobot_tenant,
 )
 from diff_nautobot_understack.settings import app_settings as settings
+from diff_nautobot_understack.snapshot import save_snapshot
 
 required_env_vars = ["NAUTOBOT_TOKEN", "NAUTOBOT_URL", "OS_CLOUD"]
 
+# diffsync logs through structlog, which prints to stdout by default; keep
+# stdout for the diff itself so --format json output stays parseable.
+structlog.configure(logger_factory=structlog.PrintLoggerFactory(sys.stderr))
+
 
 app = typer.Typer(
     name="diff",
@@ -31,14 +41,80 @@ diff_outputs = {
     "network": {"title": "Network Diff", "id_column_name": "Network ID"},
 }
 
+source_snapshot_option = typer.Option(
+    None,
+    "--source-snapshot",
+    help="Replay the OpenStack side from a snapshot instead of querying it",
+)
+destination_snapshot_option = typer.Option(
+    None,
+    "--destination-snapshot",
+    help="Replay the Nautobot side from a snapshot instead of querying it",
+)
+save_snapshots_option = typer.Option(
+    None,
+    "--save-snapshots",
+    help="Directory to save both loaded sides to, for replaying later",
+)
+
+
+def load_snapshots(snapshot_class, source_snapshot, destination_snapshot):
+    """Snapshot adapters for the sides given; live sides need credentials."""
+    if source_snapshot is None or destination_snapshot is None:
+        check_env_vars(required_env_vars)
+    try:
+        return (
+            snapshot_class(source_snapshot) if source_snapshot else None,
+            snapshot_class(destination_snapshot) if destination_snapshot else None,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def save_snapshots(diff_run: DiffRun, diff_output: str, directory: Path | None):
+    if directory is None:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    for side, adapter in (
+        ("source", diff_run.source),
+        ("destination", diff_run.destination),
+    ):
+        path = directory / f"{diff_output}-{side}-{adapter.type.lower()}.jsonl.gz"
+        count = save_snapshot(adapter, path)
+        print(f"Saved {count} {adapter.type} records to {path}", file=sys.stderr)
+
 
 def display_output(
-    diff_result: Diff, diff_output: str, output_format: str | None = None
+    diff_run: DiffRun, diff_output: str, output_format: str | None = None
 ):
-    print(diff_result.summary())
+    diff_result = diff_run.diff
     __output_format = (
         output_format if output_format is not None else settings.output_format
     )
+    if __output_format == "json":
+        # A single plain JSON document, so automation can parse stdout;
+        # rich's pretty-printing is both slow and not valid JSON.
+        json.dump(
+            {
+                "summary": diff_result.summary(),
+                "diff": diff_result.dict(),
+                "timings": diff_run.timings,
+            },
+            sys.stdout,
+            indent=2,
+            default=str,
+        )
+        sys.stdout.write("\n")
+        return
+
+    print(diff_result.summary())
+    print(
+        "Timings: "
+        + ", ".join(
+            f"{name} {seconds:.2f}s" for name, seconds in diff_run.timings.items()
+        )
+    )
     if __output_format == "table":
         diff_output_props = diff_outputs.get(diff_output)
         tabular_output(
@@ -72,13 +148,22 @@ def tabular_output(diffs, title, id_column_name):
 def projects(
     debug: bool = typer.Option(False, "--debug", "-v", help="Enable debug mode"),
     output_format: str = typer.Option(
-        "json", "--format", help="Available formats json, table"
+        "json", "--format", help="Available formats: json, table, human"
     ),
+    source_snapshot: Path | None = source_snapshot_option,
+    destination_snapshot: Path | None = destination_snapshot_option,
+    save_snapshot_dir: Path | None = save_snapshots_option,
 ):
     """OpenStack projects ⟹ Nautobot tenants"""
     settings.debug = debug
-    diff_result = openstack_all_projects_diff_from_nautobot_tenant()
-    display_output(diff_result, "project", output_format)
+    source, destination = load_snapshots(
+        ProjectSnapshot, source_snapshot, destination_snapshot
+    )
+    diff_run = openstack_all_projects_diff_from_nautobot_tenant(
+        source=source, destination=destination
+    )
+    save_snapshots(diff_run, "project", save_snapshot_dir)
+    display_output(diff_run, "project", output_format)
 
 
 @app.command()
@@ -86,13 +171,22 @@ def project(
     name: str,
     debug: bool = typer.Option(False, "--debug", "-v", help="Enable debug mode"),
     output_format: str = typer.Option(
-        "json", "--format", help="Available formats json, table"
+        "json", "--format", help="Available formats: json, table, human"
     ),
+    source_snapshot: Path | None = source_snapshot_option,
+    destination_snapshot: Path | None = destination_snapshot_option,
+    save_snapshot_dir: Path | None = save_snapshots_option,
 ):
     """OpenStack projects ⟹ Nautobot tenants"""
     settings.debug = debug
-    diff_result = openstack_project_diff_from_nautobot_tenant(os_project=name)
-    display_output(diff_result, "project", output_format)
+    source, destination = load_snapshots(
+        ProjectSnapshot, source_snapshot, destination_snapshot
+    )
+    diff_run = openstack_project_diff_from_nautobot_tenant(
+        os_project=name, source=source, destination=destination
+    )
+    save_snapshots(diff_run, "project", save_snapshot_dir)
+    display_output(diff_run, "project", output_format)
 
 
 @app.command()
@@ -101,21 +195,31 @@ def network(
     output_format: str = typer.Option(
         "json", "--format", help="Available formats: json, table, human"
     ),
+    source_snapshot: Path | None = source_snapshot_option,
+    destination_snapshot: Path | None = destination_snapshot_option,
+    save_snapshot_dir: Path | None = save_snapshots_option,
 ):
     """OpenStack networks ⟹ Nautobot UCVNIs"""
     settings.debug = debug
-    diff_result = openstack_network_diff_from_ucvni_network()
-    display_output(diff_result, "network", output_format)
+    source, destination = load_snapshots(
+        NetworkSnapshot, source_snapshot, destination_snapshot
+    )
+    diff_run = openstack_network_diff_from_ucvni_network(
+        source=source, destination=destination
+    )
+    save_snapshots(diff_run, "network", save_snapshot_dir)
+    display_output(diff_run, "network", output_format)
 
 
 def check_env_vars(required_vars):
     missing_vars = [var for var in required_vars if var not in os.environ]
 
+    # Reported on stderr, to keep stdout clean for --format json.
     if missing_vars:
-        print(f"Error: Missing environment variables: {', '.join(missing_vars)}")
+        print(
+            f"Error: Missing environment variables: {', '.join(missing_vars)}",
+            file=sys.stderr,
+        )
         sys.exit(1)
     else:
-        print("All required environment variables are set.")
-
-
-check_env_vars(required_env_vars)
+        print("All required environment variables are set.", file=sys.stderr)
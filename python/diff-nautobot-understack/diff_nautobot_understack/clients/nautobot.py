@@ -1,52 +1,97 @@
-import inspect
 import logging
+import math
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
 from urllib.parse import urljoin
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from diff_nautobot_understack.settings import app_settings as settings
 
 
 class API:
     CALLER_FRAME = 1
+    REQUEST_TIMEOUT = 10
 
     def __init__(self):
         self.base_url = settings.nautobot_url
         self.s = requests.Session()
         self.token = settings.nautobot_token
         self.s.headers.update({"Authorization": f"Token {self.token}"})
+        # One pooled connection per concurrent page fetch.
+        adapter = HTTPAdapter(pool_maxsize=settings.nautobot_page_workers)
+        self.s.mount("http://", adapter)
+        self.s.mount("https://", adapter)
 
     def make_api_request(
         self, url: str, payload: dict | None = None, paginated: bool = False
     ) -> dict | list:
-        endpoint_url = urljoin(self.base_url, url)
-        caller_function = inspect.stack()[self.CALLER_FRAME].function
+        # Only the caller's function name is logged, so read it off the frame
+        # rather than inspect.stack(), which loads source for the whole stack.
+        caller_function = sys._getframe(self.CALLER_FRAME).f_code.co_name
 
+        if paginated:
+            return [
+                item
+                for page in self._iter_pages(url, payload, caller_function)
+                for item in page
+            ]
+        endpoint_url = urljoin(self.base_url, url)
         logging.debug(
             "%(caller_function)s payload: %(payload)s",
             {"payload": payload, "caller_function": caller_function},
         )
+        resp = self.s.get(endpoint_url, timeout=self.REQUEST_TIMEOUT, json=payload)
+        return self._process_response(resp, caller_function)
 
-        if paginated:
-            return self._fetch_paginated_data(endpoint_url, payload, caller_function)
-        else:
-            resp = self.s.get(endpoint_url, timeout=10, json=payload)
-            return self._process_response(resp, caller_function)
-
-    def _fetch_paginated_data(
-        self, endpoint_url: str, payload: dict | None, caller_function: str
-    ) -> list:
-        response_items = []
-        url = endpoint_url
+    def iter_pages(self, url: str, payload: dict | None = None) -> Iterator[list]:
+        """Yield the results of a paginated endpoint one page at a time.
 
-        while url is not None:
-            resp = self.s.get(url, timeout=10, json=payload)
-            resp_data = self._process_response(resp, caller_function)
+        Pages are yielded in order as soon as each arrives, while later
+        pages are still being fetched, so callers can start loading them.
+        """
+        caller_function = sys._getframe(self.CALLER_FRAME).f_code.co_name
+        return self._iter_pages(url, payload, caller_function)
 
-            response_items.extend(resp_data.get("results", []))
-            url = resp_data.get("next")
-
-        return response_items
+    def _iter_pages(
+        self, url: str, payload: dict | None, caller_function: str
+    ) -> Iterator[list]:
+        endpoint_url = urljoin(self.base_url, url)
+        logging.debug(
+            "%(caller_function)s payload: %(payload)s",
+            {"payload": payload, "caller_function": caller_function},
+        )
+        first_url = _with_query(
+            endpoint_url, limit=settings.nautobot_page_size, keep_existing=True
+        )
+        resp = self.s.get(first_url, timeout=self.REQUEST_TIMEOUT, json=payload)
+        first_page = self._process_response(resp, caller_function)
+        results = first_page.get("results", [])
+        yield results
+
+        if first_page.get("next") is None or not results:
+            return
+        # Every page is addressable by offset once the first response tells
+        # us the total count and the page size the server actually applied,
+        # so the rest are fetched concurrently instead of following `next`.
+        page_size = len(results)
+        page_urls = [
+            _with_query(first_url, offset=page * page_size, limit=page_size)
+            for page in range(1, math.ceil(first_page["count"] / page_size))
+        ]
+
+        def fetch(page_url: str) -> list:
+            resp = self.s.get(page_url, timeout=self.REQUEST_TIMEOUT, json=payload)
+            return self._process_response(resp, caller_function).get("results", [])
+
+        with ThreadPoolExecutor(max_workers=settings.nautobot_page_workers) as pool:
+            yield from pool.map(fetch, page_urls)
 
     def _process_response(self, resp, caller_function: str) -> dict:
         if resp.content:
@@ -68,3 +113,15 @@ class API:
         except Exception as e:
             logging.error(f"HTTP error occurred: {e}")
             raise
+
+
+def _with_query(url: str, keep_existing: bool = False, **params) -> str:
+    """Set query parameters on a URL, leaving any repeated filters intact."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    existing = {key for key, _ in query}
+    if keep_existing:
+        params = {k: v for k, v in params.items() if k not in existing}
+    query = [(k, v) for k, v in query if k not in params]
+    query += [(k, str(v)) for k, v in params.items()]
+    return urlunsplit(parts._replace(query=urlencode(query)))
@@ -0,0 +1,63 @@
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+
+from diffsync import Adapter
+from diffsync.diff import Diff
+from diffsync.enum import DiffSyncFlags
+
+
+@dataclass
+class DiffRun:
+    """A diff, the loaded adapters it compared, and how long it took.
+
+    `timings` is in seconds, keyed by adapter type for each load, plus "diff".
+    """
+
+    diff: Diff
+    source: Adapter
+    destination: Adapter
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+def _timed_load(
+    adapter: Adapter, on_load_error: Callable[[Adapter, Exception], None] | None
+) -> float:
+    start = time.perf_counter()
+    try:
+        adapter.load()
+    except Exception as e:
+        if on_load_error is None:
+            raise
+        on_load_error(adapter, e)
+    return time.perf_counter() - start
+
+
+def load_and_diff(
+    source: Adapter,
+    destination: Adapter,
+    on_load_error: Callable[[Adapter, Exception], None] | None = None,
+) -> DiffRun:
+    """Load both adapters concurrently, then diff destination from source.
+
+    The two sides talk to unrelated services, so neither load waits on the
+    other. A load error is passed to on_load_error, if given, and the diff
+    goes ahead with whatever was loaded; otherwise it is raised.
+    """
+    labels = [source.type, destination.type]
+    if labels[0] == labels[1]:
+        # e.g. two snapshots of the same side taken at different times
+        labels = [f"{labels[0]} (source)", f"{labels[1]} (destination)"]
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        loads = {
+            label: pool.submit(_timed_load, adapter, on_load_error)
+            for label, adapter in zip(labels, (source, destination), strict=True)
+        }
+        timings = {label: load.result() for label, load in loads.items()}
+
+    start = time.perf_counter()
+    diff = destination.diff_from(source, flags=DiffSyncFlags.CONTINUE_ON_FAILURE)
+    timings["diff"] = time.perf_counter() - start
+    return DiffRun(diff=diff, source=source, destination=destination, timings=timings)
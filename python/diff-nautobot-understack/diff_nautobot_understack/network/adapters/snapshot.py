@@ -0,0 +1,10 @@
+from diff_nautobot_understack.network import models
+from diff_nautobot_understack.snapshot import SnapshotAdapter
+
+
+class NetworkSnapshot(SnapshotAdapter):
+    """Networks or UCVNIs replayed from a saved snapshot."""
+
+    network = models.NetworkModel
+
+    top_level = ["network"]
@@ -1,9 +1,16 @@
+import logging
+from collections.abc import Iterator
+
 from diffsync import Adapter
 from pydantic import BaseModel
 
 from diff_nautobot_understack.clients.nautobot import API
 from diff_nautobot_understack.network import models
 
+VLAN_QUERY_CHUNK_SIZE = 50
+
+logger = logging.getLogger(__name__)
+
 
 class UcvniDetails(BaseModel):
     id: str
@@ -29,10 +36,10 @@ class Network(Adapter):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.api_client = API()
+        self._related_names: dict[str, str] = {}
 
     def load(self):
-        ucvni_data: list[UcvniDetails] = self.ucvni_get()
-        for ucvni_item in ucvni_data:
+        for ucvni_item in self.ucvni_get():
             network = self.network(
                 id=ucvni_item.id,
                 name=ucvni_item.name,
@@ -44,62 +51,94 @@ class Network(Adapter):
 
     def ucvni_get(
         self,
-    ) -> list[UcvniDetails]:
-        ucvni_detail_list: list[UcvniDetails] = []
-
-        url = "/api/plugins/undercloud-vni/ucvnis/?include=relationship"
-
-        ucvnis_response = self.api_client.make_api_request(
-            f"{url}/?include=relationships", paginated=True
-        )
+    ) -> Iterator[UcvniDetails]:
+        """All UCVNIs joined with their group, status and VLAN in memory.
+
+        depth=1 inlines each UCVNI's ucvni_group and status objects, and
+        the VLANs a page of UCVNIs references (with their vlan_group
+        inlined) are fetched in a few id-filtered list calls, so the number
+        of requests no longer grows with the number of UCVNIs. UCVNIs are
+        yielded page by page while later pages are still being fetched.
+        """
+        url = "/api/plugins/undercloud-vni/ucvnis/?include=relationships&depth=1"
+        vlans_by_uuid: dict[str, dict] = {}
+
+        for ucvnis_page in self.api_client.iter_pages(url):
+            vlan_uuids_by_ucvni = {
+                ucvni_item.get("id"): [
+                    vlan_uuid_object["id"]
+                    for vlan_uuid_object in ucvni_item.get("relationships", {})
+                    .get("ucvni_vlans", {})
+                    .get("destination")
+                    .get("objects")
+                ]
+                for ucvni_item in ucvnis_page
+            }
+            page_vlan_uuids = {
+                uuid for uuids in vlan_uuids_by_ucvni.values() for uuid in uuids
+            }
+            vlans_by_uuid.update(self.get_vlans(page_vlan_uuids - vlans_by_uuid.keys()))
+
+            for ucvni_item in ucvnis_page:
+                vlan_details = self.get_vlan_details(
+                    vlan_uuids_by_ucvni[ucvni_item.get("id")], vlans_by_uuid
+                )
+                if not vlan_details:
+                    logger.warning(
+                        "Skipping UCVNI %s: no VLAN with a VLAN group",
+                        ucvni_item.get("name"),
+                    )
+                    continue
+                vlan_group, vlan_ids = next(iter(vlan_details.items()))
+                yield UcvniDetails(
+                    id=ucvni_item.get("id"),
+                    name=ucvni_item.get("name"),
+                    ucvni_id=ucvni_item.get("ucvni_id"),
+                    ucvni_group=self._related_name(ucvni_item.get("ucvni_group")),
+                    status=self._related_name(ucvni_item.get("status")).lower(),
+                    vlan_group=vlan_group,
+                    vlan_id=int(vlan_ids[0]),
+                )
 
-        for ucvni_item in ucvnis_response:
-            ucvni_group = self.api_client.make_api_request(
-                url=ucvni_item.get("ucvni_group", {}).get("url")
-            )
-            status = self.api_client.make_api_request(
-                url=ucvni_item.get("status", {}).get("url")
+    def _related_name(self, related: dict) -> str:
+        """Name of a related object, inlined by depth=1 or else fetched once."""
+        if "name" in related:
+            return related["name"]
+        url = related.get("url")
+        if url not in self._related_names:
+            self._related_names[url] = self.api_client.make_api_request(url=url).get(
+                "name"
             )
-            vlan_uuid_objects = (
-                ucvni_item.get("relationships", {})
-                .get("ucvni_vlans", {})
-                .get("destination")
-                .get("objects")
-            )
-            vlan_details = self.get_vlan_details(vlan_uuid_objects)
-            vlan_group, vlan_ids = next(iter(vlan_details.items()))
-            ucvni_details = UcvniDetails(
-                id=ucvni_item.get("id"),
-                name=ucvni_item.get("name"),
-                ucvni_id=ucvni_item.get("ucvni_id"),
-                ucvni_group=ucvni_group.get("name"),
-                status=status.get("name").lower(),
-                vlan_group=vlan_group,
-                vlan_id=int(vlan_ids[0]),
-            )
-            ucvni_detail_list.append(ucvni_details)
-        return ucvni_detail_list
-
-    def get_vlan_details(self, vlan_uuid_objects):
-        vlan_uuids = [vlan_uuid_object["id"] for vlan_uuid_object in vlan_uuid_objects]
+        return self._related_names[url]
+
+    def get_vlans(self, vlan_uuids: set[str]) -> dict[str, dict]:
+        """The given VLANs by id, with their vlan_group inlined."""
+        vlans_by_uuid = {}
+        sorted_uuids = sorted(vlan_uuids)
+        # Chunked to keep the id=... query strings well within URL limits.
+        for start in range(0, len(sorted_uuids), VLAN_QUERY_CHUNK_SIZE):
+            chunk = sorted_uuids[start : start + VLAN_QUERY_CHUNK_SIZE]
+            vlan_uuids_query_params = "&".join(f"id={value}" for value in chunk)
+            vlan_url = f"/api/ipam/vlans/?depth=1&{vlan_uuids_query_params}"
+            for vlan_response in self.api_client.make_api_request(
+                url=vlan_url, paginated=True
+            ):
+                vlans_by_uuid[vlan_response["id"]] = vlan_response
+        return vlans_by_uuid
+
+    def get_vlan_details(
+        self, vlan_uuids: list[str], vlans_by_uuid: dict[str, dict]
+    ) -> dict[str, list[int]]:
         vlan_details = {}
 
-        vlan_uuids_query_params = "&".join(f"id={value}" for value in vlan_uuids)
-        vlan_url = f"/api/ipam/vlans/?{vlan_uuids_query_params}"
-
-        vlans_response = self.api_client.make_api_request(url=vlan_url, paginated=True)
-
-        for vlan_response in vlans_response:
-            vlan_group_url = vlan_response.get("vlan_group", {}).get("url")
-
-            if vlan_group_url:
-                vlan_group_response = self.api_client.make_api_request(
-                    url=vlan_group_url
-                )
-                vlan_group_name = vlan_group_response.get("name")
-                vlan_id = vlan_response.get("vid")
+        for vlan_uuid in vlan_uuids:
+            vlan_response = vlans_by_uuid.get(vlan_uuid)
+            if vlan_response is None or not vlan_response.get("vlan_group"):
+                continue
+            vlan_group_name = self._related_name(vlan_response["vlan_group"])
+            vlan_id = vlan_response.get("vid")
 
-                if vlan_group_name:
-                    vlan_details.setdefault(vlan_group_name, []).append(vlan_id)
+            if vlan_group_name:
+                vlan_details.setdefault(vlan_group_name, []).append(vlan_id)
 
         return vlan_details
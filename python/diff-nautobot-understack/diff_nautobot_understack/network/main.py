@@ -1,25 +1,32 @@
-from diffsync.diff import Diff
-from diffsync.enum import DiffSyncFlags
+import sys
+
+from diffsync import Adapter
 from rich import print
 
+from diff_nautobot_understack.diff_run import DiffRun
+from diff_nautobot_understack.diff_run import load_and_diff
 from diff_nautobot_understack.network.adapters.openstack_network import (
     Network as OpenstackNetwork,
 )
 from diff_nautobot_understack.network.adapters.ucvni import Network as UcvniNetwork
+from diff_nautobot_understack.snapshot import SnapshotAdapter
+
+
+def openstack_network_diff_from_ucvni_network(
+    source: Adapter | None = None, destination: Adapter | None = None
+) -> DiffRun:
+    """Diff networks against UCVNIs; either side may be a snapshot."""
+    openstack_network = OpenstackNetwork() if source is None else source
+    ucvni_network = UcvniNetwork() if destination is None else destination
 
+    def report_load_error(adapter, error):
+        if isinstance(adapter, SnapshotAdapter):
+            print(f"Error reading snapshot {adapter.path}", file=sys.stderr)
+        elif adapter is openstack_network:
+            print("Error retrieving networks from Openstack", file=sys.stderr)
+        else:
+            print("Error retrieving ucvnis from Nautobot", file=sys.stderr)
 
-def openstack_network_diff_from_ucvni_network() -> Diff:
-    openstack_network = OpenstackNetwork()
-    try:
-        openstack_network.load()
-    except Exception:
-        print("Error retrieving networks from Openstack")
-    ucvni_network = UcvniNetwork()
-    try:
-        ucvni_network.load()
-    except Exception:
-        print("Error retrieving ucvnis from Nautobot")
-    ucvni_network_destination_openstack_source = ucvni_network.diff_from(
-        openstack_network, flags=DiffSyncFlags.CONTINUE_ON_FAILURE
+    return load_and_diff(
+        openstack_network, ucvni_network, on_load_error=report_load_error
     )
-    return ucvni_network_destination_openstack_source
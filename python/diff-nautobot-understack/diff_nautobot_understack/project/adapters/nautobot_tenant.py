@@ -25,16 +25,17 @@ class Tenant(Adapter):
     def load(self):
         url = f"/api/tenancy/tenants/?name={self.tenant_name}&include=relationships"
 
-        tenants_response = self.api_client.make_api_request(url, paginated=True)
-
-        for tenant in tenants_response:
-            self.add(
-                self.project(
-                    id=_remove_hyphens(tenant.get("id")),
-                    name=tenant.get("name"),
-                    description=tenant.get("description"),
+        # Tenants are added page by page while later pages are still
+        # being fetched.
+        for tenants_page in self.api_client.iter_pages(url):
+            for tenant in tenants_page:
+                self.add(
+                    self.project(
+                        id=_remove_hyphens(tenant.get("id")),
+                        name=tenant.get("name"),
+                        description=tenant.get("description"),
+                    )
                 )
-            )
 
 
 class Tenants(Adapter):
@@ -51,13 +52,14 @@ class Tenants(Adapter):
 
     def load(self):
         url = "/api/tenancy/tenants/?include=relationships"
-        tenants_response = self.api_client.make_api_request(url, paginated=True)
-
-        for tenant in tenants_response:
-            self.add(
-                self.project(
-                    id=_remove_hyphens(tenant.get("id")),
-                    name=tenant.get("name"),
-                    description=tenant.get("description"),
+        # Tenants are added page by page while later pages are still
+        # being fetched.
+        for tenants_page in self.api_client.iter_pages(url):
+            for tenant in tenants_page:
+                self.add(
+                    self.project(
+                        id=_remove_hyphens(tenant.get("id")),
+                        name=tenant.get("name"),
+                        description=tenant.get("description"),
+                    )
                 )
-            )
@@ -0,0 +1,10 @@
+from diff_nautobot_understack.project import models
+from diff_nautobot_understack.snapshot import SnapshotAdapter
+
+
+class ProjectSnapshot(SnapshotAdapter):
+    """Projects or tenants replayed from a saved snapshot."""
+
+    project = models.ProjectModel
+
+    top_level = ["project"]
@@ -1,6 +1,7 @@
-from diffsync.diff import Diff
-from diffsync.enum import DiffSyncFlags
+from diffsync import Adapter
 
+from diff_nautobot_understack.diff_run import DiffRun
+from diff_nautobot_understack.diff_run import load_and_diff
 from diff_nautobot_understack.project.adapters.nautobot_tenant import Tenant
 from diff_nautobot_understack.project.adapters.nautobot_tenant import Tenants
 from diff_nautobot_understack.project.adapters.openstack_project import Project
@@ -8,26 +9,22 @@ from diff_nautobot_understack.project.adapters.openstack_project import Projects
 from diff_nautobot_understack.settings import app_settings as settings
 
 
-def openstack_project_diff_from_nautobot_tenant(os_project=None) -> Diff:
+def openstack_project_diff_from_nautobot_tenant(
+    os_project=None,
+    source: Adapter | None = None,
+    destination: Adapter | None = None,
+) -> DiffRun:
+    """Diff a project against its tenant; either side may be a snapshot."""
     project_name = os_project if os_project is not None else settings.os_project
-    openstack_project = Project(name=project_name)
-    openstack_project.load()
+    openstack_project = Project(name=project_name) if source is None else source
+    nautobot_tenant = Tenant(name=project_name) if destination is None else destination
+    return load_and_diff(openstack_project, nautobot_tenant)
 
-    nautobot_tenant = Tenant(name=project_name)
-    nautobot_tenant.load()
-    tenant_destination_openstack_project_source = nautobot_tenant.diff_from(
-        openstack_project, flags=DiffSyncFlags.CONTINUE_ON_FAILURE
-    )
-    return tenant_destination_openstack_project_source
 
-
-def openstack_all_projects_diff_from_nautobot_tenant() -> Diff:
-    openstack_project = Projects()
-    openstack_project.load()
-
-    nautobot_tenant = Tenants()
-    nautobot_tenant.load()
-    tenant_destination_openstack_project_source = nautobot_tenant.diff_from(
-        openstack_project, flags=DiffSyncFlags.CONTINUE_ON_FAILURE
-    )
-    return tenant_destination_openstack_project_source
+def openstack_all_projects_diff_from_nautobot_tenant(
+    source: Adapter | None = None, destination: Adapter | None = None
+) -> DiffRun:
+    """Diff all projects against all tenants; either side may be a snapshot."""
+    openstack_project = Projects() if source is None else source
+    nautobot_tenant = Tenants() if destination is None else destination
+    return load_and_diff(openstack_project, nautobot_tenant)
@@ -7,6 +7,8 @@ class Settings(BaseSettings):
 
     nautobot_token: str | None = None
     nautobot_url: str = "https://nautobot.dev.undercloud.rackspace.net"
+    nautobot_page_size: int = 1000
+    nautobot_page_workers: int = 4
     debug: bool = False
     os_cloud: str | None = None
     os_project: str = "default"
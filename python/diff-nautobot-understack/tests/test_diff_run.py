@@ -0,0 +1,56 @@
+import threading
+
+from diffsync import Adapter
+
+from diff_nautobot_understack.diff_run import load_and_diff
+from diff_nautobot_understack.project import models
+
+
+class FakeAdapter(Adapter):
+    project = models.ProjectModel
+
+    top_level = ["project"]
+
+    def __init__(self, type, names, barrier=None, error=None, **kwargs):
+        super().__init__(**kwargs)
+        self.type = type
+        self.names = names
+        self.barrier = barrier
+        self.error = error
+
+    def load(self):
+        if self.barrier is not None:
+            # Only passes if both adapters are loading at the same time.
+            self.barrier.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        for name in self.names:
+            self.add(self.project(id=name, name=name, description=""))
+
+
+def test_load_and_diff_loads_both_adapters_concurrently():
+    barrier = threading.Barrier(2)
+    source = FakeAdapter("Source", ["a", "b"], barrier=barrier)
+    destination = FakeAdapter("Destination", ["b"], barrier=barrier)
+
+    run = load_and_diff(source, destination)
+
+    assert run.diff.summary()["create"] == 1
+    assert set(run.timings) == {"Source", "Destination", "diff"}
+
+
+def test_load_and_diff_reports_load_errors_and_still_diffs():
+    errors = []
+    source = FakeAdapter("Source", ["a"])
+    destination = FakeAdapter("Destination", [], error=RuntimeError("down"))
+
+    run = load_and_diff(
+        source,
+        destination,
+        on_load_error=lambda adapter, error: errors.append((adapter.type, error)),
+    )
+
+    assert [(adapter_type, str(error)) for adapter_type, error in errors] == [
+        ("Destination", "down")
+    ]
+    assert run.diff.summary()["create"] == 1
@@ -0,0 +1,83 @@
+import threading
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+from diff_nautobot_understack.clients import nautobot
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self._data = data
+        self.content = b"{}"
+        self.status_code = 200
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Serves `count` items with limit/offset pagination, capped at max_limit."""
+
+    def __init__(self, count, max_limit):
+        self.count = count
+        self.max_limit = max_limit
+        self.urls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None, json=None):
+        with self._lock:
+            self.urls.append(url)
+        query = parse_qs(urlsplit(url).query)
+        limit = min(int(query.get("limit", ["50"])[0]), self.max_limit)
+        offset = int(query.get("offset", ["0"])[0])
+        results = [{"id": i} for i in range(offset, min(offset + limit, self.count))]
+        more = offset + limit < self.count
+        return FakeResponse(
+            {
+                "count": self.count,
+                "next": f"{url}&next" if more else None,
+                "results": results,
+            }
+        )
+
+
+def make_api(session):
+    api = nautobot.API()
+    api.s = session
+    return api
+
+
+def test_paginated_request_fetches_pages_by_offset_in_order():
+    session = FakeSession(count=2500, max_limit=1000)
+    api = make_api(session)
+
+    items = api.make_api_request("/api/tenancy/tenants/?name=x", paginated=True)
+
+    assert [item["id"] for item in items] == list(range(2500))
+    assert len(session.urls) == 3
+    offsets = sorted(
+        parse_qs(urlsplit(url).query).get("offset", ["0"])[0] for url in session.urls
+    )
+    assert offsets == ["0", "1000", "2000"]
+    # Existing filters are kept on every page.
+    assert all("name=x" in url for url in session.urls)
+
+
+def test_paginated_request_uses_the_page_size_the_server_applied():
+    session = FakeSession(count=120, max_limit=50)
+    api = make_api(session)
+
+    pages = list(api.iter_pages("/api/tenancy/tenants/"))
+
+    assert [len(page) for page in pages] == [50, 50, 20]
+
+
+def test_paginated_request_single_page():
+    session = FakeSession(count=3, max_limit=1000)
+    api = make_api(session)
+
+    assert len(api.make_api_request("/api/ipam/vlans/", paginated=True)) == 3
+    assert len(session.urls) == 1
@@ -0,0 +1,65 @@
+import pytest
+from diffsync import Adapter
+
+from diff_nautobot_understack.diff_run import load_and_diff
+from diff_nautobot_understack.network.adapters.snapshot import NetworkSnapshot
+from diff_nautobot_understack.project import models
+from diff_nautobot_understack.project.adapters.snapshot import ProjectSnapshot
+from diff_nautobot_understack.snapshot import save_snapshot
+
+
+class LoadedTenants(Adapter):
+    project = models.ProjectModel
+
+    top_level = ["project"]
+    type = "Tenant"
+
+    def __init__(self, projects, **kwargs):
+        super().__init__(**kwargs)
+        self.projects = projects
+
+    def load(self):
+        for project_id, name in self.projects.items():
+            self.add(self.project(id=project_id, name=name, description=name))
+
+
+def saved_tenants(path, projects):
+    adapter = LoadedTenants(projects)
+    adapter.load()
+    return save_snapshot(adapter, path)
+
+
+@pytest.mark.parametrize("filename", ["tenants.jsonl", "tenants.jsonl.gz"])
+def test_snapshot_round_trip(tmp_path, filename):
+    path = tmp_path / filename
+    assert saved_tenants(path, {"1": "one", "2": "two"}) == 2
+
+    replayed = ProjectSnapshot(path)
+    replayed.load()
+
+    assert replayed.type == "Tenant"
+    assert {p.name for p in replayed.get_all("project")} == {"one", "two"}
+    original = LoadedTenants({"1": "one", "2": "two"})
+    original.load()
+    assert original.diff_from(replayed).summary()["no-change"] == 2
+
+
+def test_snapshot_of_other_diff_is_rejected(tmp_path):
+    path = tmp_path / "tenants.jsonl"
+    saved_tenants(path, {"1": "one"})
+
+    with pytest.raises(ValueError, match="holds project data, not network"):
+        NetworkSnapshot(path)
+
+
+def test_diff_two_snapshots_of_the_same_side(tmp_path):
+    before = tmp_path / "before.jsonl.gz"
+    after = tmp_path / "after.jsonl.gz"
+    saved_tenants(before, {"1": "one", "2": "two"})
+    saved_tenants(after, {"2": "deux", "3": "three"})
+
+    run = load_and_diff(ProjectSnapshot(before), ProjectSnapshot(after))
+
+    summary = run.diff.summary()
+    assert (summary["create"], summary["update"], summary["delete"]) == (1, 1, 1)
+    assert set(run.timings) == {"Tenant (source)", "Tenant (destination)", "diff"}
@@ -0,0 +1,119 @@
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+from diff_nautobot_understack.network.adapters import ucvni
+
+
+class FakeAPI:
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+
+    def make_api_request(self, url, payload=None, paginated=False):
+        self.requests.append(url)
+        for prefix, response in self.responses.items():
+            if url.startswith(prefix):
+                return response(url) if callable(response) else response
+        raise AssertionError(f"unexpected request {url}")
+
+    def iter_pages(self, url, payload=None):
+        # Two items per page, to exercise loading across page boundaries.
+        results = self.make_api_request(url, payload)
+        for start in range(0, len(results), 2):
+            yield results[start : start + 2]
+
+
+def make_ucvni(n, vlan_uuid):
+    return {
+        "id": f"ucvni-{n}",
+        "name": f"network-{n}",
+        "ucvni_id": 200000 + n,
+        "ucvni_group": {"id": "group-1", "name": "fabric-1"},
+        "status": {"id": "status-1", "name": "Active"},
+        "relationships": {
+            "ucvni_vlans": {"destination": {"objects": [{"id": vlan_uuid}]}}
+        },
+    }
+
+
+def test_ucvni_get_request_count_does_not_grow_with_networks():
+    ucvnis = [make_ucvni(n, f"vlan-{n}") for n in range(120)]
+    vlans = [
+        {
+            "id": f"vlan-{n}",
+            "vid": 1000 + n,
+            "vlan_group": {"id": "vg-1", "name": "f20-1-network"},
+        }
+        for n in range(120)
+    ]
+
+    def vlans_by_id(url):
+        ids = set(parse_qs(urlsplit(url).query)["id"])
+        return [vlan for vlan in vlans if vlan["id"] in ids]
+
+    api = FakeAPI(
+        {
+            "/api/plugins/undercloud-vni/ucvnis/": ucvnis,
+            "/api/ipam/vlans/": vlans_by_id,
+        }
+    )
+    adapter = ucvni.Network()
+    adapter.api_client = api
+
+    details = list(adapter.ucvni_get())
+
+    # One UCVNI listing plus one VLAN listing per page of UCVNIs, however
+    # many UCVNIs are on the page.
+    assert len(api.requests) == 1 + 60
+    assert len(details) == 120
+    assert details[7].ucvni_group == "fabric-1"
+    assert details[7].status == "active"
+    assert details[7].vlan_group == "f20-1-network"
+    assert details[7].vlan_id == 1007
+
+
+def test_ucvni_get_memoizes_related_objects_without_inlined_names():
+    ucvnis = [make_ucvni(n, "vlan-1") for n in range(3)]
+    for ucvni_item in ucvnis:
+        ucvni_item["status"] = {"url": "/api/extras/statuses/status-1/"}
+    vlans = [{"id": "vlan-1", "vid": 1800, "vlan_group": {"url": "/api/vg/vg-1/"}}]
+    api = FakeAPI(
+        {
+            "/api/plugins/undercloud-vni/ucvnis/": ucvnis,
+            "/api/ipam/vlans/": vlans,
+            "/api/extras/statuses/status-1/": {"name": "Planned"},
+            "/api/vg/vg-1/": {"name": "f20-2-network"},
+        }
+    )
+    adapter = ucvni.Network()
+    adapter.api_client = api
+
+    details = list(adapter.ucvni_get())
+
+    assert [d.status for d in details] == ["planned"] * 3
+    assert {d.vlan_group for d in details} == {"f20-2-network"}
+    assert api.requests.count("/api/extras/statuses/status-1/") == 1
+    assert api.requests.count("/api/vg/vg-1/") == 1
+
+
+def test_ucvni_get_skips_ucvnis_without_a_vlan_group(caplog):
+    ucvnis = [make_ucvni(0, "vlan-0"), make_ucvni(1, "vlan-missing")]
+    ucvnis.append(make_ucvni(2, "vlan-0"))
+    ucvnis[2]["relationships"]["ucvni_vlans"]["destination"]["objects"] = []
+    vlans = [
+        {"id": "vlan-0", "vid": 1000, "vlan_group": {"name": "f20-1-network"}},
+    ]
+    api = FakeAPI(
+        {
+            "/api/plugins/undercloud-vni/ucvnis/": ucvnis,
+            "/api/ipam/vlans/": vlans,
+        }
+    )
+    adapter = ucvni.Network()
+    adapter.api_client = api
+
+    details = list(adapter.ucvni_get())
+
+    assert [d.name for d in details] == ["network-0"]
+    assert "network-1" in caplog.text
+    assert "network-2" in caplog.text
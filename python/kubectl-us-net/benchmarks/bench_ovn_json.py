@@ -0,0 +1,140 @@
+"""Compare whole-document and streaming parsing of a large OVN JSON dump.
+
+Generates a synthetic Logical_Switch_Port `--format=json` dump (data before
+headings, the way ovs prints it) and parses it once with parse_ovn_json and
+once with iter_ovn_rows keeping three columns, each in a fresh interpreter
+so peak RSS is measured per parser:
+
+    python benchmarks/bench_ovn_json.py --rows 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from us_net.ovsdb_json import iter_ovn_rows  # noqa: E402
+from us_net.ovsdb_json import parse_ovn_json  # noqa: E402
+
+HEADINGS = [
+    "_uuid",
+    "addresses",
+    "dhcpv4_options",
+    "enabled",
+    "external_ids",
+    "ha_chassis_group",
+    "name",
+    "options",
+    "port_security",
+    "tag",
+    "type",
+    "up",
+]
+COLUMNS = ["_uuid", "name", "external_ids"]
+
+
+def _row(i: int) -> list:
+    port_id = str(uuid.UUID(int=i))
+    mac = f"fa:16:3e:{i >> 16 & 0xFF:02x}:{i >> 8 & 0xFF:02x}:{i & 0xFF:02x}"
+    ip = f"10.{i >> 16 & 0xFF}.{i >> 8 & 0xFF}.{i & 0xFF}"
+    return [
+        ["uuid", str(uuid.UUID(int=i, version=4))],
+        f"{mac} {ip}",
+        ["set", []],
+        True,
+        [
+            "map",
+            [
+                ["neutron:cidrs", f"{ip}/24"],
+                ["neutron:device_id", str(uuid.UUID(int=i + 1, version=4))],
+                ["neutron:device_owner", "compute:nova"],
+                ["neutron:network_name", f"neutron-{uuid.UUID(int=i >> 8)}"],
+                ["neutron:port_name", ""],
+                ["neutron:project_id", "0" * 32],
+                ["neutron:revision_number", "4"],
+                ["neutron:security_group_ids", str(uuid.UUID(int=7))],
+            ],
+        ],
+        ["set", []],
+        port_id,
+        ["map", [["requested-chassis", f"compute-{i % 500}"]]],
+        f"{mac} {ip}",
+        ["set", []],
+        "",
+        True,
+    ]
+
+
+def generate(path: str, rows: int) -> None:
+    with open(path, "w") as f:
+        f.write('{"data":[')
+        for i in range(rows):
+            if i:
+                f.write(",")
+            f.write(json.dumps(_row(i), separators=(",", ":")))
+        f.write('],"headings":')
+        f.write(json.dumps(HEADINGS))
+        f.write("}\n")
+
+
+def run_one(mode: str, path: str) -> None:
+    start = time.perf_counter()
+    with open(path) as f:
+        if mode == "loads":
+            rows = parse_ovn_json(f.read())
+        else:
+            rows = list(iter_ovn_rows(f, COLUMNS))
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux.
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        json.dumps(
+            {"mode": mode, "rows": len(rows), "seconds": elapsed, "mib": peak_mib}
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--mode", choices=["loads", "stream"], help=argparse.SUPPRESS)
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_one(args.mode, args.path)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lsp.json")
+        generate(path, args.rows)
+        size_mib = os.path.getsize(path) / (1 << 20)
+        print(f"Logical_Switch_Port dump: {args.rows} rows, {size_mib:.0f} MiB")
+        for mode, label in (
+            ("loads", "parse_ovn_json (all columns)"),
+            ("stream", f"iter_ovn_rows ({','.join(COLUMNS)})"),
+        ):
+            out = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--path", path],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            result = json.loads(out)
+            print(
+                f"  {label:45} {result['seconds']:6.2f}s  "
+                f"peak RSS {result['mib']:7.0f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
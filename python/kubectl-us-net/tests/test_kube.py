@@ -1,5 +1,7 @@
 import json
 import subprocess
+import sys
+import time
 
 import pytest
 
@@ -139,3 +141,70 @@ def test_resolve_node_pod_exits_on_multiple_candidates(monkeypatch):
     monkeypatch.setattr(kube, "pods_on_node", lambda ctx, node, prefix: ["a", "b"])
     with pytest.raises(SystemExit):
         kube.resolve_node_pod(make_ctx(), "node-1", "ovn-controller", None)
+
+
+def test_port_forward_yields_local_port_and_terminates(monkeypatch):
+    procs = []
+
+    class FakePopen:
+        def __init__(self, cmd, **kwargs):
+            self.cmd = cmd
+            self.stderr_target = kwargs["stderr"]
+            self.stdout = iter(
+                [
+                    "Forwarding from 127.0.0.1:40123 -> 6641\n",
+                    "Handling connection for 40123\n",
+                ]
+            )
+            self.terminated = False
+            procs.append(self)
+
+        def terminate(self):
+            self.terminated = True
+
+        def wait(self):
+            return 0
+
+    monkeypatch.setattr(kube.subprocess, "Popen", FakePopen)
+    with kube.port_forward(make_ctx(), "ovn-ovsdb-nb-0", 6641) as local_port:
+        assert local_port == 40123
+        # kubectl's later output must not be left to fill a pipe
+        assert procs[0].stderr_target is not kube.subprocess.PIPE
+        assert procs[0].cmd == [
+            "kubectl",
+            "port-forward",
+            "-n",
+            "openstack",
+            "ovn-ovsdb-nb-0",
+            ":6641",
+        ]
+    assert procs[0].terminated
+
+
+def test_port_forward_drains_kubectl_output_while_forwarding(monkeypatch, tmp_path):
+    # Stands in for kubectl logging far more than a pipe buffer holds while
+    # it forwards; it only gets to write the marker if that output is read.
+    marker = tmp_path / "done"
+    script = (
+        "import pathlib, sys, time\n"
+        "print('Forwarding from 127.0.0.1:40124 -> 6641', flush=True)\n"
+        "for _ in range(20000):\n"
+        "    print('Handling connection for 40124')\n"
+        "    print('E0101 lost connection to pod', file=sys.stderr)\n"
+        "sys.stdout.flush()\n"
+        "sys.stderr.flush()\n"
+        f"pathlib.Path({str(marker)!r}).touch()\n"
+        "time.sleep(60)\n"
+    )
+    popen = subprocess.Popen
+    monkeypatch.setattr(
+        kube.subprocess,
+        "Popen",
+        lambda cmd, **kwargs: popen([sys.executable, "-c", script], **kwargs),
+    )
+    with kube.port_forward(make_ctx(), "ovn-ovsdb-nb-0", 6641) as local_port:
+        assert local_port == 40124
+        deadline = time.monotonic() + 10
+        while not marker.exists() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert marker.exists()
@@ -1,5 +1,24 @@
+import contextlib
+import subprocess
+
+import pytest
+
+from us_net import ovn
+from us_net.connection import ConnectionContext
 from us_net.ovn import as_list
 from us_net.ovn import parse_ovn_json
+from us_net.ovn import parse_ovn_json_documents
+
+
+def make_ctx(ovsdb_rpc=False):
+    return ConnectionContext(
+        kube_context=None,
+        namespace="openstack",
+        nb_pod="ovn-ovsdb-nb-0",
+        sb_pod="ovn-ovsdb-sb-0",
+        os_cloud=None,
+        ovsdb_rpc=ovsdb_rpc,
+    )
 
 
 def test_parse_ovn_json_unwraps_uuid_and_set():
@@ -26,3 +45,214 @@ def test_as_list_normalizes_single_value_and_empty():
     assert as_list("") == []
     assert as_list("solo") == ["solo"]
     assert as_list(["a", "b"]) == ["a", "b"]
+
+
+def test_parse_ovn_json_documents_splits_concatenated_tables():
+    raw = (
+        '{"headings": ["_uuid"], "data": [[["uuid", "lr-1"]]]}\n'
+        '{"headings": ["name"], "data": []}\n'
+        '{"headings": ["ports"], "data": [[["set", [["uuid", "p1"]]]]]}\n'
+    )
+    assert parse_ovn_json_documents(raw) == [
+        [{"_uuid": "lr-1"}],
+        [],
+        [{"ports": ["p1"]}],
+    ]
+
+
+def test_parse_ovn_json_documents_empty_output():
+    assert parse_ovn_json_documents("\n") == []
+
+
+def _completed(stdout, stderr="", returncode=0):
+    return subprocess.CompletedProcess([], returncode, stdout=stdout, stderr=stderr)
+
+
+def test_nbctl_batch_runs_all_commands_in_one_exec(monkeypatch):
+    calls = []
+
+    def fake_exec(ctx, pod, container, argv):
+        calls.append((pod, argv))
+        return _completed(
+            '{"data": [["neutron-rtr-1"]], "headings": ["name"]}'
+            '{"data": [["NAT-a"], ["NAT-b"]], "headings": ["name"]}'
+        )
+
+    monkeypatch.setattr(ovn.kube, "exec_in_pod", fake_exec)
+    result = ovn.nbctl_batch(
+        make_ctx(),
+        [
+            ovn.Query("Logical_Router", where=(("name", "neutron-rtr-1"),)),
+            ovn.Query("NAT", columns=("_uuid", "type")),
+        ],
+    )
+    assert calls == [
+        (
+            "ovn-ovsdb-nb-0",
+            [
+                "ovn-nbctl",
+                "--format=json",
+                "--",
+                "find",
+                "Logical_Router",
+                "name=neutron-rtr-1",
+                "--",
+                "--columns=_uuid,type",
+                "list",
+                "NAT",
+            ],
+        )
+    ]
+    assert result == [
+        [{"name": "neutron-rtr-1"}],
+        [{"name": "NAT-a"}, {"name": "NAT-b"}],
+    ]
+
+
+def test_nbctl_batch_exits_on_result_count_mismatch(monkeypatch):
+    monkeypatch.setattr(
+        ovn.kube,
+        "exec_in_pod",
+        lambda ctx, pod, container, argv: _completed('{"headings": [], "data": []}'),
+    )
+    with pytest.raises(SystemExit):
+        ovn.nbctl_batch(make_ctx(), [ovn.Query("NAT"), ovn.Query("HA_Chassis")])
+
+
+def test_nbctl_batch_exits_on_ctl_failure(monkeypatch, capsys):
+    monkeypatch.setattr(
+        ovn.kube,
+        "exec_in_pod",
+        lambda ctx, pod, container, argv: _completed(
+            "", stderr="ovn-nbctl: no row", returncode=1
+        ),
+    )
+    with pytest.raises(SystemExit):
+        ovn.nbctl_batch(make_ctx(), [ovn.Query("NAT")])
+    assert "ovn-nbctl: no row" in capsys.readouterr().err
+
+
+def test_query_rpc_ops_project_columns_and_filter_rows():
+    query = ovn.Query(
+        "Logical_Router", where=(("name", "neutron-rtr-1"),), columns=("_uuid",)
+    )
+    assert query.rpc_ops() == [
+        {
+            "op": "select",
+            "table": "Logical_Router",
+            "where": [["name", "==", "neutron-rtr-1"]],
+            "columns": ["_uuid"],
+        }
+    ]
+    assert ovn.Query("NAT").rpc_ops() == [{"op": "select", "table": "NAT", "where": []}]
+
+
+def test_query_records_select_one_row_each():
+    by_uuid = ovn.Query("NAT", records=("nat-1", "nat-2"))
+    assert [op["where"] for op in by_uuid.rpc_ops()] == [
+        [["_uuid", "==", ["uuid", "nat-1"]]],
+        [["_uuid", "==", ["uuid", "nat-2"]]],
+    ]
+    by_name = ovn.Query("Logical_Switch", records=("net-1",), record_column="name")
+    assert by_name.rpc_ops()[0]["where"] == [["name", "==", "net-1"]]
+    assert by_name.ctl_args() == ["--if-exists", "list", "Logical_Switch", "net-1"]
+    assert ovn.Query("NAT", records=()).rpc_ops() == []
+
+
+def test_nbctl_batch_answers_queries_for_no_records_locally(monkeypatch):
+    calls = []
+
+    def fake_exec(ctx, pod, container, argv):
+        calls.append(argv)
+        return _completed('{"data": [["NAT-a"]], "headings": ["name"]}')
+
+    monkeypatch.setattr(ovn.kube, "exec_in_pod", fake_exec)
+    result = ovn.nbctl_batch(
+        make_ctx(),
+        [ovn.Query("HA_Chassis", records=()), ovn.Query("NAT", records=("nat-a",))],
+    )
+    assert result == [[], [{"name": "NAT-a"}]]
+    assert calls == [
+        ["ovn-nbctl", "--format=json", "--", "--if-exists", "list", "NAT", "nat-a"]
+    ]
+    assert ovn.nbctl_batch(make_ctx(), [ovn.Query("NAT", records=())]) == [[]]
+    assert len(calls) == 1
+
+
+def test_nbctl_batch_rpc_mode_uses_one_transact(monkeypatch):
+    forwards = []
+    transacts = []
+
+    @contextlib.contextmanager
+    def fake_port_forward(ctx, pod, remote_port):
+        forwards.append((pod, remote_port))
+        yield 40001
+
+    class FakeClient:
+        def __init__(self, host, port):
+            assert (host, port) == ("127.0.0.1", 40001)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def transact(self, db, operations):
+            transacts.append((db, operations))
+            return [
+                {"rows": [{"_uuid": ["uuid", "lr-1"], "nat": ["set", []]}]},
+                {"rows": []},
+            ]
+
+    monkeypatch.setattr(ovn.kube, "port_forward", fake_port_forward)
+    monkeypatch.setattr(ovn.ovsdb, "OvsdbClient", FakeClient)
+    result = ovn.nbctl_batch(
+        make_ctx(ovsdb_rpc=True),
+        [
+            ovn.Query("Logical_Router", where=(("name", "neutron-rtr-1"),)),
+            ovn.Query("NAT"),
+        ],
+    )
+    assert forwards == [("ovn-ovsdb-nb-0", ovn.NB_OVSDB_PORT)]
+    assert len(transacts) == 1
+    assert transacts[0][0] == "OVN_Northbound"
+    assert result == [[{"_uuid": "lr-1", "nat": []}], []]
+
+
+def test_rpc_connections_share_one_port_forward_across_batches(monkeypatch):
+    forwards = []
+    transacts = []
+
+    @contextlib.contextmanager
+    def fake_port_forward(ctx, pod, remote_port):
+        forwards.append(pod)
+        yield 40001
+
+    class FakeClient:
+        def __init__(self, host, port):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def transact(self, db, operations):
+            transacts.append(operations)
+            return [{"rows": [{"_uuid": ["uuid", "nat-1"]}]} for _ in operations]
+
+    monkeypatch.setattr(ovn.kube, "port_forward", fake_port_forward)
+    monkeypatch.setattr(ovn.ovsdb, "OvsdbClient", FakeClient)
+    ctx = make_ctx(ovsdb_rpc=True)
+    with ovn.rpc_connections(ctx):
+        first = ovn.nbctl_batch(ctx, [ovn.Query("NAT", records=("nat-1", "nat-2"))])
+        second = ovn.nbctl_batch(ctx, [ovn.Query("HA_Chassis", records=())])
+    assert forwards == ["ovn-ovsdb-nb-0"]
+    # one select per record, all of them in a single transact
+    assert len(transacts) == 1
+    assert len(transacts[0]) == 2
+    assert first == [[{"_uuid": "nat-1"}, {"_uuid": "nat-1"}]]
+    assert second == [[]]
+    assert ovn._open_sessions == {}
@@ -0,0 +1,136 @@
+import json
+import socket
+import threading
+
+import pytest
+
+from us_net.ovsdb import ZERO_UUID
+from us_net.ovsdb import OvsdbClient
+from us_net.ovsdb import OvsdbError
+
+
+def serve(responder):
+    """Start a one-connection fake OVSDB server, returning its port."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+
+    def run():
+        conn, _ = server.accept()
+        with conn, server:
+            decoder = json.JSONDecoder()
+            buffer = ""
+            while True:
+                data = conn.recv(65536)
+                if not data:
+                    return
+                buffer += data.decode()
+                while buffer.strip():
+                    try:
+                        request, end = decoder.raw_decode(buffer.lstrip())
+                    except json.JSONDecodeError:
+                        break
+                    buffer = buffer.lstrip()[end:]
+                    for reply in responder(request):
+                        conn.sendall(reply.encode())
+
+    threading.Thread(target=run, daemon=True).start()
+    return server.getsockname()[1]
+
+
+def test_transact_returns_select_results():
+    def responder(request):
+        if request.get("method") != "transact":
+            return []
+        assert request["params"][0] == "OVN_Northbound"
+        result = {"result": [{"rows": [{"name": "lr"}]}], "error": None}
+        result["id"] = request["id"]
+        # split the reply across two writes to exercise reassembly
+        body = json.dumps(result)
+        return [body[:10], body[10:]]
+
+    with OvsdbClient("127.0.0.1", serve(responder)) as client:
+        result = client.transact(
+            "OVN_Northbound", [{"op": "select", "table": "Logical_Router", "where": []}]
+        )
+    assert result == [{"rows": [{"name": "lr"}]}]
+
+
+def test_transact_reassembles_large_reply_read_in_small_chunks(monkeypatch):
+    # Multibyte characters get split across reads, and braces, brackets and
+    # escaped quotes inside strings must not end the message early.
+    rows = [
+        {"_uuid": f"uuid-{i}", "name": f'r\u00e9seau-{i} \u20ac{{]"\\', "ports": []}
+        for i in range(40000)
+    ]
+
+    def responder(request):
+        reply = {"result": [{"rows": rows}], "error": None, "id": request["id"]}
+        # two back-to-back messages in one write, the first one unrelated
+        notice = {"method": "update", "params": [None, {}], "id": None}
+        return [
+            json.dumps(notice, ensure_ascii=False)
+            + json.dumps(reply, ensure_ascii=False)
+        ]
+
+    monkeypatch.setattr("us_net.ovsdb.RECV_SIZE", 4093)
+    with OvsdbClient("127.0.0.1", serve(responder)) as client:
+        result = client.transact("OVN_Northbound", [{"op": "select"}])
+    assert result == [{"rows": rows}]
+
+
+def test_call_answers_server_echo_before_reply():
+    echoes = []
+
+    def responder(request):
+        if request.get("method") == "transact":
+            echo = {"method": "echo", "params": [], "id": "echo"}
+            reply = {"result": [{"rows": []}], "error": None, "id": request["id"]}
+            return [json.dumps(echo), json.dumps(reply)]
+        if request.get("id") == "echo":
+            echoes.append(request)
+        return []
+
+    with OvsdbClient("127.0.0.1", serve(responder)) as client:
+        assert client.transact("OVN_Southbound", [{"op": "select"}]) == [{"rows": []}]
+    assert echoes == [{"result": [], "error": None, "id": "echo"}]
+
+
+def test_transact_raises_on_operation_error():
+    def responder(request):
+        reply = {
+            "result": [{"error": "unknown column", "details": "no column foo"}],
+            "error": None,
+            "id": request["id"],
+        }
+        return [json.dumps(reply)]
+
+    with OvsdbClient("127.0.0.1", serve(responder)) as client:
+        with pytest.raises(OvsdbError, match="unknown column"):
+            client.transact("OVN_Northbound", [{"op": "select", "table": "NAT"}])
+
+
+def test_last_txn_id_reports_clustered_txn_and_cancels_monitor():
+    methods = []
+
+    def responder(request):
+        methods.append(request["method"])
+        if request["method"] == "monitor_cond_since":
+            assert request["params"][2] == {"NB_Global": [{"columns": ["nb_cfg"]}]}
+            result = [False, "txn-42", {}]
+        else:
+            result = {}
+        return [json.dumps({"result": result, "error": None, "id": request["id"]})]
+
+    with OvsdbClient("127.0.0.1", serve(responder)) as client:
+        assert client.last_txn_id("OVN_Northbound", "NB_Global", "nb_cfg") == "txn-42"
+    assert methods == ["monitor_cond_since", "monitor_cancel"]
+
+
+def test_last_txn_id_is_none_for_standalone_db():
+    def responder(request):
+        result = [False, ZERO_UUID, {}] if request["method"] != "monitor_cancel" else {}
+        return [json.dumps({"result": result, "error": None, "id": request["id"]})]
+
+    with OvsdbClient("127.0.0.1", serve(responder)) as client:
+        assert client.last_txn_id("OVN_Southbound", "SB_Global", "nb_cfg") is None
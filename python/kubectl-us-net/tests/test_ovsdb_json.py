@@ -0,0 +1,61 @@
+import io
+import json
+
+import pytest
+
+from us_net import ovsdb_json
+from us_net.ovsdb_json import iter_ovn_rows
+from us_net.ovsdb_json import iter_ovn_tables
+from us_net.ovsdb_json import parse_ovn_json
+
+TABLE = {
+    "data": [
+        [["uuid", "lsp-1"], "port-1", ["set", []], ["map", [["k", "v"]]], 1804],
+        [["uuid", "lsp-2"], "port-2", ["set", ["a", "b"]], ["map", []], ["set", []]],
+    ],
+    "headings": ["_uuid", "name", "addresses", "external_ids", "tag"],
+}
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # forces values to straddle chunk boundaries
+    monkeypatch.setattr(ovsdb_json, "CHUNK_SIZE", 5)
+
+
+@pytest.mark.parametrize("headings_first", [False, True])
+def test_iter_ovn_rows_matches_parse_ovn_json(small_chunks, headings_first):
+    table = dict(reversed(TABLE.items())) if headings_first else TABLE
+    raw = json.dumps(table)
+    assert list(iter_ovn_rows(io.StringIO(raw))) == parse_ovn_json(raw)
+
+
+def test_iter_ovn_rows_only_keeps_requested_columns(small_chunks):
+    rows = iter_ovn_rows(io.StringIO(json.dumps(TABLE)), columns=["_uuid", "tag"])
+    assert list(rows) == [
+        {"_uuid": "lsp-1", "tag": 1804},
+        {"_uuid": "lsp-2", "tag": []},
+    ]
+
+
+def test_iter_ovn_rows_yields_before_reading_everything():
+    table = {"headings": ["name"], "data": [["a"], ["b"]]}
+    stream = io.StringIO(json.dumps(table) + "garbage that is never read")
+    rows = iter_ovn_rows(stream)
+    assert next(rows) == {"name": "a"}
+
+
+def test_iter_ovn_rows_empty_table():
+    raw = '{"data": [], "headings": ["name"]}'
+    assert list(iter_ovn_rows(io.StringIO(raw))) == []
+
+
+def test_iter_ovn_rows_rejects_data_without_headings():
+    with pytest.raises(ValueError, match="no headings"):
+        list(iter_ovn_rows(io.StringIO('{"data": [["a"]]}')))
+
+
+def test_iter_ovn_tables_splits_concatenated_output(small_chunks):
+    raw = json.dumps(TABLE) + "\n" + '{"data":[],"headings":["name"]}\n'
+    tables = list(iter_ovn_tables(io.StringIO(raw), columns=["name"]))
+    assert tables == [[{"name": "port-1"}, {"name": "port-2"}], []]
@@ -1,5 +1,6 @@
 import types
 
+import pytest
 import typer
 from openstack import exceptions as os_exc
 from typer.testing import CliRunner
@@ -10,7 +11,7 @@ from us_net.connection import ConnectionContext
 runner = CliRunner()
 
 
-def make_app():
+def make_app(ovsdb_rpc=False):
     app = typer.Typer()
 
     @app.callback()
@@ -21,6 +22,7 @@ def make_app():
             nb_pod="ovn-ovsdb-nb-0",
             sb_pod="ovn-ovsdb-sb-0",
             os_cloud="dev-cloud",
+            ovsdb_rpc=ovsdb_rpc,
         )
 
     app.add_typer(router.app, name="router")
@@ -45,8 +47,12 @@ class FakeNetworkAPI:
         self._router_ports = router_ports
         self._all_ports = {p.id: p for p in (all_ports or router_ports)}
         self._routers_list = routers_list or []
+        self.calls = []
 
     def ports(self, device_id=None, fixed_ips=None):
+        self.calls.append(("ports", device_id, fixed_ips))
+        if device_id is None and fixed_ips is None:
+            return list(self._all_ports.values())
         if fixed_ips is not None:
             ip = fixed_ips.split("=", 1)[1]
             return [
@@ -57,6 +63,7 @@ class FakeNetworkAPI:
         return self._router_ports
 
     def get_port(self, port_id):
+        self.calls.append(("get_port", port_id))
         if port_id not in self._all_ports:
             raise PortNotFound(f"port {port_id} not found")
         return self._all_ports[port_id]
@@ -237,7 +244,6 @@ def patch_common(monkeypatch, *, hcg_linked=True, chassis_alive=True, centralize
         peer_lsp_int,
         peer_lsp_vm,
     ]
-    lsp_rows_by_name = {row["name"]: row for row in all_lsp_rows}
     switch_rows_by_name = {
         "neutron-net-ext": {
             "_uuid": "switch-ext",
@@ -251,22 +257,9 @@ def patch_common(monkeypatch, *, hcg_linked=True, chassis_alive=True, centralize
         },
     }
 
-    def fake_nbctl_find(ctx, table, condition):
-        if table == "Logical_Router":
-            assert condition == "name=neutron-rtr-1"
-            return [lr_row]
-        if table == "Logical_Switch_Port":
-            port_id = condition.removeprefix("name=")
-            row = lsp_rows_by_name.get(port_id)
-            return [row] if row else []
-        if table == "Logical_Switch":
-            name = condition.removeprefix("name=")
-            row = switch_rows_by_name.get(name)
-            return [row] if row else []
-        raise AssertionError(f"unexpected nbctl_find table {table!r}")
-
     def fake_nbctl_list(ctx, table):
         return {
+            "Logical_Router": [lr_row],
             "Logical_Router_Port": lrp_rows,
             "HA_Chassis_Group": hcg_rows,
             "HA_Chassis": ha_chassis_rows,
@@ -275,12 +268,38 @@ def patch_common(monkeypatch, *, hcg_linked=True, chassis_alive=True, centralize
             "Logical_Switch_Port": all_lsp_rows,
         }[table]
 
-    def fake_sbctl_list(ctx, table):
+    def fake_sbctl_list(ctx, table, columns=()):
         assert table == "Chassis"
         return chassis_rows
 
-    monkeypatch.setattr(router.ovn, "nbctl_find", fake_nbctl_find)
+    def fake_nbctl_batch(ctx, queries):
+        # Resolved through router.ovn at call time so tests that re-patch
+        # nbctl_list after patch_common still take effect. Those only list
+        # the tables they change, the others keep the rows above.
+        results = []
+        for query in queries:
+            if query.table == "Logical_Switch":
+                rows = list(switch_rows_by_name.values())
+            else:
+                try:
+                    rows = router.ovn.nbctl_list(ctx, query.table)
+                except KeyError:
+                    rows = fake_nbctl_list(ctx, query.table)
+            results.append(
+                [
+                    row
+                    for row in rows
+                    if all(row.get(col) == val for col, val in query.where)
+                    and (
+                        query.records is None
+                        or row.get(query.record_column) in query.records
+                    )
+                ]
+            )
+        return results
+
     monkeypatch.setattr(router.ovn, "nbctl_list", fake_nbctl_list)
+    monkeypatch.setattr(router.ovn, "nbctl_batch", fake_nbctl_batch)
     monkeypatch.setattr(router.ovn, "sbctl_list", fake_sbctl_list)
     monkeypatch.setattr(
         router.ovn, "sbctl_lflow_list", lambda ctx, name: "FLOW_TABLE_OUTPUT\n"
@@ -288,56 +307,79 @@ def patch_common(monkeypatch, *, hcg_linked=True, chassis_alive=True, centralize
 
 
 def test_localnet_tags_returns_unknown_network_for_missing_switch_name():
-    assert router._localnet_tags(None, None, [], {}) == "(unknown network)"
+    assert router._localnet_tags(None, [], {}) == "(unknown network)"
 
 
-def test_localnet_tags_returns_switch_not_found(monkeypatch):
-    monkeypatch.setattr(router.ovn, "nbctl_find", lambda ctx, table, condition: [])
-    assert router._localnet_tags(None, "neutron-missing", [], {}) == (
-        "(switch not found)"
-    )
+def test_localnet_tags_returns_switch_not_found():
+    assert router._localnet_tags("neutron-missing", [], {}) == "(switch not found)"
 
 
-def test_localnet_tags_returns_no_localnet_port(monkeypatch):
-    monkeypatch.setattr(
-        router.ovn,
-        "nbctl_find",
-        lambda ctx, table, condition: [{"_uuid": "sw-1", "ports": ["lsp-1"]}],
-    )
-    all_lsp_rows = [{"_uuid": "lsp-1", "type": "", "tag": []}]
-    assert router._localnet_tags(None, "neutron-net-1", all_lsp_rows, {}) == (
+def test_localnet_tags_returns_no_localnet_port():
+    switches = {"neutron-net-1": {"_uuid": "sw-1", "ports": ["lsp-1"]}}
+    lsps_by_uuid = {"lsp-1": {"_uuid": "lsp-1", "type": "", "tag": []}}
+    assert router._localnet_tags("neutron-net-1", lsps_by_uuid, switches) == (
         "(no localnet port)"
     )
 
 
-def test_localnet_tags_joins_multiple_tags(monkeypatch):
-    monkeypatch.setattr(
-        router.ovn,
-        "nbctl_find",
-        lambda ctx, table, condition: [{"_uuid": "sw-1", "ports": ["lsp-1", "lsp-2"]}],
-    )
-    all_lsp_rows = [
-        {"_uuid": "lsp-1", "type": "localnet", "tag": 1800},
-        {"_uuid": "lsp-2", "type": "localnet", "tag": 1801},
-        {"_uuid": "lsp-3", "type": "router", "tag": []},
-    ]
-    assert router._localnet_tags(None, "neutron-net-1", all_lsp_rows, {}) == (
+def test_localnet_tags_joins_multiple_tags():
+    switches = {"neutron-net-1": {"_uuid": "sw-1", "ports": ["lsp-1", "lsp-2"]}}
+    lsps_by_uuid = {
+        "lsp-1": {"_uuid": "lsp-1", "type": "localnet", "tag": 1800},
+        "lsp-2": {"_uuid": "lsp-2", "type": "localnet", "tag": 1801},
+        "lsp-3": {"_uuid": "lsp-3", "type": "router", "tag": []},
+    }
+    assert router._localnet_tags("neutron-net-1", lsps_by_uuid, switches) == (
         "1800, 1801"
     )
 
 
-def test_localnet_tags_caches_switch_lookup_across_calls(monkeypatch):
-    calls = []
+def test_router_show_fetches_nb_tables_in_one_batch(monkeypatch):
+    patch_common(monkeypatch)
+    batches = []
+    fake_batch = router.ovn.nbctl_batch
 
-    def fake_nbctl_find(ctx, table, condition):
-        calls.append(condition)
-        return [{"_uuid": "sw-1", "ports": []}]
+    def recording_batch(ctx, commands):
+        batches.append(commands)
+        return fake_batch(ctx, commands)
 
-    monkeypatch.setattr(router.ovn, "nbctl_find", fake_nbctl_find)
-    cache: dict = {}
-    router._localnet_tags(None, "neutron-net-1", [], cache)
-    router._localnet_tags(None, "neutron-net-1", [], cache)
-    assert calls == ["name=neutron-net-1"]  # only looked up once, then cached
+    monkeypatch.setattr(router.ovn, "nbctl_batch", recording_batch)
+    result = runner.invoke(make_app(), ["router", "show", "test-router"])
+    assert result.exit_code == 0
+    assert len(batches) == 1
+    tables = {query.table: query for query in batches[0]}
+    # the full table, so cached snapshots are shared by every router
+    assert tables["Logical_Router"].where == ()
+    assert "Logical_Switch" in tables
+    assert "_uuid" in tables["Logical_Switch_Port"].columns
+
+
+def test_router_show_rpc_fetches_only_the_referenced_rows(monkeypatch):
+    patch_common(monkeypatch)
+    expected = runner.invoke(make_app(), ["router", "show", "test-router"])
+    assert expected.exit_code == 0
+    batches = []
+    fake_batch = router.ovn.nbctl_batch
+
+    def recording_batch(ctx, queries):
+        batches.append(queries)
+        return fake_batch(ctx, queries)
+
+    monkeypatch.setattr(router.ovn, "nbctl_batch", recording_batch)
+    result = runner.invoke(make_app(ovsdb_rpc=True), ["router", "show", "test-router"])
+    assert result.exit_code == 0, result.output
+    report = result.output[result.output.index("\nRouter test-router") :]
+    assert report == expected.output[expected.output.index("\nRouter test-router") :]
+    queries = [query for batch in batches for query in batch]
+    # only the localnet ports are selected by condition rather than by record
+    unfiltered = [query for query in queries if query.records is None]
+    assert [(q.table, q.where) for q in unfiltered] == [
+        ("Logical_Switch_Port", (("type", "localnet"),))
+    ]
+    records = {(q.table, q.record_column): q.records for q in queries if q.records}
+    assert records[("Logical_Router", "name")] == ("neutron-rtr-1",)
+    assert records[("NAT", "_uuid")] == ("nat-uuid-1", "nat-uuid-2")
+    assert "vm-port-1" in records[("Logical_Switch_Port", "name")]
 
 
 def test_router_show_reports_gateway_and_internal_ports(monkeypatch):
@@ -642,7 +684,9 @@ def test_router_show_missing_ovn_logical_router_errors(monkeypatch):
     monkeypatch.setattr(
         router.osclient, "resolve_router", lambda conn, name_or_id: FakeRouter()
     )
-    monkeypatch.setattr(router.ovn, "nbctl_find", lambda ctx, table, condition: [])
+    monkeypatch.setattr(
+        router.ovn, "nbctl_batch", lambda ctx, queries: [[] for _ in queries]
+    )
     result = runner.invoke(make_app(), ["router", "show", "test-router"])
     assert result.exit_code == 1
 
@@ -658,21 +702,31 @@ def test_rows_by_uuid_filters_to_matching_rows_only():
         {"_uuid": "b", "name": "drop-b"},
         {"_uuid": "c", "name": "keep-c"},
     ]
-    result = router._rows_by_uuid(rows, {"a", "c"})
+    rows_by_uuid = {row["_uuid"]: row for row in rows}
+    result = router._rows_by_uuid(rows_by_uuid, ["a", "c"])
     assert result == [
         {"_uuid": "a", "name": "keep-a"},
         {"_uuid": "c", "name": "keep-c"},
     ]
 
 
-def test_rows_by_uuid_ignores_rows_missing_uuid_key():
-    rows = [{"name": "no-uuid-field"}, {"_uuid": "a", "name": "keep-a"}]
-    assert router._rows_by_uuid(rows, {"a"}) == [{"_uuid": "a", "name": "keep-a"}]
+def test_rows_by_uuid_skips_dangling_uuids():
+    rows_by_uuid = {"a": {"_uuid": "a", "name": "keep-a"}}
+    result = router._rows_by_uuid(rows_by_uuid, ["gone", "a"])
+    assert result == [{"_uuid": "a", "name": "keep-a"}]
+
+
+def test_rows_by_uuid_keeps_the_parent_order():
+    rows_by_uuid = {"a": {"_uuid": "a"}, "b": {"_uuid": "b"}}
+    assert router._rows_by_uuid(rows_by_uuid, ["b", "a"]) == [
+        {"_uuid": "b"},
+        {"_uuid": "a"},
+    ]
 
 
 def test_rows_by_uuid_returns_empty_for_no_matches():
-    rows = [{"_uuid": "a"}, {"_uuid": "b"}]
-    assert router._rows_by_uuid(rows, {"z"}) == []
+    rows_by_uuid = {"a": {"_uuid": "a"}, "b": {"_uuid": "b"}}
+    assert router._rows_by_uuid(rows_by_uuid, ["z"]) == []
 
 
 def test_router_show_flags_dangling_hcg_reference(monkeypatch):
@@ -718,6 +772,14 @@ def test_router_show_skips_dangling_ha_chassis_reference(monkeypatch):
         router.ovn,
         "nbctl_list",
         lambda ctx, table: {
+            "Logical_Router": [
+                {
+                    "_uuid": "lr-uuid",
+                    "name": "neutron-rtr-1",
+                    "options": {"chassis": "chassis-a"},
+                    "ports": ["lrp-uuid-int"],
+                }
+            ],
             "Logical_Router_Port": [
                 {
                     "_uuid": "lrp-uuid-int",
@@ -739,18 +801,6 @@ def test_router_show_skips_dangling_ha_chassis_reference(monkeypatch):
             "Logical_Switch_Port": [],
         }[table],
     )
-    monkeypatch.setattr(
-        router.ovn,
-        "nbctl_find",
-        lambda ctx, table, condition: [
-            {
-                "_uuid": "lr-uuid",
-                "name": "neutron-rtr-1",
-                "options": {"chassis": "chassis-a"},
-                "ports": ["lrp-uuid-int"],
-            }
-        ],
-    )
     result = runner.invoke(make_app(), ["router", "show", "test-router"])
     assert result.exit_code == 0
     assert "neutron-net-1 -> (empty)" in result.output
@@ -853,7 +903,9 @@ def test_router_show_pinned_chassis_flags_dead_chassis(monkeypatch):
 def test_router_show_pinned_chassis_flags_missing_bridge_mappings(monkeypatch):
     patch_common(monkeypatch, hcg_linked=False, centralized=True)
     monkeypatch.setattr(
-        router.ovn, "sbctl_list", lambda ctx, table: [{"name": "chassis-a"}]
+        router.ovn,
+        "sbctl_list",
+        lambda ctx, table, columns=(): [{"name": "chassis-a"}],
     )
     result = runner.invoke(make_app(), ["router", "show", "test-router"])
     assert result.exit_code == 0
@@ -870,6 +922,105 @@ class FakeOsRouter:
         self.flavor_id = flavor_id
 
 
+def patch_multi(monkeypatch, openstack_routers):
+    """patch_common, with Neutron listing the given routers and their ports."""
+    patch_common(monkeypatch)
+    ports = make_ports()
+    for port in ports:
+        port.device_id = "rtr-1"
+    conn = FakeConnection(
+        ports,
+        all_ports=[*ports, make_bound_port()],
+        servers={"server-1": types.SimpleNamespace(name="my-server")},
+        routers_list=openstack_routers,
+    )
+    monkeypatch.setattr(router.osclient, "get_connection", lambda os_cloud: conn)
+    monkeypatch.setattr(
+        router.osclient,
+        "resolve_router",
+        lambda conn, name_or_id: pytest.fail("multi-router show resolved singly"),
+    )
+    return conn
+
+
+def test_router_show_multiple_routers_share_one_snapshot(monkeypatch):
+    conn = patch_multi(
+        monkeypatch,
+        [FakeOsRouter("rtr-1", "test-router"), FakeOsRouter("rtr-2", "other")],
+    )
+    lr_rows = router.ovn.nbctl_list(None, "Logical_Router")
+    lr_two = {**lr_rows[0], "name": "neutron-rtr-2", "ports": [], "nat": []}
+    fake_list = router.ovn.nbctl_list
+    monkeypatch.setattr(
+        router.ovn,
+        "nbctl_list",
+        lambda ctx, table: (
+            [*lr_rows, lr_two] if table == "Logical_Router" else fake_list(ctx, table)
+        ),
+    )
+    batches = []
+    fake_batch = router.ovn.nbctl_batch
+
+    def recording_batch(ctx, queries):
+        batches.append(queries)
+        return fake_batch(ctx, queries)
+
+    monkeypatch.setattr(router.ovn, "nbctl_batch", recording_batch)
+    result = runner.invoke(
+        make_app(), ["router", "show", "test-router", "rtr-2", "--workers", "2"]
+    )
+    assert result.exit_code == 0, result.output
+    assert len(batches) == 1
+    assert batches[0][0].table == "Logical_Router"
+    assert batches[0][0].where == ()
+    first = result.output.index("Router test-router (rtr-1)")
+    second = result.output.index("Router other (rtr-2)")
+    assert first < second
+    # Each router's report stays contiguous despite concurrent rendering.
+    assert "-> port vm-port-1" in result.output[first:second]
+    assert "Owner            : server server-1 (my-server)" in result.output
+    assert "lrp-gw-1 [gateway]" in result.output
+    # Neutron ports are listed once, never fetched per port.
+    assert conn.network.calls == [("ports", None, None)]
+
+
+def test_router_show_all_skips_flavored_routers_and_reports_missing_lr(monkeypatch):
+    patch_multi(
+        monkeypatch,
+        [
+            FakeOsRouter("rtr-1", "test-router"),
+            FakeOsRouter("rtr-9", "not-in-ovn"),
+            FakeOsRouter("rtr-vrf", "vrf-router", flavor_id="flavor-uuid"),
+        ],
+    )
+    result = runner.invoke(make_app(), ["router", "show", "--all"])
+    assert result.exit_code == 1
+    assert "Router test-router (rtr-1)" in result.output
+    assert "Router not-in-ovn (rtr-9)" in result.output
+    assert "no OVN Logical_Router named neutron-rtr-9" in result.output
+    assert "vrf-router" not in result.output
+
+
+def test_router_show_multi_reports_unknown_and_ambiguous_names(monkeypatch):
+    patch_multi(
+        monkeypatch,
+        [FakeOsRouter("rtr-1", "dup"), FakeOsRouter("rtr-2", "dup")],
+    )
+    result = runner.invoke(make_app(), ["router", "show", "rtr-1", "missing"])
+    assert result.exit_code == 1
+    assert "router 'missing' not found" in result.output
+    result = runner.invoke(make_app(), ["router", "show", "rtr-1", "dup"])
+    assert result.exit_code == 1
+    assert "'dup' is ambiguous, use one of its IDs: rtr-1, rtr-2" in result.output
+
+
+def test_router_show_requires_exactly_one_of_names_or_all(monkeypatch):
+    patch_common(monkeypatch)
+    assert runner.invoke(make_app(), ["router", "show"]).exit_code == 2
+    result = runner.invoke(make_app(), ["router", "show", "test-router", "--all"])
+    assert result.exit_code == 2
+
+
 def patch_list_common(monkeypatch, openstack_routers, ovn_lr_names):
     monkeypatch.setattr(
         router.osclient,
@@ -879,7 +1030,7 @@ def patch_list_common(monkeypatch, openstack_routers, ovn_lr_names):
     monkeypatch.setattr(
         router.ovn,
         "nbctl_list",
-        lambda ctx, table: [{"name": name} for name in ovn_lr_names],
+        lambda ctx, table, columns=(): [{"name": name} for name in ovn_lr_names],
     )
 
 
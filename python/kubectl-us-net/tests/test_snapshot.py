@@ -0,0 +1,144 @@
+import pytest
+
+from us_net import snapshot
+from us_net.connection import ConnectionContext
+
+QUERY_ARGS = [["list", "NAT"]]
+LRP_ARGS = ["--columns=_uuid,name", "list", "Logical_Router_Port"]
+
+
+def make_ctx(**overrides):
+    defaults = dict(
+        kube_context="ctx-a",
+        namespace="openstack",
+        nb_pod="ovn-ovsdb-nb-0",
+        sb_pod="ovn-ovsdb-sb-0",
+        os_cloud=None,
+        cache=True,
+    )
+    defaults.update(overrides)
+    return ConnectionContext(**defaults)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(snapshot, "_kube_context", lambda kube_context: kube_context)
+
+
+class Fetcher:
+    def __init__(self):
+        self.calls = 0
+        self.fetched = []
+
+    def __call__(self, indexes):
+        self.calls += 1
+        self.fetched.append(indexes)
+        return [[{"_uuid": f"row-{self.calls}-{index}"}] for index in indexes]
+
+
+def load(ctx, fetch, probe=None, query_args=QUERY_ARGS):
+    return snapshot.load_or_fetch(
+        ctx, ctx.nb_pod, "OVN_Northbound", query_args, fetch, probe
+    )
+
+
+def test_cache_disabled_always_fetches():
+    fetch = Fetcher()
+    ctx = make_ctx(cache=False)
+    load(ctx, fetch)
+    load(ctx, fetch)
+    assert fetch.calls == 2
+    assert not snapshot.cache_dir().exists()
+
+
+def test_fresh_snapshot_is_reused():
+    fetch = Fetcher()
+    ctx = make_ctx()
+    first = load(ctx, fetch)
+    assert load(ctx, fetch) == first
+    assert fetch.calls == 1
+
+
+def test_refresh_refetches_and_rewrites():
+    fetch = Fetcher()
+    load(make_ctx(), fetch)
+    assert load(make_ctx(refresh=True), fetch) == [[{"_uuid": "row-2-0"}]]
+    assert load(make_ctx(), fetch) == [[{"_uuid": "row-2-0"}]]
+    assert fetch.calls == 2
+
+
+def test_expired_snapshot_reused_when_version_unchanged():
+    fetch = Fetcher()
+    ctx = make_ctx(cache_ttl=0)
+    load(ctx, fetch, lambda: "txn-1")
+    assert load(ctx, fetch, lambda: "txn-1") == [[{"_uuid": "row-1-0"}]]
+    assert fetch.calls == 1
+
+
+def test_expired_snapshot_refetched_when_version_changed():
+    fetch = Fetcher()
+    ctx = make_ctx(cache_ttl=0)
+    load(ctx, fetch, lambda: "txn-1")
+    assert load(ctx, fetch, lambda: "txn-2") == [[{"_uuid": "row-2-0"}]]
+    assert fetch.calls == 2
+
+
+def test_expired_snapshot_refetched_without_version():
+    fetch = Fetcher()
+    ctx = make_ctx(cache_ttl=0)
+    load(ctx, fetch)
+    load(ctx, fetch)
+    assert fetch.calls == 2
+
+
+def test_snapshots_are_keyed_by_kube_context():
+    fetch = Fetcher()
+    load(make_ctx(kube_context="ctx-a"), fetch)
+    load(make_ctx(kube_context="ctx-b"), fetch)
+    assert fetch.calls == 2
+
+
+def test_corrupt_snapshot_is_refetched():
+    fetch = Fetcher()
+    ctx = make_ctx()
+    load(ctx, fetch)
+    path = snapshot.snapshot_path(ctx, ctx.nb_pod, "OVN_Northbound", QUERY_ARGS[0])
+    path.write_text("{not json")
+    load(ctx, fetch)
+    assert fetch.calls == 2
+
+
+def test_queries_are_cached_per_table_across_batches():
+    fetch = Fetcher()
+    ctx = make_ctx()
+    load(ctx, fetch, query_args=[["find", "Logical_Router", "name=a"], LRP_ARGS])
+    results = load(
+        ctx, fetch, query_args=[["find", "Logical_Router", "name=b"], LRP_ARGS]
+    )
+    # only the query not seen before is fetched, the shared table is reused
+    assert fetch.fetched == [[0, 1], [0]]
+    assert results == [[{"_uuid": "row-2-0"}], [{"_uuid": "row-1-1"}]]
+
+
+def test_only_expired_queries_with_changed_version_are_refetched():
+    fetch = Fetcher()
+    load(make_ctx(), fetch, lambda: "txn-1", query_args=[["list", "NAT"]])
+    load(make_ctx(), fetch, lambda: "txn-2", query_args=[LRP_ARGS])
+    results = load(
+        make_ctx(cache_ttl=0),
+        fetch,
+        lambda: "txn-2",
+        query_args=[["list", "NAT"], LRP_ARGS],
+    )
+    assert fetch.fetched == [[0], [0], [0]]
+    assert results == [[{"_uuid": "row-3-0"}], [{"_uuid": "row-2-0"}]]
+
+
+def test_snapshot_count_is_bounded(monkeypatch):
+    monkeypatch.setattr(snapshot, "MAX_SNAPSHOTS", 2)
+    fetch = Fetcher()
+    ctx = make_ctx()
+    for table in ("NAT", "HA_Chassis", "Gateway_Chassis"):
+        load(ctx, fetch, query_args=[["list", table]])
+    assert len(list(snapshot.cache_dir().glob("*.json"))) == 2
@@ -6,6 +6,7 @@ import typer
 
 from us_net.commands import raw
 from us_net.commands import router
+from us_net.connection import DEFAULT_CACHE_TTL
 from us_net.connection import ConnectionContext
 
 app = typer.Typer(
@@ -36,6 +37,27 @@ def main(
         "--os-cloud",
         help="OpenStack cloud name (default: OS_CLOUD env / clouds.yaml default)",
     ),
+    ovsdb_rpc: bool = typer.Option(
+        False,
+        "--ovsdb-rpc",
+        help="Query the NB/SB databases over OVSDB JSON-RPC through kubectl "
+        "port-forward instead of exec'ing ovn-nbctl/ovn-sbctl",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Reuse OVN table snapshots saved on disk by earlier invocations",
+    ),
+    cache_ttl: float = typer.Option(
+        DEFAULT_CACHE_TTL,
+        "--cache-ttl",
+        help="Seconds a cached snapshot is reused without checking the DB version",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Refetch OVN tables and rewrite the snapshot cache (implies --cache)",
+    ),
 ) -> None:
     """Set up the shared connection context used by every subcommand."""
     ctx.obj = ConnectionContext(
@@ -44,6 +66,10 @@ def main(
         nb_pod=nb_pod,
         sb_pod=sb_pod,
         os_cloud=os_cloud,
+        ovsdb_rpc=ovsdb_rpc,
+        cache=cache or refresh,
+        cache_ttl=cache_ttl,
+        refresh=refresh,
     )
 
 
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import io
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Annotated
 from typing import Any
+from typing import TextIO
 
 import typer
 from openstack import exceptions as os_exc
@@ -20,6 +26,41 @@ NEUTRON_PREFIX = "neutron-"
 GATEWAY_DEVICE_OWNER = "network:router_gateway"
 INTERFACE_DEVICE_OWNER = "network:router_interface"
 
+DEFAULT_WORKERS = 8
+
+# Declared via Annotated to keep typer.Argument() out of the default value
+# (ruff B008), as in us_net/commands/raw.py.
+RouterArgs = Annotated[
+    list[str] | None,
+    typer.Argument(help="Neutron router name(s) or ID(s)", show_default=False),
+]
+
+# Columns `router show` reads from each table; everything else is left on
+# the OVSDB server.
+LR_COLUMNS = ("_uuid", "name", "options", "ports", "nat")
+LRP_COLUMNS = ("_uuid", "name", "networks", "ha_chassis_group", "gateway_chassis")
+HCG_COLUMNS = ("_uuid", "name", "ha_chassis")
+SWITCH_COLUMNS = ("_uuid", "name", "ports")
+CHASSIS_REF_COLUMNS = ("_uuid", "chassis_name", "priority")
+NAT_COLUMNS = (
+    "_uuid",
+    "type",
+    "external_ip",
+    "logical_ip",
+    "logical_port",
+    "external_ids",
+)
+LSP_COLUMNS = (
+    "_uuid",
+    "name",
+    "type",
+    "tag",
+    "addresses",
+    "up",
+    "external_ids",
+    "ha_chassis_group",
+)
+
 
 def _lrp_role(
     lrp_name: str, gateway_port_id: str | None, interface_port_ids: set[str]
@@ -32,9 +73,9 @@ def _lrp_role(
     return "unknown"
 
 
-def _rows_by_uuid(rows: list[dict], uuids: set[str]) -> list[dict]:
-    """Filter a full OVN table dump down to rows referenced by a parent's uuid set."""
-    return [row for row in rows if row.get("_uuid") in uuids]
+def _rows_by_uuid(rows_by_uuid: dict[str, dict], uuids: list[str]) -> list[dict]:
+    """Rows of an indexed OVN table referenced by a parent, skipping dangling ones."""
+    return [rows_by_uuid[uuid] for uuid in uuids if uuid in rows_by_uuid]
 
 
 def _chassis_physical_networks(chassis_row: dict | None) -> str:
@@ -47,7 +88,79 @@ def _chassis_physical_networks(chassis_row: dict | None) -> str:
     return ", ".join(pair.split(":", 1)[0] for pair in mappings.split(",") if pair)
 
 
-def _resolve_nat_port(conn, nat_row: dict) -> tuple[str | None, Any | None]:
+class NeutronLookup:
+    """Neutron/Nova questions `router show` asks, one API call each.
+
+    The cheapest way to inspect a single router. BulkNeutronLookup answers
+    the same questions for many routers from fleet-wide list calls made up
+    front, instead of a handful of calls per router and NAT rule.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+        # NAT ports are resolved both to pick their OVN rows (--ovsdb-rpc)
+        # and again when rendered, so each answer is kept
+        self._ports_by_id = {}
+        self._ports_by_ip = {}
+
+    def router_ports(self, router_id: str) -> list:
+        return list(self._conn.network.ports(device_id=router_id))
+
+    def get_port(self, port_id: str):
+        """The Neutron port with this ID, or None if it doesn't exist."""
+        if port_id not in self._ports_by_id:
+            try:
+                self._ports_by_id[port_id] = self._conn.network.get_port(port_id)
+            except os_exc.ResourceNotFound:
+                self._ports_by_id[port_id] = None
+        return self._ports_by_id[port_id]
+
+    def port_by_fixed_ip(self, ip_address: str):
+        if ip_address not in self._ports_by_ip:
+            matches = list(
+                self._conn.network.ports(fixed_ips=f"ip_address={ip_address}")
+            )
+            self._ports_by_ip[ip_address] = matches[0] if matches else None
+        return self._ports_by_ip[ip_address]
+
+    def server_name(self, server_id: str) -> str:
+        return self._conn.compute.get_server(server_id).name
+
+
+class BulkNeutronLookup(NeutronLookup):
+    """NeutronLookup answered from one list call per resource type."""
+
+    def __init__(self, conn):
+        super().__init__(conn)
+        self._ports_by_device: dict[str, list] = {}
+        for port in conn.network.ports():
+            self._ports_by_id[port.id] = port
+            if port.device_id:
+                self._ports_by_device.setdefault(port.device_id, []).append(port)
+            for fixed_ip in port.fixed_ips or []:
+                self._ports_by_ip.setdefault(fixed_ip["ip_address"], port)
+        # Servers aren't listed up front: a fleet-wide server list is far
+        # larger than the handful of FIP-bound instances routers point at.
+        self._server_names: dict[str, str] = {}
+
+    def router_ports(self, router_id: str) -> list:
+        return self._ports_by_device.get(router_id, [])
+
+    def get_port(self, port_id: str):
+        return self._ports_by_id.get(port_id)
+
+    def port_by_fixed_ip(self, ip_address: str):
+        return self._ports_by_ip.get(ip_address)
+
+    def server_name(self, server_id: str) -> str:
+        if server_id not in self._server_names:
+            self._server_names[server_id] = super().server_name(server_id)
+        return self._server_names[server_id]
+
+
+def _resolve_nat_port(
+    neutron: NeutronLookup, nat_row: dict
+) -> tuple[str | None, Any | None]:
     """Resolve the OpenStack port a NAT rule is bound to, if any.
 
     Prefers external_ids["neutron:fip_port_id"] (populated by neutron for
@@ -60,27 +173,23 @@ def _resolve_nat_port(conn, nat_row: dict) -> tuple[str | None, Any | None]:
         external_ids.get("neutron:fip_port_id") or nat_row.get("logical_port") or None
     )
     if port_id:
-        try:
-            return port_id, conn.network.get_port(port_id)
-        except os_exc.ResourceNotFound:
-            return port_id, None
+        return port_id, neutron.get_port(port_id)
 
     logical_ip = nat_row.get("logical_ip")
     if logical_ip and "/" not in logical_ip:
-        matches = list(conn.network.ports(fixed_ips=f"ip_address={logical_ip}"))
-        if matches:
-            return matches[0].id, matches[0]
+        port = neutron.port_by_fixed_ip(logical_ip)
+        if port is not None:
+            return port.id, port
     return None, None
 
 
-def _describe_port_owner(conn, port) -> str:
+def _describe_port_owner(neutron: NeutronLookup, port) -> str:
     """Describe what a port is bound to: a server, or another device owner."""
     device_owner = getattr(port, "device_owner", None)
     device_id = getattr(port, "device_id", None)
     if device_owner and device_owner.startswith("compute:") and device_id:
         try:
-            server = conn.compute.get_server(device_id)
-            return f"server {device_id} ({server.name})"
+            return f"server {device_id} ({neutron.server_name(device_id)})"
         except Exception:
             return f"server {device_id}"
     if device_owner:
@@ -159,28 +268,26 @@ def _describe_hcg(hcg_uuid: str | None, tables: ChassisTables) -> str:
 
 
 def _localnet_tags(
-    conn_ctx: ConnectionContext,
     switch_name: str | None,
-    all_lsp_rows: list[dict],
-    switch_row_cache: dict[str, dict | None],
+    lsps_by_uuid: dict[str, dict],
+    switches_by_name: dict[str, dict],
 ) -> str:
     """VLAN tag(s) of a network's localnet/uplink port(s), via its OVN Logical_Switch.
 
     A network can have more than one (e.g. one per leaf-switch-pair segment).
-    `all_lsp_rows` is the whole fleet's Logical_Switch_Port table, fetched
-    once by the caller rather than per port. `switch_row_cache` memoizes the
-    (cheap, scoped) Logical_Switch lookup across ports that share a network.
+    `lsps_by_uuid` and `switches_by_name` index whole-fleet table dumps
+    fetched once by the caller rather than per port.
     """
     if not switch_name:
         return "(unknown network)"
-    if switch_name not in switch_row_cache:
-        rows = ovn.nbctl_find(conn_ctx, "Logical_Switch", f"name={switch_name}")
-        switch_row_cache[switch_name] = rows[0] if rows else None
-    switch_row = switch_row_cache[switch_name]
+    switch_row = switches_by_name.get(switch_name)
     if switch_row is None:
         return "(switch not found)"
-    lsp_uuids = set(ovn.as_list(switch_row.get("ports")))
-    candidate_lsps = _rows_by_uuid(all_lsp_rows, lsp_uuids)
+    candidate_lsps = [
+        lsps_by_uuid[uuid]
+        for uuid in ovn.as_list(switch_row.get("ports"))
+        if uuid in lsps_by_uuid
+    ]
     tags = [
         tag
         for lsp in candidate_lsps
@@ -190,32 +297,222 @@ def _localnet_tags(
     return ", ".join(str(tag) for tag in tags) if tags else "(no localnet port)"
 
 
-@app.command("show")
-def show(
-    ctx: typer.Context,
-    name_or_id: str = typer.Argument(..., help="Neutron router name or ID"),
-    flows: bool = typer.Option(
-        False,
-        "--flows",
-        help="Also dump southbound logical flows for this router (can be large)",
-    ),
+@dataclass
+class OvnSnapshot:
+    """Every NB/SB row `router show` reads, fetched once however many routers.
+
+    The fetch and the lookup indexes below are shared by all the routers
+    rendered from them.
+    """
+
+    routers_by_name: dict[str, dict]
+    lrps_by_uuid: dict[str, dict]
+    nat_rows_by_uuid: dict[str, dict]
+    lsp_by_name: dict[str, dict]
+    lsps_by_uuid: dict[str, dict]
+    switches_by_name: dict[str, dict]
+    tables: ChassisTables
+
+
+def _refs(rows: list[dict], column: str) -> tuple[str, ...]:
+    """Every uuid the rows reference through one column, for a records query."""
+    return tuple(
+        sorted({uuid for row in rows for uuid in ovn.as_list(row.get(column))})
+    )
+
+
+def _nat_port_ids(neutron: NeutronLookup, nat_rows: list[dict]) -> set[str]:
+    """Neutron port IDs the NAT rules resolve to, as _render_router will."""
+    port_ids = set()
+    for nat in nat_rows:
+        # a failing lookup is reported when the rule is rendered
+        with contextlib.suppress(Exception):
+            port_id, _ = _resolve_nat_port(neutron, nat)
+            if port_id:
+                port_ids.add(port_id)
+    return port_ids
+
+
+def _fetch_fleet_tables(conn_ctx: ConnectionContext) -> tuple[list[dict], ...]:
+    # Every NB table this command needs comes back from a single round trip;
+    # the kubectl exec setup, not the dump itself, dominates each one. The
+    # column projections keep the fleet-wide tables (LSP, NAT) small. The
+    # routers are picked out of the full table too, so that with --cache the
+    # same table snapshot serves whichever routers are shown.
+    return tuple(
+        ovn.nbctl_batch(
+            conn_ctx,
+            [
+                ovn.Query("Logical_Router", columns=LR_COLUMNS),
+                ovn.Query("Logical_Router_Port", columns=LRP_COLUMNS),
+                ovn.Query("NAT", columns=NAT_COLUMNS),
+                ovn.Query("Logical_Switch_Port", columns=LSP_COLUMNS),
+                ovn.Query("Logical_Switch", columns=SWITCH_COLUMNS),
+                ovn.Query("HA_Chassis_Group", columns=HCG_COLUMNS),
+                ovn.Query("HA_Chassis", columns=CHASSIS_REF_COLUMNS),
+                ovn.Query("Gateway_Chassis", columns=CHASSIS_REF_COLUMNS),
+            ],
+        )
+    )
+
+
+def _fetch_router_rows(
+    conn_ctx: ConnectionContext, ovn_names: list[str], neutron: NeutronLookup
+) -> tuple[list[dict], ...]:
+    """Only the NB rows the given routers reference, following the references.
+
+    Each step is one transact over the connection rpc_connections() keeps
+    open, so with --ovsdb-rpc this is cheaper than dumping the fleet-wide
+    tables; through kubectl exec every step would cost a second.
+    """
+    (lr_rows,) = ovn.nbctl_batch(
+        conn_ctx,
+        [
+            ovn.Query(
+                "Logical_Router",
+                columns=LR_COLUMNS,
+                records=tuple(ovn_names),
+                record_column="name",
+            )
+        ],
+    )
+    lrps, nat_rows, localnet_lsps = ovn.nbctl_batch(
+        conn_ctx,
+        [
+            ovn.Query(
+                "Logical_Router_Port",
+                columns=LRP_COLUMNS,
+                records=_refs(lr_rows, "ports"),
+            ),
+            ovn.Query("NAT", columns=NAT_COLUMNS, records=_refs(lr_rows, "nat")),
+            # few per network, and what the VLAN tags are read from
+            ovn.Query(
+                "Logical_Switch_Port",
+                where=(("type", "localnet"),),
+                columns=LSP_COLUMNS,
+            ),
+        ],
+    )
+    # the LSPs peering with the router ports, and those NAT rules point to
+    lsp_names = {lrp["name"].removeprefix("lrp-") for lrp in lrps}
+    lsp_names |= _nat_port_ids(neutron, nat_rows)
+    lsp_rows, gateway_chassis_rows = ovn.nbctl_batch(
+        conn_ctx,
+        [
+            ovn.Query(
+                "Logical_Switch_Port",
+                columns=LSP_COLUMNS,
+                records=tuple(sorted(lsp_names)),
+                record_column="name",
+            ),
+            ovn.Query(
+                "Gateway_Chassis",
+                columns=CHASSIS_REF_COLUMNS,
+                records=_refs(lrps, "gateway_chassis"),
+            ),
+        ],
+    )
+    switch_names = {
+        name
+        for lsp in lsp_rows
+        if (name := (lsp.get("external_ids") or {}).get("neutron:network_name"))
+    }
+    switch_rows, hcg_rows = ovn.nbctl_batch(
+        conn_ctx,
+        [
+            ovn.Query(
+                "Logical_Switch",
+                columns=SWITCH_COLUMNS,
+                records=tuple(sorted(switch_names)),
+                record_column="name",
+            ),
+            ovn.Query(
+                "HA_Chassis_Group",
+                columns=HCG_COLUMNS,
+                records=_refs([*lrps, *lsp_rows], "ha_chassis_group"),
+            ),
+        ],
+    )
+    (ha_chassis_rows,) = ovn.nbctl_batch(
+        conn_ctx,
+        [
+            ovn.Query(
+                "HA_Chassis",
+                columns=CHASSIS_REF_COLUMNS,
+                records=_refs(hcg_rows, "ha_chassis"),
+            )
+        ],
+    )
+    return (
+        lr_rows,
+        lrps,
+        nat_rows,
+        [*lsp_rows, *localnet_lsps],
+        switch_rows,
+        hcg_rows,
+        ha_chassis_rows,
+        gateway_chassis_rows,
+    )
+
+
+def _fetch_ovn_snapshot(
+    conn_ctx: ConnectionContext, ovn_names: list[str], neutron: NeutronLookup
+) -> OvnSnapshot:
+    with ovn.rpc_connections(conn_ctx):
+        (
+            lr_rows,
+            lrps,
+            nat_rows,
+            lsp_rows,
+            switch_rows,
+            hcg_rows,
+            ha_chassis_rows,
+            gateway_chassis_rows,
+        ) = (
+            _fetch_router_rows(conn_ctx, ovn_names, neutron)
+            if conn_ctx.ovsdb_rpc
+            else _fetch_fleet_tables(conn_ctx)
+        )
+        sb_chassis_by_name = {
+            row["name"]: row
+            for row in ovn.sbctl_list(
+                conn_ctx, "Chassis", columns=("name", "other_config")
+            )
+        }
+    return OvnSnapshot(
+        routers_by_name={row["name"]: row for row in lr_rows},
+        lrps_by_uuid={row["_uuid"]: row for row in lrps},
+        nat_rows_by_uuid={row["_uuid"]: row for row in nat_rows},
+        lsp_by_name={row["name"]: row for row in lsp_rows},
+        lsps_by_uuid={row["_uuid"]: row for row in lsp_rows},
+        switches_by_name={row["name"]: row for row in switch_rows},
+        tables=ChassisTables(
+            hcg_rows={row["_uuid"]: row for row in hcg_rows},
+            ha_chassis_rows={row["_uuid"]: row for row in ha_chassis_rows},
+            gateway_chassis_rows={row["_uuid"]: row for row in gateway_chassis_rows},
+            sb_chassis_by_name=sb_chassis_by_name,
+        ),
+    )
+
+
+def _render_router(
+    out: TextIO,
+    conn_ctx: ConnectionContext,
+    router,
+    neutron: NeutronLookup,
+    snapshot: OvnSnapshot,
+    flows: bool,
 ) -> None:
-    """Show a router's gateway/internal IPs, HCG state, NAT rules, and SB flows."""
-    conn_ctx: ConnectionContext = ctx.obj
-    print_connection_banner(conn_ctx, include_openstack=True)
+    """Write one router's `router show` report to `out`.
 
-    try:
-        conn = osclient.get_connection(conn_ctx.os_cloud)
-        router = osclient.resolve_router(conn, name_or_id)
-    except Exception as exc:
-        typer.echo(f"ERROR: {exc}", err=True)
-        raise typer.Exit(1) from exc
+    Raises LookupError when the router has no OVN Logical_Router.
+    """
+    emit = functools.partial(print, file=out)
 
-    ports = list(conn.network.ports(device_id=router.id))
     gateway_port_id: str | None = None
     interface_port_ids: set[str] = set()
     port_fixed_ips: dict[str, list[dict]] = {}
-    for port in ports:
+    for port in neutron.router_ports(router.id):
         port_fixed_ips[port.id] = port.fixed_ips
         if port.device_owner == GATEWAY_DEVICE_OWNER:
             gateway_port_id = port.id
@@ -223,18 +520,15 @@ def show(
             interface_port_ids.add(port.id)
 
     ovn_name = f"{NEUTRON_PREFIX}{router.id}"
-    print(f"\nRouter {router.name} ({router.id})")
-    print(f"OVN Logical_Router: {ovn_name}")
-
-    lr_rows = ovn.nbctl_find(conn_ctx, "Logical_Router", f"name={ovn_name}")
-    if not lr_rows:
-        typer.echo(
-            f"\nERROR: no OVN Logical_Router named {ovn_name} "
-            "-- router may not be scheduled in OVN yet.",
-            err=True,
+    emit(f"\nRouter {router.name} ({router.id})")
+    emit(f"OVN Logical_Router: {ovn_name}")
+
+    lr = snapshot.routers_by_name.get(ovn_name)
+    if lr is None:
+        raise LookupError(
+            f"no OVN Logical_Router named {ovn_name} "
+            "-- router may not be scheduled in OVN yet."
         )
-        raise typer.Exit(1)
-    lr = lr_rows[0]
     chassis_option = lr.get("options", {}).get("chassis")
     router_is_centralized = bool(chassis_option)
     router_type = (
@@ -242,41 +536,19 @@ def show(
         if router_is_centralized
         else "distributed"
     )
-    print(f"Type: {router_type}")
+    emit(f"Type: {router_type}")
 
-    lrp_uuids = set(ovn.as_list(lr.get("ports")))
-    all_lrps = ovn.nbctl_list(conn_ctx, "Logical_Router_Port")
-    lrps = _rows_by_uuid(all_lrps, lrp_uuids)
+    lrps = _rows_by_uuid(snapshot.lrps_by_uuid, ovn.as_list(lr.get("ports")))
 
-    hcg_rows = {
-        row["_uuid"]: row for row in ovn.nbctl_list(conn_ctx, "HA_Chassis_Group")
-    }
-    ha_chassis_rows = {
-        row["_uuid"]: row for row in ovn.nbctl_list(conn_ctx, "HA_Chassis")
-    }
-    gateway_chassis_rows = {
-        row["_uuid"]: row for row in ovn.nbctl_list(conn_ctx, "Gateway_Chassis")
-    }
-    sb_chassis_by_name = {
-        row["name"]: row for row in ovn.sbctl_list(conn_ctx, "Chassis")
-    }
-    tables = ChassisTables(
-        hcg_rows=hcg_rows,
-        ha_chassis_rows=ha_chassis_rows,
-        gateway_chassis_rows=gateway_chassis_rows,
-        sb_chassis_by_name=sb_chassis_by_name,
+    tables = snapshot.tables
+    router_chassis_live = (
+        "alive" if chassis_option in tables.sb_chassis_by_name else "DEAD"
     )
-    router_chassis_live = "alive" if chassis_option in sb_chassis_by_name else "DEAD"
     router_chassis_physnets = _chassis_physical_networks(
-        sb_chassis_by_name.get(chassis_option)
+        tables.sb_chassis_by_name.get(chassis_option)
     )
-    # Fetched once and reused for every port below -- this is a fleet-wide
-    # table, so refetching it per port would scale with cluster size.
-    all_lsp_rows = ovn.nbctl_list(conn_ctx, "Logical_Switch_Port")
-    lsp_by_name = {row["name"]: row for row in all_lsp_rows}
-    switch_row_cache: dict[str, dict | None] = {}
 
-    print("\nRouter ports:")
+    emit("\nRouter ports:")
     for lrp in lrps:
         port_id = lrp["name"].removeprefix("lrp-")
         role = _lrp_role(lrp["name"], gateway_port_id, interface_port_ids)
@@ -284,30 +556,32 @@ def show(
         neutron_ips = ", ".join(
             fip["ip_address"] for fip in port_fixed_ips.get(port_id, [])
         )
-        print(f"  - {lrp['name']} [{role}]")
-        print(f"      Neutron port      : {port_id}")
-        print(f"      OVN networks      : {networks or '(none)'}")
-        print(f"      Neutron fixed IPs : {neutron_ips or '(none)'}")
+        emit(f"  - {lrp['name']} [{role}]")
+        emit(f"      Neutron port      : {port_id}")
+        emit(f"      OVN networks      : {networks or '(none)'}")
+        emit(f"      Neutron fixed IPs : {neutron_ips or '(none)'}")
 
-        peer_lsp = _find_lsp(lsp_by_name, port_id)
+        peer_lsp = _find_lsp(snapshot.lsp_by_name, port_id)
         switch_name = (
             (peer_lsp or {}).get("external_ids", {}).get("neutron:network_name")
         )
-        tags = _localnet_tags(conn_ctx, switch_name, all_lsp_rows, switch_row_cache)
-        print(f"      Network VLAN tag  : {tags}")
+        tags = _localnet_tags(
+            switch_name, snapshot.lsps_by_uuid, snapshot.switches_by_name
+        )
+        emit(f"      Network VLAN tag  : {tags}")
 
         hcg_uuid = lrp.get("ha_chassis_group")
         gw_chassis_uuids = ovn.as_list(lrp.get("gateway_chassis"))
         if hcg_uuid:
             summary = _describe_hcg(hcg_uuid, tables)
-            print(f"      HA_Chassis_Group  : {summary}")
+            emit(f"      HA_Chassis_Group  : {summary}")
         elif gw_chassis_uuids:
             # VLAN/FLAT distributed gateways are scheduled by OVN's own L3
             # scheduler via gateway_chassis, not ha_chassis_group.
             summary = _describe_chassis_refs(
                 gw_chassis_uuids, tables.gateway_chassis_rows, tables.sb_chassis_by_name
             )
-            print(f"      Gateway_Chassis   : {summary}")
+            emit(f"      Gateway_Chassis   : {summary}")
         elif router_is_centralized:
             # options:chassis alone pins every port on a centralized router
             # (gateway included) -- ovn-northd ignores/warns on
@@ -317,64 +591,165 @@ def show(
                 f"{chassis_option} ({router_chassis_live}, "
                 f"physnets={router_chassis_physnets})"
             )
-            print(f"      Pinned chassis    : {pin}")
+            emit(f"      Pinned chassis    : {pin}")
         elif role == "internal":
             # Upstream OVN never sets ha_chassis_group on an internal
             # router-interface LRP by default (only understack's
             # vxlan-specific workaround does, and only for genuinely
             # distributed routers) -- unset here is the normal state.
-            print(
+            emit(
                 "      HA_Chassis_Group  : (none) -- not set by default "
                 "on internal ports"
             )
         else:
-            print(
+            emit(
                 "      HA_Chassis_Group  : NOT LINKED (likely bug -- no "
                 "ha_chassis_group or gateway_chassis found; see "
                 "scripts/cleanup_dead_ovn_ha_chassis.py)"
             )
 
-    print("\nNAT rules:")
-    nat_uuids = set(ovn.as_list(lr.get("nat")))
-    all_nat_rows = ovn.nbctl_list(conn_ctx, "NAT")
-    nat_rows = _rows_by_uuid(all_nat_rows, nat_uuids)
+    emit("\nNAT rules:")
+    nat_rows = _rows_by_uuid(snapshot.nat_rows_by_uuid, ovn.as_list(lr.get("nat")))
     resolved_ports: dict[str, Any] = {}
     if not nat_rows:
-        print("  (none)")
+        emit("  (none)")
     for nat in nat_rows:
         nat_type = nat.get("type", "?")
         external_ip = nat.get("external_ip") or "-"
         logical_ip = nat.get("logical_ip") or "-"
         line = f"  {nat_type:<14} external={external_ip:<16} logical={logical_ip}"
         try:
-            port_id, port = _resolve_nat_port(conn, nat)
+            port_id, port = _resolve_nat_port(neutron, nat)
         except Exception as exc:
-            print(f"{line}  -> ERROR resolving port: {exc}")
+            emit(f"{line}  -> ERROR resolving port: {exc}")
             continue
         if port_id and port is None:
             line += f"  -> port {port_id} NOT FOUND (dangling NAT rule?)"
         elif port is not None:
             line += f"  -> port {port.id}"
             resolved_ports[port.id] = port
-        print(line)
+        emit(line)
 
-    print("\nPorts:")
+    emit("\nPorts:")
     if not resolved_ports:
-        print("  (none)")
+        emit("  (none)")
     for port in resolved_ports.values():
         fixed_ips = ", ".join(fip["ip_address"] for fip in (port.fixed_ips or []))
-        print(f"  {port.id} ({port.name or '(unnamed)'})")
-        print(f"      Fixed IPs        : {fixed_ips or '(none)'}")
-        print(f"      Owner            : {_describe_port_owner(conn, port)}")
-        lsp_row = _find_lsp(lsp_by_name, port.id)
-        print(f"      OVN LSP          : {_describe_lsp(lsp_row)}")
+        emit(f"  {port.id} ({port.name or '(unnamed)'})")
+        emit(f"      Fixed IPs        : {fixed_ips or '(none)'}")
+        emit(f"      Owner            : {_describe_port_owner(neutron, port)}")
+        lsp_row = _find_lsp(snapshot.lsp_by_name, port.id)
+        emit(f"      OVN LSP          : {_describe_lsp(lsp_row)}")
         lsp_hcg_uuid = (lsp_row or {}).get("ha_chassis_group")
         hcg_summary = _describe_hcg(lsp_hcg_uuid, tables)
-        print(f"      HA_Chassis_Group : {hcg_summary}")
+        emit(f"      HA_Chassis_Group : {hcg_summary}")
 
     if flows:
-        print("\nSouthbound logical flows (ovn-sbctl lflow-list):")
-        print(ovn.sbctl_lflow_list(conn_ctx, ovn_name).rstrip())
+        emit("\nSouthbound logical flows (ovn-sbctl lflow-list):")
+        emit(ovn.sbctl_lflow_list(conn_ctx, ovn_name).rstrip())
+
+
+def _resolve_routers(conn, names_or_ids: list[str], all_routers: bool) -> list:
+    """Resolve several routers from one router list call.
+
+    With --all, flavored routers are left out: they are handled by another
+    L3 backend and never get an OVN Logical_Router.
+    """
+    routers = list(conn.network.routers())
+    if all_routers:
+        return sorted(
+            (r for r in routers if not getattr(r, "flavor_id", None)),
+            key=lambda r: (r.name or "").lower(),
+        )
+    by_id = {r.id: r for r in routers}
+    by_name: dict[str, list] = {}
+    for r in routers:
+        by_name.setdefault(r.name, []).append(r)
+    resolved = []
+    for name_or_id in names_or_ids:
+        if name_or_id in by_id:
+            resolved.append(by_id[name_or_id])
+            continue
+        matches = by_name.get(name_or_id, [])
+        if not matches:
+            raise LookupError(f"router {name_or_id!r} not found")
+        if len(matches) > 1:
+            raise LookupError(
+                f"router name {name_or_id!r} is ambiguous, use one of its IDs: "
+                + ", ".join(r.id for r in matches)
+            )
+        resolved.append(matches[0])
+    return resolved
+
+
+@app.command("show")
+def show(
+    ctx: typer.Context,
+    names_or_ids: RouterArgs = None,
+    all_routers: bool = typer.Option(
+        False, "--all", help="Show every (non-flavored) Neutron router"
+    ),
+    flows: bool = typer.Option(
+        False,
+        "--flows",
+        help="Also dump southbound logical flows for each router (can be large)",
+    ),
+    workers: int = typer.Option(
+        DEFAULT_WORKERS,
+        "--workers",
+        min=1,
+        help="Routers rendered concurrently when showing more than one",
+    ),
+) -> None:
+    """Show a router's gateway/internal IPs, HCG state, NAT rules, and SB flows.
+
+    Several routers (or --all) share one OVN snapshot and bulk Neutron
+    port and router listings, and are rendered concurrently.
+    """
+    conn_ctx: ConnectionContext = ctx.obj
+    if bool(names_or_ids) == all_routers:
+        typer.echo("ERROR: pass router name(s)/ID(s) or --all, not both", err=True)
+        raise typer.Exit(2)
+    print_connection_banner(conn_ctx, include_openstack=True)
+
+    try:
+        conn = osclient.get_connection(conn_ctx.os_cloud)
+        if len(names_or_ids or []) == 1:
+            routers = [osclient.resolve_router(conn, names_or_ids[0])]
+            neutron = NeutronLookup(conn)
+        else:
+            routers = _resolve_routers(conn, names_or_ids or [], all_routers)
+            neutron = BulkNeutronLookup(conn)
+    except Exception as exc:
+        typer.echo(f"ERROR: {exc}", err=True)
+        raise typer.Exit(1) from exc
+    if not routers:
+        print("\n(no routers found)")
+        return
+
+    snapshot = _fetch_ovn_snapshot(
+        conn_ctx, [f"{NEUTRON_PREFIX}{router.id}" for router in routers], neutron
+    )
+
+    def render(router) -> tuple[str, str | None]:
+        # Each report is buffered so concurrent renders don't interleave.
+        out = io.StringIO()
+        try:
+            _render_router(out, conn_ctx, router, neutron, snapshot, flows)
+        except LookupError as exc:
+            return out.getvalue(), str(exc)
+        return out.getvalue(), None
+
+    failed = False
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order, so output stays in router order.
+        for report, error in pool.map(render, routers):
+            print(report, end="")
+            if error is not None:
+                typer.echo(f"\nERROR: {error}", err=True)
+                failed = True
+    if failed:
+        raise typer.Exit(1)
 
 
 @app.command("list")
@@ -392,7 +767,7 @@ def list_routers(ctx: typer.Context) -> None:
     openstack_routers = {r.id: r for r in conn.network.routers()}
 
     ovn_router_names: dict[str, str] = {}
-    for row in ovn.nbctl_list(conn_ctx, "Logical_Router"):
+    for row in ovn.nbctl_list(conn_ctx, "Logical_Router", columns=("name",)):
         name = row.get("name") or ""
         if name.startswith(NEUTRON_PREFIX):
             ovn_router_names[name.removeprefix(NEUTRON_PREFIX)] = name
@@ -11,6 +11,8 @@ from dataclasses import dataclass
 
 from us_net import osclient
 
+DEFAULT_CACHE_TTL = 30.0
+
 
 @dataclass
 class ConnectionContext:
@@ -19,6 +21,10 @@ class ConnectionContext:
     nb_pod: str
     sb_pod: str
     os_cloud: str | None
+    ovsdb_rpc: bool = False
+    cache: bool = False
+    cache_ttl: float = DEFAULT_CACHE_TTL
+    refresh: bool = False
 
     def kubectl_base(self) -> list[str]:
         cmd = ["kubectl"]
@@ -46,6 +52,11 @@ def print_connection_banner(
     print("=" * 64)
     print(f"  Kubernetes context : {resolve_kube_context(ctx.kube_context)}")
     print(f"  OVN namespace/pods : {ctx.namespace} (nb={ctx.nb_pod}, sb={ctx.sb_pod})")
+    if ctx.ovsdb_rpc:
+        print("  OVN DB access      : OVSDB JSON-RPC via kubectl port-forward")
+    if ctx.cache:
+        mode = "refreshing" if ctx.refresh else f"ttl={ctx.cache_ttl:g}s"
+        print(f"  OVN snapshot cache : enabled ({mode})")
     if include_openstack:
         cloud_label = ctx.os_cloud or "(default via OS_CLOUD / clouds.yaml)"
         print(f"  OpenStack cloud    : {cloud_label}")
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import json
+import re
 import subprocess
 import sys
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO
 
 from us_net.connection import ConnectionContext
 
@@ -81,3 +87,52 @@ def resolve_node_pod(
             file=sys.stderr,
         )
     sys.exit(1)
+
+
+_FORWARDING_RE = re.compile(r"Forwarding from 127\.0\.0\.1:(\d+) ->")
+
+
+def _discard(stream: IO[str]) -> None:
+    for _ in stream:
+        pass
+
+
+@contextmanager
+def port_forward(ctx: ConnectionContext, pod: str, remote_port: int) -> Iterator[int]:
+    """Forward a random local port to remote_port on pod, yielding the local port.
+
+    The kubectl process is terminated when the context exits.
+    """
+    cmd = ctx.kubectl_base() + [
+        "port-forward",
+        "-n",
+        ctx.namespace,
+        pod,
+        f":{remote_port}",
+    ]
+    # kubectl keeps logging to both streams for as long as it forwards
+    # ("Handling connection for ..."), so stderr goes to a file and stdout is
+    # drained once the port is known; a full pipe would stall the forward.
+    with tempfile.TemporaryFile("w+") as stderr:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr, text=True)
+        try:
+            local_port = None
+            for line in proc.stdout:
+                match = _FORWARDING_RE.search(line)
+                if match:
+                    local_port = int(match.group(1))
+                    break
+            if local_port is None:
+                proc.wait()
+                stderr.seek(0)
+                print(
+                    f"ERROR: kubectl port-forward to {pod}:{remote_port} failed:\n"
+                    f"{stderr.read().strip()}",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+            threading.Thread(target=_discard, args=(proc.stdout,), daemon=True).start()
+            yield local_port
+        finally:
+            proc.terminate()
+            proc.wait()
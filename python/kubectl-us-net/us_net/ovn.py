@@ -1,50 +1,110 @@
 """ovn-nbctl / ovn-sbctl helpers: exec wrappers + OVSDB JSON unwrapping.
 
-The unwrap logic is ported from scripts/cleanup_dead_ovn_ha_chassis.py, which
-already solved the problem of turning `--format=json` OVSDB output into plain
-Python values.
+The `--format=json` parsing itself lives in us_net.ovsdb_json, which the
+repair scripts under scripts/ share.
+
+Every `kubectl exec` pays for kubectl auth and exec stream setup (around a
+second each), so commands that need several tables should go through
+nbctl_batch/sbctl_batch, which chain them into one ctl invocation with `--`.
+
+With --ovsdb-rpc the same batches are instead sent as a single JSON-RPC
+`transact` through a `kubectl port-forward` to the OVSDB server (see
+us_net.ovsdb), which applies the row filters and column projections
+server-side rather than dumping whole tables through ovn-nbctl. Inside
+rpc_connections() every batch reuses the same connection, so following
+references from one batch to the next costs a request, not a new
+port-forward.
 """
 
 from __future__ import annotations
 
-import json
+import io
 import sys
+from collections.abc import Iterator
+from contextlib import ExitStack
+from contextlib import contextmanager
+from dataclasses import dataclass
 
 from us_net import kube
+from us_net import ovsdb
+from us_net import snapshot
 from us_net.connection import ConnectionContext
+from us_net.ovsdb_json import as_list  # noqa: F401 -- re-exported for commands
+from us_net.ovsdb_json import iter_ovn_tables
+from us_net.ovsdb_json import parse_ovn_json  # noqa: F401 -- re-exported
+from us_net.ovsdb_json import unwrap_ovn_value
 
 OVSDB_CONTAINER = "ovsdb"
 
+NB_DB = "OVN_Northbound"
+SB_DB = "OVN_Southbound"
+NB_OVSDB_PORT = 6641
+SB_OVSDB_PORT = 6642
+
+# A single-row table per DB, monitored to learn the last transaction id.
+GLOBAL_TABLES = {NB_DB: "NB_Global", SB_DB: "SB_Global"}
+
+
+def parse_ovn_json_documents(raw: str) -> list[list[dict]]:
+    """Parse the concatenated JSON tables printed by a multi-command ctl call.
+
+    `ovn-nbctl --format=json list A -- list B` prints one JSON document per
+    command, back to back, rather than a single JSON value.
+    """
+    return list(iter_ovn_tables(io.StringIO(raw)))
 
-def _unwrap_ovn_value(val):
-    """Recursively unwrap an OVN JSON-encoded value."""
-    if not isinstance(val, list) or len(val) < 2:
-        return val
-    tag = val[0]
-    if tag == "uuid":
-        return val[1]
-    if tag == "set":
-        return [_unwrap_ovn_value(v) for v in val[1]]
-    if tag == "map":
-        return {_unwrap_ovn_value(k): _unwrap_ovn_value(v) for k, v in val[1]}
-    return val
 
+def _unwrap_rpc_row(row: dict) -> dict:
+    return {column: unwrap_ovn_value(value) for column, value in row.items()}
 
-def parse_ovn_json(raw: str) -> list[dict]:
-    """Parse OVN --format=json list/find output into a list of row dicts."""
-    obj = json.loads(raw)
-    headings = obj["headings"]
-    return [
-        {h: _unwrap_ovn_value(v) for h, v in zip(headings, row, strict=True)}
-        for row in obj["data"]
-    ]
 
+@dataclass(frozen=True)
+class Query:
+    """One table read for nbctl_batch/sbctl_batch.
 
-def as_list(val) -> list:
-    """OVSDB unwraps single-element sets to a bare value instead of a list."""
-    if val in (None, ""):
-        return []
-    return val if isinstance(val, list) else [val]
+    Without `where` or `records` every row is returned. `where` keeps the
+    rows whose columns equal all the given values. `records` keeps the rows
+    whose `record_column` (`_uuid` or `name`) is one of the given values,
+    and none at all when it is empty; it can't be combined with `where`.
+    `columns` limits the returned columns (all of them when empty) --
+    include `_uuid` when rows are looked up by it.
+    """
+
+    table: str
+    where: tuple[tuple[str, str], ...] = ()
+    columns: tuple[str, ...] = ()
+    records: tuple[str, ...] | None = None
+    record_column: str = "_uuid"
+
+    def ctl_args(self) -> list[str]:
+        """This query as an ovn-nbctl/ovn-sbctl `list` or `find` command."""
+        args = [f"--columns={','.join(self.columns)}"] if self.columns else []
+        if self.records is not None:
+            # ctl looks records up by uuid or by name alike
+            return [*args, "--if-exists", "list", self.table, *self.records]
+        if not self.where:
+            return [*args, "list", self.table]
+        conditions = [f"{column}={value}" for column, value in self.where]
+        return [*args, "find", self.table, *conditions]
+
+    def rpc_ops(self) -> list[dict]:
+        """This query as OVSDB `select` operations, one per record if any."""
+        if self.records is None:
+            wheres = [[[column, "==", value] for column, value in self.where]]
+        else:
+            wheres = [
+                [[self.record_column, "==", ["uuid", record]]]
+                if self.record_column == "_uuid"
+                else [[self.record_column, "==", record]]
+                for record in self.records
+            ]
+        ops = []
+        for where in wheres:
+            op = {"op": "select", "table": self.table, "where": where}
+            if self.columns:
+                op["columns"] = list(self.columns)
+            ops.append(op)
+        return ops
 
 
 def _run(ctx: ConnectionContext, pod: str, ctl: str, args: list[str]) -> str:
@@ -68,19 +128,179 @@ def sbctl_raw(ctx: ConnectionContext, args: list[str]) -> str:
     return _run(ctx, ctx.sb_pod, "ovn-sbctl", args)
 
 
-def nbctl_list(ctx: ConnectionContext, table: str) -> list[dict]:
-    """`ovn-nbctl list <table>` as parsed JSON rows."""
-    return parse_ovn_json(nbctl_raw(ctx, ["--format=json", "list", table]))
+def _ctl_batch(
+    ctx: ConnectionContext, pod: str, ctl: str, queries: list[Query]
+) -> list[list[dict]]:
+    # `list` without records would dump the whole table, so queries for no
+    # records at all are answered here
+    fetched = [query for query in queries if query.records != ()]
+    if not fetched:
+        return [[] for _ in queries]
+    argv = ["--format=json"]
+    for query in fetched:
+        argv += ["--", *query.ctl_args()]
+    result = kube.exec_in_pod(ctx, pod, OVSDB_CONTAINER, [ctl, *argv])
+    if result.returncode != 0:
+        print(
+            f"ERROR: {ctl} {' '.join(argv)} failed:\n{result.stderr.strip()}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    try:
+        documents = parse_ovn_json_documents(result.stdout)
+    except ValueError as exc:
+        documents, parse_error = [], exc
+    else:
+        parse_error = None
+    if parse_error is not None or len(documents) != len(fetched):
+        print(
+            f"ERROR: {ctl} returned {len(documents)} result(s) "
+            f"for {len(fetched)} command(s)"
+            + (f": {parse_error}" if parse_error else ""),
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    results = iter(documents)
+    return [[] if query.records == () else next(results) for query in queries]
 
 
-def sbctl_list(ctx: ConnectionContext, table: str) -> list[dict]:
-    """`ovn-sbctl list <table>` as parsed JSON rows."""
-    return parse_ovn_json(sbctl_raw(ctx, ["--format=json", "list", table]))
+class _RpcSession:
+    """A port-forwarded OVSDB connection, opened on first use."""
+
+    def __init__(self, ctx: ConnectionContext, pod: str, db: str, port: int):
+        self._ctx = ctx
+        self._pod = pod
+        self._db = db
+        self._port = port
+        self._stack = ExitStack()
+        self._client: ovsdb.OvsdbClient | None = None
+
+    def __enter__(self) -> _RpcSession:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stack.close()
+
+    def _call(self, func):
+        try:
+            if self._client is None:
+                local_port = self._stack.enter_context(
+                    kube.port_forward(self._ctx, self._pod, self._port)
+                )
+                self._client = self._stack.enter_context(
+                    ovsdb.OvsdbClient("127.0.0.1", local_port)
+                )
+            return func(self._client)
+        except (OSError, ovsdb.OvsdbError) as exc:
+            print(
+                f"ERROR: {self._db} query via {self._pod} failed: {exc}",
+                file=sys.stderr,
+            )
+            sys.exit(1)
 
+    def select(self, queries: list[Query]) -> list[list[dict]]:
+        ops_by_query = [query.rpc_ops() for query in queries]
+        ops = [op for query_ops in ops_by_query for op in query_ops]
+        results = iter(
+            self._call(lambda client: client.transact(self._db, ops)) if ops else []
+        )
+        return [
+            [_unwrap_rpc_row(row) for _ in query_ops for row in next(results)["rows"]]
+            for query_ops in ops_by_query
+        ]
+
+    def last_txn_id(self) -> str | None:
+        return self._call(
+            lambda client: client.last_txn_id(
+                self._db, GLOBAL_TABLES[self._db], "nb_cfg"
+            )
+        )
+
+
+# Connections kept open by rpc_connections(), keyed by pod and database.
+_open_sessions: dict[tuple[str, str], _RpcSession] = {}
+
+
+@contextmanager
+def rpc_connections(ctx: ConnectionContext) -> Iterator[None]:
+    """Share one OVSDB connection per database between the batches run inside.
+
+    Only has an effect with --ovsdb-rpc; the connections are opened on the
+    first batch that needs them and closed when the block exits.
+    """
+    if not ctx.ovsdb_rpc:
+        yield
+        return
+    with ExitStack() as stack:
+        for pod, db, port in (
+            (ctx.nb_pod, NB_DB, NB_OVSDB_PORT),
+            (ctx.sb_pod, SB_DB, SB_OVSDB_PORT),
+        ):
+            session = stack.enter_context(_RpcSession(ctx, pod, db, port))
+            _open_sessions[pod, db] = session
+            stack.callback(_open_sessions.pop, (pod, db), None)
+        yield
+
+
+def _batch(
+    ctx: ConnectionContext,
+    pod: str,
+    ctl: str,
+    db: str,
+    port: int,
+    queries: list[Query],
+) -> list[list[dict]]:
+    query_args = [query.ctl_args() for query in queries]
+    if not ctx.ovsdb_rpc:
+        return snapshot.load_or_fetch(
+            ctx,
+            pod,
+            db,
+            query_args,
+            lambda indexes: _ctl_batch(ctx, pod, ctl, [queries[i] for i in indexes]),
+        )
+    with ExitStack() as stack:
+        session = _open_sessions.get((pod, db)) or stack.enter_context(
+            _RpcSession(ctx, pod, db, port)
+        )
+        return snapshot.load_or_fetch(
+            ctx,
+            pod,
+            db,
+            query_args,
+            lambda indexes: session.select([queries[i] for i in indexes]),
+            session.last_txn_id,
+        )
+
+
+def nbctl_batch(ctx: ConnectionContext, queries: list[Query]) -> list[list[dict]]:
+    """Run several queries against the Northbound DB in one round trip.
+
+    Returns the parsed rows of each query, in the order given.
+    """
+    return _batch(ctx, ctx.nb_pod, "ovn-nbctl", NB_DB, NB_OVSDB_PORT, queries)
+
+
+def sbctl_batch(ctx: ConnectionContext, queries: list[Query]) -> list[list[dict]]:
+    """Run several queries against the Southbound DB in one round trip.
 
-def nbctl_find(ctx: ConnectionContext, table: str, condition: str) -> list[dict]:
-    """`ovn-nbctl find <table> <condition>` as parsed JSON rows."""
-    return parse_ovn_json(nbctl_raw(ctx, ["--format=json", "find", table, condition]))
+    Returns the parsed rows of each query, in the order given.
+    """
+    return _batch(ctx, ctx.sb_pod, "ovn-sbctl", SB_DB, SB_OVSDB_PORT, queries)
+
+
+def nbctl_list(
+    ctx: ConnectionContext, table: str, columns: tuple[str, ...] = ()
+) -> list[dict]:
+    """`ovn-nbctl list <table>` as parsed JSON rows."""
+    return nbctl_batch(ctx, [Query(table, columns=columns)])[0]
+
+
+def sbctl_list(
+    ctx: ConnectionContext, table: str, columns: tuple[str, ...] = ()
+) -> list[dict]:
+    """`ovn-sbctl list <table>` as parsed JSON rows."""
+    return sbctl_batch(ctx, [Query(table, columns=columns)])[0]
 
 
 def sbctl_lflow_list(ctx: ConnectionContext, datapath_name: str) -> str:
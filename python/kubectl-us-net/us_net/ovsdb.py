@@ -0,0 +1,155 @@
+"""Minimal OVSDB JSON-RPC (RFC 7047) client.
+
+Used instead of `kubectl exec ... ovn-nbctl` when --ovsdb-rpc is passed: the
+OVSDB server is reached through a `kubectl port-forward`, and reads are sent
+as `transact` select operations with `where` clauses and column projections,
+so only the rows and columns a command actually uses come over the wire.
+"""
+
+from __future__ import annotations
+
+import codecs
+import itertools
+import json
+import re
+import socket
+from collections import deque
+
+RECV_SIZE = 65536
+
+# Characters that can open, close or quote a JSON value; everything else is
+# skipped over when looking for the end of a message.
+_STRUCTURAL = re.compile(r'[{}\[\]"\\]')
+
+# The last-txn-id monitor_cond_since reports when the database isn't clustered.
+ZERO_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+class OvsdbError(Exception):
+    """The OVSDB server rejected a request or one of its operations."""
+
+
+class OvsdbClient:
+    """A blocking JSON-RPC connection to a single OVSDB server."""
+
+    def __init__(self, host: str, port: int, timeout: float = 30.0):
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        # Text of the message being received and where the scan is within
+        # it, carried across reads so each byte is only looked at once.
+        self._parts: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._messages: deque[dict] = deque()
+        self._ids = itertools.count()
+
+    def __enter__(self) -> OvsdbClient:
+        """Use the client as a context manager that closes the socket."""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Close the connection."""
+        self.close()
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def _send(self, message: dict) -> None:
+        self._sock.sendall(json.dumps(message).encode())
+
+    def _feed(self, text: str) -> None:
+        """Split received text into messages, tracking nesting across reads.
+
+        OVSDB streams have no framing besides the JSON itself, so a message
+        ends where its top-level object closes outside of any string; only
+        then is it parsed.
+        """
+        start = 0
+        skip = 1 if self._escaped else 0
+        self._escaped = False
+        for match in _STRUCTURAL.finditer(text, skip):
+            pos = match.start()
+            if pos < skip:
+                continue  # the character escaped by a backslash
+            char = match.group()
+            if self._in_string:
+                if char == "\\":
+                    skip = pos + 2
+                    self._escaped = skip > len(text)
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            elif char in "]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(text[start : pos + 1])
+                    raw = "".join(self._parts)
+                    self._parts = []
+                    start = pos + 1
+                    try:
+                        self._messages.append(json.loads(raw))
+                    except ValueError as exc:
+                        raise OvsdbError(f"invalid message from server: {exc}") from exc
+        rest = text[start:]
+        if self._depth or rest.strip():
+            self._parts.append(rest)
+
+    def _read_message(self) -> dict:
+        """Read one JSON-RPC message."""
+        while not self._messages:
+            chunk = self._sock.recv(RECV_SIZE)
+            if not chunk:
+                raise OvsdbError("connection closed by OVSDB server")
+            self._feed(self._utf8.decode(chunk))
+        return self._messages.popleft()
+
+    def call(self, method: str, params: list):
+        """Send a request and wait for its response, answering server echoes."""
+        request_id = next(self._ids)
+        self._send({"method": method, "params": params, "id": request_id})
+        while True:
+            message = self._read_message()
+            if message.get("method") == "echo":
+                self._send(
+                    {
+                        "result": message.get("params", []),
+                        "error": None,
+                        "id": message["id"],
+                    }
+                )
+                continue
+            if message.get("id") != request_id:
+                continue  # e.g. a notification, irrelevant to one-shot reads
+            if message.get("error") is not None:
+                raise OvsdbError(f"{method} failed: {message['error']}")
+            return message["result"]
+
+    def transact(self, db: str, operations: list[dict]) -> list[dict]:
+        """Run operations in one transaction, raising if any of them failed."""
+        results = self.call("transact", [db, *operations])
+        for operation, result in zip(operations, results, strict=False):
+            if result is not None and "error" in result:
+                raise OvsdbError(
+                    f"{operation.get('op')} on {operation.get('table')} failed: "
+                    f"{result['error']}: {result.get('details', '')}"
+                )
+        return results
+
+    def last_txn_id(self, db: str, table: str, column: str) -> str | None:
+        """Id of the database's latest transaction, None if it isn't clustered.
+
+        monitor_cond_since is the only request that reports it, so a
+        throwaway monitor on one small column is set up and cancelled.
+        """
+        monitor_id = "us-net-txn-id"
+        result = self.call(
+            "monitor_cond_since",
+            [db, monitor_id, {table: [{"columns": [column]}]}, ZERO_UUID],
+        )
+        self.call("monitor_cancel", [monitor_id])
+        txn_id = result[1]
+        return None if txn_id == ZERO_UUID else txn_id
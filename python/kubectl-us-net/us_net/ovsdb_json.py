@@ -0,0 +1,204 @@
+"""Parsing of `ovn-nbctl`/`ovn-sbctl --format=json` table output.
+
+This module only uses the standard library so that the standalone repair
+scripts under scripts/ can import it straight from a checkout instead of
+keeping their own copies.
+
+`--format=json` prints one JSON object per table, `{"data": [...],
+"headings": [...]}`, with every cell in OVSDB's wire encoding (`["uuid",
+...]`, `["set", [...]]`, `["map", [...]]`). On a large cloud the
+Logical_Switch_Port dump alone is hundreds of MB, so iter_ovn_rows reads
+it incrementally from a stream, decodes one row at a time and only
+unwraps the requested columns, instead of loading the whole dump and
+every cell at once.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import TextIO
+
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = " \t\n\r"
+
+
+def unwrap_ovn_value(val):
+    """Recursively unwrap an OVN JSON-encoded value."""
+    if not isinstance(val, list) or len(val) < 2:
+        return val
+    tag = val[0]
+    if tag == "uuid":
+        return val[1]
+    if tag == "set":
+        return [unwrap_ovn_value(v) for v in val[1]]
+    if tag == "map":
+        return {unwrap_ovn_value(k): unwrap_ovn_value(v) for k, v in val[1]}
+    return val
+
+
+def as_list(val) -> list:
+    """OVSDB unwraps single-element sets to a bare value instead of a list."""
+    if val in (None, ""):
+        return []
+    return val if isinstance(val, list) else [val]
+
+
+class _Reader:
+    """Incremental JSON tokenizer over a text stream, just enough for tables."""
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Next non-whitespace character, or "" at end of input."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise ValueError(f"expected {char!r} in OVN JSON output, got {found!r}")
+        self._pos += 1
+
+    def accept(self, char: str) -> bool:
+        if self._peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def at_end(self) -> bool:
+        return self._peek() == ""
+
+    def _decode(self):
+        self._peek()
+        while True:
+            try:
+                val, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Most likely the value runs past the buffered input.
+                if not self._fill():
+                    raise
+                continue
+            if end == len(self._buf) and not self._eof:
+                # A number could continue in the next chunk.
+                if self._fill():
+                    continue
+            return val, end
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input as needed."""
+        val, self._pos = self._decode()
+        return val
+
+    def raw_value(self) -> str:
+        """The source text of the next complete JSON value."""
+        _, end = self._decode()
+        text = self._buf[self._pos : end]
+        self._pos = end
+        return text
+
+
+def _project(row: list, headings: list[str], wanted: frozenset[str] | None) -> dict:
+    return {
+        heading: unwrap_ovn_value(cell)
+        for heading, cell in zip(headings, row, strict=True)
+        if wanted is None or heading in wanted
+    }
+
+
+def _read_table(reader: _Reader, wanted: frozenset[str] | None) -> Iterator[dict]:
+    headings: list[str] | None = None
+    pending: list[str] = []  # source text of rows seen before the headings
+    reader.expect("{")
+    if reader.accept("}"):
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == "headings":
+            headings = reader.value()
+            pending.reverse()
+            while pending:
+                yield _project(json.loads(pending.pop()), headings, wanted)
+        elif key == "data":
+            reader.expect("[")
+            if not reader.accept("]"):
+                while True:
+                    if headings is None:
+                        # ovs sorts object keys, so "data" normally precedes
+                        # "headings". Until they arrive, rows are held as
+                        # text, several times smaller than decoded cells.
+                        pending.append(reader.raw_value())
+                    else:
+                        yield _project(reader.value(), headings, wanted)
+                    if reader.accept("]"):
+                        break
+                    reader.expect(",")
+        else:
+            reader.value()  # e.g. "caption"
+        if reader.accept("}"):
+            break
+        reader.expect(",")
+    if pending:
+        raise ValueError("OVN JSON table has data but no headings")
+
+
+def iter_ovn_rows(
+    stream: TextIO, columns: Iterable[str] | None = None
+) -> Iterator[dict]:
+    """Yield the rows of one `--format=json` table as they are read.
+
+    Args:
+        stream: Text stream positioned at the start of the table
+        columns: Columns to keep; all of them when None. Other cells are
+            dropped without being unwrapped.
+    """
+    wanted = frozenset(columns) if columns is not None else None
+    yield from _read_table(_Reader(stream), wanted)
+
+
+def iter_ovn_tables(
+    stream: TextIO, columns: Iterable[str] | None = None
+) -> Iterator[list[dict]]:
+    """Yield each table of a multi-command `ovn-nbctl ... -- ...` output.
+
+    Every table is fully read before it is yielded; use iter_ovn_rows to
+    stream the rows of a single large table.
+    """
+    wanted = frozenset(columns) if columns is not None else None
+    reader = _Reader(stream)
+    while not reader.at_end():
+        yield list(_read_table(reader, wanted))
+
+
+def parse_ovn_json(raw: str) -> list[dict]:
+    """Parse OVN --format=json list/find output into a list of row dicts."""
+    obj = json.loads(raw)
+    headings = obj["headings"]
+    return [
+        {h: unwrap_ovn_value(v) for h, v in zip(headings, row, strict=True)}
+        for row in obj["data"]
+    ]
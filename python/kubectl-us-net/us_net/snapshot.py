@@ -0,0 +1,153 @@
+"""Opt-in on-disk cache of OVN query results (--cache / --refresh).
+
+Operators typically run `router show` over and over while debugging, and
+each run re-dumps the same fleet-wide tables. With the cache enabled, the
+parsed rows of each query of an nbctl_batch/sbctl_batch are saved per kube
+context, pod, database, table and projection, so a table is shared by
+every batch that reads it the same way:
+
+- younger than --cache-ttl: reused without contacting the cluster at all;
+- older: reused if the database's last transaction id is unchanged (only
+  known with --ovsdb-rpc against a clustered DB), refetched otherwise;
+- --refresh: always refetched, and the cache rewritten.
+
+Only the queries that cannot be reused are fetched, still in one batch.
+Only the MAX_SNAPSHOTS most recently used snapshots are kept.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from us_net.connection import ConnectionContext
+from us_net.connection import resolve_kube_context
+
+Rows = list[list[dict]]
+
+MAX_SNAPSHOTS = 64
+
+
+def cache_dir() -> Path:
+    """Directory snapshots are stored in, following the XDG base dir spec."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base) / "kubectl-us-net"
+
+
+@functools.cache
+def _kube_context(kube_context: str | None) -> str:
+    return resolve_kube_context(kube_context)
+
+
+def snapshot_path(
+    ctx: ConnectionContext, pod: str, db: str, query_args: list[str]
+) -> Path:
+    """Cache file for one query against one database."""
+    key = json.dumps(
+        {
+            "context": _kube_context(ctx.kube_context),
+            "namespace": ctx.namespace,
+            "pod": pod,
+            "db": db,
+            "query": query_args,
+        },
+        sort_keys=True,
+    )
+    return cache_dir() / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+
+def _read(path: Path) -> dict | None:
+    try:
+        with path.open() as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write(path: Path, version: str | None, rows: list[dict]) -> None:
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Written to a temp file and renamed so a concurrent invocation never
+    # reads a partial snapshot; mkstemp also keeps it private to the user.
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": version, "fetched_at": time.time(), "rows": rows}, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _prune(directory: Path) -> None:
+    """Delete all but the MAX_SNAPSHOTS most recently written snapshots."""
+    try:
+        paths = sorted(
+            directory.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True
+        )
+    except OSError:
+        return  # raced with another invocation pruning, it will have done it
+    for path in paths[MAX_SNAPSHOTS:]:
+        with contextlib.suppress(OSError):
+            path.unlink()
+
+
+def load_or_fetch(
+    ctx: ConnectionContext,
+    pod: str,
+    db: str,
+    query_args: list[list[str]],
+    fetch: Callable[[list[int]], Rows],
+    probe_version: Callable[[], str | None] | None = None,
+) -> Rows:
+    """Return the rows of a batch, reusing each query's cached rows if still valid.
+
+    Args:
+        ctx: Connection context; the cache is bypassed unless ctx.cache is set
+        pod: OVSDB pod the batch runs against
+        db: Database name
+        query_args: The batch's queries in ctl form, each one keying its rows
+        fetch: Runs the queries at the given positions of the batch against
+            the cluster, returning their rows in that order
+        probe_version: Returns the database's current transaction id, or None
+            when it can't be determined
+    """
+    if not ctx.cache:
+        return fetch(list(range(len(query_args))))
+
+    paths = [snapshot_path(ctx, pod, db, args) for args in query_args]
+    results: list[list[dict] | None] = [None] * len(paths)
+    expired = {}
+    for index, path in enumerate(paths):
+        entry = None if ctx.refresh else _read(path)
+        if entry is None:
+            continue
+        if time.time() - entry["fetched_at"] < ctx.cache_ttl:
+            results[index] = entry["rows"]
+        else:
+            expired[index] = entry
+    if all(rows is not None for rows in results):
+        return results
+
+    version = probe_version() if probe_version else None
+    if version is not None:
+        for index, entry in expired.items():
+            if entry["version"] == version:
+                _write(paths[index], version, entry["rows"])
+                results[index] = entry["rows"]
+
+    # The version is probed before fetching, so a change that lands
+    # mid-fetch makes the stored version stale rather than the rows.
+    missing = [index for index, rows in enumerate(results) if rows is None]
+    if missing:
+        for index, rows in zip(missing, fetch(missing), strict=True):
+            _write(paths[index], version, rows)
+            results[index] = rows
+    _prune(cache_dir())
+    return results
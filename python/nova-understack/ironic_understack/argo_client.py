@@ -1,14 +1,32 @@
+import json
+import logging
 import time
 
 import requests
 import urllib3
 
+logger = logging.getLogger(__name__)
+
+TERMINAL_PHASES = ("Succeeded", "Failed", "Error")
+
 
 class ArgoClient:
     """Client for interacting with Argo Workflows REST API."""
 
+    # upper bound for the exponential backoff used when polling
+    max_poll_interval = 30
+    # how many times a watch stream that ended early is re-opened before
+    # falling back to polling
+    watch_reconnects = 3
+    connect_timeout = 10
+
     def __init__(
-        self, url: str, token: str | None, namespace="argo-events", ssl_verify=False
+        self,
+        url: str,
+        token: str | None,
+        namespace="argo-events",
+        ssl_verify=False,
+        watch=True,
     ):
         """Initialize the Argo client.
 
@@ -17,6 +35,8 @@ class ArgoClient:
             (Optional) token: Authentication token for API access. If not provided
                 the default token from
                 /var/run/secrets/kubernetes.io/serviceaccount/token is used.
+            watch: Use the workflow event stream to wait for completion instead
+                of polling. Polling is still used as a fallback.
         """
         self.url = url.rstrip("/")
         self.token = token or self._kubernetes_token
@@ -31,6 +51,7 @@ class ArgoClient:
             }
         )
         self.namespace = namespace
+        self.watch = watch
 
     def _generate_workflow_name(self, playbook_name: str) -> str:
         """Generate workflow name based on playbook name.
@@ -65,22 +86,18 @@ class ArgoClient:
         with open("/var/run/secrets/kubernetes.io/serviceaccount/token") as f:
             return f.read()
 
-    def run_playbook(self, playbook_name: str, **extra_vars) -> dict:
-        """Run an Ansible playbook via Argo Workflows.
-
-        This method creates a workflow from the ansible-workflow-template and waits
-        for it to complete synchronously.
+    def submit_playbook(self, playbook_name: str, **extra_vars) -> str:
+        """Submit an Ansible playbook run without waiting for it.
 
         Args:
             playbook_name: Name of the Ansible playbook to run
             **extra_vars: Arbitrary key/value pairs to pass as extra_vars to Ansible
 
         Returns:
-            dict: The final workflow status
+            str: Name of the created workflow
 
         Raises:
             requests.RequestException: If API requests fail
-            RuntimeError: If workflow fails or times out
         """
         # Convert extra_vars dict to space-separated key=value string
         extra_vars_str = " ".join(f"{key}={value}" for key, value in extra_vars.items())
@@ -115,11 +132,84 @@ class ArgoClient:
         response.raise_for_status()
 
         workflow = response.json()
-        workflow_name = workflow["metadata"]["name"]
+        return workflow["metadata"]["name"]
+
+    def run_playbook(self, playbook_name: str, **extra_vars) -> dict:
+        """Run an Ansible playbook via Argo Workflows.
+
+        This method creates a workflow from the ansible-workflow-template and waits
+        for it to complete synchronously.
+
+        Args:
+            playbook_name: Name of the Ansible playbook to run
+            **extra_vars: Arbitrary key/value pairs to pass as extra_vars to Ansible
+
+        Returns:
+            dict: The final workflow status
+
+        Raises:
+            requests.RequestException: If API requests fail
+            RuntimeError: If workflow fails or times out
+        """
+        workflow_name = self.submit_playbook(playbook_name, **extra_vars)
 
         # Wait for workflow completion
         return self._wait_for_completion(workflow_name)
 
+    def run_playbooks(
+        self, playbooks: list[tuple[str, dict]], timeout: int = 600
+    ) -> list[dict]:
+        """Run several Ansible playbooks concurrently.
+
+        All workflows are submitted first and then waited on together using a
+        single watch on the namespace, so N playbooks cost one event stream
+        instead of N polling loops.
+
+        Args:
+            playbooks: List of (playbook_name, extra_vars) pairs
+            timeout: Maximum time to wait for all workflows in seconds
+
+        Returns:
+            list[dict]: The final workflow status, in the order of ``playbooks``
+
+        Raises:
+            requests.RequestException: If API requests fail
+            RuntimeError: If any workflow fails or the wait times out
+        """
+        names = [
+            self.submit_playbook(playbook_name, **extra_vars)
+            for playbook_name, extra_vars in playbooks
+        ]
+        workflows = self._wait_for_workflows(names, timeout=timeout)
+
+        errors = []
+        for name in names:
+            try:
+                self._check_workflow(name, workflows[name])
+            except RuntimeError as e:
+                errors.append(str(e))
+        if errors:
+            raise RuntimeError("; ".join(errors))
+
+        return [workflows[name] for name in names]
+
+    @staticmethod
+    def _phase(workflow: dict) -> str | None:
+        return workflow.get("status", {}).get("phase")
+
+    def _check_workflow(self, workflow_name: str, workflow: dict) -> dict:
+        """Raise if a finished workflow did not succeed."""
+        phase = self._phase(workflow)
+        if phase == "Failed":
+            status = workflow.get("status", {}).get("message", "Unknown error")
+            raise RuntimeError(f"Workflow {workflow_name} failed: {status}")
+        elif phase == "Error":
+            status = workflow.get("status", {}).get("message", "Unknown error")
+            raise RuntimeError(
+                f"Workflow {workflow_name} encountered an error: {status}"
+            )
+        return workflow
+
     def _wait_for_completion(
         self, workflow_name: str, timeout: int = 600, poll_interval: int = 5
     ) -> dict:
@@ -128,7 +218,8 @@ class ArgoClient:
         Args:
             workflow_name: Name of the workflow to monitor
             timeout: Maximum time to wait in seconds (default: 10 minutes)
-            poll_interval: Time between status checks in seconds
+            poll_interval: Initial time between status checks in seconds when
+                falling back to polling
 
         Returns:
             dict: Final workflow status
@@ -136,30 +227,124 @@ class ArgoClient:
         Raises:
             RuntimeError: If workflow fails or times out
         """
+        workflows = self._wait_for_workflows(
+            [workflow_name], timeout=timeout, poll_interval=poll_interval
+        )
+        return self._check_workflow(workflow_name, workflows[workflow_name])
+
+    def _wait_for_workflows(
+        self, workflow_names: list[str], timeout: int = 600, poll_interval: int = 5
+    ) -> dict[str, dict]:
+        """Wait for all the given workflows to reach a terminal phase.
+
+        The workflow event stream is used when enabled, returning as soon as
+        the last workflow finishes. If the stream cannot be used, the remaining
+        workflows are polled with exponential backoff.
+
+        Returns:
+            dict: Final workflow status keyed by workflow name
+
+        Raises:
+            RuntimeError: If the workflows do not finish within the timeout
+        """
         start_time = time.time()
+        finished: dict[str, dict] = {}
+
+        if self.watch:
+            try:
+                self._watch_workflows(workflow_names, finished, start_time, timeout)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(
+                    "Watching Argo workflows failed, falling back to polling: %s", e
+                )
+
+        pending = [name for name in workflow_names if name not in finished]
+        if pending:
+            self._poll_workflows(pending, finished, start_time, timeout, poll_interval)
+
+        return finished
+
+    def _watch_workflows(
+        self,
+        workflow_names: list[str],
+        finished: dict[str, dict],
+        start_time: float,
+        timeout: int,
+    ) -> None:
+        """Follow the workflow event stream until all workflows finish.
+
+        Finished workflows are recorded in ``finished``. Returns early, leaving
+        the rest pending, when the timeout is reached or the stream keeps
+        closing before all workflows finish.
+        """
+        wanted = set(workflow_names)
+        params = {}
+        if len(wanted) == 1:
+            params["listOptions.fieldSelector"] = f"metadata.name={workflow_names[0]}"
+
+        for _ in range(1 + self.watch_reconnects):
+            remaining = timeout - (time.time() - start_time)
+            if remaining <= 0:
+                return
+            params["listOptions.timeoutSeconds"] = str(max(1, int(remaining)))
+
+            with self.session.get(
+                f"{self.url}/api/v1/workflow-events/{self.namespace}",
+                params=params,
+                stream=True,
+                timeout=(self.connect_timeout, remaining),
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if "error" in event:
+                        raise ValueError(f"workflow event stream error: {event}")
+
+                    workflow = event.get("result", {}).get("object") or {}
+                    name = workflow.get("metadata", {}).get("name")
+                    if name in wanted and self._phase(workflow) in TERMINAL_PHASES:
+                        finished[name] = workflow
+                        if wanted.issubset(finished):
+                            return
+
+            logger.debug("Argo workflow event stream closed, reconnecting")
+
+    def _poll_workflows(
+        self,
+        workflow_names: list[str],
+        finished: dict[str, dict],
+        start_time: float,
+        timeout: int,
+        poll_interval: int,
+    ) -> None:
+        """Poll workflows with exponential backoff until all finish.
+
+        Raises:
+            RuntimeError: If the workflows do not finish within the timeout
+        """
+        pending = list(workflow_names)
+        delay = poll_interval
 
         while time.time() - start_time < timeout:
-            response = self.session.get(
-                f"{self.url}/api/v1/workflows/{self.namespace}/{workflow_name}"
-            )
-            response.raise_for_status()
-
-            workflow = response.json()
-            phase = workflow.get("status", {}).get("phase")
-
-            if phase == "Succeeded":
-                return workflow
-            elif phase == "Failed":
-                status = workflow.get("status", {}).get("message", "Unknown error")
-                raise RuntimeError(f"Workflow {workflow_name} failed: {status}")
-            elif phase == "Error":
-                status = workflow.get("status", {}).get("message", "Unknown error")
-                raise RuntimeError(
-                    f"Workflow {workflow_name} encountered an error: {status}"
+            for workflow_name in list(pending):
+                response = self.session.get(
+                    f"{self.url}/api/v1/workflows/{self.namespace}/{workflow_name}"
                 )
+                response.raise_for_status()
+
+                workflow = response.json()
+                if self._phase(workflow) in TERMINAL_PHASES:
+                    finished[workflow_name] = workflow
+                    pending.remove(workflow_name)
+
+            if not pending:
+                return
 
-            time.sleep(poll_interval)
+            time.sleep(delay)
+            delay = min(delay * 2, max(poll_interval, self.max_poll_interval))
 
         raise RuntimeError(
-            f"Workflow {workflow_name} timed out after {timeout} seconds"
+            f"Workflow {', '.join(pending)} timed out after {timeout} seconds"
         )
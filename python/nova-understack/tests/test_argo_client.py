@@ -1,5 +1,7 @@
 """Unit tests for ArgoClient."""
 
+import json
+from unittest.mock import MagicMock
 from unittest.mock import Mock
 from unittest.mock import mock_open
 from unittest.mock import patch
@@ -92,7 +94,7 @@ class TestArgoClient:
     @patch("requests.Session.get")
     def test_run_playbook_success(self, mock_get, mock_post):
         """Test successful playbook execution."""
-        client = ArgoClient(self.base_url, self.token)
+        client = ArgoClient(self.base_url, self.token, watch=False)
 
         # Mock workflow creation response
         workflow_response = {"metadata": {"name": "ansible-test-playbook-abc123"}}
@@ -146,7 +148,7 @@ class TestArgoClient:
     @patch("requests.Session.post")
     def test_run_playbook_creation_failure(self, mock_post):
         """Test playbook execution when workflow creation fails."""
-        client = ArgoClient(self.base_url, self.token)
+        client = ArgoClient(self.base_url, self.token, watch=False)
 
         mock_post.return_value.raise_for_status.side_effect = requests.RequestException(
             "API Error"
@@ -159,7 +161,7 @@ class TestArgoClient:
     @patch("requests.Session.get")
     def test_run_playbook_with_empty_extra_vars(self, mock_get, mock_post):
         """Test playbook execution with no extra variables."""
-        client = ArgoClient(self.base_url, self.token)
+        client = ArgoClient(self.base_url, self.token, watch=False)
 
         workflow_response = {"metadata": {"name": "ansible-test-abc123"}}
         mock_post.return_value.json.return_value = workflow_response
@@ -180,7 +182,7 @@ class TestArgoClient:
     @patch("requests.Session.get")
     def test_wait_for_completion_success(self, mock_get, mock_sleep):
         """Test successful workflow completion monitoring."""
-        client = ArgoClient(self.base_url, self.token)
+        client = ArgoClient(self.base_url, self.token, watch=False)
 
         # Mock workflow status progression
         responses = [
@@ -201,7 +203,7 @@ class TestArgoClient:
     @patch("requests.Session.get")
     def test_wait_for_completion_failure(self, mock_get, mock_sleep):
         """Test workflow failure during monitoring."""
-        client = ArgoClient(self.base_url, self.token)
+        client = ArgoClient(self.base_url, self.token, watch=False)
 
         failed_workflow = {
             "status": {"phase": "Failed", "message": "Workflow execution failed"}
@@ -216,7 +218,7 @@ class TestArgoClient:
     @patch("requests.Session.get")
     def test_wait_for_completion_error(self, mock_get, mock_sleep):
         """Test workflow error during monitoring."""
-        client = ArgoClient(self.base_url, self.token)
+        client = ArgoClient(self.base_url, self.token, watch=False)
 
         error_workflow = {
             "status": {"phase": "Error", "message": "Workflow encountered an error"}
@@ -234,7 +236,7 @@ class TestArgoClient:
     @patch("requests.Session.get")
     def test_wait_for_completion_timeout(self, mock_get, mock_sleep, mock_time):
         """Test workflow timeout during monitoring."""
-        client = ArgoClient(self.base_url, self.token)
+        client = ArgoClient(self.base_url, self.token, watch=False)
 
         # Mock time progression to simulate timeout
         mock_time.side_effect = [0, 300, 700]  # Start, middle, timeout
@@ -249,7 +251,7 @@ class TestArgoClient:
     @patch("requests.Session.get")
     def test_wait_for_completion_api_error(self, mock_get):
         """Test API error during workflow monitoring."""
-        client = ArgoClient(self.base_url, self.token)
+        client = ArgoClient(self.base_url, self.token, watch=False)
 
         mock_get.return_value.raise_for_status.side_effect = requests.RequestException(
             "API Error"
@@ -262,7 +264,7 @@ class TestArgoClient:
     @patch("requests.Session.get")
     def test_wait_for_completion_missing_status(self, mock_get, mock_sleep):
         """Test workflow monitoring with missing status information."""
-        client = ArgoClient(self.base_url, self.token)
+        client = ArgoClient(self.base_url, self.token, watch=False)
 
         # Mock workflow without status
         workflow_no_status = {"metadata": {"name": "test-workflow"}}
@@ -275,3 +277,143 @@ class TestArgoClient:
             pytest.raises(RuntimeError, match="timed out"),
         ):
             client._wait_for_completion("test-workflow", timeout=600, poll_interval=1)
+
+    @staticmethod
+    def _event_stream(*workflows):
+        """Build a mocked streaming response yielding workflow events."""
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = [
+            json.dumps({"result": {"type": "MODIFIED", "object": wf}}).encode()
+            for wf in workflows
+        ]
+        return response
+
+    @patch("requests.Session.get")
+    def test_wait_for_completion_watch(self, mock_get):
+        """Test workflow completion is taken from the event stream."""
+        client = ArgoClient(self.base_url, self.token)
+
+        succeeded = {
+            "metadata": {"name": "test-workflow"},
+            "status": {"phase": "Succeeded"},
+        }
+        mock_get.return_value = self._event_stream(
+            {"metadata": {"name": "test-workflow"}, "status": {"phase": "Running"}},
+            succeeded,
+        )
+
+        result = client._wait_for_completion("test-workflow")
+
+        assert result == succeeded
+        mock_get.assert_called_once()
+        args, kwargs = mock_get.call_args
+        assert args[0] == f"{self.base_url}/api/v1/workflow-events/argo-events"
+        assert kwargs["stream"] is True
+        assert (
+            kwargs["params"]["listOptions.fieldSelector"]
+            == "metadata.name=test-workflow"
+        )
+
+    @patch("requests.Session.get")
+    def test_wait_for_completion_watch_failure(self, mock_get):
+        """Test a failed workflow reported by the event stream."""
+        client = ArgoClient(self.base_url, self.token)
+
+        mock_get.return_value = self._event_stream(
+            {
+                "metadata": {"name": "test-workflow"},
+                "status": {"phase": "Failed", "message": "boom"},
+            }
+        )
+
+        with pytest.raises(RuntimeError, match="Workflow test-workflow failed: boom"):
+            client._wait_for_completion("test-workflow")
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_wait_for_completion_watch_falls_back_to_polling(
+        self, mock_get, mock_sleep
+    ):
+        """Test polling is used when the event stream is unavailable."""
+        client = ArgoClient(self.base_url, self.token)
+
+        succeeded = {"status": {"phase": "Succeeded"}}
+        poll_response = Mock()
+        poll_response.json.return_value = succeeded
+        mock_get.side_effect = [
+            requests.ConnectionError("stream reset"),
+            poll_response,
+        ]
+
+        result = client._wait_for_completion("test-workflow")
+
+        assert result == succeeded
+        mock_get.assert_called_with(
+            f"{self.base_url}/api/v1/workflows/argo-events/test-workflow"
+        )
+
+    @patch("time.sleep")
+    @patch("requests.Session.get")
+    def test_poll_backoff(self, mock_get, mock_sleep):
+        """Test polling backs off exponentially up to the maximum interval."""
+        client = ArgoClient(self.base_url, self.token, watch=False)
+
+        running = {"status": {"phase": "Running"}}
+        mock_get.return_value.json.side_effect = [running] * 5 + [
+            {"status": {"phase": "Succeeded"}}
+        ]
+
+        client._wait_for_completion("test-workflow", poll_interval=5)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [5, 10, 20, 30, 30]
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_run_playbooks_shares_one_watch(self, mock_post, mock_get):
+        """Test concurrent playbooks are waited on with a single stream."""
+        client = ArgoClient(self.base_url, self.token)
+
+        mock_post.return_value.json.side_effect = [
+            {"metadata": {"name": "ansible-one-abc"}},
+            {"metadata": {"name": "ansible-two-def"}},
+        ]
+        one = {
+            "metadata": {"name": "ansible-one-abc"},
+            "status": {"phase": "Succeeded"},
+        }
+        two = {
+            "metadata": {"name": "ansible-two-def"},
+            "status": {"phase": "Succeeded"},
+        }
+        other = {"metadata": {"name": "unrelated"}, "status": {"phase": "Failed"}}
+        mock_get.return_value = self._event_stream(two, other, one)
+
+        result = client.run_playbooks(
+            [("one.yml", {"device_id": "d1"}), ("two.yml", {"device_id": "d2"})]
+        )
+
+        assert result == [one, two]
+        mock_get.assert_called_once()
+        assert "listOptions.fieldSelector" not in mock_get.call_args.kwargs["params"]
+
+    @patch("requests.Session.get")
+    @patch("requests.Session.post")
+    def test_run_playbooks_reports_failures(self, mock_post, mock_get):
+        """Test failures of concurrent playbooks are reported together."""
+        client = ArgoClient(self.base_url, self.token)
+
+        mock_post.return_value.json.side_effect = [
+            {"metadata": {"name": "ansible-one-abc"}},
+            {"metadata": {"name": "ansible-two-def"}},
+        ]
+        mock_get.return_value = self._event_stream(
+            {"metadata": {"name": "ansible-one-abc"}, "status": {"phase": "Succeeded"}},
+            {
+                "metadata": {"name": "ansible-two-def"},
+                "status": {"phase": "Error", "message": "pod deleted"},
+            },
+        )
+
+        with pytest.raises(RuntimeError, match="ansible-two-def encountered an error"):
+            client.run_playbooks([("one.yml", {}), ("two.yml", {})])
@@ -0,0 +1,64 @@
+"""Compare ways of crawling a BMC's disk and NIC inventory.
+
+Runs bmc_disk.physical_disks and bmc_chassis_info.in_band_interfaces
+against a local fake Redfish server that delays every request, first one
+GET at a time (as before), then with concurrent GETs, then with $expand:
+
+    python benchmarks/bench_redfish_crawl.py --drives 24 --nics 8 --latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_redfish import FakeRedfish
+from fake_redfish import dell_server
+
+from understack_workflows import bmc as bmc_module
+from understack_workflows.bmc_chassis_info import in_band_interfaces
+from understack_workflows.bmc_disk import physical_disks
+
+
+def crawl(args, expand: bool, concurrency: int) -> tuple[int, float]:
+    resources = dell_server(drives=args.drives, nics=args.nics, expand=expand)
+    bmc_module.MAX_CONCURRENT_REQUESTS = concurrency
+    with FakeRedfish(resources, latency=args.latency) as server:
+        bmc = server.bmc()
+        start = time.perf_counter()
+        disks = physical_disks(bmc)
+        nics = in_band_interfaces(bmc)
+        elapsed = time.perf_counter() - start
+        bmc.close()
+    if (len(disks), len(nics)) != (args.drives, args.nics):
+        raise RuntimeError(f"crawled {len(disks)} disks and {len(nics)} NICs")
+    return len(server.requests), elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drives", type=int, default=24)
+    parser.add_argument("--nics", type=int, default=8)
+    parser.add_argument(
+        "--latency", type=float, default=0.2, help="seconds per Redfish request"
+    )
+    args = parser.parse_args()
+
+    concurrency = bmc_module.MAX_CONCURRENT_REQUESTS
+    print(f"{'mode':<12} {'requests':>8} {'seconds':>8}")
+    for mode, expand, workers in (
+        ("sequential", False, 1),
+        ("concurrent", False, concurrency),
+        ("expand", True, concurrency),
+    ):
+        count, elapsed = crawl(args, expand, workers)
+        print(f"{mode:<12} {count:>8} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""Measure enrollment and Nautobot sync against fake Redfish, Ironic and Nautobot.
+
+Enrolls a fleet of fake Dell servers with enroll_servers, then syncs each
+enrolled node to Nautobot: the device, then its interfaces, then both
+again when nothing has changed.  For each step it reports the API requests
+made per server to each service, the wall-clock time, and the peak memory
+allocated by Python while it ran (fakes included):
+
+    python benchmarks/bench_workflows.py --servers 20 --redfish-latency 0.05
+
+--save records the request counts in a JSON file and --compare fails when
+a later run makes more requests per server than the recorded one, so a
+change that adds API calls is noticed before it reaches a real fleet.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# read by understack_workflows when it is imported
+os.environ.setdefault("BMC_MASTER", "bench")
+os.environ.setdefault("DNS_SERVER_IPV4_ADDR_1", "10.4.4.4")
+os.environ.setdefault("DNS_SERVER_IPV4_ADDR_2", "10.4.4.5")
+
+from fake_ironic import FakeIronic
+from fake_ironic import dell_inventory
+from fake_nautobot import FakeNautobot
+from fake_redfish import SYSTEM
+from fake_redfish import FakeRedfish
+from fake_redfish import dell_server
+
+from understack_workflows.bmc import Bmc
+from understack_workflows.ironic import client as ironic_client_module
+from understack_workflows.main.enroll_servers import enroll_servers
+from understack_workflows.oslo_event.nautobot_device_interface_sync import (
+    sync_interfaces_to_nautobot,
+)
+from understack_workflows.oslo_event.nautobot_device_sync import sync_device_to_nautobot
+
+SERVERS_PER_RACK = 20
+CABLED_NICS = 2  # NICs per server cabled to the rack's pair of switches
+
+
+class Fleet:
+    """Fake BMCs for a number of servers, plus the Ironic and Nautobot fakes."""
+
+    def __init__(self, args):
+        self.redfish: dict[str, FakeRedfish] = {}
+        hardware = {}
+        lldp = {}
+        self.nautobot = FakeNautobot(latency=args.api_latency)
+        location = self.nautobot.add("dcim/locations", name="DFW3")
+        for i in range(args.servers):
+            ip_address = f"10.46.{i // 250}.{i % 250 + 1}"
+            resources = dell_server(drives=args.drives, nics=args.nics, server_id=i)
+            bmc = FakeRedfish(resources, latency=args.redfish_latency)
+            self.redfish[ip_address] = bmc
+            hardware[bmc.url] = dell_inventory(resources, ip_address)
+            nics = resources[f"{SYSTEM}/EthernetInterfaces/"]["Members"]
+            for n, nic in enumerate(nics[:CABLED_NICS]):
+                mac = resources[nic["@odata.id"]]["MACAddress"].lower()
+                lldp[mac] = self._cable(i, n, location)
+        self.ironic = FakeIronic(hardware, lldp, latency=args.api_latency)
+
+    def _cable(self, server: int, nic: int, location: dict) -> dict:
+        """Connect a server NIC to a switch port in Nautobot, return its LLDP."""
+        rack_name = f"F20-{server // SERVERS_PER_RACK + 1}"
+        switch_name = f"f20-{server // SERVERS_PER_RACK + 1}-{nic + 1}"
+        port_name = f"Ethernet1/{server % SERVERS_PER_RACK + 1}"
+        objects = self.nautobot.objects
+        racks = {r["name"]: r for r in objects.get("dcim/racks", {}).values()}
+        rack = racks.get(rack_name) or self.nautobot.add(
+            "dcim/racks", name=rack_name, location=location["id"]
+        )
+        switches = {d["name"]: d for d in objects.get("dcim/devices", {}).values()}
+        switch = switches.get(switch_name) or self.nautobot.add(
+            "dcim/devices",
+            name=switch_name,
+            location=location["id"],
+            rack=rack["id"],
+            status="Active",
+        )
+        self.nautobot.add("dcim/interfaces", device=switch["id"], name=port_name)
+        return {
+            "switch_info": switch_name,
+            "port_id": port_name,
+            "switch_id": f"c4:7e:e0:e4:{server // SERVERS_PER_RACK:02x}:{nic:02x}",
+        }
+
+    def services(self) -> dict[str, list]:
+        return {
+            "redfish": list(self.redfish.values()),
+            "ironic": [self.ironic],
+            "nautobot": [self.nautobot],
+        }
+
+    def __enter__(self) -> Fleet:
+        """Start every fake, and point our BMC and Ironic clients at them."""
+        for fakes in self.services().values():
+            for fake in fakes:
+                fake.__enter__()
+        Bmc.url = lambda bmc: self.redfish[bmc.ip_address].url
+        ironic = self.ironic.client()
+        ironic_client_module.get_ironic_client = lambda *a, **kw: ironic
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Stop every fake."""
+        for fakes in self.services().values():
+            for fake in fakes:
+                fake.__exit__(*exc)
+
+
+def measure(fleet: Fleet, step, servers: int, trace_memory: bool) -> dict:
+    """Run step, returning requests per server, seconds and peak MiB."""
+    for fakes in fleet.services().values():
+        for fake in fakes:
+            fake.reset()
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    step()
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    counts = {
+        service: sum((fake.request_counts() for fake in fakes), start=Counter())
+        for service, fakes in fleet.services().items()
+    }
+    return {
+        "seconds": round(elapsed, 2),
+        "peak_mib": round(peak / 2**20, 1),
+        "requests_per_server": {
+            service: round(sum(count.values()) / servers, 1)
+            for service, count in counts.items()
+        },
+        "routes": {
+            service: dict(sorted(count.items())) for service, count in counts.items()
+        },
+    }
+
+
+def for_each(function, items, concurrency: int) -> None:
+    """Call function on each item, concurrently; fail if any call fails."""
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(function, items))
+    if any(results):
+        raise RuntimeError(f"{function.__name__} failed for some servers")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=10, help="fleet size")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--drives", type=int, default=8)
+    parser.add_argument("--nics", type=int, default=4)
+    parser.add_argument(
+        "--redfish-latency", type=float, default=0.05, help="seconds per BMC request"
+    )
+    parser.add_argument(
+        "--api-latency",
+        type=float,
+        default=0.005,
+        help="seconds per Ironic or Nautobot request",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="skip tracemalloc, which slows the run, for cleaner timings",
+    )
+    parser.add_argument("--routes", action="store_true", help="count by endpoint")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument(
+        "--compare", help="fail if requests per server exceed this saved run"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    results = {}
+    with Fleet(args) as fleet:
+        nautobot = fleet.nautobot.api()
+
+        def enroll():
+            servers = [(ip_address, None) for ip_address in fleet.redfish]
+            enrolled = enroll_servers(
+                servers,
+                concurrency=args.concurrency,
+                firmware_update=False,
+                raid_configure=True,
+                old_password=None,
+            )
+            if not all(result.succeeded for result in enrolled):
+                raise RuntimeError("enrollment failed for some servers")
+
+        def sync_devices():
+            for_each(sync_device, list(fleet.ironic.nodes), args.concurrency)
+
+        def sync_device(node_uuid):
+            return sync_device_to_nautobot(node_uuid, nautobot, sync_interfaces=False)
+
+        def sync_interfaces():
+            for_each(sync_interface, list(fleet.ironic.nodes), args.concurrency)
+
+        def sync_interface(node_uuid):
+            return sync_interfaces_to_nautobot(node_uuid, nautobot)
+
+        def resync():
+            for_each(resync_one, list(fleet.ironic.nodes), args.concurrency)
+
+        def resync_one(node_uuid):
+            return sync_device_to_nautobot(node_uuid, nautobot)
+
+        for name, step in (
+            ("enroll", enroll),
+            ("device sync", sync_devices),
+            ("interface sync", sync_interfaces),
+            ("resync unchanged", resync),
+        ):
+            results[name] = measure(fleet, step, args.servers, not args.no_memory)
+
+    report(results, args)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"servers": args.servers, "results": results}, f, indent=2)
+    if args.compare and regressions(results, args.compare):
+        sys.exit(1)
+
+
+def report(results: dict, args) -> None:
+    services = ("redfish", "ironic", "nautobot")
+    print(f"{args.servers} servers, {args.concurrency} at a time; requests per server")
+    print(f"{'step':<18}" + "".join(f"{s:>9}" for s in services) + "  seconds  MiB")
+    for name, result in results.items():
+        per_server = result["requests_per_server"]
+        print(
+            f"{name:<18}"
+            + "".join(f"{per_server[s]:>9}" for s in services)
+            + f"  {result['seconds']:>7.2f}  {result['peak_mib']:>4}"
+        )
+        if args.routes:
+            for service in services:
+                for route, count in result["routes"][service].items():
+                    print(f"    {service:<9} {count:>6}  {route}")
+
+
+def regressions(results: dict, baseline_path: str) -> list[str]:
+    """Steps and services now making more requests per server than before."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    found = []
+    for name, result in results.items():
+        before = baseline.get(name, {}).get("requests_per_server", {})
+        for service, count in result["requests_per_server"].items():
+            if count > before.get(service, count):
+                found.append(f"{name}: {service} {before[service]} -> {count}")
+    for line in found:
+        print(f"REGRESSION {line}")
+    return found
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Plumbing shared by the local stand-ins for BMC, Ironic and Nautobot APIs.
+
+Each fake serves JSON over plain HTTP on 127.0.0.1, delays every request
+by a configurable latency, and records every request it receives so a
+benchmark can count them.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import SplitResult
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+
+UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+class FakeService:
+    """Serve on 127.0.0.1 until stopped; use as a context manager.
+
+    Subclasses implement respond(), returning (status, data, headers).
+    At most max_concurrent requests are worked on at once, the rest queue.
+    """
+
+    def __init__(self, latency: float = 0.0, max_concurrent: int = 64):
+        self.latency = latency
+        self.requests: list[tuple[str, str]] = []
+        self._busy = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self):
+        """Start serving."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def respond(self, method: str, url: SplitResult, body) -> tuple[int, object, dict]:
+        raise NotImplementedError
+
+    def route(self, path: str) -> str:
+        """The path with identifiers replaced, for counting requests by kind."""
+        return UUID_RE.sub("{uuid}", path.split("?")[0])
+
+    def request_counts(self) -> Counter:
+        """Requests received so far, by method and route."""
+        with self._lock:
+            return Counter(
+                f"{method} {self.route(path)}" for method, path in self.requests
+            )
+
+    def reset(self) -> None:
+        """Forget the requests received so far."""
+        with self._lock:
+            self.requests.clear()
+
+    def _dispatch(self, method: str, raw_path: str, body):
+        with self._lock:
+            self.requests.append((method, raw_path))
+        with self._busy:
+            time.sleep(self.latency)
+            return self.respond(method, urlsplit(unquote(raw_path)), body)
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                status, data, headers = fake._dispatch(self.command, self.path, body)
+                payload = b"" if data is None else json.dumps(data).encode()
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if payload:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, *_args):
+                pass
+
+        return Handler
@@ -0,0 +1,261 @@
+"""A local stand-in for the Ironic API, for benchmarks.
+
+Keeps nodes and ports in memory and serves the parts of the v1 API that
+our workflows use.  Provision state transitions complete instantly, so a
+benchmark measures our API calls rather than Ironic's work.  Inspecting a
+node fills in its properties, inventory and ports from the hardware that
+its driver_info redfish_address is registered under.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import uuid
+from urllib.parse import SplitResult
+from urllib.parse import parse_qs
+
+from fake_http import FakeService
+from fake_redfish import MANAGER
+from fake_redfish import SYSTEM
+from ironicclient.client import get_client
+from ironicclient.common.http import LATEST_VERSION
+
+MIN_VERSION = "1.1"
+MAX_VERSION = LATEST_VERSION
+
+# provision state verb -> the stable state it leads to
+TRANSITIONS = {
+    "manage": "manageable",
+    "inspect": "manageable",
+    "clean": "manageable",
+    "provide": "available",
+}
+
+ROUTE_RE = re.compile(r"^(/v1/(?:nodes|runbooks|ports))/(?!detail$)[^/]+")
+
+
+def dell_inventory(resources: dict, bmc_address: str) -> dict:
+    """The inventory Ironic's inspection records for a fake_redfish server."""
+    system = resources[SYSTEM]
+    nics = resources[f"{SYSTEM}/EthernetInterfaces/"]["Members"]
+    controller = resources[f"{SYSTEM}/Storage"]["Members"][0]["@odata.id"]
+    drives = resources[controller]["Drives"]
+    bmc_nic = resources[f"{MANAGER}/EthernetInterfaces/"]["Members"][0]["@odata.id"]
+    return {
+        "inventory": {
+            "system_vendor": {
+                "manufacturer": system["Manufacturer"],
+                "product_name": f"{system['Model']} (SKU=0AF7;"
+                f"ModelName={system['Model']})",
+                "serial_number": system["SKU"],
+            },
+            "interfaces": [
+                {
+                    "name": resources[nic["@odata.id"]]["Id"],
+                    "mac_address": resources[nic["@odata.id"]]["MACAddress"].lower(),
+                }
+                for nic in nics
+            ],
+            "storage_controllers": [
+                {
+                    "id": resources[controller]["Id"],
+                    "drives": [
+                        {
+                            "id": resources[drive["@odata.id"]]["Id"],
+                            "size": resources[drive["@odata.id"]]["CapacityBytes"],
+                        }
+                        for drive in drives
+                    ],
+                }
+            ],
+            "bmc_mac": resources[bmc_nic]["MACAddress"].lower(),
+            "bmc_address": bmc_address,
+        },
+        "plugin_data": {},
+    }
+
+
+class FakeIronic(FakeService):
+    """Serve the Ironic API on 127.0.0.1 until stopped.
+
+    hardware maps each redfish_address to the inventory inspection finds
+    there, and lldp maps a MAC address to the local_link_connection that
+    agent inspection would record for it.
+    """
+
+    def __init__(
+        self,
+        hardware: dict[str, dict],
+        lldp: dict[str, dict] | None = None,
+        latency: float = 0.0,
+    ):
+        super().__init__(latency=latency)
+        self.hardware = hardware
+        self.lldp = lldp or {}
+        self.nodes: dict[str, dict] = {}
+        self.inventories: dict[str, dict] = {}
+        self.ports: dict[str, dict] = {}
+        self._state = threading.Lock()
+
+    def client(self):
+        """An ironicclient talking to this server, negotiated as ours are."""
+        client = get_client(
+            "1",
+            endpoint=f"{self.url}/",
+            auth_type="none",
+            os_ironic_api_version="latest",
+        )
+        client.negotiate_api_version()
+        return client
+
+    def route(self, path: str) -> str:
+        return ROUTE_RE.sub(r"\1/{ident}", path.split("?")[0])
+
+    def respond(self, method: str, url: SplitResult, body):
+        headers = {
+            "X-OpenStack-Ironic-API-Minimum-Version": MIN_VERSION,
+            "X-OpenStack-Ironic-API-Maximum-Version": MAX_VERSION,
+        }
+        parts = url.path.strip("/").split("/")
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        with self._state:
+            status, data = self._respond(method, parts, query, body)
+        if status >= 400:
+            error = {"faultstring": data, "debuginfo": None}
+            data = {"error_message": json.dumps(error)}
+        return status, data, headers
+
+    def _respond(self, method: str, parts: list[str], query: dict, body):
+        match method, parts:
+            case "GET", ([] | ["v1"]):
+                version = {
+                    "id": "v1",
+                    "status": "CURRENT",
+                    "min_version": MIN_VERSION,
+                    "version": MAX_VERSION,
+                }
+                return 200, {"versions": [version], "default_version": version}
+            case "POST", ["v1", "nodes"]:
+                return 201, self._create_node(body)
+            case _, ["v1", "nodes", ident, *rest]:
+                node = self._find_node(ident)
+                if node is None:
+                    return 404, f"Node {ident} could not be found."
+                return self._node_request(method, node, rest, query, body)
+            case "GET", ["v1", "ports", *detail]:
+                node = self._find_node(query.get("node", ""))
+                ports = [
+                    port
+                    for port in self.ports.values()
+                    if node is None or port["node_uuid"] == node["uuid"]
+                ]
+                if not detail:
+                    ports = [{k: p[k] for k in ("uuid", "address")} for p in ports]
+                return 200, {"ports": ports}
+            case "GET", ["v1", "runbooks", name]:
+                return 404, f"Runbook {name} could not be found."
+        return 404, f"No route for {method} /{'/'.join(parts)}"
+
+    def _node_request(self, method, node, rest, query, body):
+        match method, rest:
+            case "GET", []:
+                if "fields" in query:
+                    fields = query["fields"].split(",")
+                    return 200, {k: v for k, v in node.items() if k in fields}
+                return 200, node
+            case "PATCH", []:
+                _apply_patch(node, body)
+                return 200, node
+            case "PUT", ["states", "provision"]:
+                self._transition(node, body["target"])
+                return 202, None
+            case "PUT", ["states", "raid"]:
+                node["target_raid_config"] = body
+                return 204, None
+            case "GET", ["traits"]:
+                return 200, {"traits": node["traits"]}
+            case "GET", ["inventory"]:
+                if node["uuid"] not in self.inventories:
+                    return 404, f"Node {node['uuid']} has no inventory."
+                return 200, self.inventories[node["uuid"]]
+        return 404, f"No route for {method} node {'/'.join(rest)}"
+
+    def _find_node(self, ident: str) -> dict | None:
+        if ident in self.nodes:
+            return self.nodes[ident]
+        return next((n for n in self.nodes.values() if n["name"] == ident), None)
+
+    def _create_node(self, data: dict) -> dict:
+        node = {
+            "uuid": str(uuid.uuid4()),
+            "name": None,
+            "driver": None,
+            "driver_info": {},
+            "provision_state": "enroll",
+            "target_provision_state": None,
+            "power_state": "power on",
+            "maintenance": False,
+            "last_error": None,
+            "properties": {},
+            "extra": {},
+            "traits": [],
+            "lessee": None,
+            "owner": None,
+            "resource_class": None,
+            "boot_interface": None,
+            "deploy_interface": None,
+            "inspect_interface": None,
+            **data,
+        }
+        self.nodes[node["uuid"]] = node
+        return node
+
+    def _transition(self, node: dict, target: str) -> None:
+        if target == "inspect":
+            self._inspect(node)
+        node["provision_state"] = TRANSITIONS[target]
+
+    def _inspect(self, node: dict) -> None:
+        inventory = self.hardware[node["driver_info"]["redfish_address"]]
+        self.inventories[node["uuid"]] = inventory
+        node["properties"] = {
+            "memory_mb": 393216,
+            "cpus": 48,
+            "cpu_arch": "x86_64",
+            "local_gb": 446,
+        }
+        if any(port["node_uuid"] == node["uuid"] for port in self.ports.values()):
+            return
+        pxe_enabled = True
+        for interface in inventory["inventory"]["interfaces"]:
+            link = self.lldp.get(interface["mac_address"], {})
+            port = {
+                "uuid": str(uuid.uuid4()),
+                "address": interface["mac_address"],
+                "node_uuid": node["uuid"],
+                "name": None,
+                "pxe_enabled": bool(link) and pxe_enabled,
+                "extra": {"bios_name": interface["name"]},
+                "local_link_connection": link,
+                "physical_network": "f20-1-network" if link else None,
+                "portgroup_uuid": None,
+            }
+            pxe_enabled = pxe_enabled and not port["pxe_enabled"]
+            self.ports[port["uuid"]] = port
+
+
+def _apply_patch(node: dict, patch: list[dict]) -> None:
+    """Apply a JSON patch, as sent by ironicclient, to a node."""
+    for operation in patch:
+        *parents, key = operation["path"].strip("/").split("/")
+        target = node
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        if operation["op"] == "remove" and target is node:
+            node[key] = None  # top-level fields reset to their default
+        elif operation["op"] == "remove":
+            target.pop(key, None)
+        else:
+            target[key] = operation["value"]
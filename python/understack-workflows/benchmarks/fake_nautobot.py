@@ -0,0 +1,194 @@
+"""A local stand-in for the Nautobot API, for benchmarks.
+
+A generic in-memory REST store: any /api/<app>/<model>/ endpoint can be
+listed, filtered, created, fetched, patched and deleted the way pynautobot
+expects.  Related objects are returned nested, with a url, so pynautobot
+builds records for them; a filter on a relation matches its id or name.
+GraphQL queries are counted and answered by an optional callable.
+"""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from collections.abc import Callable
+from urllib.parse import SplitResult
+from urllib.parse import parse_qs
+
+import pynautobot
+from fake_http import FakeService
+
+# field -> the endpoint of the object it refers to
+RELATIONS = {
+    "device": "dcim/devices",
+    "location": "dcim/locations",
+    "rack": "dcim/racks",
+    "tenant": "tenancy/tenants",
+    "interface": "dcim/interfaces",
+    "cable": "dcim/cables",
+    "ip_address": "ipam/ip-addresses",
+    "status": "extras/statuses",
+    "role": "extras/roles",
+}
+
+# fields Nautobot includes, null or blank, in every object of these models
+DEFAULTS = {
+    "dcim/devices": {
+        "serial": "",
+        "location": None,
+        "rack": None,
+        "position": None,
+        "face": None,
+        "tenant": None,
+    },
+    "dcim/interfaces": {
+        "cable": None,
+        "description": "",
+        "mac_address": None,
+        "mgmt_only": False,
+        "type": None,
+    },
+}
+
+# fields holding a choice, which Nautobot returns as {"value", "label"}
+CHOICES = {"type", "face"}
+
+
+class FakeNautobot(FakeService):
+    """Serve the Nautobot REST and GraphQL APIs on 127.0.0.1 until stopped."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        graphql: Callable[[str, dict], dict] | None = None,
+    ):
+        super().__init__(latency=latency)
+        self.graphql = graphql or (lambda query, variables: {})
+        self.objects: dict[str, dict[str, dict]] = {}
+        self._state = threading.Lock()
+
+    def api(self):
+        """A pynautobot client talking to this server."""
+        return pynautobot.api(self.url, token="bench")  # noqa: S106
+
+    def add(self, endpoint: str, **fields) -> dict:
+        """Store an object directly, e.g. to seed switches, returning it."""
+        with self._state:
+            return self._create(endpoint, fields)
+
+    def route(self, path: str) -> str:
+        parts = path.split("?")[0].strip("/").split("/")
+        return "/" + "/".join(parts[:3] + ["{id}"] * (len(parts) > 3))
+
+    def respond(self, method: str, url: SplitResult, body):
+        parts = url.path.strip("/").split("/")
+        if parts[:2] == ["api", "graphql"]:
+            data = self.graphql(body.get("query", ""), body.get("variables") or {})
+            return 200, {"data": data}, {}
+        if len(parts) not in (3, 4) or parts[0] != "api":
+            return 404, {"detail": "Not found."}, {}
+        endpoint = "/".join(parts[1:3])
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        with self._state:
+            status, data = self._respond(method, endpoint, parts[3:], query, body)
+        return status, data, {}
+
+    def _respond(self, method, endpoint, key, query, body):
+        table = self.objects.setdefault(endpoint, {})
+        match method, key:
+            case "GET", []:
+                filters = {
+                    k: v for k, v in query.items() if k not in ("limit", "offset")
+                }
+                candidates = list(table.values())
+                if "id" in filters:
+                    candidates = [table[k] for k in [filters["id"]] if k in table]
+                results = [
+                    self._render(obj)
+                    for obj in candidates
+                    if all(self._matches(obj, k, v) for k, v in filters.items())
+                ]
+                page = {"next": None, "previous": None}
+                return 200, {"count": len(results), **page, "results": results}
+            case "POST", []:
+                return 201, self._render(self._create(endpoint, body))
+            case _, [id_] if id_ not in table:
+                return 404, {"detail": "Not found."}
+            case "GET", [id_]:
+                return 200, self._render(table[id_])
+            case "PATCH", [id_]:
+                for field, value in body.items():
+                    table[id_][field] = self._store_value(field, value)
+                return 200, self._render(table[id_])
+            case "DELETE", [id_]:
+                self._delete(endpoint, id_)
+                return 204, None
+        return 405, {"detail": f"Method {method} not allowed."}
+
+    def _create(self, endpoint: str, fields: dict) -> dict:
+        obj = {"id": str(uuid.uuid4()), **DEFAULTS.get(endpoint, {})}
+        for field, value in fields.items():
+            obj[field] = self._store_value(field, value)
+        if endpoint == "dcim/cables":
+            # Nautobot links both ends of a cable back to it
+            for end in ("termination_a_id", "termination_b_id"):
+                interface = self.objects.get("dcim/interfaces", {}).get(obj.get(end))
+                if interface is not None:
+                    interface["cable"] = obj["id"]
+        self.objects.setdefault(endpoint, {})[obj["id"]] = obj
+        return obj
+
+    def _delete(self, endpoint: str, id_: str) -> None:
+        del self.objects[endpoint][id_]
+        for interface in self.objects.get("dcim/interfaces", {}).values():
+            if interface.get("cable") == id_:
+                interface["cable"] = None
+
+    def _store_value(self, field: str, value):
+        """Keep relations as the id they refer to, choices as their value."""
+        if field in ("status", "role"):
+            name = value.get("name") if isinstance(value, dict) else value
+            return self._named(RELATIONS[field], name)
+        if isinstance(value, dict) and (field in RELATIONS or field in CHOICES):
+            return value.get("id") or value.get("value")
+        return value
+
+    def _named(self, endpoint: str, name: str) -> str:
+        """The id of the status or role called name (or with id name)."""
+        table = self.objects.setdefault(endpoint, {})
+        if name in table:
+            return name
+        for obj in table.values():
+            if obj["name"] == name:
+                return obj["id"]
+        return self._create(endpoint, {"name": name})["id"]
+
+    def _render(self, obj: dict) -> dict:
+        data = dict(obj)
+        for field, value in obj.items():
+            if field in RELATIONS and value is not None:
+                endpoint = RELATIONS[field]
+                related = self.objects.get(endpoint, {}).get(value, {})
+                data[field] = {
+                    "id": value,
+                    "url": f"{self.url}/api/{endpoint}/{value}/",
+                    **({"name": related["name"]} if "name" in related else {}),
+                }
+            elif field in CHOICES and value is not None:
+                data[field] = {"value": value, "label": value}
+        data["url"] = f"{self.url}/api/{self._endpoint_of(obj)}/{obj['id']}/"
+        data.setdefault("custom_fields", {})
+        return data
+
+    def _endpoint_of(self, obj: dict) -> str:
+        return next(e for e, table in self.objects.items() if obj["id"] in table)
+
+    def _matches(self, obj: dict, field: str, value: str) -> bool:
+        if field.endswith("_id") and field[:-3] in RELATIONS:
+            return obj.get(field[:-3]) == value
+        if field in RELATIONS:
+            related = self.objects.get(RELATIONS[field], {}).get(obj.get(field), {})
+            return value in (obj.get(field), related.get("name"))
+        if field == "address":
+            return str(obj.get(field, "")).split("/")[0] == value.split("/")[0]
+        return str(obj.get(field)) == value
@@ -0,0 +1,229 @@
+"""A local stand-in for a BMC's Redfish API, for benchmarks.
+
+Serves a dict of Redfish resources keyed by path over plain HTTP, with a
+configurable delay per request and a cap on how many requests it works on
+at once, the way a busy iDRAC behaves.  $expand is honoured on collections
+when the service root advertises it.  Settings PATCHed for the next reset
+create a configuration job, which has completed by the time it is first
+read, as if the server had already rebooted.
+"""
+
+from __future__ import annotations
+
+import itertools
+from urllib.parse import SplitResult
+
+from fake_http import FakeService
+
+from understack_workflows.bmc import Bmc
+
+SYSTEM = "/redfish/v1/Systems/System.Embedded.1"
+MANAGER = "/redfish/v1/Managers/iDRAC.Embedded.1"
+
+
+def dell_server(
+    drives: int = 24, nics: int = 8, expand: bool = True, server_id: int = 0
+) -> dict:
+    """Redfish resources for a Dell server with the given drives and NICs.
+
+    server_id makes the service tag and MAC addresses unique in a fleet.
+    The BIOS and iDRAC settings are factory defaults, not our standard ones.
+    """
+    controller = f"{SYSTEM}/Storage/RAID.SL.1-1"
+    drive_paths = [
+        f"{controller}/Drives/Disk.Bay.{n}:Enclosure.Internal.0-1"
+        for n in range(drives)
+    ]
+    nic_paths = [f"{SYSTEM}/EthernetInterfaces/NIC.Slot.{n}-1" for n in range(nics)]
+    idrac_nic = f"{MANAGER}/EthernetInterfaces/NIC.1"
+    mac_prefix = f"14:23:F3:{server_id >> 8 & 0xFF:02X}:{server_id & 0xFF:02X}"
+    features = {"ExpandQuery": {"ExpandAll": True, "NoLinks": True, "Levels": True}}
+    resources = {
+        "/redfish/v1": {
+            "@odata.id": "/redfish/v1",
+            "ProtocolFeaturesSupported": features if expand else {},
+        },
+        "/redfish/v1/Systems/": _collection([SYSTEM]),
+        "/redfish/v1/Managers/": _collection([MANAGER]),
+        SYSTEM: {
+            "@odata.id": SYSTEM,
+            "Manufacturer": "Dell Inc.",
+            "Model": "PowerEdge R7615",
+            "SKU": f"BENCH{server_id:04d}",
+            "BiosVersion": "1.6.10",
+            "PowerState": "On",
+            "MemorySummary": {"TotalSystemMemoryGiB": 384},
+            "ProcessorSummary": {"Model": "AMD EPYC 9454P 48-Core Processor"},
+            "Oem": {"Dell": {}},
+        },
+        f"{SYSTEM}/Bios": {
+            "Attributes": {
+                "HttpDev1TlsMode": "TLS",
+                "TimeZone": "Local",
+                "OS-BMC.1.AdminState": "Enabled",
+                "IPMILan.1.Enable": "Enabled",
+                "SecureBoot": "Enabled",
+                "PxeDev1EnDis": "Enabled",
+                "HttpDev1EnDis": "Disabled",
+                "HttpDev2EnDis": "Disabled",
+                "HttpDev3EnDis": "Disabled",
+                "HttpDev4EnDis": "Disabled",
+                "HttpDev1Interface": "NIC.Integrated.1-1-1",
+            }
+        },
+        f"{SYSTEM}/Bios/Settings": {"Attributes": {}},
+        f"{SYSTEM}/Storage": _collection([controller]),
+        controller: {
+            "@odata.id": controller,
+            "Id": "RAID.SL.1-1",
+            "Drives": [{"@odata.id": path} for path in drive_paths],
+        },
+        f"{SYSTEM}/EthernetInterfaces/": _collection(nic_paths),
+        f"{MANAGER}/Jobs": _collection([]),
+        f"{MANAGER}/EthernetInterfaces/": _collection([idrac_nic]),
+        idrac_nic: {
+            "@odata.id": idrac_nic,
+            "Name": "Manager Ethernet Interface",
+            "HostName": "idrac-factory",
+            "MACAddress": f"{mac_prefix}:FF",
+            "IPv4Addresses": [
+                {
+                    "Address": "10.46.96.156",
+                    "AddressOrigin": "DHCP",
+                    "Gateway": "10.46.96.129",
+                    "SubnetMask": "255.255.255.192",
+                }
+            ],
+        },
+        f"{MANAGER}/Attributes": {
+            "Attributes": {
+                "SNMP.1.AgentEnable": "Disabled",
+                "SNMP.1.SNMPProtocol": "SNMPv3",
+                "SNMP.1.AgentCommunity": "public",
+                "SNMP.1.AlertPort": 162,
+                "SwitchConnectionView.1.Enable": "Disabled",
+                "NTPConfigGroup.1.NTPEnable": "Enabled",
+                "Time.1.Timezone": "CST6CDT",
+                "IPv4.1.DNS1": "192.0.2.53",
+                "IPv4.1.DNS2": "192.0.2.54",
+            }
+        },
+    }
+    for n, path in enumerate(drive_paths):
+        resources[path] = {
+            "@odata.id": path,
+            "Id": path.rsplit("/", 1)[-1],
+            "Name": f"Solid State Disk 0:1:{n}",
+            "MediaType": "SSD",
+            "Model": "MTFDDAK480TDS",
+            "CapacityBytes": 479559942144,
+            "Status": {"Health": "OK"},
+        }
+    for n, path in enumerate(nic_paths):
+        resources[path] = {
+            "@odata.id": path,
+            "Id": path.rsplit("/", 1)[-1],
+            "Name": "System Ethernet Interface",
+            "Description": f"NIC in Slot {n} Port 1",
+            "MACAddress": f"{mac_prefix}:{n:02X}",
+        }
+    return resources
+
+
+def _collection(paths: list[str]) -> dict:
+    return {
+        "Members": [{"@odata.id": path} for path in paths],
+        "Members@odata.count": len(paths),
+    }
+
+
+class FakeRedfish(FakeService):
+    """Serve resources on 127.0.0.1 until stopped; use as a context manager."""
+
+    def __init__(self, resources: dict, latency: float = 0.05, max_concurrent=4):
+        super().__init__(latency=latency, max_concurrent=max_concurrent)
+        self.resources = resources
+        self._job_ids = itertools.count(1)
+
+    def bmc(self) -> Bmc:
+        """A Bmc talking to this server."""
+        return LocalBmc(self.port)
+
+    def respond(self, method: str, url: SplitResult, body):
+        path = url.path
+        if method == "POST" and path.endswith("/Sessions"):
+            return 201, {"@odata.id": f"{path}/1"}, {"X-Auth-Token": "bench"}
+        if method == "POST" and path == f"{MANAGER}/Jobs":
+            return 200, {}, {"Location": self._create_job(body["TargetSettingsURI"])}
+        if method == "DELETE":
+            self._delete_job(path)
+            return 204, None, {}
+        # Redfish paths are served with or without a trailing slash
+        for candidate in (path, path.rstrip("/"), path.rstrip("/") + "/"):
+            if candidate in self.resources:
+                path = candidate
+                break
+        else:
+            return 404, {"error": f"{path} not found"}, {}
+        if method == "PATCH":
+            resource = self.resources[path]
+            for key, value in (body or {}).items():
+                if isinstance(value, dict) and isinstance(resource.get(key), dict):
+                    resource[key].update(value)
+                else:
+                    resource[key] = value
+            if "@Redfish.SettingsApplyTime" in (body or {}):
+                return 202, None, {"Location": self._create_job(path)}
+            return 200, resource, {}
+        data = self.resources[path]
+        if data.get("JobState") == "Scheduled":
+            data["JobState"] = "Completed"
+            data["Message"] = "Job completed successfully."
+        if "$expand=" in url.query and self._expand_supported():
+            data = {
+                **data,
+                "Members": [
+                    self.resources.get(m["@odata.id"], m)
+                    for m in data.get("Members", [])
+                ],
+            }
+        return 200, data, {}
+
+    def _create_job(self, settings_path: str) -> str:
+        """Queue a configuration job for settings_path, returning its path."""
+        path = f"{MANAGER}/Jobs/JID_{next(self._job_ids):012d}"
+        self.resources[path] = {
+            "@odata.id": path,
+            "Id": path.rsplit("/", 1)[-1],
+            "JobType": "BIOSConfiguration",
+            "JobState": "Scheduled",
+            "Message": "Task successfully scheduled.",
+            "TargetSettingsURI": settings_path,
+        }
+        jobs = self.resources[f"{MANAGER}/Jobs"]
+        jobs["Members"].append({"@odata.id": path})
+        jobs["Members@odata.count"] = len(jobs["Members"])
+        return path
+
+    def _delete_job(self, path: str) -> None:
+        if self.resources.pop(path, None) is None:
+            return
+        jobs = self.resources[f"{MANAGER}/Jobs"]
+        jobs["Members"].remove({"@odata.id": path})
+        jobs["Members@odata.count"] = len(jobs["Members"])
+
+    def _expand_supported(self) -> bool:
+        root = self.resources["/redfish/v1"]
+        return bool(root["ProtocolFeaturesSupported"].get("ExpandQuery"))
+
+
+class LocalBmc(Bmc):
+    """A Bmc reached over plain HTTP on a local port."""
+
+    def __init__(self, port: int):
+        super().__init__(ip_address="127.0.0.1", password="bench")  # noqa: S106
+        self.port = port
+
+    def url(self):
+        """Return base redfish URL."""
+        return f"http://127.0.0.1:{self.port}"
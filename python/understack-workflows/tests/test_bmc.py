@@ -1,7 +1,10 @@
 import os
+import threading
 
 import pytest
 
+from understack_workflows.bmc import Bmc
+from understack_workflows.bmc import RedfishRequestError
 from understack_workflows.bmc import bmc_for_ip_address
 
 
@@ -25,3 +28,247 @@ def test_bmc_for_ip_address(mock_creds, monkeypatch):
     assert bmc.url() == "https://1.2.3.4"
     assert bmc.username == "root"
     assert bmc.password == "1MlzcjJ7bnICKp98wrdx"
+
+
+@pytest.fixture
+def bmc():
+    return Bmc(ip_address="1.2.3.4", password="secret")
+
+
+def mock_session_login(requests_mock):
+    return requests_mock.post(
+        "https://1.2.3.4/redfish/v1/SessionService/Sessions",
+        json={"@odata.id": "/sessions/1"},
+        headers={"X-Auth-Token": "tOkEn"},
+    )
+
+
+def test_redfish_request_reuses_one_pooled_session(bmc, requests_mock):
+    requests_mock.get("https://1.2.3.4/redfish/v1/Systems/", json={"Members": []})
+
+    bmc.redfish_request("/redfish/v1/Systems/")
+    http = bmc.http()
+    bmc.redfish_request("/redfish/v1/Systems/")
+
+    assert bmc.http() is http
+    retry = http.get_adapter("https://1.2.3.4").max_retries
+    assert 503 in retry.status_forcelist
+    assert requests_mock.last_request.headers["Authorization"].startswith("Basic ")
+
+
+def test_redfish_request_uses_token_while_session_is_open(bmc, requests_mock):
+    mock_session_login(requests_mock)
+    logout = requests_mock.delete("https://1.2.3.4/sessions/1")
+    systems = requests_mock.get("https://1.2.3.4/redfish/v1/Systems/", json={})
+
+    with bmc.session("secret"):
+        bmc.redfish_request("/redfish/v1/Systems/")
+    bmc.redfish_request("/redfish/v1/Systems/")
+
+    in_session, after_session = systems.request_history
+    assert in_session.headers["X-Auth-Token"] == "tOkEn"
+    assert "Authorization" not in in_session.headers
+    assert "X-Auth-Token" not in after_session.headers
+    assert logout.last_request.headers["X-Auth-Token"] == "tOkEn"
+
+
+def test_redfish_request_logs_in_again_when_session_expires(bmc, requests_mock):
+    login = mock_session_login(requests_mock)
+    requests_mock.delete("https://1.2.3.4/sessions/1")
+    systems = requests_mock.get(
+        "https://1.2.3.4/redfish/v1/Systems/",
+        [{"status_code": 401, "text": "expired"}, {"json": {"Members": []}}],
+    )
+
+    with bmc.session("secret"):
+        assert bmc.redfish_request("/redfish/v1/Systems/") == {"Members": []}
+
+    assert login.call_count == 2
+    assert systems.call_count == 2
+
+
+def test_session_logout_failure_is_not_fatal(bmc, requests_mock):
+    mock_session_login(requests_mock)
+    requests_mock.delete("https://1.2.3.4/sessions/1", status_code=500)
+
+    with bmc.session("secret") as token:
+        assert token == "tOkEn"
+
+    assert bmc._token is None
+
+
+def test_explicit_token_is_not_renewed(bmc, requests_mock):
+    requests_mock.get("https://1.2.3.4/redfish/v1/Systems/", status_code=401)
+
+    with pytest.raises(RedfishRequestError):
+        bmc.redfish_request("/redfish/v1/Systems/", token="stale")
+
+
+def test_collection_members_uses_expand_when_advertised(bmc, requests_mock):
+    requests_mock.get(
+        "https://1.2.3.4/redfish/v1",
+        json={"ProtocolFeaturesSupported": {"ExpandQuery": {"ExpandAll": True}}},
+    )
+    expanded = requests_mock.get(
+        "https://1.2.3.4/redfish/v1/Systems?$expand=*",
+        json={"Members": [{"@odata.id": "/redfish/v1/Systems/1", "Id": "1"}]},
+    )
+
+    members = bmc.collection_members("/redfish/v1/Systems")
+
+    assert members == [{"@odata.id": "/redfish/v1/Systems/1", "Id": "1"}]
+    assert expanded.called_once
+
+
+def test_resolve_members_fetches_links_concurrently_in_order(bmc):
+    barrier = threading.Barrier(2)
+
+    def redfish_request(path):
+        # Only passes if two requests are in flight at the same time.
+        barrier.wait(timeout=5)
+        return {"Id": path.rsplit("/", 1)[-1]}
+
+    bmc.redfish_request = redfish_request
+    members = [
+        {"@odata.id": "/redfish/v1/Drives/0"},
+        {"@odata.id": "/redfish/v1/Drives/x", "Id": "x"},
+        {"@odata.id": "/redfish/v1/Drives/1"},
+    ]
+
+    resolved = bmc.resolve_members(members)
+
+    assert [m["Id"] for m in resolved] == ["0", "x", "1"]
+
+
+SYSTEM_URL = "https://1.2.3.4/redfish/v1/Systems/1"
+
+
+def test_read_cache_fetches_each_resource_once(bmc, requests_mock):
+    system = requests_mock.get(SYSTEM_URL, json={"PowerState": "On"})
+
+    with bmc.read_cache():
+        first = bmc.redfish_request("/redfish/v1/Systems/1")
+        first["PowerState"] = "changed by caller"
+        second = bmc.redfish_request("/redfish/v1/Systems/1")
+
+    assert system.call_count == 1
+    assert second == {"PowerState": "On"}
+
+
+def test_gets_are_not_cached_outside_read_cache(bmc, requests_mock):
+    system = requests_mock.get(SYSTEM_URL, json={})
+
+    bmc.redfish_request("/redfish/v1/Systems/1")
+    bmc.redfish_request("/redfish/v1/Systems/1")
+
+    assert system.call_count == 2
+
+
+def test_read_cache_is_invalidated_by_patch(bmc, requests_mock):
+    system = requests_mock.get(
+        SYSTEM_URL, [{"json": {"HostName": "a"}}, {"json": {"HostName": "b"}}]
+    )
+    requests_mock.patch(SYSTEM_URL + "/", json={})
+
+    with bmc.read_cache():
+        bmc.redfish_request("/redfish/v1/Systems/1")
+        bmc.redfish_request(
+            "/redfish/v1/Systems/1/", method="PATCH", payload={"HostName": "b"}
+        )
+        after = bmc.redfish_request("/redfish/v1/Systems/1")
+
+    assert system.call_count == 2
+    assert after == {"HostName": "b"}
+
+
+def test_read_cache_settings_patch_invalidates_the_resource(bmc, requests_mock):
+    bios = requests_mock.get(SYSTEM_URL + "/Bios", json={"Attributes": {}})
+    requests_mock.patch(SYSTEM_URL + "/Bios/Settings", json={})
+
+    with bmc.read_cache():
+        bmc.redfish_request("/redfish/v1/Systems/1/Bios")
+        bmc.redfish_request(
+            "/redfish/v1/Systems/1/Bios/Settings", method="PATCH", payload={}
+        )
+        bmc.redfish_request("/redfish/v1/Systems/1/Bios")
+
+    assert bios.call_count == 2
+
+
+def test_gets_with_etag_are_not_kept_outside_read_cache(bmc, requests_mock):
+    requests_mock.get(SYSTEM_URL, json={}, headers={"ETag": 'W/"1"'})
+
+    for _ in range(3):
+        bmc.redfish_request("/redfish/v1/Systems/1")
+
+    assert bmc._cache == {}
+    assert "If-None-Match" not in requests_mock.last_request.headers
+
+
+def test_read_cache_keeps_a_bounded_number_of_etags(bmc, requests_mock, mocker):
+    mocker.patch("understack_workflows.bmc.MAX_CACHED_RESOURCES", 2)
+    requests_mock.get(SYSTEM_URL, json={}, headers={"ETag": 'W/"1"'})
+
+    with bmc.read_cache():
+        for n in range(4):
+            bmc.redfish_request(f"/redfish/v1/Systems/1?n={n}")
+
+    assert list(bmc._cache) == [
+        "/redfish/v1/Systems/1?n=2",
+        "/redfish/v1/Systems/1?n=3",
+    ]
+
+
+def test_read_cache_revalidates_with_etag_in_later_blocks(bmc, requests_mock):
+    system = requests_mock.get(
+        SYSTEM_URL,
+        [
+            {"json": {"PowerState": "On"}, "headers": {"ETag": 'W/"1"'}},
+            {"status_code": 304},
+        ],
+    )
+
+    with bmc.read_cache():
+        bmc.redfish_request("/redfish/v1/Systems/1")
+    with bmc.read_cache():
+        revalidated = bmc.redfish_request("/redfish/v1/Systems/1")
+        bmc.redfish_request("/redfish/v1/Systems/1")
+
+    assert revalidated == {"PowerState": "On"}
+    assert system.call_count == 2
+    assert system.last_request.headers["If-None-Match"] == 'W/"1"'
+
+
+def test_gets_outside_read_cache_do_not_revalidate_cached_etags(bmc, requests_mock):
+    system = requests_mock.get(
+        SYSTEM_URL, json={"PowerState": "On"}, headers={"ETag": 'W/"1"'}
+    )
+
+    with bmc.read_cache():
+        bmc.redfish_request("/redfish/v1/Systems/1")
+    data = bmc.redfish_request("/redfish/v1/Systems/1")
+    data["PowerState"] = "Off"
+
+    assert "If-None-Match" not in system.last_request.headers
+    assert bmc._cache["/redfish/v1/Systems/1"].data == {"PowerState": "On"}
+
+
+def test_redfish_request_location_returns_created_path(bmc, requests_mock):
+    requests_mock.patch(
+        SYSTEM_URL + "/Bios/Settings",
+        status_code=202,
+        headers={"Location": "https://1.2.3.4/redfish/v1/Managers/1/Jobs/JID_1"},
+    )
+
+    location = bmc.redfish_request_location(
+        "/redfish/v1/Systems/1/Bios/Settings", method="PATCH", payload={}
+    )
+
+    assert location == "/redfish/v1/Managers/1/Jobs/JID_1"
+
+
+def test_redfish_request_location_raises_on_failure(bmc, requests_mock):
+    requests_mock.post("https://1.2.3.4/redfish/v1/Managers/1/Jobs", status_code=400)
+
+    with pytest.raises(RedfishRequestError):
+        bmc.redfish_request_location("/redfish/v1/Managers/1/Jobs", payload={})
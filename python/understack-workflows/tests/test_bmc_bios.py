@@ -1,4 +1,8 @@
+import pytest
+
 from understack_workflows import bmc_bios
+from understack_workflows.bmc import RedfishRequestError
+from understack_workflows.bmc_jobs import DellJob
 
 
 def test_update_dell_bios_settings_skips_patch_when_desired_values_are_pending(mocker):
@@ -23,7 +27,7 @@ def test_update_dell_bios_settings_skips_patch_when_desired_values_are_pending(m
 
     result = bmc_bios.update_dell_bios_settings(bmc, "NIC.Embedded.1-1-1")
 
-    assert result == {}
+    assert result is None
     patch_bios_settings.assert_not_called()
 
 
@@ -56,11 +60,85 @@ def test_update_dell_bios_settings_only_patches_settings_not_already_pending(moc
 
     result = bmc_bios.update_dell_bios_settings(bmc, "NIC.Embedded.1-1-1")
 
-    assert result == {
-        "HttpDev1EnDis": "Enabled",
-        "HttpDev1Interface": "NIC.Embedded.1-1-1",
-        "HttpDev1TlsMode": "None",
-        "OS-BMC.1.AdminState": "Disabled",
-        "PxeDev1EnDis": "Disabled",
-    }
-    patch_bios_settings.assert_called_once_with(bmc, result)
+    assert result is patch_bios_settings.return_value
+    patch_bios_settings.assert_called_once_with(
+        bmc,
+        {
+            "HttpDev1EnDis": "Enabled",
+            "HttpDev1Interface": "NIC.Embedded.1-1-1",
+            "HttpDev1TlsMode": "None",
+            "OS-BMC.1.AdminState": "Disabled",
+            "PxeDev1EnDis": "Disabled",
+        },
+    )
+
+
+SETTINGS = "/redfish/v1/Systems/System.Embedded.1/Bios/Settings"
+JOBS = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs"
+
+
+@pytest.fixture
+def dell_bmc(mocker):
+    bmc = mocker.Mock()
+    bmc.system_path = "/redfish/v1/Systems/System.Embedded.1"
+    bmc.manager_path = "/redfish/v1/Managers/iDRAC.Embedded.1"
+    return bmc
+
+
+def test_patch_bios_settings_returns_job_from_location(dell_bmc):
+    dell_bmc.redfish_request_location.return_value = f"{JOBS}/JID_1"
+
+    job = bmc_bios.patch_bios_settings(dell_bmc, {"TimeZone": "UTC"})
+
+    assert job.path == f"{JOBS}/JID_1"
+    dell_bmc.redfish_request_location.assert_called_once_with(
+        SETTINGS,
+        payload={
+            "@Redfish.SettingsApplyTime": {"ApplyTime": "OnReset"},
+            "Attributes": {"TimeZone": "UTC"},
+        },
+        method="PATCH",
+    )
+
+
+def test_patch_bios_settings_creates_job_when_firmware_does_not(dell_bmc, mocker):
+    dell_bmc.redfish_request_location.side_effect = [None, f"{JOBS}/JID_2"]
+
+    job = bmc_bios.patch_bios_settings(dell_bmc, {"TimeZone": "UTC"})
+
+    assert job.id == "JID_2"
+    assert dell_bmc.redfish_request_location.call_args == mocker.call(
+        JOBS, payload={"TargetSettingsURI": SETTINGS}
+    )
+
+
+def test_patch_bios_settings_replaces_a_queued_job(dell_bmc, mocker):
+    dell_bmc.redfish_request_location.side_effect = [
+        RedfishRequestError("HTTP 400 - Pending configuration values"),
+        f"{JOBS}/JID_2",
+    ]
+    dell_bmc.redfish_request.return_value = {"Attributes": {"SecureBoot": "Disabled"}}
+    queued = DellJob(dell_bmc, f"{JOBS}/JID_1", state="Scheduled")
+    mocker.patch.object(bmc_bios, "pending_jobs", return_value=[queued])
+    delete_job = mocker.patch.object(bmc_bios, "delete_job")
+
+    job = bmc_bios.patch_bios_settings(dell_bmc, {"TimeZone": "UTC"})
+
+    delete_job.assert_called_once_with(queued)
+    assert job.id == "JID_2"
+    payload = dell_bmc.redfish_request_location.call_args.kwargs["payload"]
+    assert payload["Attributes"] == {"SecureBoot": "Disabled", "TimeZone": "UTC"}
+
+
+def test_patch_bios_settings_will_not_replace_a_running_job(dell_bmc, mocker):
+    dell_bmc.redfish_request_location.side_effect = RedfishRequestError(
+        "HTTP 400 - Pending configuration values"
+    )
+    running = DellJob(dell_bmc, f"{JOBS}/JID_1", state="Running")
+    mocker.patch.object(bmc_bios, "pending_jobs", return_value=[running])
+    delete_job = mocker.patch.object(bmc_bios, "delete_job")
+
+    with pytest.raises(RedfishRequestError, match="JID_1 is Running"):
+        bmc_bios.patch_bios_settings(dell_bmc, {"TimeZone": "UTC"})
+
+    delete_job.assert_not_called()
@@ -9,12 +9,17 @@ from understack_workflows.bmc import Bmc
 
 
 class FakeBmc(Bmc):
-    def __init__(self, fixtures):
+    def __init__(self, fixtures, service_root=None):
         self.fixtures = fixtures
+        self.service_root = service_root or {}
+        self.requested = []
         self.ip_address = "1.2.3.4"
         super().__init__(ip_address=self.ip_address)
 
     def redfish_request(self, path: str, *_args, **_kw) -> dict:
+        self.requested.append(path)
+        if path == "/redfish/v1":
+            return self.service_root
         path = path.replace("/", "_") + ".json"
         return self.fixtures[path]
 
@@ -53,3 +58,53 @@ def test_chassis_info_R7615():
         memory_gib=96,
         cpu="AMD EPYC 9124 16-Core Processor",
     )
+
+
+def test_in_band_interfaces_skips_partitions_of_listed_ports():
+    bmc = FakeBmc(read_fixtures("json_samples/bmc_chassis_info/R7615"))
+
+    interfaces = bmc_chassis_info.in_band_interfaces(bmc)
+
+    assert [i["name"] for i in interfaces] == [
+        "NIC.Integrated.1-1",
+        "NIC.Integrated.1-2",
+        "NIC.Embedded.1-1-1",
+        "NIC.Slot.1-1",
+        "NIC.Slot.1-2",
+        "NIC.Embedded.2-1-1",
+        "NIC.Slot.2-1-1",
+        "NIC.Slot.2-2-1",
+    ]
+    assert interfaces[0]["mac_address"] == "D4:04:E6:4F:8D:B4"
+    assert not any(path.endswith("NIC.Slot.1-1-1") for path in bmc.requested)
+
+
+def test_in_band_interfaces_uses_expand_when_supported():
+    fixtures = read_fixtures("json_samples/bmc_chassis_info/R7615")
+    prefix = "_redfish_v1_Systems_System.Embedded.1_EthernetInterfaces_"
+    index = fixtures[prefix + ".json"]
+    expanded = {
+        **index,
+        "Members": [
+            fixtures.get(member["@odata.id"].replace("/", "_") + ".json", member)
+            for member in index["Members"]
+        ],
+    }
+    fixtures[prefix + "?$expand=.($levels=1).json"] = expanded
+    bmc = FakeBmc(
+        fixtures,
+        service_root={
+            "ProtocolFeaturesSupported": {
+                "ExpandQuery": {"Levels": True, "NoLinks": True, "MaxLevels": 1}
+            }
+        },
+    )
+
+    interfaces = bmc_chassis_info.in_band_interfaces(bmc)
+
+    assert len(interfaces) == 8
+    assert bmc.requested == [
+        "/redfish/v1/Systems/",
+        "/redfish/v1",
+        "/redfish/v1/Systems/System.Embedded.1/EthernetInterfaces/?$expand=.($levels=1)",
+    ]
@@ -3,7 +3,9 @@ import json
 import pytest
 from pytest_mock import MockerFixture
 
+from understack_workflows.bmc import Bmc
 from understack_workflows.bmc_disk import Disk
+from understack_workflows.bmc_disk import physical_disks
 
 DELL_TEST_DISK_PATH = "/redfish/v1/Systems/System.Embedded.1/Storage/RAID.SL.1-1/Drives/Disk.Bay.1:Enclosure.Internal.0-1:RAID.SL.1-1"  # noqa: E501
 HP_TEST_DISK_PATH = (
@@ -86,3 +88,40 @@ def test_disk_gb_conversion():
         capacity_bytes=479559942144,
     )
     assert disk.capacity_gb == 480
+
+
+class DictBmc(Bmc):
+    def __init__(self, resources):
+        super().__init__(ip_address="1.2.3.4")
+        self.resources = resources
+        self.requested = []
+
+    def redfish_request(self, path: str, *_args, **_kw) -> dict:
+        self.requested.append(path)
+        return self.resources[path]
+
+
+def test_physical_disks_dell_fetches_each_drive_once(mock_dell_disk_data):
+    system = "/redfish/v1/Systems/System.Embedded.1"
+    drives = [f"{system}/Storage/RAID.SL.1-1/Drives/Disk.Bay.{n}" for n in range(3)]
+    bmc = DictBmc(
+        {
+            "/redfish/v1": {},
+            "/redfish/v1/Systems/": {"Members": [{"@odata.id": system}]},
+            system: {"Manufacturer": "Dell Inc."},
+            f"{system}/Storage": {
+                "Members": [{"@odata.id": f"{system}/Storage/RAID.SL.1-1"}]
+            },
+            f"{system}/Storage/RAID.SL.1-1": {
+                "Drives": [{"@odata.id": drive} for drive in drives]
+            },
+        }
+        | dict.fromkeys(drives, mock_dell_disk_data)
+    )
+
+    disks = physical_disks(bmc)
+
+    assert [disk.name for disk in disks] == ["Solid State Disk 0:1:1"] * 3
+    assert sorted(bmc.requested[-3:]) == drives
+    # The manufacturer is read once, not once per drive.
+    assert bmc.requested.count(system) == 1
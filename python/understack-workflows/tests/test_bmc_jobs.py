@@ -0,0 +1,76 @@
+import pytest
+
+from understack_workflows import bmc_jobs
+from understack_workflows.bmc_jobs import DellJob
+from understack_workflows.bmc_jobs import JobFailedError
+from understack_workflows.bmc_jobs import JobTimeoutError
+
+JOBS = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs"
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.patch.object(bmc_jobs.time, "sleep")
+
+
+def job_with_states(mocker, name, *states):
+    bmc = mocker.Mock()
+    bmc.redfish_request.side_effect = [{"JobState": s, "Message": s} for s in states]
+    return DellJob(bmc, f"{JOBS}/{name}")
+
+
+def test_wait_for_jobs_polls_until_every_job_completes(mocker, sleep):
+    quick = job_with_states(mocker, "JID_1", "Completed")
+    slow = job_with_states(mocker, "JID_2", "Scheduled", "Running", "Completed")
+
+    bmc_jobs.wait_for_jobs([quick, slow], poll_interval=5)
+
+    assert quick.bmc.redfish_request.call_count == 1
+    assert slow.bmc.redfish_request.call_count == 3
+    assert sleep.call_args_list == [mocker.call(5)] * 2
+
+
+@pytest.mark.parametrize(
+    "state", ["Failed", "CompletedWithErrors", "RebootFailed", "Aborted"]
+)
+def test_wait_for_jobs_raises_when_a_job_fails(mocker, sleep, state):
+    job = job_with_states(mocker, "JID_1", "Running", state)
+
+    with pytest.raises(JobFailedError, match=f"JID_1 {state}"):
+        bmc_jobs.wait_for_jobs([job])
+
+
+def test_wait_for_jobs_gives_up_after_timeout(mocker, sleep):
+    job = job_with_states(mocker, "JID_1", "Running")
+
+    with pytest.raises(JobTimeoutError, match="JID_1"):
+        bmc_jobs.wait_for_jobs([job], timeout=0)
+
+    sleep.assert_not_called()
+
+
+def test_pending_jobs_lists_unfinished_jobs_of_a_type(mocker):
+    bmc = mocker.Mock()
+    bmc.manager_path = "/redfish/v1/Managers/iDRAC.Embedded.1"
+    bmc.resolve_members.return_value = [
+        {
+            "@odata.id": f"{JOBS}/JID_1",
+            "JobType": "BIOSConfiguration",
+            "JobState": "Completed",
+        },
+        {
+            "@odata.id": f"{JOBS}/JID_2",
+            "JobType": "BIOSConfiguration",
+            "JobState": "Scheduled",
+        },
+        {
+            "@odata.id": f"{JOBS}/JID_3",
+            "JobType": "RAIDConfiguration",
+            "JobState": "Scheduled",
+        },
+    ]
+
+    jobs = bmc_jobs.pending_jobs(bmc, "BIOSConfiguration")
+
+    bmc.collection_members.assert_called_once_with(JOBS)
+    assert [(job.id, job.state) for job in jobs] == [("JID_2", "Scheduled")]
@@ -9,6 +9,7 @@ from ironicclient.v1.node import Node
 
 from understack_workflows.bmc_chassis_info import ChassisInfo
 from understack_workflows.bmc_chassis_info import InterfaceInfo
+from understack_workflows.bmc_jobs import DellJob
 from understack_workflows.ironic_node import NodeInterface
 from understack_workflows.ironic_node import get_lldp_connected_interfaces
 from understack_workflows.main import enroll_server
@@ -229,6 +230,7 @@ def test_enrol_happy_path_uses_virtual_media_inspect_and_flips_back(mocker):
     update_dell_bios_settings = mocker.patch.object(
         enroll_server, "update_dell_bios_settings"
     )
+    wait_for_jobs = mocker.patch.object(enroll_server, "wait_for_jobs")
     mocker.patch(
         "understack_workflows.ironic.client.get_ironic_client",
         return_value=fake_ironic,
@@ -248,6 +250,7 @@ def test_enrol_happy_path_uses_virtual_media_inspect_and_flips_back(mocker):
         old_password="old-password",
     )
     update_dell_drac_settings.assert_called_once_with(fake_bmc)
+    fake_bmc.close.assert_called_once_with()
     bmc_set_hostname.assert_called_once_with(fake_bmc, "None", "Dell-ABC123")
 
     # BIOS settings configured exactly once, using pxe_enabled port BIOS names.
@@ -255,6 +258,9 @@ def test_enrol_happy_path_uses_virtual_media_inspect_and_flips_back(mocker):
         fake_bmc,
         pxe_interface="NIC.Integrated.1-1",
     )
+    # Each BIOS job is followed until the server has rebooted and run it.
+    bios_job = update_dell_bios_settings.return_value
+    assert wait_for_jobs.call_args_list == [mocker.call([bios_job])] * 2
 
     fake_ironic.node.create.assert_called_once_with(
         name="Dell-ABC123",
@@ -384,6 +390,7 @@ def test_enrol_existing_failed_node_recovers_and_updates(mocker):
     mocker.patch.object(enroll_server, "update_dell_drac_settings")
     mocker.patch.object(enroll_server, "bmc_set_hostname")
     mocker.patch.object(enroll_server, "update_dell_bios_settings")
+    mocker.patch.object(enroll_server, "wait_for_jobs")
     mocker.patch(
         "understack_workflows.ironic.client.get_ironic_client",
         return_value=fake_ironic,
@@ -596,3 +603,35 @@ def test_get_lldp_connected_interfaces_absent_from_lldp():
     result = get_lldp_connected_interfaces(interfaces, parsed_lldp={})
 
     assert result == []
+
+
+def test_wait_for_bios_job_leaves_scheduled_job_when_no_reboot_is_known(mocker):
+    bmc = MagicMock()
+    bmc.redfish_request.return_value = {"JobState": "Scheduled"}
+    wait_for_jobs = mocker.patch.object(enroll_server, "wait_for_jobs")
+
+    enroll_server.wait_for_bios_job(DellJob(bmc, "/Jobs/JID_1"), rebooted=False)
+
+    wait_for_jobs.assert_not_called()
+
+
+def test_wait_for_bios_job_waits_for_a_job_that_has_started(mocker):
+    bmc = MagicMock()
+    bmc.redfish_request.return_value = {"JobState": "Running"}
+    wait_for_jobs = mocker.patch.object(enroll_server, "wait_for_jobs")
+    job = DellJob(bmc, "/Jobs/JID_1")
+
+    enroll_server.wait_for_bios_job(job, rebooted=False)
+
+    wait_for_jobs.assert_called_once_with([job])
+
+
+def test_wait_for_bios_job_after_reboot_waits_even_if_scheduled(mocker):
+    bmc = MagicMock()
+    wait_for_jobs = mocker.patch.object(enroll_server, "wait_for_jobs")
+    job = DellJob(bmc, "/Jobs/JID_1", state="Scheduled")
+
+    enroll_server.wait_for_bios_job(job, rebooted=True)
+
+    bmc.redfish_request.assert_not_called()
+    wait_for_jobs.assert_called_once_with([job])
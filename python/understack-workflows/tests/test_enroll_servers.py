@@ -0,0 +1,79 @@
+import json
+import threading
+
+import pytest
+
+from understack_workflows.main import enroll_servers
+
+
+def test_enroll_servers_runs_concurrently_and_isolates_failures(mocker):
+    barrier = threading.Barrier(3)
+
+    def fake_enroll(ip_address, **kwargs):
+        # Only passes if all three servers are being enrolled at once.
+        barrier.wait(timeout=5)
+        if ip_address == "10.0.0.2":
+            raise RuntimeError("BMC unreachable")
+
+    enroll = mocker.patch.object(enroll_servers, "enroll", side_effect=fake_enroll)
+
+    results = enroll_servers.enroll_servers(
+        [("10.0.0.1", None), ("10.0.0.2", None), ("10.0.0.3", "cmdb-3")],
+        concurrency=3,
+        firmware_update=False,
+        raid_configure=True,
+        old_password=None,
+    )
+
+    assert [(r.ip_address, r.succeeded) for r in results] == [
+        ("10.0.0.1", True),
+        ("10.0.0.2", False),
+        ("10.0.0.3", True),
+    ]
+    assert results[1].error == "RuntimeError: BMC unreachable"
+    enroll.assert_any_call(
+        ip_address="10.0.0.3",
+        firmware_update=False,
+        raid_configure=True,
+        old_password=None,
+        external_cmdb_id="cmdb-3",
+    )
+
+
+def test_read_servers(tmp_path):
+    path = tmp_path / "servers.txt"
+    path.write_text("# rack 12\n10.0.0.1\n\n10.0.0.2  4242  # replaced PSU\n")
+
+    assert enroll_servers.read_servers(str(path)) == [
+        ("10.0.0.1", None),
+        ("10.0.0.2", 4242),
+    ]
+
+
+def test_main_prints_report_and_fails_if_any_server_failed(mocker, capsys):
+    mocker.patch.object(enroll_servers.helpers, "setup_logger")
+    mocker.patch.object(
+        enroll_servers,
+        "enroll",
+        side_effect=lambda ip_address, **_: ip_address == "10.0.0.2" and 1 / 0,
+    )
+    mocker.patch(
+        "sys.argv",
+        ["enroll-servers", "--ip-address", "10.0.0.1", "--ip-address", "10.0.0.2"],
+    )
+
+    with pytest.raises(SystemExit) as exit_info:
+        enroll_servers.main()
+
+    assert exit_info.value.code == 1
+    report = json.loads(capsys.readouterr().out)
+    assert [(r["ip_address"], r["succeeded"]) for r in report] == [
+        ("10.0.0.1", True),
+        ("10.0.0.2", False),
+    ]
+
+
+@pytest.mark.parametrize("concurrency", ["0", "-1", "many"])
+def test_argument_parser_rejects_bad_concurrency(concurrency):
+    with pytest.raises(SystemExit):
+        enroll_servers.argument_parser().parse_args(["--concurrency", concurrency])
@@ -0,0 +1,236 @@
+"""Tests for batch NetApp operations across projects."""
+
+import json
+import threading
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from understack_workflows.main.netapp_batch import argument_parser
+from understack_workflows.main.netapp_batch import configure_net_step
+from understack_workflows.main.netapp_batch import main
+from understack_workflows.main.netapp_batch import read_projects_file
+from understack_workflows.netapp.batch import ensure_svm
+from understack_workflows.netapp.batch import run_batch
+from understack_workflows.netapp.exceptions import SvmOperationError
+from understack_workflows.netapp.manager import NetAppManager
+from understack_workflows.netapp.value_objects import AggregateResult
+
+PROJECT_A = "12345678123456789abc123456789012"
+PROJECT_B = "abcdefab123456789abc123456789012"
+
+
+class TestEnsureSvm:
+    """Test cases for the ensure_svm batch step."""
+
+    def test_existing_svm_is_left_alone(self):
+        """Test an existing SVM is not created again."""
+        manager = Mock()
+        manager.check_if_svm_exists.return_value = True
+
+        assert ensure_svm(manager, PROJECT_A) == "exists"
+        manager.create_svm.assert_not_called()
+
+    def test_missing_svm_is_created(self):
+        """Test a missing SVM is created on the selected aggregate."""
+        manager = Mock()
+        manager.check_if_svm_exists.return_value = False
+        manager.select_aggregate_name.return_value = "aggr_a"
+
+        assert ensure_svm(manager, PROJECT_A) == "created"
+        manager.create_svm.assert_called_once_with(PROJECT_A, "aggr_a")
+
+    def test_batch_spreads_new_svms_across_aggregates(self):
+        """Test SVMs created in one batch do not all land on one aggregate."""
+        client = Mock()
+        client.get_aggregates.return_value = [
+            AggregateResult(name="aggr_a", state="online", used_percent=10),
+            AggregateResult(name="aggr_b", state="online", used_percent=20),
+            AggregateResult(name="aggr_c", state="online", used_percent=30),
+        ]
+        svm_service = Mock()
+        svm_service.exists.return_value = False
+        manager = NetAppManager(netapp_client=client, svm_service=svm_service)
+        projects = [f"{n:032x}" for n in range(4)]
+
+        results = run_batch(manager, projects, [("svm", ensure_svm)], max_workers=4)
+
+        assert all(result.success for result in results)
+        placed = [call.args[1] for call in svm_service.create_svm.call_args_list]
+        assert sorted(placed) == ["aggr_a", "aggr_a", "aggr_b", "aggr_c"]
+        assert client.get_aggregates.call_count == 4
+
+
+class TestRunBatch:
+    """Test cases for run_batch."""
+
+    def test_results_in_input_order_without_duplicates(self):
+        """Test each project is processed once and reported in input order."""
+        step = Mock(side_effect=lambda _, project_id: f"done-{project_id}")
+
+        results = run_batch(Mock(), [PROJECT_B, PROJECT_A, PROJECT_B], [("step", step)])
+
+        assert [r.project_id for r in results] == [PROJECT_B, PROJECT_A]
+        assert results[0].steps == {"step": f"done-{PROJECT_B}"}
+        assert step.call_count == 2
+
+    def test_failure_is_isolated_per_project(self):
+        """Test a failing project stops its own steps but not other projects."""
+
+        def first(_, project_id):
+            if project_id == PROJECT_A:
+                raise SvmOperationError("SVM creation failed")
+            return "ok"
+
+        second = Mock(return_value="ok")
+
+        results = run_batch(
+            Mock(), [PROJECT_A, PROJECT_B], [("first", first), ("second", second)]
+        )
+
+        assert results[0].success is False
+        assert results[0].failed_step == "first"
+        assert results[0].error == "SVM creation failed"
+        assert results[0].steps == {}
+        assert results[1].success is True
+        assert results[1].steps == {"first": "ok", "second": "ok"}
+        second.assert_called_once_with(second.call_args.args[0], PROJECT_B)
+
+    def test_projects_run_concurrently_on_one_manager(self):
+        """Test projects overlap and share the same manager."""
+        manager = Mock()
+        barrier = threading.Barrier(2, timeout=5)
+        managers = []
+
+        def step(mgr, _):
+            managers.append(mgr)
+            barrier.wait()
+            return "ok"
+
+        results = run_batch(
+            manager, [PROJECT_A, PROJECT_B], [("step", step)], max_workers=2
+        )
+
+        assert all(r.success for r in results)
+        assert managers == [manager, manager]
+
+    def test_on_result_callback(self):
+        """Test results are reported as each project finishes."""
+        reported = []
+
+        run_batch(
+            Mock(),
+            [PROJECT_A],
+            [("step", Mock(return_value="ok"))],
+            on_result=reported.append,
+        )
+
+        assert [r.project_id for r in reported] == [PROJECT_A]
+
+    def test_empty_batch(self):
+        """Test an empty project list returns no results."""
+        assert run_batch(Mock(), [], []) == []
+
+
+class TestReadProjectsFile:
+    """Test cases for reading JSONL project files."""
+
+    def test_reads_strings_and_objects(self, tmp_path):
+        """Test both JSON strings and objects are accepted."""
+        path = tmp_path / "projects.jsonl"
+        path.write_text(
+            json.dumps("12345678-1234-5678-9abc-123456789012")
+            + "\n\n"
+            + json.dumps({"project_id": PROJECT_B, "name": "demo"})
+            + "\n"
+        )
+
+        assert read_projects_file(str(path)) == [
+            "12345678123456789abc123456789012",
+            PROJECT_B,
+        ]
+
+    def test_invalid_line_reports_location(self, tmp_path):
+        """Test an invalid entry raises with its line number."""
+        path = tmp_path / "projects.jsonl"
+        path.write_text(json.dumps(PROJECT_A) + "\n" + '{"name": "demo"}\n')
+
+        with pytest.raises(ValueError, match=r"projects\.jsonl:2"):
+            read_projects_file(str(path))
+
+
+class TestConfigureNetStep:
+    """Test cases for the configure-net batch step."""
+
+    @patch("understack_workflows.main.netapp_batch.netapp_create_interfaces_and_routes")
+    @patch("understack_workflows.main.netapp_batch.validate_and_transform_response")
+    @patch("understack_workflows.main.netapp_batch.execute_graphql_query")
+    def test_configures_first_vm(self, mock_query, mock_validate, mock_create):
+        """Test interfaces are created from the first VM in the response."""
+        manager = Mock()
+        vm_info = Mock()
+        mock_validate.return_value = [vm_info]
+        nautobot_client = Mock()
+
+        step = configure_net_step(nautobot_client)
+
+        assert step(manager, PROJECT_A) == "configured"
+        mock_query.assert_called_once_with(nautobot_client, PROJECT_A)
+        mock_create.assert_called_once_with(manager, vm_info, PROJECT_A)
+
+    @patch("understack_workflows.main.netapp_batch.netapp_create_interfaces_and_routes")
+    @patch("understack_workflows.main.netapp_batch.validate_and_transform_response")
+    @patch("understack_workflows.main.netapp_batch.execute_graphql_query")
+    def test_no_interfaces(self, mock_query, mock_validate, mock_create):
+        """Test projects without a VM in Nautobot are reported, not failed."""
+        mock_validate.return_value = []
+
+        assert configure_net_step(Mock())(Mock(), PROJECT_A) == "no-interfaces"
+        mock_create.assert_not_called()
+
+
+class TestMain:
+    """Test cases for the netapp-batch entry point."""
+
+    def test_argument_defaults(self):
+        """Test the default steps and parallelism."""
+        args = argument_parser().parse_args(["--project-id", PROJECT_A])
+
+        assert args.project_id == [PROJECT_A]
+        assert args.steps == ["create-svm", "configure-net"]
+        assert args.max_workers == 4
+
+    @patch("understack_workflows.main.netapp_batch.setup_logger")
+    def test_no_projects(self, mock_setup_logger):
+        """Test main fails when no projects are given."""
+        with patch("sys.argv", ["netapp-batch"]):
+            assert main() == 2
+
+    @patch("understack_workflows.main.netapp_batch.run_batch")
+    @patch("understack_workflows.main.netapp_batch.NetAppManager")
+    @patch("understack_workflows.main.netapp_batch.select_backend")
+    @patch("understack_workflows.main.netapp_batch.setup_logger")
+    def test_exit_code_reflects_failures(
+        self, mock_setup_logger, mock_select_backend, mock_manager, mock_run_batch
+    ):
+        """Test main returns 1 when any project failed and shares one manager."""
+        mock_run_batch.return_value = [Mock(success=True), Mock(success=False)]
+        argv = [
+            "netapp-batch",
+            "--project-id",
+            PROJECT_A,
+            "--project-id",
+            PROJECT_B,
+            "--steps",
+            "create-svm",
+        ]
+
+        with patch("sys.argv", argv):
+            assert main() == 1
+
+        mock_manager.assert_called_once()
+        manager, project_ids, steps = mock_run_batch.call_args.args
+        assert manager is mock_manager.return_value
+        assert project_ids == [PROJECT_A, PROJECT_B]
+        assert steps == [("create-svm", ensure_svm)]
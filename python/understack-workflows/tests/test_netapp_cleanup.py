@@ -0,0 +1,273 @@
+"""Tests for concurrent NetApp project cleanup."""
+
+import json
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from understack_workflows.main.netapp_cleanup_projects import main
+from understack_workflows.netapp.cleanup import CleanupEngine
+from understack_workflows.netapp.exceptions import VolumeOperationError
+from understack_workflows.netapp.svm_service import SvmService
+from understack_workflows.netapp.value_objects import JobResult
+from understack_workflows.netapp.value_objects import ProjectCleanupResult
+from understack_workflows.netapp.value_objects import SvmResult
+from understack_workflows.netapp.value_objects import VolumeResult
+from understack_workflows.netapp.volume_service import VolumeService
+
+PROJECT_A = "12345678123456789abc123456789012"
+PROJECT_B = "abcdefab123456789abc123456789012"
+
+
+class FakeJobs:
+    """Tracks deletion jobs, each finishing after a number of polls."""
+
+    def __init__(self, polls=1, failing=()):
+        self.polls = polls
+        self.failing = set(failing)
+        self.submitted = []
+        self.queries = []
+        self._remaining = {}
+
+    def submit(self, name):
+        job_uuid = f"job-{name}"
+        self.submitted.append(name)
+        self._remaining[job_uuid] = self.polls
+        return job_uuid
+
+    def get_jobs(self, job_uuids):
+        self.queries.append(sorted(job_uuids))
+        results = {}
+        for job_uuid in job_uuids:
+            self._remaining[job_uuid] -= 1
+            if self._remaining[job_uuid] > 0:
+                state = "running"
+            elif job_uuid in self.failing:
+                state = "failure"
+            else:
+                state = "success"
+            results[job_uuid] = JobResult(uuid=job_uuid, state=state, message=state)
+        return results
+
+
+class TestCleanupEngine:
+    """Test cases for CleanupEngine class."""
+
+    @pytest.fixture
+    def jobs(self):
+        """Create the fake ONTAP job tracker."""
+        return FakeJobs()
+
+    @pytest.fixture
+    def mock_client(self, jobs):
+        """Create a mock NetApp client where every volume and SVM exists."""
+        client = Mock()
+        client.find_volume.side_effect = lambda name, svm: VolumeResult(
+            name=name, uuid=f"{name}-uuid", size=1, state="online", svm_name=svm
+        )
+        client.find_svm.side_effect = lambda name: SvmResult(
+            name=name, uuid=f"{name}-uuid", state="online"
+        )
+        client.start_volume_deletion.side_effect = lambda name, force: jobs.submit(name)
+        client.start_svm_deletion.side_effect = jobs.submit
+        client.get_jobs.side_effect = jobs.get_jobs
+        return client
+
+    @pytest.fixture
+    def engine(self, mock_client):
+        """Create CleanupEngine instance with mocked dependencies."""
+        return CleanupEngine(
+            mock_client,
+            SvmService(mock_client),
+            VolumeService(mock_client),
+            poll_interval=0,
+        )
+
+    def test_volume_deleted_before_svm(self, engine, jobs):
+        """Test the SVM deletion is only submitted after the volume job."""
+        results = engine.run(["proj1"])
+
+        assert jobs.submitted == ["vol_proj1", "os-proj1"]
+        assert jobs.queries == [["job-vol_proj1"], ["job-os-proj1"]]
+        assert results[0].volume is True
+        assert results[0].svm is True
+        assert results[0].error is None
+
+    def test_jobs_of_all_projects_polled_together(self, engine, jobs):
+        """Test outstanding jobs of every project share one status query."""
+        results = engine.run(["proj1", "proj2", "proj3"])
+
+        assert all(r.error is None for r in results)
+        assert len(jobs.queries) == 2
+        assert len(jobs.queries[0]) == 3
+        assert [r.project_id for r in results] == ["proj1", "proj2", "proj3"]
+
+    def test_failed_volume_job_skips_svm(self, mock_client):
+        """Test the SVM is kept when its volume could not be deleted."""
+        jobs = FakeJobs(failing=["job-vol_proj1"])
+        mock_client.get_jobs.side_effect = jobs.get_jobs
+        mock_client.start_volume_deletion.side_effect = lambda n, force: jobs.submit(n)
+        mock_client.start_svm_deletion.side_effect = jobs.submit
+        engine = CleanupEngine(
+            mock_client,
+            SvmService(mock_client),
+            VolumeService(mock_client),
+            poll_interval=0,
+        )
+
+        result = engine.run(["proj1", "proj2"])
+
+        assert result[0].volume is False
+        assert result[0].svm is False
+        assert "volume deletion job job-vol_proj1 failed" in result[0].error
+        assert result[1].error is None
+        assert "os-proj1" not in jobs.submitted
+
+    def test_missing_volume_goes_straight_to_svm(self, engine, mock_client, jobs):
+        """Test projects without a volume only delete the SVM."""
+        mock_client.find_volume.side_effect = None
+        mock_client.find_volume.return_value = None
+
+        result = engine.run(["proj1"])
+
+        assert jobs.submitted == ["os-proj1"]
+        assert result[0].volume is True
+        assert result[0].svm is True
+
+    def test_nothing_to_delete(self, engine, mock_client):
+        """Test projects without volume or SVM finish without any job."""
+        mock_client.find_volume.side_effect = None
+        mock_client.find_volume.return_value = None
+        mock_client.find_svm.side_effect = None
+        mock_client.find_svm.return_value = None
+
+        result = engine.run(["proj1"])
+
+        assert result[0].volume is True
+        assert result[0].svm is True
+        mock_client.get_jobs.assert_not_called()
+
+    def test_synchronous_deletion(self, engine, mock_client):
+        """Test deletions that finish without a job need no polling."""
+        mock_client.start_volume_deletion.side_effect = None
+        mock_client.start_volume_deletion.return_value = None
+        mock_client.start_svm_deletion.side_effect = None
+        mock_client.start_svm_deletion.return_value = None
+
+        result = engine.run(["proj1"])
+
+        assert result[0].svm is True
+        mock_client.get_jobs.assert_not_called()
+
+    def test_rejected_deletion(self, engine, mock_client):
+        """Test a rejected deletion request is reported for that project."""
+        mock_client.start_volume_deletion.side_effect = VolumeOperationError(
+            "NetApp Volume deletion failed: busy"
+        )
+
+        result = engine.run(["proj1"])
+
+        assert result[0].volume is False
+        assert result[0].error == "NetApp Volume deletion failed: busy"
+
+    def test_timeout(self, mock_client):
+        """Test projects still waiting on jobs after the timeout are failed."""
+        jobs = FakeJobs(polls=1000)
+        mock_client.get_jobs.side_effect = jobs.get_jobs
+        mock_client.start_volume_deletion.side_effect = lambda n, force: jobs.submit(n)
+        engine = CleanupEngine(
+            mock_client,
+            SvmService(mock_client),
+            VolumeService(mock_client),
+            poll_interval=0,
+            timeout=0,
+        )
+
+        result = engine.run(["proj1"])
+
+        assert result[0].volume is False
+        assert "Timed out" in result[0].error
+
+    def test_missing_job_fails_without_waiting_for_timeout(self, mock_client):
+        """Test a job ONTAP does not know about fails its project at once."""
+        mock_client.get_jobs.side_effect = lambda job_uuids: {}
+        engine = CleanupEngine(
+            mock_client,
+            SvmService(mock_client),
+            VolumeService(mock_client),
+            poll_interval=0,
+            timeout=60,
+        )
+
+        result = engine.run(["proj1"])
+
+        assert result[0].error == "ONTAP job job-vol_proj1 not found"
+        assert mock_client.get_jobs.call_count == 1
+        mock_client.start_svm_deletion.assert_not_called()
+
+    def test_job_query_errors_are_retried(self, engine, mock_client, jobs):
+        """Test a failed job status query is retried on the next poll."""
+        calls = iter([Exception("timeout")])
+
+        def get_jobs(job_uuids):
+            error = next(calls, None)
+            if error is not None:
+                raise error
+            return jobs.get_jobs(job_uuids)
+
+        mock_client.get_jobs.side_effect = get_jobs
+
+        result = engine.run(["proj1"])
+
+        assert result[0].error is None
+        assert result[0].svm is True
+
+
+class TestMain:
+    """Test cases for the netapp-cleanup-projects entry point."""
+
+    @patch("understack_workflows.main.netapp_cleanup_projects.setup_logger")
+    def test_no_projects(self, mock_setup_logger):
+        """Test main fails when no projects are given."""
+        with patch("sys.argv", ["netapp-cleanup-projects"]):
+            assert main() == 2
+
+    @patch("understack_workflows.main.netapp_cleanup_projects.NetAppManager")
+    @patch("understack_workflows.main.netapp_cleanup_projects.select_backend")
+    @patch("understack_workflows.main.netapp_cleanup_projects.setup_logger")
+    def test_runs_engine_and_reports_failures(
+        self, mock_setup_logger, mock_select_backend, mock_manager, capsys
+    ):
+        """Test all projects go to one cleanup run and failures set the exit code."""
+        manager = mock_manager.return_value
+        manager.cleanup_projects.return_value = [
+            ProjectCleanupResult(
+                project_id=PROJECT_A, volume=True, svm=True, duration=1.0
+            ),
+            ProjectCleanupResult(
+                project_id=PROJECT_B,
+                volume=False,
+                svm=False,
+                error="volume deletion job failed",
+                duration=2.0,
+            ),
+        ]
+        argv = [
+            "netapp-cleanup-projects",
+            "--project-id",
+            PROJECT_A,
+            "--project-id",
+            PROJECT_B,
+            "--max-workers",
+            "8",
+        ]
+
+        with patch("sys.argv", argv):
+            assert main() == 1
+
+        manager.cleanup_projects.assert_called_once_with(
+            [PROJECT_A, PROJECT_B], max_workers=8, timeout=900.0
+        )
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [line["project_id"] for line in lines] == [PROJECT_A, PROJECT_B]
@@ -144,7 +144,9 @@ class TestNetAppClient:
         result = netapp_client.delete_svm("test-svm")
 
         assert result is True
-        mock_svm_instance.get.assert_called_once_with(name="test-svm")
+        mock_svm_instance.get.assert_called_once_with(
+            name="test-svm", fields="uuid,name"
+        )
         mock_svm_instance.delete.assert_called_once()
 
     @patch("understack_workflows.netapp.client.Svm")
@@ -173,6 +175,79 @@ class TestNetAppClient:
         assert result.name == "test-svm"
         assert result.uuid == "svm-uuid-123"
         assert result.state == "online"
+        mock_svm_class.find.assert_called_once_with(
+            name="test-svm", fields="uuid,name,state"
+        )
+
+    @patch("understack_workflows.netapp.client.Volume")
+    def test_start_volume_deletion_returns_job(self, mock_volume_class, netapp_client):
+        """Test volume deletion is submitted without polling the job."""
+        mock_volume = mock_volume_class.return_value
+        response = MagicMock()
+        response.http_response.json.return_value = {"job": {"uuid": "job-1"}}
+        mock_volume.delete.return_value = response
+
+        job_uuid = netapp_client.start_volume_deletion("vol_test", force=True)
+
+        assert job_uuid == "job-1"
+        mock_volume.get.assert_called_once_with(name="vol_test", fields="uuid,name")
+        mock_volume.delete.assert_called_once_with(
+            poll=False, allow_delete_while_mapped=True
+        )
+
+    @patch("understack_workflows.netapp.client.Svm")
+    def test_start_svm_deletion_synchronous(self, mock_svm_class, netapp_client):
+        """Test a deletion without a job link reports no job."""
+        mock_svm = mock_svm_class.return_value
+        mock_svm.delete.return_value.http_response.json.return_value = {}
+
+        assert netapp_client.start_svm_deletion("os-test") is None
+        mock_svm.delete.assert_called_once_with(poll=False)
+
+    @patch("understack_workflows.netapp.client.Svm")
+    def test_start_svm_deletion_failure(self, mock_svm_class, netapp_client):
+        """Test a rejected SVM deletion raises SvmOperationError."""
+        mock_svm_class.return_value.delete.side_effect = NetAppRestError("busy")
+
+        with pytest.raises(SvmOperationError):
+            netapp_client.start_svm_deletion("os-test")
+
+    @patch("understack_workflows.netapp.client.Job")
+    def test_get_jobs_single_query(self, mock_job_class, netapp_client):
+        """Test several jobs are looked up with one collection query."""
+        job1 = MagicMock(uuid="job-1", state="success", message="Complete")
+        job2 = MagicMock(uuid="job-2", state="running", message=None)
+        mock_job_class.get_collection.return_value = [job1, job2]
+
+        jobs = netapp_client.get_jobs(["job-1", "job-2"])
+
+        mock_job_class.get_collection.assert_called_once_with(
+            uuid="job-1|job-2", fields="uuid,state,message"
+        )
+        assert jobs["job-1"].succeeded
+        assert not jobs["job-2"].is_terminal
+
+    def test_get_jobs_empty(self, netapp_client):
+        """Test looking up no jobs does not hit the cluster."""
+        assert netapp_client.get_jobs([]) == {}
+
+    @patch("understack_workflows.netapp.client.Volume")
+    def test_find_volume_filters_on_server(self, mock_volume_class, netapp_client):
+        """Test volume lookup filters by SVM server-side and projects fields."""
+        mock_volume = MagicMock()
+        mock_volume.name = "vol_test"
+        mock_volume.uuid = "vol-uuid-123"
+        mock_volume.size = 1024
+        mock_volume.state = "online"
+        mock_volume_class.find.return_value = mock_volume
+
+        result = netapp_client.find_volume("vol_test", "os-test")
+
+        assert result is not None
+        assert result.uuid == "vol-uuid-123"
+        mock_volume_class.find.assert_called_once_with(
+            name="vol_test", fields="uuid,name,size,state", **{"svm.name": "os-test"}
+        )
 
     @patch("understack_workflows.netapp.client.Svm")
     def test_find_svm_not_found(self, mock_svm_class, netapp_client):
@@ -294,7 +369,9 @@ class TestNetAppClient:
         result = netapp_client.delete_volume("test-volume")
 
         assert result is True
-        mock_volume_instance.get.assert_called_once_with(name="test-volume")
+        mock_volume_instance.get.assert_called_once_with(
+            name="test-volume", fields="uuid,name,state"
+        )
         mock_volume_instance.delete.assert_called_once()
 
     @patch("understack_workflows.netapp.client.Volume")
@@ -307,7 +384,9 @@ class TestNetAppClient:
         result = netapp_client.delete_volume("test-volume")
 
         assert result is False
-        mock_volume_instance.get.assert_called_once_with(name="test-volume")
+        mock_volume_instance.get.assert_called_once_with(
+            name="test-volume", fields="uuid,name,state"
+        )
         mock_volume_instance.delete.assert_not_called()
 
     @patch("understack_workflows.netapp.client.Volume")
@@ -440,6 +519,36 @@ class TestNetAppClient:
         assert exc_info.value.context["node_name"] == "node-01"
         assert exc_info.value.context["port_name"] == "e4a"
 
+    @patch("understack_workflows.netapp.client.Port")
+    def test_get_physical_ports_success(self, mock_port_class, netapp_client):
+        """Test physical port retrieval with broadcast domains."""
+        port1 = MagicMock()
+        port1.name = "e4a"
+        port1.node.name = "node-01"
+        port1.broadcast_domain.name = "Fabric-A"
+        port2 = MagicMock(spec=["name", "node"])
+        port2.name = "e0M"
+        port2.node.name = "node-01"
+        mock_port_class.get_collection.return_value = [port1, port2]
+
+        result = netapp_client.get_physical_ports()
+
+        mock_port_class.get_collection.assert_called_once_with(
+            type="physical", fields="name,node.name,broadcast_domain.name"
+        )
+        assert result[0].name == "e4a"
+        assert result[0].node_name == "node-01"
+        assert result[0].broadcast_domain_name == "Fabric-A"
+        assert result[1].broadcast_domain_name is None
+
+    @patch("understack_workflows.netapp.client.Port")
+    def test_get_physical_ports_failure(self, mock_port_class, netapp_client):
+        """Test physical port retrieval failure."""
+        mock_port_class.get_collection.side_effect = NetAppRestError("boom")
+
+        with pytest.raises(NetworkOperationError):
+            netapp_client.get_physical_ports()
+
     @patch("understack_workflows.netapp.client.Node")
     def test_get_nodes_success(self, mock_node_class, netapp_client):
         """Test successful node retrieval."""
@@ -453,6 +562,7 @@ class TestNetAppClient:
 
         result = netapp_client.get_nodes()
 
+        mock_node_class.get_collection.assert_called_once_with(fields="name,uuid")
         assert len(result) == 2
         assert all(isinstance(node, NodeResult) for node in result)
         assert result[0].name == "node-01"
@@ -495,6 +605,40 @@ class TestNetAppClient:
 
         assert len(result) == 2
         assert all(isinstance(ns, NamespaceResult) for ns in result)
+        mock_namespace_class.get_collection.assert_called_once_with(
+            fields="uuid,name,status.mapped",
+            max_records=500,
+            **{"svm.name": "test-svm", "location.volume.name": "test-volume"},
+        )
+
+    @patch("understack_workflows.netapp.client.config")
+    @patch("understack_workflows.netapp.client.NvmeNamespace")
+    def test_iter_namespaces_is_lazy(
+        self, mock_namespace_class, mock_config_module, netapp_client
+    ):
+        """Test namespaces are streamed as the collection is consumed."""
+        mock_config_module.CONNECTION = MagicMock()
+        consumed = []
+
+        def collection():
+            for i in range(3):
+                ns = MagicMock()
+                ns.uuid = f"ns-uuid-{i}"
+                ns.name = f"namespace-{i}"
+                ns.status.mapped = False
+                consumed.append(i)
+                yield ns
+
+        mock_namespace_class.get_collection.return_value = collection()
+        namespace_spec = NamespaceSpec(svm_name="test-svm", volume_name="test-volume")
+
+        namespaces = netapp_client.iter_namespaces(namespace_spec, page_size=2)
+        first = next(namespaces)
+
+        assert first.uuid == "ns-uuid-0"
+        assert consumed == [0]
+        assert [ns.name for ns in namespaces] == ["namespace-1", "namespace-2"]
+        assert mock_namespace_class.get_collection.call_args.kwargs["max_records"] == 2
 
     @patch("understack_workflows.netapp.client.config")
     def test_get_namespaces_no_connection(self, mock_config_module, netapp_client):
@@ -598,6 +742,9 @@ class TestNetAppClientInterface:
             "create_svm",
             "delete_svm",
             "find_svm",
+            "start_svm_deletion",
+            "start_volume_deletion",
+            "get_jobs",
             "create_volume",
             "delete_volume",
             "find_volume",
@@ -606,6 +753,8 @@ class TestNetAppClientInterface:
             "get_broadcast_domain_name",
             "get_aggregates",
             "get_nodes",
+            "get_physical_ports",
+            "iter_namespaces",
             "get_namespaces",
             "create_route",
         }
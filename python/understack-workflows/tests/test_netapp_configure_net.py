@@ -1489,10 +1489,10 @@ class TestNetappCreateInterfaces:
             # Verify create_lif was called for each interface
             assert mock_netapp_manager.create_lif.call_count == 4
 
-            # Verify each call had correct parameters
-            for i, call in enumerate(mock_netapp_manager.create_lif.call_args_list):
-                assert call.args[0] == project_id
-                assert call.args[1] == mock_configs[i]
+            # Verify each call had correct parameters (LIFs are created
+            # concurrently, so the call order is not fixed)
+            for config in mock_configs:
+                mock_netapp_manager.create_lif.assert_any_call(project_id, config)
 
             # Verify create_routes_for_project was called with correct parameters
             mock_netapp_manager.create_routes_for_project.assert_called_once_with(
@@ -1644,11 +1644,10 @@ class TestNetappCreateInterfaces:
             # Verify create_lif was called for each interface
             assert mock_netapp_manager.create_lif.call_count == 4
 
-            # Verify each call had correct parameters
-            for i, _expected_name in enumerate(expected_names):
-                call_args = mock_netapp_manager.create_lif.call_args_list[i]
-                assert call_args.args[0] == project_id
-                assert call_args.args[1] == mock_configs[i]
+            # Verify each call had correct parameters (LIFs are created
+            # concurrently, so the call order is not fixed)
+            for config in mock_configs:
+                mock_netapp_manager.create_lif.assert_any_call(project_id, config)
 
             # Verify create_routes_for_project was called with correct parameters
             mock_netapp_manager.create_routes_for_project.assert_called_once_with(
@@ -1685,6 +1684,52 @@ class TestNetappCreateInterfaces:
                 project_id, [mock_config]
             )
 
+    def test_netapp_create_interfaces_creates_routes_after_all_lifs(self):
+        """Test routes wait for every LIF and LIFs sharing a port are serialized."""
+        events = []
+        mock_netapp_manager = Mock()
+        mock_netapp_manager.config.netapp_nic_slot_prefix = "e4"
+        mock_netapp_manager.create_lif.side_effect = lambda _, config: events.append(
+            config.name
+        )
+        mock_netapp_manager.create_routes_for_project.side_effect = lambda *_: (
+            events.append("routes")
+        )
+
+        interfaces = [
+            InterfaceInfo(name="N1-lif-A", address="100.127.0.21/29", vlan=2002),
+            InterfaceInfo(name="N1-lif-B", address="100.127.128.21/29", vlan=2002),
+            InterfaceInfo(name="N2-lif-A", address="100.127.0.22/29", vlan=2002),
+            InterfaceInfo(name="N2-lif-B", address="100.127.128.22/29", vlan=2002),
+        ]
+        vm_network_info = VirtualMachineNetworkInfo(interfaces=interfaces)
+
+        netapp_create_interfaces_and_routes(
+            mock_netapp_manager, vm_network_info, "test-project-plan", max_workers=4
+        )
+
+        assert sorted(events[:4]) == ["N1-lif-A", "N1-lif-B", "N2-lif-A", "N2-lif-B"]
+        assert events[4:] == ["routes"]
+
+    def test_netapp_create_interfaces_skips_routes_on_lif_failure(self):
+        """Test routes are not created when a LIF fails."""
+        mock_netapp_manager = Mock()
+        mock_netapp_manager.create_lif.side_effect = Exception("LIF failed")
+        interface = InterfaceInfo(name="N1-lif-A", address="100.127.0.21/29", vlan=2002)
+        vm_network_info = VirtualMachineNetworkInfo(interfaces=[interface])
+
+        with patch(
+            "understack_workflows.main.netapp_configure_net.NetappIPInterfaceConfig"
+        ) as mock_config_class:
+            mock_config_class.from_nautobot_response.return_value = [Mock()]
+
+            with pytest.raises(Exception, match="LIF failed"):
+                netapp_create_interfaces_and_routes(
+                    mock_netapp_manager, vm_network_info, "test-project-error"
+                )
+
+        mock_netapp_manager.create_routes_for_project.assert_not_called()
+
 
 class TestArgumentParserNetappConfigPath:
     """Test cases for the --netapp-config-path argument."""
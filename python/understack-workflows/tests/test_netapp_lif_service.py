@@ -184,6 +184,30 @@ class TestLifService:
         assert result == mock_nodes[0]  # node-01
         mock_client.get_nodes.assert_called_once()
 
+    def test_topology_lookups_bypass_client(self, mock_client, sample_config):
+        """Test node and broadcast domain lookups use the shared topology."""
+        topology = Mock()
+        topology.get_nodes.return_value = [
+            NodeResult(name="node-01", uuid="node-uuid-1"),
+        ]
+        topology.get_broadcast_domain_name.return_value = DYNAMIC_BROADCAST_DOMAIN
+        mock_client.find_svm.return_value = SvmResult(
+            name="os-test-project-123", uuid="svm-uuid-123", state="online"
+        )
+        mock_client.get_or_create_port.return_value = PortResult(
+            uuid="port-uuid-123", name="e4a-100", node_name="node-01", port_type="vlan"
+        )
+        lif_service = LifService(mock_client, topology)
+
+        lif_service.create_lif("test-project-123", sample_config)
+
+        topology.get_nodes.assert_called_once_with()
+        topology.get_broadcast_domain_name.assert_called_once_with(
+            "node-01", sample_config.base_port_name
+        )
+        mock_client.get_nodes.assert_not_called()
+        mock_client.get_broadcast_domain_name.assert_not_called()
+
     def test_identify_home_node_n2_interface(self, lif_service, mock_client):
         """Test node identification for N2 interface."""
         config = NetappIPInterfaceConfig(
@@ -100,7 +100,7 @@ netapp_password = test-password
     def test_get_aggregates_delegates_to_client(
         self, mock_host_connection, mock_config, mock_config_file
     ):
-        """Test get_aggregates delegates to NetAppClient."""
+        """Test get_aggregates delegates to NetAppClient, uncached."""
         manager = NetAppManager(netapp_config=mock_config_file)
         aggregates = [
             AggregateResult(name="aggr_b", state="online", used_percent=40),
@@ -150,6 +150,25 @@ netapp_password = test-password
 
         assert result == "aggr_a"
 
+    @patch("understack_workflows.netapp.manager.config")
+    @patch("understack_workflows.netapp.manager.HostConnection")
+    def test_select_aggregate_name_spreads_repeated_selections(
+        self, mock_host_connection, mock_config, mock_config_file
+    ):
+        """Test repeated selections rotate through aggregates by usage."""
+        manager = NetAppManager(netapp_config=mock_config_file)
+        manager._client.get_aggregates = MagicMock(
+            return_value=[
+                AggregateResult(name="aggr_b", state="online", used_percent=40),
+                AggregateResult(name="aggr_a", state="online", used_percent=20),
+            ]
+        )
+
+        result = [manager.select_aggregate_name() for _ in range(3)]
+
+        assert result == ["aggr_a", "aggr_b", "aggr_a"]
+        assert manager._client.get_aggregates.call_count == 3
+
     @patch("understack_workflows.netapp.manager.config")
     @patch("understack_workflows.netapp.manager.HostConnection")
     def test_select_aggregate_name_raises_when_none_available(
@@ -401,7 +420,7 @@ netapp_password = test-password
         manager._lif_service.identify_home_node = MagicMock(
             return_value=NodeResult(name="node-01", uuid="node-uuid-1")
         )
-        manager._client.get_broadcast_domain_name = MagicMock(
+        manager._topology.get_broadcast_domain_name = MagicMock(
             return_value="test-domain"
         )
 
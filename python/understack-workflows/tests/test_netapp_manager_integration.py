@@ -454,7 +454,7 @@ netapp_password = test-password
             manager._lif_service.identify_home_node = MagicMock(
                 return_value=NodeResult(name="node-03", uuid="node-uuid-3")
             )
-            manager._client.get_broadcast_domain_name = MagicMock(
+            manager._topology.get_broadcast_domain_name = MagicMock(
                 return_value="test-domain"
             )
             manager.create_lif("project", config_obj)
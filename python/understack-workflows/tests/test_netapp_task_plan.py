@@ -0,0 +1,99 @@
+"""Tests for NetApp task plan execution."""
+
+import threading
+
+import pytest
+
+from understack_workflows.netapp.task_plan import TaskPlan
+
+
+class TestTaskPlan:
+    """Test cases for TaskPlan class."""
+
+    def test_empty_plan(self):
+        """Test running a plan without tasks."""
+        assert TaskPlan().run() == {}
+
+    def test_results_keyed_by_name(self):
+        """Test task results are returned by task name."""
+        plan = TaskPlan()
+        plan.add("double", lambda x: x * 2, 21)
+        plan.add("greet", "hello {name}".format, name="netapp")
+
+        assert plan.run() == {"double": 42, "greet": "hello netapp"}
+
+    def test_dependencies_run_first(self):
+        """Test a task only starts once its dependencies have finished."""
+        order = []
+        plan = TaskPlan(max_workers=4)
+        plan.add("port", order.append, "port")
+        plan.add("lif", order.append, "lif", depends_on=["port"])
+        plan.add("route", order.append, "route", depends_on=["lif"])
+
+        plan.run()
+
+        assert order == ["port", "lif", "route"]
+
+    def test_independent_tasks_run_concurrently(self):
+        """Test tasks without dependencies between them overlap."""
+        barrier = threading.Barrier(3, timeout=5)
+        plan = TaskPlan(max_workers=3)
+        for name in ("a", "b", "c"):
+            plan.add(name, barrier.wait)
+
+        # Would raise BrokenBarrierError if the tasks ran one at a time
+        assert len(plan.run()) == 3
+
+    def test_parallelism_is_bounded(self):
+        """Test no more than max_workers tasks run at the same time."""
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def task():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            threading.Event().wait(0.01)
+            with lock:
+                active.pop()
+
+        plan = TaskPlan(max_workers=2)
+        for i in range(6):
+            plan.add(str(i), task)
+        plan.run()
+
+        assert max(peak) <= 2
+
+    def test_failure_skips_dependents_and_reraises(self):
+        """Test the first failure is raised and dependent tasks never start."""
+        calls = []
+
+        def fail():
+            raise RuntimeError("port failed")
+
+        plan = TaskPlan()
+        plan.add("port", fail)
+        plan.add("lif", calls.append, "lif", depends_on=["port"])
+
+        with pytest.raises(RuntimeError, match="port failed"):
+            plan.run()
+        assert calls == []
+
+    def test_duplicate_task_name(self):
+        """Test adding two tasks with the same name is rejected."""
+        plan = TaskPlan()
+        plan.add("a", print)
+
+        with pytest.raises(ValueError, match="already part of the plan"):
+            plan.add("a", print)
+
+    def test_unknown_dependency(self):
+        """Test depending on a task that was not added is rejected."""
+        with pytest.raises(ValueError, match="unknown tasks"):
+            TaskPlan().add("a", print, depends_on=["missing"])
+
+    def test_invalid_max_workers(self):
+        """Test max_workers must be positive."""
+        with pytest.raises(ValueError, match="at least 1"):
+            TaskPlan(max_workers=0)
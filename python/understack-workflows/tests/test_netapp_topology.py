@@ -0,0 +1,137 @@
+"""Tests for the NetApp cluster topology cache."""
+
+import json
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from understack_workflows.netapp.exceptions import NetworkOperationError
+from understack_workflows.netapp.topology import ClusterTopology
+from understack_workflows.netapp.value_objects import NodeResult
+from understack_workflows.netapp.value_objects import PhysicalPortResult
+
+
+class TestClusterTopology:
+    """Test cases for ClusterTopology class."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock NetApp client reporting a two node cluster."""
+        client = Mock()
+        client.get_nodes.return_value = [
+            NodeResult(name="node-01", uuid="node-uuid-1"),
+            NodeResult(name="node-02", uuid="node-uuid-2"),
+        ]
+        client.get_physical_ports.return_value = [
+            PhysicalPortResult(
+                name="e4a", node_name="node-01", broadcast_domain_name="Fabric-A"
+            ),
+            PhysicalPortResult(
+                name="e4b", node_name="node-01", broadcast_domain_name="Fabric-B"
+            ),
+            PhysicalPortResult(name="e0M", node_name="node-01"),
+        ]
+        return client
+
+    @pytest.fixture
+    def topology(self, mock_client):
+        """Create ClusterTopology instance with mocked dependencies."""
+        return ClusterTopology(mock_client)
+
+    def test_lookups_share_one_fetch(self, topology, mock_client):
+        """Test nodes and ports are fetched once for all lookups."""
+        for _ in range(4):
+            assert len(topology.get_nodes()) == 2
+            assert topology.get_broadcast_domain_name("node-01", "e4a") == "Fabric-A"
+            assert topology.get_broadcast_domain_name("node-01", "e4b") == "Fabric-B"
+
+        mock_client.get_nodes.assert_called_once_with()
+        mock_client.get_physical_ports.assert_called_once_with()
+        mock_client.get_aggregates.assert_not_called()
+        mock_client.get_broadcast_domain_name.assert_not_called()
+
+    def test_unknown_port_falls_back_to_client(self, topology, mock_client):
+        """Test ports missing from the snapshot are looked up on the cluster."""
+        mock_client.get_broadcast_domain_name.return_value = "Fabric-C"
+
+        assert topology.get_broadcast_domain_name("node-02", "e4a") == "Fabric-C"
+        mock_client.get_broadcast_domain_name.assert_called_once_with("node-02", "e4a")
+
+    def test_unknown_port_error_propagates(self, topology, mock_client):
+        """Test lookup errors from the client fallback are not swallowed."""
+        mock_client.get_broadcast_domain_name.side_effect = NetworkOperationError(
+            "No broadcast domain found for the requested port"
+        )
+
+        with pytest.raises(NetworkOperationError):
+            topology.get_broadcast_domain_name("node-01", "e0M")
+
+    def test_snapshot_expires_after_ttl(self, mock_client):
+        """Test the snapshot is fetched again once the TTL has elapsed."""
+        topology = ClusterTopology(mock_client, ttl=60)
+
+        with patch("understack_workflows.netapp.topology.time.time") as mock_time:
+            mock_time.return_value = 1000.0
+            topology.get_nodes()
+            mock_time.return_value = 1059.0
+            topology.get_nodes()
+            assert mock_client.get_nodes.call_count == 1
+
+            mock_time.return_value = 1061.0
+            topology.get_nodes()
+            assert mock_client.get_nodes.call_count == 2
+
+    def test_invalidate_forces_refetch(self, topology, mock_client):
+        """Test invalidate drops the cached snapshot."""
+        topology.get_nodes()
+        topology.invalidate()
+        topology.get_nodes()
+
+        assert mock_client.get_nodes.call_count == 2
+
+    def test_snapshot_is_persisted_and_reused(self, mock_client, tmp_path):
+        """Test a persisted snapshot is reused by a new topology instance."""
+        cache_path = str(tmp_path / "topology.json")
+
+        ClusterTopology(mock_client, cache_path=cache_path).get_nodes()
+        other_client = Mock()
+        topology = ClusterTopology(other_client, cache_path=cache_path)
+
+        assert [node.name for node in topology.get_nodes()] == ["node-01", "node-02"]
+        assert topology.get_broadcast_domain_name("node-01", "e4b") == "Fabric-B"
+        other_client.get_nodes.assert_not_called()
+        other_client.get_physical_ports.assert_not_called()
+
+    def test_expired_persisted_snapshot_is_ignored(self, mock_client, tmp_path):
+        """Test a persisted snapshot older than the TTL is refetched."""
+        cache_path = tmp_path / "topology.json"
+        ClusterTopology(mock_client, cache_path=str(cache_path)).get_nodes()
+        data = json.loads(cache_path.read_text())
+        data["fetched_at"] -= 3600
+        cache_path.write_text(json.dumps(data))
+
+        ClusterTopology(mock_client, ttl=60, cache_path=str(cache_path)).get_nodes()
+
+        assert mock_client.get_nodes.call_count == 2
+
+    def test_corrupt_persisted_snapshot_is_ignored(self, mock_client, tmp_path):
+        """Test an unreadable cache file does not break topology loading."""
+        cache_path = tmp_path / "topology.json"
+        cache_path.write_text("{not json")
+
+        topology = ClusterTopology(mock_client, cache_path=str(cache_path))
+
+        assert len(topology.get_nodes()) == 2
+        assert json.loads(cache_path.read_text())["nodes"][0]["name"] == "node-01"
+
+    def test_invalidate_removes_persisted_snapshot(self, topology, tmp_path):
+        """Test invalidate removes the persisted snapshot."""
+        cache_path = tmp_path / "topology.json"
+        topology = ClusterTopology(topology._client, cache_path=str(cache_path))
+        topology.get_nodes()
+        assert cache_path.exists()
+
+        topology.invalidate()
+
+        assert not cache_path.exists()
@@ -3,12 +3,17 @@
 import copy
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
+from urllib.parse import urlsplit
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 from sushy import Sushy
+from urllib3.util.retry import Retry
 
 from understack_workflows.bmc_password_standard import standard_password
 from understack_workflows.helpers import credential
@@ -23,6 +28,36 @@ HEADERS = {
     "Content-Type": "application/json; charset=utf-8",
 }
 
+# BMCs are slow to complete TLS handshakes and occasionally drop connections
+# or return 5xx while busy.  Connections are kept alive and reused, and
+# failed connects, dropped reads and 5xx responses are retried with backoff.
+# Retry only repeats reads and status codes for idempotent methods, so a
+# PATCH or POST is never sent twice once the BMC may have acted on it.
+POOL_MAXSIZE = 4
+RETRY = Retry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=(500, 502, 503, 504),
+    raise_on_status=False,
+)
+
+# Redfish GETs in flight at once against one BMC, when crawling resources.
+# iDRACs in particular serve few requests in parallel and slow down, or
+# start failing, when pushed harder.
+MAX_CONCURRENT_REQUESTS = POOL_MAXSIZE
+
+# Resources with an ETag kept between read_cache() blocks for revalidation.
+MAX_CACHED_RESOURCES = 256
+
+
+@dataclass
+class CachedResource:
+    """A Redfish GET response kept by Bmc, with the ETag it was served with."""
+
+    data: dict
+    etag: str | None
+    generation: int
+
 
 class RedfishRequestError(Exception):
     """Handle Exceptions from Redfish handler."""
@@ -46,12 +81,24 @@ class Bmc:
         self._base_path: str | None = None
         self._system_path: str | None = None
         self._manager_path: str | None = None
+        self._http: requests.Session | None = None
+        # Redfish session in use by redfish_request, while session() is active
+        self._token: str | None = None
+        self._session_path: str | None = None
+        self._session_password: str | None = None
+        self._session_lock = threading.Lock()
+        self._expand_query: str | None = None
+        self._expand_checked = False
+        self._cache: dict[str, CachedResource] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_depth = 0
+        self._cache_generation = 0
 
     @property
     def base_path(self) -> str:
-        """Read System path from BMC."""
-        self._system_path = self._base_path or self.get_base_path()
-        return self._system_path
+        """Read Base path from BMC."""
+        self._base_path = self._base_path or self.get_base_path()
+        return self._base_path
 
     @property
     def system_path(self) -> str:
@@ -88,6 +135,55 @@ class Bmc:
         _result = self.redfish_request("/redfish/v1/Managers/")
         return _result["Members"][0]["@odata.id"].rstrip("/")
 
+    def expand_query(self) -> str | None:
+        """The $expand value that inlines a collection's members, if supported.
+
+        Read once from ProtocolFeaturesSupported in the service root.
+        """
+        if not self._expand_checked:
+            root = self.redfish_request(self.base_path)
+            features = root.get("ProtocolFeaturesSupported", {})
+            expand = features.get("ExpandQuery", {})
+            if expand.get("NoLinks"):
+                self._expand_query = "."
+            elif expand.get("ExpandAll"):
+                self._expand_query = "*"
+            if self._expand_query and expand.get("Levels"):
+                self._expand_query += "($levels=1)"
+            self._expand_checked = True
+        return self._expand_query
+
+    def collection_members(self, path: str) -> list[dict]:
+        """Members of a Redfish collection, inlined with $expand if possible.
+
+        Members the BMC did not expand are left as {"@odata.id": ...} links,
+        to be fetched with resolve_members.
+        """
+        expand = self.expand_query()
+        if expand:
+            return self.redfish_request(f"{path}?$expand={expand}")["Members"]
+        return self.redfish_request(path)["Members"]
+
+    def resolve_members(self, members: list[dict]) -> list[dict]:
+        """Replace bare {"@odata.id": ...} links with the resources they name.
+
+        The links are fetched concurrently, MAX_CONCURRENT_REQUESTS at a time;
+        members that are already expanded are returned as they are.
+        """
+        links = [m["@odata.id"] for m in members if m.keys() == {"@odata.id"}]
+        fetched = dict(zip(links, self.redfish_request_many(links), strict=True))
+        return [
+            fetched[m["@odata.id"]] if m.keys() == {"@odata.id"} else m for m in members
+        ]
+
+    def redfish_request_many(self, paths: list[str]) -> list[dict]:
+        """GET each path, concurrently, returning responses in the same order."""
+        if len(paths) < 2:
+            return [self.redfish_request(path) for path in paths]
+        workers = min(MAX_CONCURRENT_REQUESTS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.redfish_request, paths))
+
     def get_manufacturer(self) -> str:
         """Read and return Manufacturer."""
         return self.redfish_request(self.system_path)["Manufacturer"].lower()
@@ -133,18 +229,73 @@ class Bmc:
 
     @contextmanager
     def session(self, password):
-        """Yields a token for use with later requests, logs out afterwards."""
+        """Yields a token for use with later requests, logs out afterwards.
+
+        While the session is open, redfish_request uses its token whenever
+        no other token is given, instead of sending basic auth each time.
+        Should the BMC expire the session, it logs in again.
+        """
+        previous = self._token, self._session_path, self._session_password
         token, session = self.get_session(password)
+        self._token, self._session_path = token, session
+        self._session_password = password
         try:
             yield token
         finally:
+            token, session = self._token, self._session_path
+            self._token, self._session_path, self._session_password = previous
             if session:
-                self.close_session(session=session, token=token)
+                try:
+                    self.close_session(session=session, token=token)
+                except (RedfishRequestError, requests.RequestException) as e:
+                    logger.warning("%s failed to log out of session: %s", self, e)
 
     def close_session(self, session: str, token: str | None = None) -> None:
         """Close BMC token session."""
         self.redfish_request(method="DELETE", path=session, token=token)
 
+    @contextmanager
+    def read_cache(self):
+        """Serve repeated GETs of a resource from memory until the block exits.
+
+        Use around one step of a workflow, so that each Redfish resource is
+        fetched at most once however many helpers read it.  PATCH, POST and
+        DELETE requests drop cached copies of the path they were sent to,
+        and of its parent, such as the resource a Settings object applies
+        to or the collection a member was added to.  In later blocks, a
+        cached resource with an ETag is revalidated with If-None-Match
+        rather than downloaded again.  GETs outside a block are not cached.
+        """
+        with self._cache_lock:
+            if self._cache_depth == 0:
+                self._cache_generation += 1
+            self._cache_depth += 1
+        try:
+            yield self
+        finally:
+            with self._cache_lock:
+                self._cache_depth -= 1
+                if self._cache_depth == 0:
+                    # Entries without an ETag can't be revalidated later, and
+                    # only the most recently read are worth keeping.
+                    kept = [(k, v) for k, v in self._cache.items() if v.etag]
+                    self._cache = dict(kept[-MAX_CACHED_RESOURCES:])
+
+    def close(self) -> None:
+        """Close pooled connections to the BMC."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def http(self) -> requests.Session:
+        """Return the pooled HTTP session used for all requests to the BMC."""
+        if self._http is None:
+            adapter = HTTPAdapter(max_retries=RETRY, pool_maxsize=POOL_MAXSIZE)
+            self._http = requests.Session()
+            self._http.mount("https://", adapter)
+            self._http.mount("http://", adapter)
+        return self._http
+
     def session_request(
         self,
         path: str,
@@ -156,7 +307,7 @@ class Bmc:
         """Request a session via Redfish against the Bmc."""
         _headers = copy.copy(HEADERS)
         url = f"{self.url()}{path}"
-        r = requests.request(
+        r = self.http().request(
             method,
             url,
             verify=verify,
@@ -206,11 +357,116 @@ class Bmc:
         timeout: int = 30,
     ) -> dict:
         """Request a path via Redfish against the Bmc."""
+        cached = None
+        if method != "GET":
+            self._invalidate(path)
+        elif self._cache_depth:
+            cached = self._cache.get(path)
+            if cached and cached.generation == self._cache_generation:
+                return copy.deepcopy(cached.data)
+
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag else {}
+        r = self._send_in_session(
+            method, path, token, payload, verify, timeout, headers
+        )
+        if r.status_code == 304 and cached:
+            data = cached.data
+        else:
+            self._raise_for_status(r)
+            data = r.json() if r.text else {}
+
+        if method == "GET" and self._cache_depth:
+            with self._cache_lock:
+                self._cache[path] = CachedResource(
+                    data=data,
+                    etag=r.headers.get("ETag") or (cached.etag if cached else None),
+                    generation=self._cache_generation,
+                )
+            return copy.deepcopy(data)
+        return data
+
+    def redfish_request_location(
+        self,
+        path: str,
+        method: str = "POST",
+        payload: dict | None = None,
+        verify: bool = False,
+        timeout: int = 30,
+    ) -> str | None:
+        """Send a request that makes the BMC create something, such as a job.
+
+        Returns the path of what was created, from the Location header of
+        the response, or None if the BMC did not say.
+        """
+        self._invalidate(path)
+        r = self._send_in_session(method, path, None, payload, verify, timeout)
+        self._raise_for_status(r)
+        location = r.headers.get("Location")
+        return urlsplit(location).path if location else None
+
+    def _send_in_session(
+        self,
+        method: str,
+        path: str,
+        token: str | None,
+        payload: dict | None,
+        verify: bool,
+        timeout: int,
+        headers: dict | None = None,
+    ) -> requests.Response:
+        # Use the open session unless given a token, logging in again if
+        # the BMC has expired it.
+        session_token = self._token if token is None else None
+        url = f"{self.url()}{path}"
+        r = self._send(
+            method, url, token or session_token, payload, verify, timeout, headers
+        )
+        if r.status_code == 401 and session_token:
+            self._renew_session(expired_token=session_token)
+            r = self._send(method, url, self._token, payload, verify, timeout, headers)
+        return r
+
+    def _raise_for_status(self, r: requests.Response) -> None:
+        if r.status_code >= 400:
+            raise RedfishRequestError(
+                f"BMC communications failure HTTP {r.status_code} "
+                + f"{r.reason} from {r.url} - {r.text}"
+            )
+
+    def _invalidate(self, path: str) -> None:
+        """Drop cached copies of path and its parent, including any queries."""
+        target = path.split("?")[0].rstrip("/")
+        targets = {target, target.rsplit("/", 1)[0]}
+        with self._cache_lock:
+            for key in list(self._cache):
+                if key.split("?")[0].rstrip("/") in targets:
+                    del self._cache[key]
+
+    def _renew_session(self, expired_token: str) -> None:
+        # Concurrent requests may all find the session expired; log in once.
+        with self._session_lock:
+            if self._token != expired_token:
+                return
+            logger.info("%s Redfish session has expired, logging in again", self)
+            self._token, self._session_path = self.get_session(
+                str(self._session_password)
+            )
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        token: str | None,
+        payload: dict | None,
+        verify: bool,
+        timeout: int,
+        headers: dict | None = None,
+    ) -> requests.Response:
         _headers = copy.copy(HEADERS)
+        _headers.update(headers or {})
         if token:
             _headers.update({"X-Auth-Token": token})
-        url = f"{self.url()}{path}"
-        r = requests.request(
+        return self.http().request(
             method,
             url,
             auth=None if token else (self.username, self.password),
@@ -219,15 +475,6 @@ class Bmc:
             json=payload,
             headers=_headers,
         )
-        if r.status_code >= 400:
-            raise RedfishRequestError(
-                f"BMC communications failure HTTP {r.status_code} "
-                + f"{r.reason} from {url} - {r.text}"
-            )
-        if r.text:
-            return r.json()
-        else:
-            return {}
 
     def sushy(self):
         """Return a Sushy interface to BMC."""
@@ -2,9 +2,14 @@ import logging
 
 from understack_workflows.bmc import Bmc
 from understack_workflows.bmc import RedfishRequestError
+from understack_workflows.bmc_jobs import DellJob
+from understack_workflows.bmc_jobs import delete_job
+from understack_workflows.bmc_jobs import pending_jobs
 
 logger = logging.getLogger(__name__)
 
+BIOS_JOB_TYPE = "BIOSConfiguration"
+
 
 def required_bios_settings(pxe_interface: str | None) -> dict[str, str]:
     """Return Bios settings map for BMC."""
@@ -82,12 +87,15 @@ def required_change_for_bios_setting(
     return required_value
 
 
-def update_dell_bios_settings(bmc: Bmc, pxe_interface: str | None) -> dict:
+def update_dell_bios_settings(bmc: Bmc, pxe_interface: str | None) -> DellJob | None:
     """Check and update BIOS settings to standard as required.
 
-    Any changes take effect on next server reboot.
+    Reads the current and pending BIOS attributes once and PATCHes only
+    those that differ.  Any changes take effect on next server reboot,
+    when the configuration job created for them runs.
 
-    Returns the changes that were made
+    Returns that job, to be followed with bmc_jobs.wait_for_jobs, or None
+    if no changes were needed.
     """
     current_settings = bmc.redfish_request(bmc.system_path + "/Bios")["Attributes"]
     pending_settings = bmc.redfish_request(bmc.system_path + "/Bios/Settings").get(
@@ -108,26 +116,62 @@ def update_dell_bios_settings(bmc: Bmc, pxe_interface: str | None) -> dict:
             continue
         required_changes[key] = required_change
 
-    if required_changes:
-        patch_bios_settings(bmc, required_changes)
-        logger.info("%s BIOS settings will be updated on next server boot.", bmc)
-    else:
+    if not required_changes:
         logger.info("%s all required BIOS settings present and correct.", bmc)
+        return None
 
-    return required_changes
+    job = patch_bios_settings(bmc, required_changes)
+    logger.info("%s BIOS settings will be updated on next server boot.", bmc)
+    return job
 
 
-def patch_bios_settings(bmc: Bmc, new_settings: dict):
-    """Apply Bios settings to BMC."""
+def patch_bios_settings(bmc: Bmc, new_settings: dict) -> DellJob:
+    """Apply Bios settings to BMC, returning the configuration job for them.
+
+    The iDRAC refuses changes while a BIOS configuration job is already
+    queued.  If that job is still waiting for a reboot it is deleted and
+    its settings are sent again along with the new ones, so that one job
+    applies them all; a job that has started running cannot be replaced,
+    so that is an error.
+    """
     settings_path = f"{bmc.system_path}/Bios/Settings"
+    try:
+        location = _patch_settings(bmc, settings_path, new_settings)
+    except RedfishRequestError as e:
+        if "Pending configuration values" not in repr(e):
+            raise
+        jobs = pending_jobs(bmc, BIOS_JOB_TYPE)
+        running = [job for job in jobs if not job.scheduled]
+        if running:
+            raise RedfishRequestError(
+                f"{bmc} cannot change BIOS settings while "
+                + ", ".join(f"{job} is {job.state}" for job in running)
+            ) from e
+        logger.info("%s BIOS settings job already queued, replacing it.", bmc)
+        queued_settings = bmc.redfish_request(settings_path).get("Attributes", {})
+        for job in jobs:
+            delete_job(job)
+        location = _patch_settings(
+            bmc, settings_path, {**queued_settings, **new_settings}
+        )
+
+    if location is None:
+        # Older iDRAC firmware only creates the job when asked to.
+        location = bmc.redfish_request_location(
+            bmc.manager_path + "/Jobs",
+            payload={"TargetSettingsURI": settings_path},
+        )
+    if location is None:
+        raise RedfishRequestError(f"{bmc} did not create a BIOS configuration job")
+
+    job = DellJob(bmc, location)
+    logger.info("%s BIOS configuration job %s created", bmc, job.id)
+    return job
+
+
+def _patch_settings(bmc: Bmc, settings_path: str, settings: dict) -> str | None:
     payload = {
         "@Redfish.SettingsApplyTime": {"ApplyTime": "OnReset"},
-        "Attributes": new_settings,
+        "Attributes": settings,
     }
-    try:
-        bmc.redfish_request(settings_path, payload=payload, method="PATCH")
-    except RedfishRequestError as e:
-        if "Pending configuration values" in repr(e):
-            logger.info("%s BIOS settings job already queued, ignoring.", bmc)
-            return
-        raise
+    return bmc.redfish_request_location(settings_path, payload=payload, method="PATCH")
@@ -86,10 +86,11 @@ def bmc_interface(bmc) -> InterfaceInfo:
     data = {k.lower(): v for k, v in _data.items()}
     host_name = data.get("hostname")
 
-    if get_system_vendor(bmc) == "Dell":
+    vendor = get_system_vendor(bmc)
+    if vendor == "Dell":
         bmc_name = "iDRAC"
         bmc_description = "Dedicated iDRAC interface"
-    elif get_system_vendor(bmc) == "HP":
+    elif vendor == "HP":
         bmc_name = "iLO"
         bmc_description = str(data.get("name"))
     else:
@@ -148,15 +149,18 @@ def in_band_interfaces(bmc: Bmc) -> list[dict]:
     in redfish output at all, and if they are, whether the mac address
     information is present in the base interface, the partition, or both.
     Excludes removal of devices where no reference of -1 exists.
+
+    Interfaces are read with $expand where the BMC supports it, otherwise
+    fetched concurrently.
     """
-    index_data = bmc.redfish_request(bmc.system_path + "/EthernetInterfaces/")
-    urls = [member["@odata.id"] for member in index_data["Members"]]
-    interface_results = [
-        interface_detail(bmc, url)
-        for url in urls
+    members = bmc.collection_members(bmc.system_path + "/EthernetInterfaces/")
+    urls = [member["@odata.id"] for member in members]
+    wanted = [
+        member
+        for member, url in zip(members, urls, strict=True)
         if (not re.search(r"-\d$", url)) or (re.sub(r"-\d$", "", url) not in urls)
     ]
-    return list(interface_results)
+    return [interface_data(data) for data in bmc.resolve_members(wanted)]
 
 
 def interface_detail(bmc, path) -> dict:
@@ -170,7 +174,11 @@ def interface_detail(bmc, path) -> dict:
 
     InterfaceEnabled, LinkStatus, Status.Health, State.Enabled, SpeedMbps
     """
-    data = bmc.redfish_request(path)
+    return interface_data(bmc.redfish_request(path))
+
+
+def interface_data(data: dict) -> dict:
+    """Standardised data about a NIC, from its EthernetInterface resource."""
     _data = {k.lower(): v for k, v in data.items()}
     name = _data.get("name")
     hostname = _data.get("hostname", "")
@@ -1,5 +1,6 @@
 import base64
 import logging
+from contextlib import closing
 from time import sleep
 
 from understack_workflows.bmc import AuthException
@@ -40,20 +41,21 @@ def set_bmc_password(
     )
 
     failures = []
-    for attempt, password in enumerate(candidate_passwords):
-        if attempt > 1:
-            logger.debug(
-                "Waiting for 1 minute before BMC login attempt "
-                "with password %s of %s to avoid security lock-out",
-                attempt + 1,
-                len(candidate_passwords),
-            )
-            sleep(60)
-
-        try:
-            return _log_in_and_set_password(bmc, password, new_password)
-        except RedfishRequestError as e:
-            failures.append(e)
+    with closing(bmc):
+        for attempt, password in enumerate(candidate_passwords):
+            if attempt > 1:
+                logger.debug(
+                    "Waiting for 1 minute before BMC login attempt "
+                    "with password %s of %s to avoid security lock-out",
+                    attempt + 1,
+                    len(candidate_passwords),
+                )
+                sleep(60)
+
+            try:
+                return _log_in_and_set_password(bmc, password, new_password)
+            except RedfishRequestError as e:
+                failures.append(e)
 
     raise AuthException(
         f"Unable to log in to BMC {ip_address} with any known password! "
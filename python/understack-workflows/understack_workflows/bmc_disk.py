@@ -35,8 +35,11 @@ class Disk:
     @staticmethod
     def from_path(bmc: Bmc, path: str):
         """Disk path request."""
-        disk_data = bmc.redfish_request(path)
-        bmc_type = bmc.get_manufacturer()
+        return Disk.from_data(bmc.redfish_request(path), bmc.get_manufacturer())
+
+    @staticmethod
+    def from_data(disk_data: dict, bmc_type: str):
+        """Disk from a Redfish drive resource read from a BMC of bmc_type."""
         if "dell" in bmc_type:
             _bytes = disk_data["CapacityBytes"]
             _name = disk_data["Name"]
@@ -53,39 +56,36 @@ class Disk:
 
 
 def physical_disks(bmc: Bmc) -> list[Disk]:
-    """Retrieve list of physical physical_disks."""
+    """Retrieve list of physical physical_disks.
+
+    Controllers are read with $expand where the BMC supports it, and drives
+    are fetched concurrently rather than one request after another.
+    """
     try:
         bmc_type = bmc.get_manufacturer()
         if "dell" in bmc_type:
-            path = "/Storage"
-            storage_member_paths = [
-                member["@odata.id"]
-                for member in bmc.redfish_request(bmc.system_path + path)["Members"]
-            ]
-            disks = [
-                bmc.redfish_request(drive_path)["Drives"]
-                for drive_path in storage_member_paths
-            ]
-            disk_paths = [disk for sublist in disks for disk in sublist]
-            disk_list = [
-                Disk.from_path(bmc, path=disk["@odata.id"]) for disk in disk_paths
-            ]
+            controllers = bmc.resolve_members(
+                bmc.collection_members(bmc.system_path + "/Storage")
+            )
+            disk_links = [disk for c in controllers for disk in c["Drives"]]
         else:
-            path = "/SmartStorage/ArrayControllers"
-            storage_controller_paths = [
-                member["@odata.id"]
-                for member in bmc.redfish_request(bmc.system_path + path)["Members"]
-            ]
-            storage_member_paths = [
-                bmc.redfish_request(drive_path)["links"]["PhysicalDrives"]["href"]
-                for drive_path in storage_controller_paths
-            ]
-            disks = [
-                bmc.redfish_request(drive_path)["Members"]
-                for drive_path in storage_member_paths
+            controllers = bmc.resolve_members(
+                bmc.collection_members(
+                    bmc.system_path + "/SmartStorage/ArrayControllers"
+                )
+            )
+            drive_collections = bmc.redfish_request_many(
+                [c["links"]["PhysicalDrives"]["href"] for c in controllers]
+            )
+            disk_links = [
+                disk
+                for collection in drive_collections
+                for disk in collection["Members"]
             ]
-        disk_paths = [disk for sublist in disks for disk in sublist]
-        disk_list = [Disk.from_path(bmc, path=disk["@odata.id"]) for disk in disk_paths]
+        disk_list = [
+            Disk.from_data(disk_data, bmc_type)
+            for disk_data in bmc.resolve_members(disk_links)
+        ]
         logger.debug("Retrieved %d disks.", len(disk_list))
         return disk_list
     except RedfishRequestError as err:
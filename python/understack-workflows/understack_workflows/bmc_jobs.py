@@ -0,0 +1,115 @@
+import logging
+import time
+from dataclasses import dataclass
+
+from understack_workflows.bmc import Bmc
+
+logger = logging.getLogger(__name__)
+
+# How long to wait for a configuration job, which runs while the server
+# reboots, and how often to check on it meanwhile.
+JOB_TIMEOUT_SECS = 30 * 60
+JOB_POLL_INTERVAL_SECS = 15
+
+# Dell JobState values: a job waits in one of SCHEDULED_STATES for the
+# server to reboot, then runs until it reaches a terminal state.
+SCHEDULED_STATES = {"New", "Scheduled"}
+COMPLETED_STATES = {"Completed"}
+FAILED_STATES = {"Failed", "CompletedWithErrors", "RebootFailed", "Aborted"}
+
+
+class JobFailedError(Exception):
+    """A BMC job ended in failure."""
+
+
+class JobTimeoutError(Exception):
+    """A BMC job did not finish in time."""
+
+
+@dataclass
+class DellJob:
+    """A Dell lifecycle controller job, as last seen by refresh()."""
+
+    bmc: Bmc
+    path: str
+    state: str = "New"
+    message: str = ""
+
+    def __str__(self):
+        """Name the job and its BMC, for log messages."""
+        return f"{self.bmc} job {self.id}"
+
+    @property
+    def id(self) -> str:
+        return self.path.rstrip("/").rsplit("/", 1)[-1]
+
+    @property
+    def finished(self) -> bool:
+        return self.state in COMPLETED_STATES | FAILED_STATES
+
+    @property
+    def scheduled(self) -> bool:
+        return self.state in SCHEDULED_STATES
+
+    @property
+    def failed(self) -> bool:
+        return self.state in FAILED_STATES
+
+    def refresh(self) -> bool:
+        """Read the job's current state, answering whether it has finished."""
+        data = self.bmc.redfish_request(self.path)
+        self.state = data.get("JobState", self.state)
+        self.message = data.get("Message", "")
+        return self.finished
+
+
+def pending_jobs(bmc: Bmc, job_type: str) -> list[DellJob]:
+    """Unfinished jobs of the given JobType, e.g. "BIOSConfiguration"."""
+    members = bmc.resolve_members(bmc.collection_members(bmc.manager_path + "/Jobs"))
+    jobs = [
+        DellJob(bmc, m["@odata.id"], m.get("JobState", "New"), m.get("Message", ""))
+        for m in members
+        if m.get("JobType") == job_type
+    ]
+    return [job for job in jobs if not job.finished]
+
+
+def delete_job(job: DellJob) -> None:
+    """Cancel a job that has not started, discarding the changes it holds."""
+    logger.info("%s deleting %s job", job, job.state)
+    job.bmc.redfish_request(job.path, method="DELETE")
+
+
+def wait_for_jobs(
+    jobs: list[DellJob],
+    timeout: float = JOB_TIMEOUT_SECS,
+    poll_interval: float = JOB_POLL_INTERVAL_SECS,
+) -> None:
+    """Wait until every job has completed.
+
+    The jobs may be on any number of BMCs: each round checks on every job
+    that is still running, so one caller can follow a whole fleet.
+
+    Raises JobFailedError as soon as any job fails, and JobTimeoutError if
+    some are still unfinished after timeout seconds.
+    """
+    deadline = time.monotonic() + timeout
+    unfinished = list(jobs)
+    while True:
+        unfinished = [job for job in unfinished if not job.refresh()]
+        failed = [job for job in jobs if job.failed]
+        if failed:
+            raise JobFailedError(
+                "; ".join(f"{job} {job.state}: {job.message}" for job in failed)
+            )
+        if not unfinished:
+            for job in jobs:
+                logger.info("%s completed", job)
+            return
+        if time.monotonic() >= deadline:
+            raise JobTimeoutError(
+                f"{', '.join(str(job) for job in unfinished)} not finished "
+                f"after {timeout} seconds"
+            )
+        logger.debug("Waiting for %d of %d jobs", len(unfinished), len(jobs))
+        time.sleep(poll_interval)
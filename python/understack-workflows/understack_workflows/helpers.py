@@ -19,7 +19,10 @@ _NOISY_LOGGERS = [
 ]
 
 
-def setup_logger(level: int = logging.DEBUG) -> None:
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def setup_logger(level: int = logging.DEBUG, log_format: str = LOG_FORMAT) -> None:
     """Configure logging for a main entry point.
 
     Sets the root logger to the requested level and explicitly suppresses
@@ -30,6 +33,7 @@ def setup_logger(level: int = logging.DEBUG) -> None:
 
     params:
     level: log level for the root logger (default: DEBUG)
+    log_format: logging format string for the console handler
     """
     logging.config.dictConfig(
         {
@@ -37,7 +41,7 @@ def setup_logger(level: int = logging.DEBUG) -> None:
             "disable_existing_loggers": False,
             "formatters": {
                 "standard": {
-                    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                    "format": log_format,
                     "datefmt": "%Y-%m-%d %H:%M:%S %z",
                 },
             },
@@ -64,6 +68,17 @@ def int_or_str(value: str) -> int | str:
         return value
 
 
+def positive_int(value: str) -> int:
+    """Argparse type for a count that must be at least one."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"integer expected: '{value}'") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: '{value}'")
+    return number
+
+
 def boolean_args(val):
     normalised = str(val).upper()
     if normalised in ["YES", "TRUE", "T", "1"]:
@@ -3,6 +3,7 @@
 import argparse
 import logging
 import os
+from contextlib import closing
 
 from ironicclient.v1.node import Node
 
@@ -15,6 +16,8 @@ from understack_workflows.bmc_chassis_info import ChassisInfo
 from understack_workflows.bmc_chassis_info import chassis_info
 from understack_workflows.bmc_credentials import set_bmc_password
 from understack_workflows.bmc_hostname import bmc_set_hostname
+from understack_workflows.bmc_jobs import DellJob
+from understack_workflows.bmc_jobs import wait_for_jobs
 from understack_workflows.bmc_settings import update_dell_drac_settings
 from understack_workflows.raid import configure_raid
 
@@ -49,7 +52,9 @@ def main() -> None:
     - Configure the Dell HTTP-boot BIOS entries using the LLDP-confirmed PXE
       interfaces, then flip the node back to its final production http-ipxe boot
       mode for cleaning and provisioning (we prefer PXE-based booting over
-      virtual media, for performance reasons).
+      virtual media, for performance reasons).  BIOS changes are applied by
+      an iDRAC configuration job when the server next boots; we wait for it
+      to complete after that boot.
 
     - Optionally configure RAID.
 
@@ -82,61 +87,77 @@ def enroll(
         logger.info("  external_cmdb_id=%s", external_cmdb_id)
 
     bmc = bmc_for_ip_address(ip_address)
-    device_info = initialize_bmc(bmc, old_password)
-
-    node = ironic_node.create_or_update(
-        bmc=bmc,
-        name=device_name(device_info),
-        manufacturer=device_info.manufacturer,
-        external_cmdb_id=external_cmdb_id,
+    set_bmc_password(
+        ip_address=bmc.ip_address,
+        new_password=bmc.password,
+        old_password=old_password,
     )
 
-    # Out-of-band redfish inspection populates data including baremetal ports.
-    #
-    # Our hooks augment the ironic baremetal port with the BMC-reported
-    # interface name (e.g. NIC.Integrated.1-1) as well as some placeholder
-    # "enrol" dummy data that is required by Ironic/Neutron to perform agent
-    # inspection.  Neutron needs to assign a port to the provisioning network
-    # and it bails out unless we have ports with pxe_enabled, local_link_info,
-    # etc.
-    ironic_node.inspect_out_of_band(node)
-    inventory = ironic_node.get_node_inventory(node)
-
-    # Agent inspection gathers LLDP and full hardware inventory.
-    #
-    # Virtual media boot makes Neutron behave differently to normal HTTP agent
-    # boot - in our normal configuration it fails to set up ports on the
-    # provisioning network.
-    #
-    # Therefore, we only use virtual media during our "enroll" phase, when the
-    # port data is set up in a manner that suits the Neutron algorithm.  If a
-    # normal PXE/HTTP port is available then we use it instead:
-
-    pxe_interface = ironic_node.pxe_enabled_bios_name(node)
-    update_dell_bios_settings(bmc, pxe_interface=pxe_interface)
-    agent_inspection(node, virtual_media=not pxe_interface)
-
-    pxe_interface = ironic_node.pxe_enabled_bios_name(node)
-    if not pxe_interface:
-        raise RuntimeError(
-            f"[node:{node.uuid}] Agent inspection produced no pxe_enabled ports "
-            "cannot configure HTTP boot."
+    # Log in once, so every Redfish request below reuses one session token
+    # and pooled connection rather than re-authenticating each time.  The
+    # pooled connections are closed when we are done with this server.
+    with closing(bmc), bmc.session(bmc.password):
+        device_info = initialize_bmc(bmc)
+
+        node = ironic_node.create_or_update(
+            bmc=bmc,
+            name=device_name(device_info),
+            manufacturer=device_info.manufacturer,
+            external_cmdb_id=external_cmdb_id,
         )
-    logger.info("[node:%s] Selected PXE interface %s", node.uuid, pxe_interface)
 
-    update_dell_bios_settings(bmc, pxe_interface=pxe_interface)
-
-    if raid_configure:
-        configure_raid(node, inventory)
-        # RAID reconfiguration changes the disk layout; refresh inventory.
+        # Out-of-band redfish inspection populates data including baremetal ports.
+        #
+        # Our hooks augment the ironic baremetal port with the BMC-reported
+        # interface name (e.g. NIC.Integrated.1-1) as well as some placeholder
+        # "enrol" dummy data that is required by Ironic/Neutron to perform agent
+        # inspection.  Neutron needs to assign a port to the provisioning network
+        # and it bails out unless we have ports with pxe_enabled, local_link_info,
+        # etc.
         ironic_node.inspect_out_of_band(node)
-    else:
-        logger.info("%s RAID configuration was not requested", node.uuid)
+        inventory = ironic_node.get_node_inventory(node)
+
+        # Agent inspection gathers LLDP and full hardware inventory.
+        #
+        # Virtual media boot makes Neutron behave differently to normal HTTP agent
+        # boot - in our normal configuration it fails to set up ports on the
+        # provisioning network.
+        #
+        # Therefore, we only use virtual media during our "enroll" phase, when the
+        # port data is set up in a manner that suits the Neutron algorithm.  If a
+        # normal PXE/HTTP port is available then we use it instead:
+
+        pxe_interface = ironic_node.pxe_enabled_bios_name(node)
+        bios_job = update_dell_bios_settings(bmc, pxe_interface=pxe_interface)
+        agent_inspection(node, virtual_media=not pxe_interface)
+        # Booting the agent ran the BIOS job; make sure it applied cleanly.
+        wait_for_bios_job(bios_job, rebooted=True)
+
+        pxe_interface = ironic_node.pxe_enabled_bios_name(node)
+        if not pxe_interface:
+            raise RuntimeError(
+                f"[node:{node.uuid}] Agent inspection produced no pxe_enabled ports "
+                "cannot configure HTTP boot."
+            )
+        logger.info("[node:%s] Selected PXE interface %s", node.uuid, pxe_interface)
+
+        bios_job = update_dell_bios_settings(bmc, pxe_interface=pxe_interface)
+
+        if raid_configure:
+            configure_raid(node, inventory)
+            # RAID reconfiguration changes the disk layout; refresh inventory.
+            ironic_node.inspect_out_of_band(node)
+        else:
+            logger.info("%s RAID configuration was not requested", node.uuid)
+
+        if firmware_update:
+            ironic_node.apply_firmware_updates(node)
+
+        ironic_node.transition(node, target_state="provide", expected_state="available")
+        # Cleaning normally reboots the server, running any BIOS job queued
+        # above, but not if automated cleaning is disabled.
+        wait_for_bios_job(bios_job, rebooted=False)
 
-    if firmware_update:
-        ironic_node.apply_firmware_updates(node)
-
-    ironic_node.transition(node, target_state="provide", expected_state="available")
     logger.info("Completed enroll workflow for bmc_ip_address=%s", ip_address)
 
 
@@ -169,22 +190,36 @@ def agent_inspection(node: Node, virtual_media=False) -> None:
     )
 
 
-def initialize_bmc(bmc: Bmc, old_password: str | None) -> ChassisInfo:
-    """Discover and configure BMC with Undercloud standard settings."""
-    set_bmc_password(
-        ip_address=bmc.ip_address,
-        new_password=bmc.password,
-        old_password=old_password,
-    )
+def wait_for_bios_job(job: DellJob | None, rebooted: bool) -> None:
+    """Wait for a BIOS job to apply, if the server has booted since it was queued.
 
-    device_info = chassis_info(bmc)
-    for line in device_info.dump:
-        logger.info("Discovered %s", line)
+    Unless we know the server has rebooted, a job that is still scheduled is
+    left to apply on its next boot rather than waited on.
+    """
+    if job is None:
+        return
+    if not rebooted and not job.refresh() and job.scheduled:
+        logger.info("%s is %s, it will apply on next boot", job, job.state)
+        return
+    logger.info("Waiting for %s to apply BIOS settings", job)
+    wait_for_jobs([job])
+
+
+def initialize_bmc(bmc: Bmc) -> ChassisInfo:
+    """Discover and configure BMC with Undercloud standard settings.
+
+    The BMC must already accept its standard password.  The helpers below
+    read several of the same Redfish resources; each is fetched only once.
+    """
+    with bmc.read_cache():
+        device_info = chassis_info(bmc)
+        for line in device_info.dump:
+            logger.info("Discovered %s", line)
 
-    if device_info.manufacturer == "Dell":
-        update_dell_drac_settings(bmc)
+        if device_info.manufacturer == "Dell":
+            update_dell_drac_settings(bmc)
 
-    bmc_set_hostname(bmc, device_info.bmc_hostname, device_name(device_info))
+        bmc_set_hostname(bmc, device_info.bmc_hostname, device_name(device_info))
     return device_info
 
 
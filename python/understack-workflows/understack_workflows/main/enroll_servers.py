@@ -0,0 +1,179 @@
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from dataclasses import dataclass
+
+from understack_workflows import helpers
+from understack_workflows.main.enroll_server import enroll
+from understack_workflows.main.enroll_server import parse_bool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 10
+
+
+@dataclass
+class EnrollResult:
+    """Outcome of enrolling one server, for the bulk enrollment report."""
+
+    ip_address: str
+    succeeded: bool
+    seconds: float
+    error: str | None = None
+
+
+def main() -> None:
+    """On-board many baremetal nodes from one process.
+
+    Runs the enroll-server workflow for every BMC IP address given, several
+    servers at a time.  Each server is enrolled in its own thread with its
+    own BMC connection, so a failure or a slow BMC affects only that server;
+    the Ironic client is shared by all of them.
+
+    A JSON report with the outcome and duration for each server is printed
+    on stdout.  Exits non-zero if any server failed to enroll.
+    """
+    helpers.setup_logger(
+        log_format="%(asctime)s - %(threadName)s - %(name)s - %(levelname)s"
+        " - %(message)s"
+    )
+    args = argument_parser().parse_args()
+
+    servers = list(args.ip_address)
+    if args.ip_address_file:
+        servers.extend(read_servers(args.ip_address_file))
+    if not servers:
+        argument_parser().error("no BMC IP addresses given")
+
+    results = enroll_servers(
+        servers,
+        concurrency=args.concurrency,
+        old_password=args.old_password,
+        firmware_update=args.firmware_update,
+        raid_configure=args.raid_configure,
+    )
+    json.dump([asdict(result) for result in results], sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    if not all(result.succeeded for result in results):
+        sys.exit(1)
+
+
+def enroll_servers(
+    servers: list[tuple[str, int | str | None]],
+    concurrency: int,
+    firmware_update: bool,
+    raid_configure: bool,
+    old_password: str | None,
+) -> list[EnrollResult]:
+    """Enroll each (ip_address, external_cmdb_id), at most concurrency at once.
+
+    Results are returned in the order the servers were given.
+    """
+
+    def enroll_one(server: tuple[str, int | str | None]) -> EnrollResult:
+        ip_address, external_cmdb_id = server
+        # Log lines from every server are interleaved; tag them with the BMC.
+        threading.current_thread().name = f"bmc-{ip_address}"
+        start = time.perf_counter()
+        try:
+            enroll(
+                ip_address=ip_address,
+                firmware_update=firmware_update,
+                raid_configure=raid_configure,
+                old_password=old_password,
+                external_cmdb_id=external_cmdb_id,
+            )
+        except Exception as e:
+            logger.exception("Enroll workflow failed for bmc_ip_address=%s", ip_address)
+            return EnrollResult(
+                ip_address=ip_address,
+                succeeded=False,
+                seconds=round(time.perf_counter() - start, 1),
+                error=f"{type(e).__name__}: {e}",
+            )
+        return EnrollResult(
+            ip_address=ip_address,
+            succeeded=True,
+            seconds=round(time.perf_counter() - start, 1),
+        )
+
+    logger.info(
+        "Enrolling %d servers, %d at a time",
+        len(servers),
+        min(concurrency, len(servers)),
+    )
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(enroll_one, servers))
+
+    failed = [result.ip_address for result in results if not result.succeeded]
+    logger.info("Enrolled %d of %d servers", len(results) - len(failed), len(results))
+    if failed:
+        logger.error("Failed to enroll: %s", ", ".join(failed))
+    return results
+
+
+def read_servers(path: str) -> list[tuple[str, int | str | None]]:
+    """Read "IP_ADDRESS [EXTERNAL_CMDB_ID]" lines, skipping blanks and comments."""
+    servers = []
+    with open(path) as f:
+        for line in f:
+            fields = line.split("#", 1)[0].split()
+            if not fields:
+                continue
+            external_cmdb_id = (
+                helpers.int_or_str(fields[1]) if len(fields) > 1 else None
+            )
+            servers.append((fields[0], external_cmdb_id))
+    return servers
+
+
+def argument_parser():
+    parser = argparse.ArgumentParser(
+        prog=os.path.basename(__file__),
+        description="Run the server enroll workflow for many servers at once",
+    )
+    parser.add_argument(
+        "--ip-address",
+        action="append",
+        default=[],
+        type=lambda value: (value, None),
+        help="IP Address of a BMC (may be repeated)",
+    )
+    parser.add_argument(
+        "--ip-address-file",
+        help='File of "IP_ADDRESS [EXTERNAL_CMDB_ID]" lines, one server per line',
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=helpers.positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Servers to enroll at once (default {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--old-password",
+        required=False,
+        help="Old (current) BMC password, tried on every server",
+    )
+    parser.add_argument(
+        "--firmware-update",
+        type=parse_bool,
+        default=False,
+        help="Run firmware update runbooks after inspection",
+    )
+    parser.add_argument(
+        "--raid-configure",
+        type=parse_bool,
+        default=True,
+        help="Configure RAID before inspection",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+import argparse
+import json
+import logging
+import os
+
+from understack_workflows.helpers import credential
+from understack_workflows.helpers import parser_nautobot_args
+from understack_workflows.helpers import setup_logger
+from understack_workflows.main.netapp_configure_net import execute_graphql_query
+from understack_workflows.main.netapp_configure_net import (
+    netapp_create_interfaces_and_routes,
+)
+from understack_workflows.main.netapp_configure_net import validate_and_normalize_uuid
+from understack_workflows.main.netapp_configure_net import (
+    validate_and_transform_response,
+)
+from understack_workflows.nautobot import Nautobot
+from understack_workflows.netapp.batch import BatchStep
+from understack_workflows.netapp.batch import ensure_svm
+from understack_workflows.netapp.batch import run_batch
+from understack_workflows.netapp.config import NetAppConfig
+from understack_workflows.netapp.manager import NetAppManager
+from understack_workflows.netapp.task_plan import DEFAULT_MAX_WORKERS
+from understack_workflows.netapp.value_objects import ProjectBatchResult
+
+logger = logging.getLogger(__name__)
+
+STEP_CREATE_SVM = "create-svm"
+STEP_CONFIGURE_NET = "configure-net"
+
+
+def argument_parser():
+    """Parse command line arguments for batch NetApp project operations."""
+    parser = argparse.ArgumentParser(
+        description="Create SVMs and configure NetApp interfaces for many "
+        "projects using a single NetApp connection",
+    )
+
+    parser.add_argument(
+        "--project-id",
+        type=validate_and_normalize_uuid,
+        action="append",
+        default=[],
+        help="OpenStack project ID (UUID) to process, may be repeated",
+    )
+
+    parser.add_argument(
+        "--projects-file",
+        type=str,
+        help="JSONL file with one project per line, either a JSON string or "
+        'an object with a "project_id" key',
+    )
+
+    parser.add_argument(
+        "--steps",
+        nargs="+",
+        choices=[STEP_CREATE_SVM, STEP_CONFIGURE_NET],
+        default=[STEP_CREATE_SVM, STEP_CONFIGURE_NET],
+        help="Steps to run for each project, in order (default: all)",
+    )
+
+    parser.add_argument(
+        "--netapp-config-path",
+        type=str,
+        default="/etc/netapp/netapp_nvme.conf",
+        help="Path to NetApp config with credentials "
+        "(default: /etc/netapp/netapp_nvme.conf)",
+    )
+
+    parser.add_argument(
+        "--backend",
+        type=str,
+        help="NetApp config section to use (default: the first section)",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="Number of projects processed concurrently "
+        f"(default: {DEFAULT_MAX_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--topology-cache-dir",
+        type=str,
+        default=None,
+        help="Directory to persist the NetApp cluster topology snapshot in "
+        "(default: no persistence)",
+    )
+
+    return parser_nautobot_args(parser)
+
+
+def read_projects_file(path: str) -> list[str]:
+    """Read normalized project IDs from a JSONL file.
+
+    Args:
+        path: Path to the JSONL file
+
+    Returns:
+        list[str]: Project IDs in file order
+
+    Raises:
+        ValueError: If a line is not valid JSON or has no valid project ID
+    """
+    project_ids = []
+    with open(path) as f:
+        for lineno, raw_line in enumerate(f, start=1):
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+                if isinstance(entry, dict):
+                    entry = entry["project_id"]
+                project_ids.append(validate_and_normalize_uuid(str(entry)))
+            except (ValueError, KeyError, argparse.ArgumentTypeError) as e:
+                raise ValueError(f"{path}:{lineno}: invalid project entry") from e
+    return project_ids
+
+
+def select_backend(config_path: str, section: str | None) -> NetAppConfig:
+    """Return the NetApp backend configuration to run the batch against."""
+    if section:
+        return NetAppConfig(config_path, section)
+    return NetAppConfig.get_all_backends(config_path)[0]
+
+
+def configure_net_step(nautobot_client: Nautobot) -> BatchStep:
+    """Build the batch step configuring LIFs and routes from Nautobot data."""
+
+    def configure_net(manager: NetAppManager, project_id: str) -> str:
+        raw_response = execute_graphql_query(nautobot_client, project_id)
+        vm_network_infos = validate_and_transform_response(raw_response)
+        if not vm_network_infos:
+            return "no-interfaces"
+        netapp_create_interfaces_and_routes(manager, vm_network_infos[0], project_id)
+        return "configured"
+
+    return configure_net
+
+
+def print_result(result: ProjectBatchResult) -> None:
+    """Print a project result as a JSON line."""
+    print(result.model_dump_json(), flush=True)
+
+
+def main():
+    """Run the requested steps for every project in the batch.
+
+    Each project result is printed as a JSON line as soon as it finishes.
+
+    Returns:
+        int: Exit code
+            - 0: Every project succeeded
+            - 1: At least one project failed
+            - 2: Invalid arguments or configuration
+    """
+    setup_logger(level=logging.INFO)
+    args = argument_parser().parse_args()
+
+    try:
+        project_ids = list(args.project_id)
+        if args.projects_file:
+            project_ids.extend(read_projects_file(args.projects_file))
+        if not project_ids:
+            logger.error("No projects given, use --project-id or --projects-file")
+            return 2
+
+        backend_config = select_backend(args.netapp_config_path, args.backend)
+    except Exception as e:
+        logger.error("Unable to start batch: %s", e)
+        return 2
+
+    topology_cache_path = None
+    if args.topology_cache_dir:
+        topology_cache_path = os.path.join(
+            args.topology_cache_dir, f"{backend_config.section}.json"
+        )
+    manager = NetAppManager(
+        netapp_config=backend_config, topology_cache_path=topology_cache_path
+    )
+
+    steps: list[tuple[str, BatchStep]] = []
+    for step_name in args.steps:
+        if step_name == STEP_CREATE_SVM:
+            steps.append((step_name, ensure_svm))
+        elif step_name == STEP_CONFIGURE_NET:
+            nb_token = args.nautobot_token or credential("nb-token", "token")
+            nautobot_client = Nautobot(args.nautobot_url, nb_token, logger=logger)
+            steps.append((step_name, configure_net_step(nautobot_client)))
+
+    results = run_batch(
+        manager,
+        project_ids,
+        steps,
+        max_workers=args.max_workers,
+        on_result=print_result,
+    )
+    return 0 if all(result.success for result in results) else 1
+
+
+if __name__ == "__main__":
+    exit(main())
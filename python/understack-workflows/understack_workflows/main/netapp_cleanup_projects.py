@@ -0,0 +1,106 @@
+import argparse
+import logging
+
+from understack_workflows.helpers import setup_logger
+from understack_workflows.main.netapp_batch import read_projects_file
+from understack_workflows.main.netapp_batch import select_backend
+from understack_workflows.main.netapp_configure_net import validate_and_normalize_uuid
+from understack_workflows.netapp.cleanup import DEFAULT_CLEANUP_TIMEOUT
+from understack_workflows.netapp.manager import NetAppManager
+from understack_workflows.netapp.task_plan import DEFAULT_MAX_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+def argument_parser():
+    """Parse command line arguments for offboarding many projects."""
+    parser = argparse.ArgumentParser(
+        description="Delete the volume and SVM of many projects using a single "
+        "NetApp connection, tracking all ONTAP deletion jobs together",
+    )
+
+    parser.add_argument(
+        "--project-id",
+        type=validate_and_normalize_uuid,
+        action="append",
+        default=[],
+        help="OpenStack project ID (UUID) to clean up, may be repeated",
+    )
+
+    parser.add_argument(
+        "--projects-file",
+        type=str,
+        help="JSONL file with one project per line, either a JSON string or "
+        'an object with a "project_id" key',
+    )
+
+    parser.add_argument(
+        "--netapp-config-path",
+        type=str,
+        default="/etc/netapp/netapp_nvme.conf",
+        help="Path to NetApp config with credentials "
+        "(default: /etc/netapp/netapp_nvme.conf)",
+    )
+
+    parser.add_argument(
+        "--backend",
+        type=str,
+        help="NetApp config section to use (default: the first section)",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of concurrent NetApp requests (default: {DEFAULT_MAX_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_CLEANUP_TIMEOUT,
+        help="Seconds after which unfinished projects are reported failed "
+        f"(default: {DEFAULT_CLEANUP_TIMEOUT:.0f})",
+    )
+
+    return parser
+
+
+def main():
+    """Remove the volume and then the SVM of every project given.
+
+    Each project result is printed as a JSON line once all are finished.
+
+    Returns:
+        int: Exit code
+            - 0: Every project was cleaned up
+            - 1: At least one project failed
+            - 2: Invalid arguments or configuration
+    """
+    setup_logger(level=logging.INFO)
+    args = argument_parser().parse_args()
+
+    try:
+        project_ids = list(args.project_id)
+        if args.projects_file:
+            project_ids.extend(read_projects_file(args.projects_file))
+        if not project_ids:
+            logger.error("No projects given, use --project-id or --projects-file")
+            return 2
+
+        backend_config = select_backend(args.netapp_config_path, args.backend)
+    except Exception as e:
+        logger.error("Unable to start cleanup: %s", e)
+        return 2
+
+    manager = NetAppManager(netapp_config=backend_config)
+    results = manager.cleanup_projects(
+        project_ids, max_workers=args.max_workers, timeout=args.timeout
+    )
+    for result in results:
+        print(result.model_dump_json(), flush=True)
+    return 0 if all(result.error is None for result in results) else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,6 +1,7 @@
 import argparse
 import json
 import logging
+import os
 import uuid
 
 from understack_workflows.helpers import credential
@@ -9,6 +10,8 @@ from understack_workflows.helpers import setup_logger
 from understack_workflows.nautobot import Nautobot
 from understack_workflows.netapp.config import NetAppConfig
 from understack_workflows.netapp.manager import NetAppManager
+from understack_workflows.netapp.task_plan import DEFAULT_MAX_WORKERS
+from understack_workflows.netapp.task_plan import TaskPlan
 from understack_workflows.netapp.value_objects import NetappIPInterfaceConfig
 from understack_workflows.netapp.value_objects import VirtualMachineNetworkInfo
 
@@ -66,6 +69,14 @@ def argument_parser():
         "(default: /etc/netapp/netapp_nvme.conf)",
     )
 
+    parser.add_argument(
+        "--topology-cache-dir",
+        type=str,
+        default=None,
+        help="Directory to persist NetApp cluster topology snapshots in, "
+        "one file per backend (default: no persistence)",
+    )
+
     # Add Nautobot connection arguments using the helper
     return parser_nautobot_args(parser)
 
@@ -262,6 +273,7 @@ def netapp_create_interfaces_and_routes(
     mgr: NetAppManager,
     nautobot_response: VirtualMachineNetworkInfo,
     project_id: str,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> None:
     """Create NetApp LIF interfaces and routes based on Nautobot VM network config.
 
@@ -269,11 +281,16 @@ def netapp_create_interfaces_and_routes(
     configurations and creates the corresponding LIF (Logical Interface) on the
     NetApp storage system, followed by creating routes for network connectivity.
 
+    Each LIF creates its home VLAN port first. LIFs that share a home port are
+    created one after another, all others run concurrently. Routes are created
+    once every LIF is in place.
+
     Args:
         mgr: NetAppManager instance for creating LIF interfaces and routes
         nautobot_response: Validated virtual machine network information from
             Nautobot
         project_id: OpenStack project ID for logging and context
+        max_workers: Maximum number of NetApp operations running concurrently
 
     Returns:
         None
@@ -287,13 +304,35 @@ def netapp_create_interfaces_and_routes(
         nautobot_response, mgr.config
     )
 
-    # Create LIF interfaces
-    for interface_config in configs:
+    def create_lif(interface_config: NetappIPInterfaceConfig) -> None:
         logger.info("Creating LIF %s for project %s", interface_config.name, project_id)
         mgr.create_lif(project_id, interface_config)
 
-    # Create routes
-    mgr.create_routes_for_project(project_id, configs)
+    # Build the dependency plan: home port -> LIF -> routes
+    plan = TaskPlan(max_workers=max_workers)
+    last_lif_on_port = {}
+    for interface_config in configs:
+        home_port = (
+            interface_config.desired_node_number,
+            interface_config.base_port_name,
+            interface_config.vlan_id,
+        )
+        previous = last_lif_on_port.get(home_port)
+        last_lif_on_port[home_port] = plan.add(
+            f"lif:{interface_config.name}",
+            create_lif,
+            interface_config,
+            depends_on=[previous] if previous else [],
+        )
+
+    plan.add(
+        "routes",
+        mgr.create_routes_for_project,
+        project_id,
+        configs,
+        depends_on=list(last_lif_on_port.values()),
+    )
+    plan.run()
     return
 
 
@@ -381,7 +420,15 @@ def main():
         backends = NetAppConfig.get_all_backends(args.netapp_config_path)
         netapp_manager = None
         for backend_config in backends:
-            mgr = NetAppManager(netapp_config=backend_config)
+            topology_cache_path = None
+            if args.topology_cache_dir:
+                topology_cache_path = os.path.join(
+                    args.topology_cache_dir, f"{backend_config.section}.json"
+                )
+            mgr = NetAppManager(
+                netapp_config=backend_config,
+                topology_cache_path=topology_cache_path,
+            )
             if mgr.check_if_svm_exists(project_id=args.project_id):
                 netapp_manager = mgr
                 logger.info(
@@ -0,0 +1,136 @@
+"""Batch execution of NetApp operations across many projects.
+
+Running one workflow per project means every project pays for reading the
+configuration, connecting to the cluster and loading the topology. The
+helpers here run a list of steps for many projects on a single
+NetAppManager, so all projects share its connection and topology cache.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent import futures
+
+from understack_workflows.netapp.manager import NetAppManager
+from understack_workflows.netapp.task_plan import DEFAULT_MAX_WORKERS
+from understack_workflows.netapp.value_objects import ProjectBatchResult
+
+logger = logging.getLogger(__name__)
+
+BatchStep = Callable[[NetAppManager, str], str]
+
+
+def ensure_svm(manager: NetAppManager, project_id: str) -> str:
+    """Create the SVM for a project unless it already exists.
+
+    Args:
+        manager: NetAppManager connected to the target cluster
+        project_id: The project identifier
+
+    Returns:
+        str: "exists" or "created"
+    """
+    if manager.check_if_svm_exists(project_id):
+        return "exists"
+
+    manager.create_svm(project_id, manager.select_aggregate_name())
+    return "created"
+
+
+def run_project(
+    manager: NetAppManager,
+    project_id: str,
+    steps: list[tuple[str, BatchStep]],
+) -> ProjectBatchResult:
+    """Run the steps for a single project, stopping at the first failure.
+
+    Args:
+        manager: NetAppManager connected to the target cluster
+        project_id: The project identifier
+        steps: Ordered (name, step) pairs to run
+
+    Returns:
+        ProjectBatchResult: Outcome of the steps for the project
+    """
+    started = time.monotonic()
+    outcomes: dict[str, str] = {}
+
+    for step_name, step in steps:
+        try:
+            outcomes[step_name] = step(manager, project_id)
+        except Exception as e:
+            logger.error(
+                "Step %(step)s failed for project %(project_id)s: %(error)s",
+                {"step": step_name, "project_id": project_id, "error": str(e)},
+            )
+            return ProjectBatchResult(
+                project_id=project_id,
+                success=False,
+                steps=outcomes,
+                failed_step=step_name,
+                error=str(e),
+                duration=time.monotonic() - started,
+            )
+
+    return ProjectBatchResult(
+        project_id=project_id,
+        success=True,
+        steps=outcomes,
+        duration=time.monotonic() - started,
+    )
+
+
+def run_batch(
+    manager: NetAppManager,
+    project_ids: Iterable[str],
+    steps: list[tuple[str, BatchStep]],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_result: Callable[[ProjectBatchResult], None] | None = None,
+) -> list[ProjectBatchResult]:
+    """Run the steps for many projects concurrently on one manager.
+
+    A failing project does not affect the others. Steps are expected to be
+    idempotent so that a batch can simply be re-run after a partial failure.
+
+    Args:
+        manager: NetAppManager connected to the target cluster
+        project_ids: Projects to process; duplicates are processed once
+        steps: Ordered (name, step) pairs to run for each project
+        max_workers: Maximum number of projects processed at the same time
+        on_result: Optional callback invoked as each project finishes
+
+    Returns:
+        list[ProjectBatchResult]: Results in the order the projects were given
+    """
+    unique_ids = list(dict.fromkeys(project_ids))
+    if not unique_ids:
+        return []
+
+    logger.info(
+        "Running %(steps)s for %(count)d project(s) with %(workers)d workers",
+        {
+            "steps": [name for name, _ in steps],
+            "count": len(unique_ids),
+            "workers": max_workers,
+        },
+    )
+
+    results: dict[str, ProjectBatchResult] = {}
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {
+            executor.submit(run_project, manager, project_id, steps): project_id
+            for project_id in unique_ids
+        }
+        for future in futures.as_completed(pending):
+            result = future.result()
+            results[pending[future]] = result
+            if on_result is not None:
+                on_result(result)
+
+    failed = sum(1 for result in results.values() if not result.success)
+    logger.info(
+        "Batch finished: %(succeeded)d succeeded, %(failed)d failed",
+        {"succeeded": len(results) - failed, "failed": failed},
+    )
+    return [results[project_id] for project_id in unique_ids]
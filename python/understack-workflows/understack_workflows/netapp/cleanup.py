@@ -0,0 +1,223 @@
+"""Concurrent project cleanup driven by ONTAP job tracking.
+
+Deleting a volume or an SVM returns an ONTAP job, and the SDK normally
+blocks until that job finishes. When offboarding many projects that means
+waiting for every deletion one after another. The engine in this module
+submits deletions without waiting, follows all outstanding jobs with a
+single query per poll and only deletes a project's SVM once its volume
+is gone.
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from concurrent import futures
+
+from understack_workflows.netapp.client import NetAppClientInterface
+from understack_workflows.netapp.svm_service import SvmService
+from understack_workflows.netapp.task_plan import DEFAULT_MAX_WORKERS
+from understack_workflows.netapp.value_objects import JobResult
+from understack_workflows.netapp.value_objects import ProjectCleanupResult
+from understack_workflows.netapp.volume_service import VolumeService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 2.0
+DEFAULT_CLEANUP_TIMEOUT = 900.0
+
+
+class _ProjectCleanup:
+    """Cleanup progress of a single project."""
+
+    def __init__(self, project_id: str):
+        self.project_id = project_id
+        self.started = time.monotonic()
+        self.volume_done = False
+        self.svm_done = False
+        self.svm_existed = False
+        self.job_uuid: str | None = None
+        self.error: str | None = None
+        self.finished_at: float | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.error is None and not (self.volume_done and self.svm_done)
+
+    def fail(self, error: str) -> None:
+        self.error = error
+        self.job_uuid = None
+        self.finished_at = time.monotonic()
+
+    def result(self) -> ProjectCleanupResult:
+        finished_at = self.finished_at or time.monotonic()
+        return ProjectCleanupResult(
+            project_id=self.project_id,
+            volume=self.volume_done,
+            svm=self.svm_done,
+            error=self.error,
+            duration=finished_at - self.started,
+        )
+
+
+class CleanupEngine:
+    """Removes the volume and SVM of many projects concurrently."""
+
+    def __init__(
+        self,
+        client: NetAppClientInterface,
+        svm_service: SvmService,
+        volume_service: VolumeService,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        timeout: float = DEFAULT_CLEANUP_TIMEOUT,
+    ):
+        """Initialize the cleanup engine.
+
+        Args:
+            client: NetApp client for low-level operations
+            svm_service: SVM service, used for naming and existence checks
+            volume_service: Volume service, used for naming and existence checks
+            max_workers: Maximum number of concurrent existence checks and
+                         deletion requests
+            poll_interval: Seconds between job status queries
+            timeout: Seconds after which unfinished projects are reported failed
+        """
+        self._client = client
+        self._svm_service = svm_service
+        self._volume_service = volume_service
+        self._max_workers = max_workers
+        self._poll_interval = poll_interval
+        self._timeout = timeout
+
+    def run(self, project_ids: Iterable[str]) -> list[ProjectCleanupResult]:
+        """Remove the volume and then the SVM of every project.
+
+        Args:
+            project_ids: Projects to clean up; duplicates are processed once
+
+        Returns:
+            list[ProjectCleanupResult]: Results in the order the projects
+            were given
+        """
+        projects = [_ProjectCleanup(pid) for pid in dict.fromkeys(project_ids)]
+        if not projects:
+            return []
+
+        logger.info(
+            "Starting cleanup of %(count)d project(s)", {"count": len(projects)}
+        )
+        deadline = time.monotonic() + self._timeout
+
+        with futures.ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            list(executor.map(self._start, projects))
+
+            while True:
+                waiting = {p.job_uuid: p for p in projects if p.job_uuid}
+                if not waiting:
+                    break
+                if time.monotonic() >= deadline:
+                    for project in waiting.values():
+                        project.fail(
+                            f"Timed out waiting for ONTAP job {project.job_uuid}"
+                        )
+                    break
+
+                time.sleep(self._poll_interval)
+                try:
+                    jobs = self._client.get_jobs(list(waiting))
+                except Exception as e:
+                    logger.warning(
+                        "Unable to query ONTAP jobs: %(error)s", {"error": str(e)}
+                    )
+                    continue
+
+                next_step = []
+                for job_uuid, project in waiting.items():
+                    job = jobs.get(job_uuid)
+                    if job is None:
+                        # ONTAP lists every job it accepted, so it never will.
+                        project.fail(f"ONTAP job {job_uuid} not found")
+                    elif job.is_terminal:
+                        self._job_finished(project, job)
+                        if project.active:
+                            next_step.append(project)
+                list(executor.map(self._advance, next_step))
+
+        results = [project.result() for project in projects]
+        failed = [r.project_id for r in results if r.error is not None]
+        logger.info(
+            "Cleanup finished: %(succeeded)d succeeded, %(failed)d failed",
+            {
+                "succeeded": len(results) - len(failed),
+                "failed": len(failed),
+                "failed_projects": failed,
+            },
+        )
+        return results
+
+    def _start(self, project: _ProjectCleanup) -> None:
+        """Check what exists for a project and start deleting it."""
+        try:
+            volume_existed = self._volume_service.exists(project.project_id)
+            project.svm_existed = self._svm_service.exists(project.project_id)
+        except Exception as e:
+            project.fail(f"Existence check failed: {e}")
+            return
+
+        project.volume_done = not volume_existed
+        project.svm_done = not project.svm_existed
+        self._advance(project)
+
+    def _advance(self, project: _ProjectCleanup) -> None:
+        """Submit the next deletion for a project, volume before SVM."""
+        try:
+            if not project.volume_done:
+                volume_name = self._volume_service.get_volume_name(project.project_id)
+                project.job_uuid = self._client.start_volume_deletion(
+                    volume_name, force=True
+                )
+                if project.job_uuid is None:
+                    project.volume_done = True
+                else:
+                    return
+
+            if not project.svm_done:
+                svm_name = self._svm_service.get_svm_name(project.project_id)
+                project.job_uuid = self._client.start_svm_deletion(svm_name)
+                if project.job_uuid is None:
+                    project.svm_done = True
+                else:
+                    return
+
+            project.finished_at = time.monotonic()
+        except Exception as e:
+            logger.error(
+                "Cleanup of project %(project_id)s failed: %(error)s",
+                {"project_id": project.project_id, "error": str(e)},
+            )
+            project.fail(str(e))
+
+    def _job_finished(self, project: _ProjectCleanup, job: JobResult) -> None:
+        """Record the outcome of the deletion job a project was waiting on."""
+        phase = "volume" if not project.volume_done else "SVM"
+        project.job_uuid = None
+
+        if not job.succeeded:
+            project.fail(f"{phase} deletion job {job.uuid} failed: {job.message}")
+            if phase == "volume" and project.svm_existed:
+                logger.warning(
+                    "Skipping SVM deletion for project %(project_id)s because "
+                    "volume deletion failed",
+                    {"project_id": project.project_id},
+                )
+            return
+
+        logger.info(
+            "Deleted %(phase)s for project %(project_id)s",
+            {"phase": phase, "project_id": project.project_id},
+        )
+        if phase == "volume":
+            project.volume_done = True
+        else:
+            project.svm_done = True
+            project.finished_at = time.monotonic()
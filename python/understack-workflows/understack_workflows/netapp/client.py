@@ -9,6 +9,7 @@ handling low-level operations and converting between value objects and SDK objec
 import logging
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Iterator
 from typing import cast
 
 import requests
@@ -17,6 +18,7 @@ from netapp_ontap.error import NetAppRestError
 from netapp_ontap.host_connection import HostConnection
 from netapp_ontap.resources import Aggregate
 from netapp_ontap.resources import IpInterface
+from netapp_ontap.resources import Job
 from netapp_ontap.resources import NetworkRoute
 from netapp_ontap.resources import Node
 from netapp_ontap.resources import NvmeNamespace
@@ -33,9 +35,11 @@ from understack_workflows.netapp.exceptions import VolumeOperationError
 from understack_workflows.netapp.value_objects import AggregateResult
 from understack_workflows.netapp.value_objects import InterfaceResult
 from understack_workflows.netapp.value_objects import InterfaceSpec
+from understack_workflows.netapp.value_objects import JobResult
 from understack_workflows.netapp.value_objects import NamespaceResult
 from understack_workflows.netapp.value_objects import NamespaceSpec
 from understack_workflows.netapp.value_objects import NodeResult
+from understack_workflows.netapp.value_objects import PhysicalPortResult
 from understack_workflows.netapp.value_objects import PortResult
 from understack_workflows.netapp.value_objects import PortSpec
 from understack_workflows.netapp.value_objects import RouteResult
@@ -50,6 +54,13 @@ logger = logging.getLogger(__name__)
 SVM_ROOT_VOLUME_SIZE_BYTES = 1024**3
 SVM_ROOT_VOLUME_AUTOSIZE_MAXIMUM_BYTES = 2 * 1024**3
 
+# Only request the fields the value objects need instead of full records
+SVM_FIELDS = "uuid,name,state"
+VOLUME_FIELDS = "uuid,name,size,state"
+
+# Records per request when streaming large collections
+NAMESPACE_PAGE_SIZE = 500
+
 
 class NetAppClientInterface(ABC):
     """Abstract interface for NetApp operations."""
@@ -116,6 +127,50 @@ class NetAppClientInterface(ABC):
             bool: True if deletion was successful, False otherwise
         """
 
+    @abstractmethod
+    def start_svm_deletion(self, svm_name: str) -> str | None:
+        """Request deletion of an SVM without waiting for it to complete.
+
+        Args:
+            svm_name: Name of the SVM to delete
+
+        Returns:
+            str | None: UUID of the ONTAP job tracking the deletion, or None
+            if the deletion completed synchronously
+
+        Raises:
+            SvmOperationError: If the deletion request is rejected
+        """
+
+    @abstractmethod
+    def start_volume_deletion(
+        self, volume_name: str, force: bool = False
+    ) -> str | None:
+        """Request deletion of a volume without waiting for it to complete.
+
+        Args:
+            volume_name: Name of the volume to delete
+            force: Delete even if the volume is still mapped
+
+        Returns:
+            str | None: UUID of the ONTAP job tracking the deletion, or None
+            if the deletion completed synchronously
+
+        Raises:
+            VolumeOperationError: If the deletion request is rejected
+        """
+
+    @abstractmethod
+    def get_jobs(self, job_uuids: list[str]) -> dict[str, JobResult]:
+        """Get the state of several ONTAP jobs with a single request.
+
+        Args:
+            job_uuids: UUIDs of the jobs to look up
+
+        Returns:
+            dict[str, JobResult]: Job states keyed by job UUID
+        """
+
     @abstractmethod
     def find_volume(self, volume_name: str, svm_name: str) -> VolumeResult | None:
         """Find a volume by name within a specific SVM.
@@ -162,6 +217,14 @@ class NetAppClientInterface(ABC):
     def get_broadcast_domain_name(self, node_name: str, port_name: str) -> str:
         """Get the broadcast domain name for a port."""
 
+    @abstractmethod
+    def get_physical_ports(self) -> list[PhysicalPortResult]:
+        """Get all physical ports in the cluster with their broadcast domains.
+
+        Returns:
+            List[PhysicalPortResult]: List of physical ports
+        """
+
     @abstractmethod
     def get_nodes(self) -> list[NodeResult]:
         """Get all nodes in the cluster.
@@ -170,6 +233,20 @@ class NetAppClientInterface(ABC):
             List[NodeResult]: List of all nodes
         """
 
+    @abstractmethod
+    def iter_namespaces(
+        self, namespace_spec: NamespaceSpec, page_size: int = NAMESPACE_PAGE_SIZE
+    ) -> Iterator[NamespaceResult]:
+        """Stream NVMe namespaces for a specific SVM and volume page by page.
+
+        Args:
+            namespace_spec: Specification for namespace query
+            page_size: Number of records fetched per request
+
+        Yields:
+            NamespaceResult: Matching namespaces
+        """
+
     @abstractmethod
     def get_namespaces(self, namespace_spec: NamespaceSpec) -> list[NamespaceResult]:
         """Get NVMe namespaces for a specific SVM and volume.
@@ -274,7 +351,7 @@ class NetAppClient(NetAppClientInterface):
             )
 
             svm.post()
-            svm.get()  # Refresh to get the latest state
+            svm.get(fields=SVM_FIELDS)  # Refresh to get the latest state
             self._configure_svm_root_volume(svm_spec)
 
             result = SvmResult(
@@ -340,7 +417,7 @@ class NetAppClient(NetAppClientInterface):
             logger.info("Deleting SVM: %(svm_name)s", {"svm_name": svm_name})
 
             svm = Svm()
-            svm.get(name=svm_name)
+            svm.get(name=svm_name, fields="uuid,name")
 
             logger.info(
                 "Found SVM '%(svm_name)s' with UUID %(uuid)s",
@@ -365,7 +442,7 @@ class NetAppClient(NetAppClientInterface):
     def find_svm(self, svm_name: str) -> SvmResult | None:
         """Find a Storage Virtual Machine (SVM) by name."""
         try:
-            svm = Svm.find(name=svm_name)
+            svm = Svm.find(name=svm_name, fields=SVM_FIELDS)
             if svm:
                 return SvmResult(
                     name=str(svm.name),
@@ -412,7 +489,7 @@ class NetAppClient(NetAppClientInterface):
             )
 
             volume.post()
-            volume.get()  # Refresh to get the latest state
+            volume.get(fields=VOLUME_FIELDS)  # Refresh to get the latest state
 
             result = VolumeResult(
                 name=str(volume.name),
@@ -454,7 +531,7 @@ class NetAppClient(NetAppClientInterface):
             )
 
             volume = Volume()
-            volume.get(name=volume_name)
+            volume.get(name=volume_name, fields="uuid,name,state")
 
             logger.info("Found volume '%(volume_name)s'", {"volume_name": volume_name})
 
@@ -482,10 +559,93 @@ class NetAppClient(NetAppClientInterface):
             )
             return False
 
+    def start_svm_deletion(self, svm_name: str) -> str | None:
+        """Request deletion of an SVM without waiting for it to complete."""
+        try:
+            svm = Svm()
+            svm.get(name=svm_name, fields="uuid,name")
+            response = svm.delete(poll=False)
+            job_uuid = self._job_uuid(response)
+
+            logger.info(
+                "SVM '%(svm_name)s' deletion submitted",
+                {"svm_name": svm_name, "job_uuid": job_uuid},
+            )
+            return job_uuid
+
+        except NetAppRestError as e:
+            raise SvmOperationError(
+                f"NetApp SVM deletion failed: {e}",
+                svm_name=svm_name,
+                context={"svm_name": svm_name, "netapp_error": str(e)},
+            ) from e
+
+    def start_volume_deletion(
+        self, volume_name: str, force: bool = False
+    ) -> str | None:
+        """Request deletion of a volume without waiting for it to complete."""
+        try:
+            volume = Volume()
+            volume.get(name=volume_name, fields="uuid,name")
+            if force:
+                response = volume.delete(poll=False, allow_delete_while_mapped=True)
+            else:
+                response = volume.delete(poll=False)
+            job_uuid = self._job_uuid(response)
+
+            logger.info(
+                "Volume '%(volume_name)s' deletion submitted",
+                {"volume_name": volume_name, "job_uuid": job_uuid, "force": force},
+            )
+            return job_uuid
+
+        except NetAppRestError as e:
+            raise VolumeOperationError(
+                f"NetApp Volume deletion failed: {e}",
+                volume_name=volume_name,
+                context={"volume_name": volume_name, "netapp_error": str(e)},
+            ) from e
+
+    def get_jobs(self, job_uuids: list[str]) -> dict[str, JobResult]:
+        """Get the state of several ONTAP jobs with a single request."""
+        if not job_uuids:
+            return {}
+
+        try:
+            jobs = Job.get_collection(
+                uuid="|".join(job_uuids), fields="uuid,state,message"
+            )
+            return {
+                str(job.uuid): JobResult(
+                    uuid=str(job.uuid),
+                    state=str(job.state),
+                    message=getattr(job, "message", None),
+                )
+                for job in jobs
+            }
+
+        except NetAppRestError as e:
+            raise NetAppManagerError(
+                f"NetApp Job query failed: {e}",
+                context={"job_uuids": job_uuids, "netapp_error": str(e)},
+            ) from e
+
+    @staticmethod
+    def _job_uuid(response) -> str | None:
+        """Extract the job UUID from an asynchronous ONTAP response."""
+        try:
+            return response.http_response.json()["job"]["uuid"]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
     def find_volume(self, volume_name: str, svm_name: str) -> VolumeResult | None:
         """Find a volume by name within a specific SVM."""
         try:
-            volume = Volume.find(name=volume_name, svm={"name": svm_name})
+            volume = Volume.find(
+                name=volume_name,
+                fields=VOLUME_FIELDS,
+                **{"svm.name": svm_name},  # pyright: ignore[reportArgumentType]
+            )
             if volume:
                 return VolumeResult(
                     name=str(volume.name),
@@ -524,7 +684,8 @@ class NetAppClient(NetAppClientInterface):
             # attempt to load the existing interface first
             pc = IpInterface.get_collection(
                 name=interface_spec.name,
-                svm=interface_spec.svm_name,
+                fields="uuid,name",
+                **{"svm.name": interface_spec.svm_name},  # pyright: ignore[reportArgumentType]
             )
 
             try:
@@ -677,12 +838,46 @@ class NetAppClient(NetAppClientInterface):
                 },
             ) from None
 
+    def get_physical_ports(self) -> list[PhysicalPortResult]:
+        """Get all physical ports in the cluster with their broadcast domains."""
+        try:
+            logger.debug("Retrieving cluster physical ports")
+
+            ports = Port.get_collection(
+                type="physical", fields="name,node.name,broadcast_domain.name"
+            )
+            results = []
+
+            for port in ports:
+                broadcast_domain = getattr(port, "broadcast_domain", None)
+                results.append(
+                    PhysicalPortResult(
+                        name=str(port.name),
+                        node_name=str(port.node.name),
+                        broadcast_domain_name=str(broadcast_domain.name)
+                        if broadcast_domain is not None
+                        else None,
+                    )
+                )
+
+            logger.info(
+                "Retrieved %(port_count)d physical ports from cluster",
+                {"port_count": len(results)},
+            )
+            return results
+
+        except NetAppRestError as e:
+            raise NetworkOperationError(
+                f"NetApp physical port retrieval failed: {e}",
+                context={"netapp_error": str(e)},
+            ) from e
+
     def get_nodes(self) -> list[NodeResult]:
         """Get all nodes in the cluster."""
         try:
             logger.debug("Retrieving cluster nodes")
 
-            nodes = list(Node.get_collection())
+            nodes = list(Node.get_collection(fields="name,uuid"))
             results = []
 
             for node in nodes:
@@ -740,52 +935,43 @@ class NetAppClient(NetAppClientInterface):
                 context={"netapp_error": str(e)},
             ) from e
 
-    def get_namespaces(self, namespace_spec: NamespaceSpec) -> list[NamespaceResult]:
-        """Get NVMe namespaces for a specific SVM and volume."""
-        try:
-            # Check if connection is available
-            if not config.CONNECTION:
-                logger.warning("No NetApp connection available for namespace query")
-                return []
-
-            logger.debug(
-                "Querying namespaces for SVM %(svm_name)s, volume %(volume_name)s",
-                {
-                    "svm_name": namespace_spec.svm_name,
-                    "volume_name": namespace_spec.volume_name,
-                },
-            )
+    def iter_namespaces(
+        self, namespace_spec: NamespaceSpec, page_size: int = NAMESPACE_PAGE_SIZE
+    ) -> Iterator[NamespaceResult]:
+        """Stream NVMe namespaces for a specific SVM and volume page by page."""
+        # Check if connection is available
+        if not config.CONNECTION:
+            logger.warning("No NetApp connection available for namespace query")
+            return
+
+        logger.debug(
+            "Querying namespaces for SVM %(svm_name)s, volume %(volume_name)s",
+            {
+                "svm_name": namespace_spec.svm_name,
+                "volume_name": namespace_spec.volume_name,
+            },
+        )
 
+        try:
+            # The SDK only requests the next page once the current one has
+            # been consumed, so memory stays bounded by page_size
             ns_collection = NvmeNamespace.get_collection(
-                query=namespace_spec.query_string,
                 fields="uuid,name,status.mapped",
+                max_records=page_size,
+                **namespace_spec.filters,  # pyright: ignore[reportArgumentType]
             )
 
-            results = []
             for ns in ns_collection:
-                results.append(
-                    NamespaceResult(
-                        uuid=str(ns.uuid),
-                        name=str(ns.name),
-                        mapped=getattr(ns.status, "mapped", False)
-                        if hasattr(ns, "status")
-                        else False,
-                        svm_name=namespace_spec.svm_name,
-                        volume_name=namespace_spec.volume_name,
-                    )
+                yield NamespaceResult(
+                    uuid=str(ns.uuid),
+                    name=str(ns.name),
+                    mapped=getattr(ns.status, "mapped", False)
+                    if hasattr(ns, "status")
+                    else False,
+                    svm_name=namespace_spec.svm_name,
+                    volume_name=namespace_spec.volume_name,
                 )
 
-            logger.info(
-                "Retrieved %(namespace_count)d namespaces",
-                {
-                    "namespace_count": len(results),
-                    "svm": namespace_spec.svm_name,
-                    "volume": namespace_spec.volume_name,
-                },
-            )
-
-            return results
-
         except NetAppRestError as e:
             raise NetAppManagerError(
                 f"NetApp Namespace query failed: {e}",
@@ -796,6 +982,21 @@ class NetAppClient(NetAppClientInterface):
                 },
             ) from e
 
+    def get_namespaces(self, namespace_spec: NamespaceSpec) -> list[NamespaceResult]:
+        """Get NVMe namespaces for a specific SVM and volume."""
+        results = list(self.iter_namespaces(namespace_spec))
+
+        logger.info(
+            "Retrieved %(namespace_count)d namespaces",
+            {
+                "namespace_count": len(results),
+                "svm": namespace_spec.svm_name,
+                "volume": namespace_spec.volume_name,
+            },
+        )
+
+        return results
+
     def create_route(self, route_spec: RouteSpec) -> RouteResult:
         """Create a network route.
 
@@ -12,6 +12,7 @@ from understack_workflows.netapp.exceptions import HomeNodeNotFoundError
 from understack_workflows.netapp.exceptions import NetAppManagerError
 from understack_workflows.netapp.exceptions import NetworkOperationError
 from understack_workflows.netapp.exceptions import SvmNotFoundError
+from understack_workflows.netapp.topology import ClusterTopology
 from understack_workflows.netapp.value_objects import InterfaceSpec
 from understack_workflows.netapp.value_objects import NetappIPInterfaceConfig
 from understack_workflows.netapp.value_objects import NodeResult
@@ -24,13 +25,20 @@ logger = logging.getLogger(__name__)
 class LifService:
     """Service for managing Logical Interface (LIF) operations with business logic."""
 
-    def __init__(self, client: NetAppClientInterface):
+    def __init__(
+        self,
+        client: NetAppClientInterface,
+        topology: ClusterTopology | None = None,
+    ):
         """Initialize the LIF service.
 
         Args:
             client: NetApp client for low-level operations
+            topology: Shared cluster topology cache for node and broadcast
+                      domain lookups (defaults to querying the client)
         """
         self._client = client
+        self._topology = topology if topology is not None else client
 
     def create_lif(self, project_id: str, config: NetappIPInterfaceConfig) -> None:
         """Create a logical interface (LIF) for a project.
@@ -68,7 +76,7 @@ class LifService:
                 )
 
             home_node = self.identify_home_node(config)
-            broadcast_domain_name = self._client.get_broadcast_domain_name(
+            broadcast_domain_name = self._topology.get_broadcast_domain_name(
                 home_node.name, config.base_port_name
             )
 
@@ -203,7 +211,7 @@ class LifService:
             )
 
             # Get all nodes from the cluster
-            nodes = self._client.get_nodes()
+            nodes = self._topology.get_nodes()
 
             # Apply business logic to find matching node
             for node in nodes:
@@ -1,18 +1,27 @@
 import logging
+import threading
+from collections import Counter
 
 import urllib3
 from netapp_ontap import config
 from netapp_ontap.host_connection import HostConnection
 from netapp_ontap.resources.nvme_namespace import NvmeNamespace
 
+from understack_workflows.netapp.cleanup import DEFAULT_CLEANUP_TIMEOUT
+from understack_workflows.netapp.cleanup import CleanupEngine
+from understack_workflows.netapp.client import NAMESPACE_PAGE_SIZE
 from understack_workflows.netapp.client import NetAppClient
 from understack_workflows.netapp.exceptions import NetAppManagerError
 from understack_workflows.netapp.lif_service import LifService
 from understack_workflows.netapp.route_service import RouteService
 from understack_workflows.netapp.svm_service import SvmService
+from understack_workflows.netapp.task_plan import DEFAULT_MAX_WORKERS
+from understack_workflows.netapp.topology import DEFAULT_TOPOLOGY_TTL
+from understack_workflows.netapp.topology import ClusterTopology
 from understack_workflows.netapp.value_objects import AggregateResult
 from understack_workflows.netapp.value_objects import NetappIPInterfaceConfig
 from understack_workflows.netapp.value_objects import NodeResult
+from understack_workflows.netapp.value_objects import ProjectCleanupResult
 from understack_workflows.netapp.value_objects import RouteResult
 from understack_workflows.netapp.volume_service import VolumeService
 
@@ -36,6 +45,9 @@ class NetAppManager:
         volume_service=None,
         lif_service=None,
         route_service=None,
+        topology=None,
+        topology_cache_path: str | None = None,
+        topology_ttl: float = DEFAULT_TOPOLOGY_TTL,
     ):
         """Initialize NetAppManager with dependency injection support.
 
@@ -47,6 +59,10 @@ class NetAppManager:
             volume_service: VolumeService instance (optional, for dependency injection)
             lif_service: LifService instance (optional, for dependency injection)
             route_service: RouteService instance (optional, for dependency injection)
+            topology: ClusterTopology instance (optional, for dependency injection)
+            topology_cache_path: File to persist the cluster topology snapshot
+                                 to, so later runs can skip fetching it
+            topology_ttl: Seconds a cluster topology snapshot stays valid
         """
         # Set up dependencies with dependency injection or create defaults
         self._setup_dependencies(
@@ -56,8 +72,17 @@ class NetAppManager:
             volume_service,
             lif_service,
             route_service,
+            topology,
+            topology_cache_path,
+            topology_ttl,
         )
 
+        # Aggregates chosen by select_aggregate_name, so that one manager
+        # creating many SVMs spreads them out: a new SVM barely changes an
+        # aggregate's usage, so usage alone would pick the same one each time.
+        self._aggregate_selections: Counter[str] = Counter()
+        self._selection_lock = threading.Lock()
+
     def _setup_dependencies(
         self,
         netapp_config,
@@ -66,6 +91,9 @@ class NetAppManager:
         volume_service,
         lif_service,
         route_service,
+        topology=None,
+        topology_cache_path=None,
+        topology_ttl=DEFAULT_TOPOLOGY_TTL,
     ):
         """Set up all service dependencies with dependency injection."""
         # Initialize configuration
@@ -124,6 +152,14 @@ class NetAppManager:
                 )
             self._client = NetAppClient(self._config)
 
+        # Nodes and ports are fetched once and shared by services
+        if topology is not None:
+            self._topology = topology
+        else:
+            self._topology = ClusterTopology(
+                self._client, ttl=topology_ttl, cache_path=topology_cache_path
+            )
+
         # Initialize services - they should always be created if not provided
         if svm_service is not None:
             self._svm_service = svm_service
@@ -138,7 +174,7 @@ class NetAppManager:
         if lif_service is not None:
             self._lif_service = lif_service
         else:
-            self._lif_service = LifService(self._client)
+            self._lif_service = LifService(self._client, self._topology)
 
         if route_service is not None:
             self._route_service = route_service
@@ -154,7 +190,12 @@ class NetAppManager:
         return self._client.get_aggregates()
 
     def select_aggregate_name(self) -> str:
-        """Select the least-used online aggregate for SVM creation."""
+        """Select an online aggregate for SVM creation.
+
+        Usage is read from the cluster on every call. The aggregate this
+        manager has selected least often wins, then the least-used one, so
+        consecutive or concurrent selections are spread across aggregates.
+        """
         aggregates = self.get_aggregates()
         if not aggregates:
             raise NetAppManagerError("No NetApp aggregates are available")
@@ -167,10 +208,16 @@ class NetAppManager:
         if not eligible_aggregates:
             raise NetAppManagerError("No eligible NetApp aggregates are available")
 
-        selected = min(
-            eligible_aggregates,
-            key=lambda aggregate: (aggregate.used_percent, aggregate.name),
-        )
+        with self._selection_lock:
+            selected = min(
+                eligible_aggregates,
+                key=lambda aggregate: (
+                    self._aggregate_selections[aggregate.name],
+                    aggregate.used_percent,
+                    aggregate.name,
+                ),
+            )
+            self._aggregate_selections[selected.name] += 1
         return selected.name
 
     def delete_svm(self, svm_name: str) -> bool:
@@ -277,8 +324,9 @@ class NetAppManager:
             return None
 
         ns_list = NvmeNamespace.get_collection(
-            query=f"svm.name={svm_name}&location.volume.name={volume_name}",
             fields="uuid,name,status.mapped",
+            max_records=NAMESPACE_PAGE_SIZE,
+            **{"svm.name": svm_name, "location.volume.name": volume_name},  # pyright: ignore[reportArgumentType]
         )
         return ns_list
 
@@ -450,6 +498,35 @@ class NetAppManager:
 
         return {"volume": delete_vol_result, "svm": delete_svm_result}
 
+    def cleanup_projects(
+        self,
+        project_ids: list[str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float = DEFAULT_CLEANUP_TIMEOUT,
+    ) -> list[ProjectCleanupResult]:
+        """Removes the Volume and SVM of many projects concurrently.
+
+        Deletions are submitted without blocking on their ONTAP jobs and all
+        outstanding jobs are tracked together. A project's SVM is only
+        deleted once its volume deletion job has succeeded.
+
+        Args:
+            project_ids: The project IDs to clean up
+            max_workers: Maximum number of concurrent NetApp requests
+            timeout: Seconds after which unfinished projects are reported failed
+
+        Returns:
+            list[ProjectCleanupResult]: Per-project outcome, in input order
+        """
+        engine = CleanupEngine(
+            self._client,
+            self._svm_service,
+            self._volume_service,
+            max_workers=max_workers,
+            timeout=timeout,
+        )
+        return engine.run(project_ids)
+
     def create_lif(self, project_id, config: NetappIPInterfaceConfig):
         """Creates a logical interface (LIF) for a project.
 
@@ -463,7 +540,7 @@ class NetAppManager:
         Delegates to LifService for port management.
         """
         home_node = self._lif_service.identify_home_node(config)
-        broadcast_domain_name = self._client.get_broadcast_domain_name(
+        broadcast_domain_name = self._topology.get_broadcast_domain_name(
             home_node.name, config.base_port_name
         )
         return self._lif_service.create_home_port(
@@ -5,10 +5,12 @@ including route creation and nexthop management.
 """
 
 import logging
+from concurrent import futures
 
 from understack_workflows.netapp.client import NetAppClientInterface
 from understack_workflows.netapp.exceptions import NetAppManagerError
 from understack_workflows.netapp.exceptions import NetworkOperationError
+from understack_workflows.netapp.task_plan import DEFAULT_MAX_WORKERS
 from understack_workflows.netapp.value_objects import NetappIPInterfaceConfig
 from understack_workflows.netapp.value_objects import RouteResult
 from understack_workflows.netapp.value_objects import RouteSpec
@@ -19,13 +21,17 @@ logger = logging.getLogger(__name__)
 class RouteService:
     """Service for managing network route operations with business logic."""
 
-    def __init__(self, client: NetAppClientInterface):
+    def __init__(
+        self, client: NetAppClientInterface, max_workers: int = DEFAULT_MAX_WORKERS
+    ):
         """Initialize the route service.
 
         Args:
             client: NetApp client for low-level operations
+            max_workers: Maximum number of routes created concurrently
         """
         self._client = client
+        self._max_workers = max_workers
 
     def create_routes_from_interfaces(
         self,
@@ -53,37 +59,23 @@ class RouteService:
                 {"count": len(unique_nexthops), "project_id": project_id},
             )
 
-            # Create routes for each unique nexthop
+            # Routes for different nexthops are independent, create them
+            # concurrently
             svm_name = f"os-{project_id}"
-            results = []
-
-            for nexthop in unique_nexthops:
-                try:
-                    route_spec = RouteSpec.from_nexthop_ip(svm_name, nexthop)
-                    result = self._client.create_route(route_spec)
-                    results.append(result)
-
-                    logger.info(
-                        "Created route: %(destination)s via %(gateway)s for SVM "
-                        "%(svm_name)s",
-                        {
-                            "destination": result.destination,
-                            "gateway": result.gateway,
-                            "svm_name": result.svm_name,
-                        },
+            if not unique_nexthops:
+                return []
+
+            with futures.ThreadPoolExecutor(
+                max_workers=min(len(unique_nexthops), self._max_workers)
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda nexthop: self._create_route(
+                            project_id, svm_name, nexthop
+                        ),
+                        unique_nexthops,
                     )
-
-                except NetAppManagerError:
-                    raise
-                except Exception as e:
-                    raise NetworkOperationError(
-                        f"Operation 'Route creation for nexthop {nexthop}' failed: {e}",
-                        context={
-                            "project_id": project_id,
-                            "svm_name": svm_name,
-                            "nexthop": nexthop,
-                        },
-                    ) from e
+                )
 
             return results
 
@@ -98,6 +90,48 @@ class RouteService:
                 },
             ) from e
 
+    def _create_route(
+        self, project_id: str, svm_name: str, nexthop: str
+    ) -> RouteResult:
+        """Create the route for a single nexthop.
+
+        Args:
+            project_id: The project identifier
+            svm_name: Name of the SVM owning the route
+            nexthop: Nexthop IP address
+
+        Returns:
+            RouteResult: Result of the route creation
+
+        Raises:
+            NetworkOperationError: If route creation fails
+        """
+        try:
+            route_spec = RouteSpec.from_nexthop_ip(svm_name, nexthop)
+            result = self._client.create_route(route_spec)
+
+            logger.info(
+                "Created route: %(destination)s via %(gateway)s for SVM %(svm_name)s",
+                {
+                    "destination": result.destination,
+                    "gateway": result.gateway,
+                    "svm_name": result.svm_name,
+                },
+            )
+            return result
+
+        except NetAppManagerError:
+            raise
+        except Exception as e:
+            raise NetworkOperationError(
+                f"Operation 'Route creation for nexthop {nexthop}' failed: {e}",
+                context={
+                    "project_id": project_id,
+                    "svm_name": svm_name,
+                    "nexthop": nexthop,
+                },
+            ) from e
+
     def _extract_unique_nexthops(
         self, interface_configs: list[NetappIPInterfaceConfig]
     ) -> list[str]:
@@ -0,0 +1,150 @@
+"""Dependency-aware concurrent execution of NetApp operations.
+
+ONTAP REST calls that create objects routinely take seconds each. Most of
+the operations needed to set up a project only depend on a few others, so
+this module lets callers describe them as a small dependency graph and
+runs every step as soon as its prerequisites have completed.
+"""
+
+import logging
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent import futures
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class _Task:
+    def __init__(self, name, func, args, kwargs, depends_on):
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.depends_on = depends_on
+
+
+class TaskPlan:
+    """A set of named tasks with dependencies, run with bounded parallelism.
+
+    Tasks are started in the order they were added once all of their
+    dependencies have succeeded. When a task fails no new tasks are started,
+    tasks already running are allowed to finish and the first failure is
+    re-raised from ``run``.
+
+    Example:
+        >>> plan = TaskPlan(max_workers=2)
+        >>> plan.add("a", lambda: 1)
+        'a'
+        >>> plan.add("b", lambda: 2, depends_on=["a"])
+        'b'
+        >>> plan.run()
+        {'a': 1, 'b': 2}
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        """Initialize an empty plan.
+
+        Args:
+            max_workers: Maximum number of tasks running at the same time
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._max_workers = max_workers
+        self._tasks: dict[str, _Task] = {}
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        /,
+        *args,
+        depends_on: Iterable[str] = (),
+        **kwargs,
+    ) -> str:
+        """Add a task to the plan.
+
+        Args:
+            name: Unique task name, used to reference it as a dependency
+            func: Callable to run
+            *args: Positional arguments for ``func``
+            depends_on: Names of tasks that must succeed before this one
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            str: The task name
+
+        Raises:
+            ValueError: If the name is already used or a dependency is unknown
+        """
+        if name in self._tasks:
+            raise ValueError(f"Task '{name}' is already part of the plan")
+        depends_on = tuple(depends_on)
+        unknown = [dep for dep in depends_on if dep not in self._tasks]
+        if unknown:
+            raise ValueError(f"Task '{name}' depends on unknown tasks: {unknown}")
+
+        self._tasks[name] = _Task(name, func, args, kwargs, depends_on)
+        return name
+
+    def run(self) -> dict[str, Any]:
+        """Run all tasks, honouring dependencies.
+
+        Returns:
+            dict[str, Any]: Task results keyed by task name
+
+        Raises:
+            Exception: The first exception raised by any task
+        """
+        results: dict[str, Any] = {}
+        pending = list(self._tasks.values())
+        running: dict[futures.Future, _Task] = {}
+        failure: BaseException | None = None
+
+        if not pending:
+            return results
+
+        with futures.ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while pending or running:
+                if failure is None:
+                    for task in [t for t in pending if self._ready(t, results)]:
+                        if len(running) >= self._max_workers:
+                            break
+                        pending.remove(task)
+                        logger.debug("Starting task %(task)s", {"task": task.name})
+                        future = executor.submit(task.func, *task.args, **task.kwargs)
+                        running[future] = task
+                elif not running:
+                    break
+
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    try:
+                        results[task.name] = future.result()
+                    except Exception as e:
+                        logger.error(
+                            "Task %(task)s failed: %(error)s",
+                            {"task": task.name, "error": str(e)},
+                        )
+                        if failure is None:
+                            failure = e
+
+        if failure is not None:
+            if pending:
+                logger.warning(
+                    "Skipped %(count)d task(s) after failure: %(tasks)s",
+                    {
+                        "count": len(pending),
+                        "tasks": [task.name for task in pending],
+                    },
+                )
+            raise failure
+
+        return results
+
+    @staticmethod
+    def _ready(task: _Task, results: dict[str, Any]) -> bool:
+        return all(dep in results for dep in task.depends_on)
@@ -0,0 +1,168 @@
+"""Cluster topology cache for NetApp Manager.
+
+Nodes and physical ports with their broadcast domains rarely change, yet
+every LIF operation used to look them up again. This module loads them once
+into a snapshot that the services share, optionally persisting it to disk so
+short-lived workflow pods can reuse it. Aggregate usage changes with every
+volume, so it is not cached here.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+from pydantic import ValidationError
+
+from understack_workflows.netapp.client import NetAppClientInterface
+from understack_workflows.netapp.value_objects import NodeResult
+from understack_workflows.netapp.value_objects import TopologySnapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOPOLOGY_TTL = 300.0
+
+
+class ClusterTopology:
+    """Lazily loaded, TTL-bound view of near-static cluster facts.
+
+    The object exposes the same lookup methods as NetAppClient
+    (``get_nodes`` and ``get_broadcast_domain_name``) so services can use it
+    in place of the client for those calls.
+    """
+
+    def __init__(
+        self,
+        client: NetAppClientInterface,
+        ttl: float = DEFAULT_TOPOLOGY_TTL,
+        cache_path: str | None = None,
+    ):
+        """Initialize the topology cache.
+
+        Args:
+            client: NetApp client used to fetch the topology
+            ttl: Seconds a snapshot stays valid, in memory and on disk
+            cache_path: Optional JSON file to persist the snapshot to
+        """
+        self._client = client
+        self._ttl = ttl
+        self._cache_path = cache_path
+        self._snapshot: TopologySnapshot | None = None
+        self._broadcast_domains: dict[tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> TopologySnapshot:
+        """Return a fresh topology snapshot, fetching it if needed."""
+        with self._lock:
+            if self._snapshot is None or not self._is_fresh(self._snapshot):
+                snapshot = self._load_persisted()
+                if snapshot is None:
+                    snapshot = self._fetch()
+                    self._persist(snapshot)
+                self._set_snapshot(snapshot)
+            return self._snapshot  # pyright: ignore[reportReturnType]
+
+    def invalidate(self) -> None:
+        """Drop the in-memory snapshot and any persisted copy."""
+        with self._lock:
+            self._snapshot = None
+            self._broadcast_domains = {}
+            if self._cache_path:
+                try:
+                    os.remove(self._cache_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(
+                        "Unable to remove topology cache %(path)s: %(error)s",
+                        {"path": self._cache_path, "error": str(e)},
+                    )
+
+    def get_nodes(self) -> list[NodeResult]:
+        """Get all nodes in the cluster."""
+        return list(self.snapshot().nodes)
+
+    def get_broadcast_domain_name(self, node_name: str, port_name: str) -> str:
+        """Get the broadcast domain name for a physical port.
+
+        Ports missing from the snapshot (e.g. added after it was taken) are
+        looked up directly on the cluster.
+        """
+        self.snapshot()
+        name = self._broadcast_domains.get((node_name, port_name))
+        if name is not None:
+            return name
+
+        logger.debug(
+            "Port %(node_name)s:%(port_name)s not in topology snapshot",
+            {"node_name": node_name, "port_name": port_name},
+        )
+        return self._client.get_broadcast_domain_name(node_name, port_name)
+
+    def _is_fresh(self, snapshot: TopologySnapshot) -> bool:
+        return time.time() - snapshot.fetched_at < self._ttl
+
+    def _set_snapshot(self, snapshot: TopologySnapshot) -> None:
+        self._snapshot = snapshot
+        self._broadcast_domains = {
+            (port.node_name, port.name): port.broadcast_domain_name
+            for port in snapshot.ports
+            if port.broadcast_domain_name
+        }
+
+    def _fetch(self) -> TopologySnapshot:
+        logger.debug("Fetching cluster topology")
+        snapshot = TopologySnapshot(
+            nodes=self._client.get_nodes(),
+            ports=self._client.get_physical_ports(),
+            fetched_at=time.time(),
+        )
+        logger.info(
+            "Loaded cluster topology: %(node_count)d nodes, %(port_count)d ports",
+            {
+                "node_count": len(snapshot.nodes),
+                "port_count": len(snapshot.ports),
+            },
+        )
+        return snapshot
+
+    def _load_persisted(self) -> TopologySnapshot | None:
+        if not self._cache_path:
+            return None
+
+        try:
+            with open(self._cache_path) as f:
+                snapshot = TopologySnapshot.model_validate(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, ValidationError) as e:
+            logger.warning(
+                "Ignoring unreadable topology cache %(path)s: %(error)s",
+                {"path": self._cache_path, "error": str(e)},
+            )
+            return None
+
+        if not self._is_fresh(snapshot):
+            logger.debug(
+                "Topology cache %(path)s has expired", {"path": self._cache_path}
+            )
+            return None
+
+        logger.debug("Using topology cache %(path)s", {"path": self._cache_path})
+        return snapshot
+
+    def _persist(self, snapshot: TopologySnapshot) -> None:
+        if not self._cache_path:
+            return
+
+        tmp_path = f"{self._cache_path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                f.write(snapshot.model_dump_json())
+            os.replace(tmp_path, self._cache_path)
+        except OSError as e:
+            logger.warning(
+                "Unable to write topology cache %(path)s: %(error)s",
+                {"path": self._cache_path, "error": str(e)},
+            )
@@ -556,6 +556,15 @@ class NamespaceSpec(BaseModel):
         """
         return f"svm.name={self.svm_name}&location.volume.name={self.volume_name}"
 
+    @property
+    def filters(self) -> dict[str, str]:
+        """Server-side filters for the NetApp SDK namespace collection.
+
+        Returns:
+            dict[str, str]: Query parameters keyed by ONTAP field name
+        """
+        return {"svm.name": self.svm_name, "location.volume.name": self.volume_name}
+
 
 class RouteSpec(BaseModel):
     """Specification for creating a network route.
@@ -821,6 +830,48 @@ class PortResult(BaseModel):
     port_type: str | None = None
 
 
+class PhysicalPortResult(BaseModel):
+    """Result of a physical port query operation.
+
+    This model represents a physical cluster port together with the
+    broadcast domain it belongs to, as reported by ONTAP.
+
+    Attributes:
+        name: Port name (e.g., "e4a")
+        node_name: Name of the node hosting the port
+        broadcast_domain_name: Broadcast domain of the port, if any
+
+    Example:
+        >>> result = PhysicalPortResult(
+        ...     name="e4a",
+        ...     node_name="node1",
+        ...     broadcast_domain_name="Fabric-A"
+        ... )
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    node_name: str
+    broadcast_domain_name: str | None = None
+
+
+class TopologySnapshot(BaseModel):
+    """Point-in-time view of near-static cluster topology.
+
+    Attributes:
+        nodes: Cluster nodes
+        ports: Physical ports with their broadcast domains
+        fetched_at: Unix timestamp of when the snapshot was taken
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    nodes: tuple[NodeResult, ...]
+    ports: tuple[PhysicalPortResult, ...]
+    fetched_at: float
+
+
 class InterfaceResult(BaseModel):
     """Result of an interface operation.
 
@@ -915,3 +966,85 @@ class RouteResult(BaseModel):
     gateway: str
     destination: str | IPv4Network
     svm_name: str
+
+
+class JobResult(BaseModel):
+    """State of an ONTAP asynchronous job.
+
+    Attributes:
+        uuid: Job identifier assigned by NetApp
+        state: Job state (queued, running, paused, success or failure)
+        message: Status message reported by ONTAP, if any
+
+    Example:
+        >>> job = JobResult(uuid="12345678-1234-1234-1234-123456789abc",
+        ...                 state="success")
+        >>> job.is_terminal
+        True
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    uuid: str
+    state: str
+    message: str | None = None
+
+    @property
+    def is_terminal(self) -> bool:
+        """Whether the job has finished, successfully or not."""
+        return self.state in ("success", "failure")
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the job finished successfully."""
+        return self.state == "success"
+
+
+class ProjectCleanupResult(BaseModel):
+    """Outcome of removing the volume and SVM of a project.
+
+    Attributes:
+        project_id: The project identifier
+        volume: Whether the volume is gone (deleted or never existed)
+        svm: Whether the SVM is gone (deleted or never existed)
+        error: Reason the cleanup did not complete, if any
+        duration: Seconds spent on the project
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    project_id: str
+    volume: bool
+    svm: bool
+    error: str | None = None
+    duration: float = 0.0
+
+
+class ProjectBatchResult(BaseModel):
+    """Outcome of running a batch of NetApp operations for one project.
+
+    Attributes:
+        project_id: The project identifier
+        success: Whether every step completed
+        steps: Outcome of each completed step, keyed by step name
+        failed_step: Name of the step that failed, if any
+        error: Error message of the failed step, if any
+        duration: Seconds spent on the project
+
+    Example:
+        >>> result = ProjectBatchResult(
+        ...     project_id="12345678123456789abc123456789012",
+        ...     success=True,
+        ...     steps={"create-svm": "created"},
+        ...     duration=4.2
+        ... )
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    project_id: str
+    success: bool
+    steps: dict[str, str] = Field(default_factory=dict)
+    failed_step: str | None = None
+    error: str | None = None
+    duration: float = 0.0
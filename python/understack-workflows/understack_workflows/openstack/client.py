@@ -1,6 +1,7 @@
 """helper to setup OpenStack clients."""
 
 # attempt to prevent re-export
+import functools as _functools
 import os as _os
 import sys as _sys
 from importlib import metadata as _meta
@@ -40,8 +41,14 @@ def get_openstack_client(cloud=None, region_name="") -> Connection:
     return Connection(config=cloud_region)
 
 
+@_functools.cache
 def get_ironic_client(cloud=None, region_name="") -> IronicClient:  # type: ignore
-    """Returns our Ironic Client wrapper configured from our clouds.yaml."""
+    """Returns our Ironic Client wrapper configured from our clouds.yaml.
+
+    The client is built once per cloud and region and then shared, so its
+    Keystone token, negotiated API version and connection pool are reused
+    by every caller in the process, including concurrent ones.
+    """
     cloud_region = _get_os_cloud_region(cloud, region_name)
     client = _get_ironic_client(
         api_version="1",
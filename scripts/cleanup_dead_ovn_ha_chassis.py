@@ -71,6 +71,18 @@ import logging
 import os
 import subprocess
 import sys
+import tempfile
+
+# The OVN JSON parser is shared with kubectl-us-net; it only needs the
+# standard library, so it is imported straight from the checkout.
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "python", "kubectl-us-net"
+    ),
+)
+from us_net.ovsdb_json import as_list as _as_list
+from us_net.ovsdb_json import iter_ovn_rows
 
 NB_POD = "ovn-ovsdb-nb-0"
 SB_POD = "ovn-ovsdb-sb-0"
@@ -84,36 +96,6 @@ HA_CHASSIS_GROUP_HIGHEST_PRIORITY = 32767
 log = logging.getLogger(__name__)
 
 
-def _unwrap_ovn_value(val):
-    """Recursively unwrap an OVN JSON-encoded value."""
-    if not isinstance(val, list) or len(val) < 2:
-        return val
-    tag = val[0]
-    if tag == "uuid":
-        return val[1]
-    if tag == "set":
-        return [_unwrap_ovn_value(v) for v in val[1]]
-    if tag == "map":
-        return {_unwrap_ovn_value(k): _unwrap_ovn_value(v) for k, v in val[1]}
-    return val
-
-
-def parse_ovn_json(raw: str) -> list[dict]:
-    """Parse OVN --format=json list output into a list of row dicts."""
-    obj = json.loads(raw)
-    headings = obj["headings"]
-    return [
-        {h: _unwrap_ovn_value(v) for h, v in zip(headings, row)} for row in obj["data"]
-    ]
-
-
-def _as_list(val) -> list:
-    """OVSDB unwraps single-element sets to a bare value instead of a list."""
-    if val in (None, ""):
-        return []
-    return val if isinstance(val, list) else [val]
-
-
 def _ovn_cmd(
     kubectl_base: list[str], pod: str, ctl: str, *args: str
 ) -> subprocess.CompletedProcess:
@@ -127,16 +109,39 @@ def _ovn_cmd(
 def _ovn_list(
     kubectl_base: list[str], pod: str, ctl: str, table: str, columns: str
 ) -> list[dict]:
-    result = _ovn_cmd(
-        kubectl_base, pod, ctl, f"--columns={columns}", "--format=json", "list", table
-    )
-    if result.returncode != 0:
+    # Streamed rather than captured: Logical_Switch_Port alone can be
+    # hundreds of MB on a large cloud, and only `columns` are kept.
+    # stderr goes to a file so a chatty kubectl can't block on it while
+    # stdout is still being read.
+    with (
+        tempfile.TemporaryFile("w+") as stderr_file,
+        subprocess.Popen(
+            kubectl_base
+            + ["exec", "-n", OVN_NAMESPACE, pod, "--", ctl]
+            + [f"--columns={columns}", "--format=json", "list", table],
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+        ) as proc,
+    ):
+        try:
+            rows = list(iter_ovn_rows(proc.stdout, columns.split(",")))
+            parse_error = ""
+        except ValueError as exc:
+            # Nothing drains stdout any more; stop kubectl rather than
+            # wait for it to finish writing.
+            proc.kill()
+            rows, parse_error = [], str(exc)
+        proc.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read().strip()
+    if proc.returncode != 0 or parse_error:
         print(
-            f"ERROR: {ctl} list {table} failed:\n{result.stderr.strip()}",
+            f"ERROR: {ctl} list {table} failed:\n{stderr or parse_error}",
             file=sys.stderr,
         )
         sys.exit(1)
-    return parse_ovn_json(result.stdout)
+    return rows
 
 
 def get_live_chassis_names(kubectl_base: list[str]) -> set[str]:
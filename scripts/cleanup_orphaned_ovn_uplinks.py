@@ -9,43 +9,31 @@ Runs in dry-run mode by default. Pass --execute to delete the LSPs.
 """
 
 import argparse
-import json
 import logging
+import os
 import subprocess
 import sys
+import tempfile
 
 import openstack
 import openstack.exceptions
 
+# The OVN JSON parser is shared with kubectl-us-net; it only needs the
+# standard library, so it is imported straight from the checkout.
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "python", "kubectl-us-net"
+    ),
+)
+from us_net.ovsdb_json import iter_ovn_rows
+
 OVN_POD = "ovn-ovsdb-nb-0"
 OVN_NAMESPACE = "openstack"
 
 log = logging.getLogger(__name__)
 
 
-def _unwrap_ovn_value(val):
-    """Recursively unwrap an OVN JSON-encoded value."""
-    if not isinstance(val, list) or len(val) < 2:
-        return val
-    tag = val[0]
-    if tag == "uuid":
-        return val[1]
-    if tag == "set":
-        return [_unwrap_ovn_value(v) for v in val[1]]
-    if tag == "map":
-        return {_unwrap_ovn_value(k): _unwrap_ovn_value(v) for k, v in val[1]}
-    return val
-
-
-def parse_ovn_json(raw: str) -> list[dict]:
-    """Parse OVN --format=json list output into a list of row dicts."""
-    obj = json.loads(raw)
-    headings = obj["headings"]
-    return [
-        {h: _unwrap_ovn_value(v) for h, v in zip(headings, row)} for row in obj["data"]
-    ]
-
-
 def _ovn_cmd(kubectl_base: list[str], *args: str) -> subprocess.CompletedProcess:
     return subprocess.run(
         kubectl_base
@@ -56,6 +44,42 @@ def _ovn_cmd(kubectl_base: list[str], *args: str) -> subprocess.CompletedProcess
     )
 
 
+def _ovn_list(kubectl_base: list[str], table: str, columns: str) -> list[dict]:
+    # Streamed rather than captured: logical_switch_port can be hundreds of
+    # MB on a large cloud, and only `columns` are kept.
+    # stderr goes to a file so a chatty kubectl can't block on it while
+    # stdout is still being read.
+    with (
+        tempfile.TemporaryFile("w+") as stderr_file,
+        subprocess.Popen(
+            kubectl_base
+            + ["exec", "-n", OVN_NAMESPACE, OVN_POD, "--", "ovn-nbctl"]
+            + [f"--columns={columns}", "--format=json", "list", table],
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            text=True,
+        ) as proc,
+    ):
+        try:
+            rows = list(iter_ovn_rows(proc.stdout, columns.split(",")))
+            parse_error = ""
+        except ValueError as exc:
+            # Nothing drains stdout any more; stop kubectl rather than
+            # wait for it to finish writing.
+            proc.kill()
+            rows, parse_error = [], str(exc)
+        proc.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read().strip()
+    if proc.returncode != 0 or parse_error:
+        print(
+            f"ERROR: ovn-nbctl list {table} failed:\n{stderr or parse_error}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    return rows
+
+
 def list_ovn_uplink_lsps(kubectl_base: list[str]) -> list[dict]:
     """Return [{lport_name, uuid, neutron_port_name}] for every uplink-* LSP.
 
@@ -66,20 +90,7 @@ def list_ovn_uplink_lsps(kubectl_base: list[str]) -> list[dict]:
       external_ids["neutron:port_name"]="uplink-{segment_id}".  Matched by
       the external_ids field (shown as "aka" in ovn-nbctl show).
     """
-    result = _ovn_cmd(
-        kubectl_base,
-        "--columns=name,_uuid,external_ids",
-        "--format=json",
-        "list",
-        "logical_switch_port",
-    )
-    if result.returncode != 0:
-        print(
-            f"ERROR: ovn-nbctl list logical_switch_port failed:\n{result.stderr.strip()}",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-    rows = parse_ovn_json(result.stdout)
+    rows = _ovn_list(kubectl_base, "logical_switch_port", "name,_uuid,external_ids")
     lsps = []
     for r in rows:
         lport_name = r.get("name", "")
@@ -100,20 +111,7 @@ def list_ovn_uplink_lsps(kubectl_base: list[str]) -> list[dict]:
 
 def build_lsp_network_map(kubectl_base: list[str]) -> dict[str, str]:
     """Return {port_uuid: network_id} for all ports on neutron-* switches."""
-    result = _ovn_cmd(
-        kubectl_base,
-        "--columns=name,ports",
-        "--format=json",
-        "list",
-        "logical_switch",
-    )
-    if result.returncode != 0:
-        print(
-            f"ERROR: ovn-nbctl list logical_switch failed:\n{result.stderr.strip()}",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-    rows = parse_ovn_json(result.stdout)
+    rows = _ovn_list(kubectl_base, "logical_switch", "name,ports")
     mapping: dict[str, str] = {}
     for row in rows:
         switch_name = row.get("name", "")
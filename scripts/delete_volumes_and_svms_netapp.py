@@ -597,7 +597,9 @@ def delete_svm(hostname, login, password, project_id):
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Delete NetApp ONTAP volume and SVM for a project"
+        description="Delete NetApp ONTAP volume and SVM for a project",
+        epilog="To offboard many projects at once, use netapp-cleanup-projects "
+        "from understack-workflows.",
     )
     parser.add_argument("project_id", help="Project ID")
 